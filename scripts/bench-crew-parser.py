@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Benchmark the crew-string parser in generate-templates.py against the
+previous if/elif implementation, in strings/sec
+"""
+
+import argparse
+import random
+import re
+import time
+
+from script_modules import load_script
+
+generate_templates = load_script("generate-templates")
+
+def legacy_clean_text(text):
+    """clean_text() before the compiled parser"""
+    if not text:
+        return ""
+    text = re.sub(r'[\u200e\u200f\u202a-\u202e]', '', text)
+    return text.strip()
+
+def legacy_parse_crew(crew_str):
+    """parse_crew() before the compiled parser, kept as the baseline"""
+    if not crew_str:
+        return []
+    crew_str = legacy_clean_text(crew_str)
+    if not crew_str:
+        return []
+    crew = []
+    if 'صناعيى و' in crew_str:
+        crew.append({'roleCode': 'LAB-PLUMBER', 'qty': 1, 'description': 'صناعي'})
+        match = re.search(r'(\d+)\s*مساعد', crew_str)
+        if match:
+            crew.append({'roleCode': 'LAB-PLUMBER-ASST', 'qty': int(match.group(1)), 'description': 'مساعد'})
+    elif 'كهربائى و' in crew_str:
+        crew.append({'roleCode': 'LAB-ELECTRICIAN', 'qty': 1, 'description': 'كهربائي'})
+        match = re.search(r'(\d+)\s*مساعد', crew_str)
+        if match:
+            crew.append({'roleCode': 'LAB-ELECTRICIAN-ASST', 'qty': int(match.group(1)), 'description': 'مساعد'})
+    elif 'نجار+' in crew_str or 'نجار +' in crew_str:
+        crew.append({'roleCode': 'LAB-CARPENTER-FW', 'qty': 1, 'description': 'نجار'})
+        match = re.search(r'(\d+)\s*عامل', crew_str)
+        if match:
+            crew.append({'roleCode': 'LAB-GENERAL', 'qty': int(match.group(1)), 'description': 'عامل'})
+    elif 'نحات+عامل' in crew_str or 'نحات + عامل' in crew_str:
+        crew.append({'roleCode': 'LAB-DEMOLITION', 'qty': 1, 'description': 'نحات'})
+        crew.append({'roleCode': 'LAB-GENERAL', 'qty': 1, 'description': 'عامل'})
+    elif re.match(r'^\d+نحات$', crew_str.replace(' ', '')):
+        match = re.search(r'(\d+)', crew_str)
+        if match:
+            crew.append({'roleCode': 'LAB-DEMOLITION', 'qty': int(match.group(1)), 'description': 'نحات'})
+    elif crew_str == 'نحات':
+        crew.append({'roleCode': 'LAB-DEMOLITION', 'qty': 1, 'description': 'نحات'})
+    elif 'ماكينة' in crew_str:
+        crew.append({'roleCode': 'EQP-COMPRESSOR', 'qty': 1, 'description': 'ماكينة'})
+        crew.append({'roleCode': 'LAB-GENERAL', 'qty': 1, 'description': 'عامل'})
+    elif 'مجموعة عمل' in crew_str:
+        crew.append({'roleCode': 'LAB-GENERAL', 'qty': 3, 'description': 'مجموعة عمل'})
+    elif re.match(r'^\d+عامل$', crew_str.replace(' ', '')):
+        match = re.search(r'(\d+)', crew_str)
+        if match:
+            crew.append({'roleCode': 'LAB-GENERAL', 'qty': int(match.group(1)), 'description': 'عامل'})
+    return crew
+
+def synthetic_corpus(crew_strings, size, seed=7):
+    """Field-report-like corpus: the sheet's crew strings with varied counts"""
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(size):
+        text = rng.choice(crew_strings)
+        corpus.append(re.sub(r'\d+', lambda _: str(rng.randint(1, 12)), text))
+    return corpus
+
+def strings_per_sec(parse, corpus):
+    start = time.perf_counter()
+    for text in corpus:
+        parse(text)
+    return len(corpus) / (time.perf_counter() - start)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument("--size", type=int, default=50000, help="Crew strings in the synthetic corpus")
+    args = parser.parse_args()
+
+    items = generate_templates.load_items()
+    crew_strings = [item['crew'] for item in items if item.get('crew')]
+    mismatches = [text for text in crew_strings
+                  if generate_templates.parse_crew(text) != legacy_parse_crew(text)]
+    print(f"Sheet crew strings: {len(crew_strings)}, mismatches vs legacy parser: {len(mismatches)}")
+
+    corpus = synthetic_corpus(crew_strings, args.size)
+    uncached = generate_templates._parse_crew_cached.__wrapped__
+    legacy = strings_per_sec(legacy_parse_crew, corpus)
+    compiled = strings_per_sec(uncached, corpus)
+    generate_templates._parse_crew_cached.cache_clear()
+    memoized = strings_per_sec(generate_templates.parse_crew, corpus)
+    print(f"Corpus: {len(corpus)} strings ({len(set(corpus))} distinct)")
+    print(f"  legacy if/elif parser : {legacy:>12,.0f} strings/sec")
+    print(f"  compiled, no cache    : {compiled:>12,.0f} strings/sec ({compiled / legacy:.1f}x)")
+    print(f"  compiled, memoized    : {memoized:>12,.0f} strings/sec ({memoized / legacy:.1f}x)")
+
+if __name__ == "__main__":
+    main()
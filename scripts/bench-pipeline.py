@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+Benchmark the extraction and generation stages at increasing data scales
+
+Datasets are scaled from extracted-productivity.json (1x, 100x, 1000x by
+default): copies of each row get a numbered description and re-drawn crew
+counts, so the parse_crew cache sees a realistic number of distinct strings.
+The workbook is generated per scale from the reference catalog, with the rate
+sheets grown to `scale` times their rows, and encrypted with the workbook
+password.
+
+Stages:
+  clean_text, parse_crew, generate_id, generate_code  per call, each call timed on its own
+  ts_emit       write_template_modules() into a temp directory
+  decrypt_excel decrypt the generated workbook in memory
+  sheet_parse   read and classify every sheet of the decrypted workbook
+  seed_write    write_seed_dir() of the extracted records
+
+Each stage reports throughput, latency percentiles (per call for the small
+functions, per run for the others) and peak traced memory, measured in a
+separate run under tracemalloc so tracing does not skew the timings.
+Results are saved as JSON; --baseline compares them with an earlier result
+file and exits non-zero when a stage lost more than --tolerance throughput.
+"""
+
+import argparse
+import io
+import json
+import platform
+import random
+import re
+import statistics
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+import openpyxl
+from msoffcrypto.format.ooxml import OOXMLFile
+
+from script_modules import load_script
+from seed_store import write_seed_dir
+
+generate_templates = load_script("generate-templates")
+extract_excel_data = load_script("extract-excel-data")
+
+DEFAULT_SCALES = (1, 100, 1000)
+PERCENTILES = (50, 90, 99)
+# perf_counter_ns() pairs sampled to estimate the timer's own cost
+TIMER_SAMPLES = 1000
+DEFAULT_TOLERANCE = 0.15
+
+def scaled_items(items, scale, seed=7):
+    """`scale` copies of the sheet rows; copies get their own description and crew counts"""
+    rng = random.Random(seed)
+    scaled = [dict(item) for item in items]
+    for copy in range(1, scale):
+        for item in items:
+            row = dict(item, description=f"{item['description']} {copy}")
+            if row.get('crew'):
+                row['crew'] = re.sub(r'\d+', lambda _: str(rng.randint(1, 12)), row['crew'])
+            scaled.append(row)
+    return scaled
+
+def build_workbook(path, scale, password=extract_excel_data.PASSWORD):
+    """Encrypted workbook with the reference rate sheets (rows x scale), BOQ templates and indirect costs"""
+    workbook = openpyxl.Workbook(write_only=True)
+    for title, rates in (("Labor", extract_excel_data.extract_labor_rates()),
+                         ("Materials", extract_excel_data.extract_material_rates()),
+                         ("Equipment", extract_excel_data.extract_equipment_rates())):
+        sheet = workbook.create_sheet(title)
+        sheet.append(["الكود", "البيان", "الاسم بالانجليزية", "الوحدة", "السعر", "المكونات", "معامل الهالك"])
+        for copy in range(scale):
+            suffix = f"-{copy:04d}" if copy else ""
+            for rate in rates:
+                sheet.append([rate["code"] + suffix, rate["name_ar"], rate["name_en"], rate["unit"], rate["rate"],
+                              rate.get("components"), rate.get("waste_factor")])
+    for template in extract_excel_data.extract_boq_templates():
+        sheet = workbook.create_sheet(template["code"])
+        for label, field in (("الكود", "code"), ("البند", "name_ar"), ("الاسم بالانجليزية", "name_en"),
+                             ("الوحدة", "unit"), ("التصنيف", "category")):
+            sheet.append([label, template[field]])
+        sheet.append(["كود السعر", "الوصف", "الكمية"])
+        for section in ("materials", "labor", "equipment"):
+            for component in template[section]:
+                sheet.append([component["rateCode"], component["description"], component["qty"]])
+    sheet = workbook.create_sheet("Indirect")
+    sheet.append(["الكود", "البيان", "الاسم بالانجليزية", "النسبة", "يطبق على"])
+    for indirect in extract_excel_data.extract_indirect_costs():
+        sheet.append([indirect["code"], indirect["name_ar"], indirect["name_en"], indirect["percentage"],
+                      ",".join(indirect["applies_to"])])
+
+    plain = io.BytesIO()
+    workbook.save(plain)
+    plain.seek(0)
+    with open(path, 'wb') as f:
+        OOXMLFile(plain).encrypt(password, f)
+
+def percentiles(values):
+    ordered = sorted(values)
+    return {
+        f"p{p}": ordered[min(len(ordered) - 1, round(p / 100 * (len(ordered) - 1)))]
+        for p in PERCENTILES
+    }
+
+def peak_memory_mb(run):
+    tracemalloc.start()
+    try:
+        run()
+        return tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+    finally:
+        tracemalloc.stop()
+
+def timer_overhead_ns():
+    """Median cost of an empty perf_counter_ns() pair, subtracted from per-call timings"""
+    clock = time.perf_counter_ns
+    samples = []
+    for _ in range(TIMER_SAMPLES):
+        began = clock()
+        samples.append(clock() - began)
+    return statistics.median(samples)
+
+def bench_calls(call, arguments, setup=None):
+    """Per-call stage: throughput from a pass over every argument tuple, latency
+    percentiles from a second pass that times each call on its own.
+
+    Both passes run after `setup`, so caches it clears start cold in each.
+    """
+    if setup:
+        setup()
+    began = time.perf_counter()
+    for args in arguments:
+        call(*args)
+    total = time.perf_counter() - began
+
+    if setup:
+        setup()
+    overhead = timer_overhead_ns()
+    clock = time.perf_counter_ns
+    latencies = []
+    for args in arguments:
+        began = clock()
+        call(*args)
+        latencies.append(max(clock() - began - overhead, 0))
+
+    def traced():
+        if setup:
+            setup()
+        for args in arguments:
+            call(*args)
+
+    return {
+        "items": len(arguments),
+        "unit": "calls",
+        "seconds": total,
+        "throughput": len(arguments) / total,
+        "latencyUs": {name: value / 1000 for name, value in percentiles(latencies).items()},
+        "peakMemoryMB": peak_memory_mb(traced),
+    }
+
+def bench_runs(run, items, unit, repeat):
+    """Whole-stage run, repeated; latency is per run"""
+    timings = []
+    for _ in range(repeat):
+        began = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - began)
+    median = statistics.median(timings)
+    return {
+        "items": items,
+        "unit": unit,
+        "seconds": median,
+        "throughput": items / median,
+        "latencyMs": {name: value * 1000 for name, value in percentiles(timings).items()},
+        "peakMemoryMB": peak_memory_mb(run),
+    }
+
+def bench_scale(base_items, scale, repeat, tmp):
+    items = scaled_items(base_items, scale)
+    crew_rates = generate_templates.load_crew_rates()
+    results = {}
+
+    texts = [(item['description'],) for item in items] + [(item['unit'],) for item in items]
+    results["clean_text"] = bench_calls(generate_templates.clean_text, texts)
+    results["parse_crew"] = bench_calls(generate_templates.parse_crew, [(item.get('crew'),) for item in items],
+                                        setup=generate_templates._parse_crew_cached.cache_clear)
+    indexed = [(item['category'], index) for index, item in enumerate(items, 1)]
+    results["generate_id"] = bench_calls(generate_templates.generate_id,
+                                         [(category, index, None) for category, index in indexed])
+    results["generate_code"] = bench_calls(generate_templates.generate_code, indexed)
+
+    output = Path(tmp) / f"templates-{scale}" / "productivity-templates.ts"
+    output.parent.mkdir()
+    results["ts_emit"] = bench_runs(
+        lambda: generate_templates.write_template_modules(output, items, crew_rates),
+        len(items), "templates", repeat)
+
+    workbook_path = Path(tmp) / f"workbook-{scale}.xlsx"
+    build_workbook(workbook_path, scale)
+    decrypted = extract_excel_data.decrypt_excel(workbook_path)
+    workbook_bytes = len(decrypted.getvalue())
+    results["decrypt_excel"] = bench_runs(lambda: extract_excel_data.decrypt_excel(workbook_path),
+                                          workbook_bytes, "bytes", repeat)
+    results["decrypt_excel"]["workbookBytes"] = workbook_path.stat().st_size
+
+    def parse_sheets():
+        decrypted.seek(0)
+        parsed = {"rates": [], "boq_templates": [], "indirect_costs": []}
+        for _, kind, records, _ in extract_excel_data.iter_workbook_sheets(decrypted):
+            if kind:
+                parsed[kind].extend(records)
+        return parsed
+
+    sections = parse_sheets()
+    records = sum(len(section) for section in sections.values())
+    results["sheet_parse"] = bench_runs(parse_sheets, records, "records", repeat)
+
+    seed_dir = Path(tmp) / f"seed-{scale}"
+    results["seed_write"] = bench_runs(lambda: write_seed_dir(seed_dir, sections), records, "records", repeat)
+    return results
+
+def compare(results, baseline, tolerance):
+    """Stages whose throughput fell more than `tolerance` below the baseline"""
+    regressions = []
+    for scale, stages in results["scales"].items():
+        for stage, current in stages.items():
+            previous = baseline.get("scales", {}).get(scale, {}).get(stage)
+            if not previous:
+                continue
+            ratio = current["throughput"] / previous["throughput"]
+            current["vsBaseline"] = round(ratio, 3)
+            if ratio < 1 - tolerance:
+                regressions.append((scale, stage, ratio))
+    return regressions
+
+def print_results(results):
+    print(f"{'scale':>6} {'stage':14} {'throughput':>16} {'p50':>12} {'p99':>12} {'peak MB':>9} {'vs base':>8}")
+    for scale, stages in results["scales"].items():
+        for stage, result in stages.items():
+            if "latencyUs" in result:
+                p50, p99 = (f"{result['latencyUs'][p]:.2f} us" for p in ("p50", "p99"))
+            else:
+                p50, p99 = (f"{result['latencyMs'][p]:.1f} ms" for p in ("p50", "p99"))
+            versus = f"{result['vsBaseline']:.2f}x" if "vsBaseline" in result else "-"
+            throughput = f"{result['throughput']:,.0f} {result['unit']}/s"
+            print(f"{scale + 'x':>6} {stage:14} {throughput:>16} {p50:>12} {p99:>12} "
+                  f"{result['peakMemoryMB']:>9.2f} {versus:>8}")
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark the extraction and template generation stages")
+    parser.add_argument("--scales", type=int, nargs="+", default=list(DEFAULT_SCALES),
+                        help="Multiples of the sheet rows to benchmark at")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per whole-stage benchmark")
+    parser.add_argument("--output", help="Write the results as JSON")
+    parser.add_argument("--baseline", help="Earlier --output file to compare throughput against")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="Throughput loss vs the baseline reported as a regression")
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    base_items = generate_templates.load_items()
+    results = {
+        "generated_at": datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "scales": {},
+    }
+    with tempfile.TemporaryDirectory(prefix="bench-pipeline-") as tmp:
+        for scale in args.scales:
+            print(f"Benchmarking {scale}x ({len(base_items) * scale} templates)...")
+            results["scales"][str(scale)] = bench_scale(base_items, scale, args.repeat, tmp)
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+    print_results(results)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"✓ Saved to: {args.output}")
+    if regressions:
+        for scale, stage, ratio in regressions:
+            print(f"⚠ {stage} at {scale}x: {ratio:.2f}x baseline throughput")
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+import fs from "node:fs";
+import path from "node:path";
+import vm from "node:vm";
+import zlib from "node:zlib";
+import { performance } from "node:perf_hooks";
+import ts from "typescript";
+
+// Usage: node scripts/bench-template-lookups.mjs [templates.ts ...]
+// Generate a larger catalog first with:
+//   python scripts/generate-templates.py --synthetic 10000 --output /tmp/templates-10k.ts
+// (add --layout objects for the one-literal-per-template layout)
+
+const root = process.cwd();
+const files = process.argv.slice(2);
+if (files.length === 0) files.push("src/data/productivity-templates.ts");
+
+// Transpile and evaluate `file` with the modules it imports (relative and
+// "@/" paths under src/; type-only and package imports are stubbed)
+function loadModule(file) {
+  const sources = [];
+  const outputs = [];
+  const cache = new Map();
+  let transpileMs = 0;
+
+  function resolve(fromDir, specifier) {
+    const base = specifier.startsWith("@/") ? path.join(root, "src", specifier.slice(2)) : path.resolve(fromDir, specifier);
+    return [base, `${base}.ts`, `${base}.tsx`].find((candidate) => fs.existsSync(candidate) && fs.statSync(candidate).isFile());
+  }
+
+  function load(modulePath) {
+    if (cache.has(modulePath)) return cache.get(modulePath).exports;
+    const source = fs.readFileSync(modulePath, "utf8");
+    const start = performance.now();
+    const output = ts.transpileModule(source, {
+      compilerOptions: { module: ts.ModuleKind.CommonJS, target: ts.ScriptTarget.ES2020 },
+    }).outputText;
+    transpileMs += performance.now() - start;
+    sources.push(source);
+    outputs.push(output);
+
+    const module = { exports: {} };
+    cache.set(modulePath, module);
+    const require = (specifier) => {
+      const target = specifier.startsWith(".") || specifier.startsWith("@/") ? resolve(path.dirname(modulePath), specifier) : null;
+      return target ? load(target) : {};
+    };
+    vm.runInNewContext(output, { exports: module.exports, module, require }, { filename: modulePath });
+    return module.exports;
+  }
+
+  const start = performance.now();
+  const exports = load(path.resolve(root, file));
+  const totalMs = performance.now() - start;
+  return {
+    modules: cache.size,
+    sourceBytes: sources.reduce((sum, source) => sum + Buffer.byteLength(source), 0),
+    outputBytes: outputs.reduce((sum, output) => sum + Buffer.byteLength(output), 0),
+    gzipBytes: outputs.reduce((sum, output) => sum + zlib.gzipSync(output).length, 0),
+    exports,
+    transpileMs,
+    evaluateMs: totalMs - transpileMs,
+  };
+}
+
+// The linear scans the helpers used before the generated indexes
+const linear = {
+  byId: (templates, id) => templates.find((t) => t.id === id),
+  byCode: (templates, code) => templates.find((t) => t.code === code),
+  byCategory: (templates, categoryId) => templates.filter((t) => t.categoryId === categoryId && t.isActive),
+  bySource: (templates, source) => templates.filter((t) => t.source === source && t.isActive),
+  search: (templates, query) => {
+    const lowerQuery = query.toLowerCase();
+    return templates.filter((t) => t.nameAr.includes(query) || t.nameEn?.toLowerCase().includes(lowerQuery));
+  },
+};
+
+function nsPerCall(fn, keys, minMs = 200) {
+  let calls = 0;
+  const start = performance.now();
+  let elapsed = 0;
+  while (elapsed < minMs) {
+    for (const key of keys) fn(key);
+    calls += keys.length;
+    elapsed = performance.now() - start;
+  }
+  return (elapsed * 1e6) / calls;
+}
+
+function sample(values, count) {
+  const picked = [];
+  for (let i = 0; i < count; i++) picked.push(values[(i * 7919) % values.length]);
+  return picked;
+}
+
+for (const file of files) {
+  const mod = loadModule(file);
+  const templates = mod.exports.productivityTemplates;
+  // First pass over every row; columnar catalogs build their row objects here
+  const firstPassStart = performance.now();
+  for (const template of templates) template.code;
+  const firstPassMs = performance.now() - firstPassStart;
+  const ids = sample(templates.map((t) => t.id), 1000);
+  const codes = sample(templates.map((t) => t.code), 1000);
+  const categories = sample([...new Set(templates.map((t) => t.categoryId))], 100);
+  const sources = sample([...new Set(templates.map((t) => t.source))], 100);
+  const words = [...new Set(templates.flatMap((t) => t.nameAr.split(/\s+/)).filter((w) => w.length >= 3))];
+  const queries = sample(words, 200);
+
+  console.log(`\n${file}: ${templates.length} templates`);
+  console.log(
+    `  size: ${mod.sourceBytes} B source, ${mod.outputBytes} B JS, ${mod.gzipBytes} B gzipped ` +
+      `(${mod.modules} modules)`
+  );
+  console.log(
+    `  load: ${mod.transpileMs.toFixed(1)} ms transpile, ${mod.evaluateMs.toFixed(1)} ms evaluate, ` +
+      `${firstPassMs.toFixed(1)} ms first pass over all rows`
+  );
+
+  const rows = [
+    ["getTemplateById", mod.exports.getTemplateById, (k) => linear.byId(templates, k), ids],
+    ["getTemplateByCode", mod.exports.getTemplateByCode, (k) => linear.byCode(templates, k), codes],
+    ["getTemplatesByCategory", mod.exports.getTemplatesByCategory, (k) => linear.byCategory(templates, k), categories],
+    ["getTemplatesBySource", mod.exports.getTemplatesBySource, (k) => linear.bySource(templates, k), sources],
+    ["searchTemplates", mod.exports.searchTemplates, (k) => linear.search(templates, k), queries],
+  ];
+  for (const [name, indexed, scan, keys] of rows) {
+    const indexedNs = nsPerCall(indexed, keys);
+    const scanNs = nsPerCall(scan, keys);
+    console.log(
+      `  ${name.padEnd(24)} ${indexedNs.toFixed(0).padStart(9)} ns indexed  ` +
+        `${scanNs.toFixed(0).padStart(9)} ns linear scan  (${(scanNs / indexedNs).toFixed(1)}x)`
+    );
+  }
+}
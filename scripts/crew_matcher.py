@@ -0,0 +1,257 @@
+"""
+Fuzzy resolution of crew strings that parse_crew() does not understand
+
+The index holds every role name of crew-roles.ts (Arabic, each side of a
+"/" alternative, and English) and the parser's own crew words (CREW_WORDS,
+whose reading wins where both name a word), normalized like the template
+search keys. Each name is split into character trigrams, padded so short
+words such as "بنا" still get a few; an inverted index maps each trigram to
+the names containing it. Looking up a term only scores the names sharing
+one of its trigrams (Dice coefficient of the two trigram sets), so lookups
+stay cheap as the catalog grows. The best RESCORE_CANDIDATES names are then
+rescored word by word, averaging that Dice with how well each word of the
+longer of term and name pairs with a word of the other, so "عامل صبب" is
+read as "عامل صب" rather than the bare "عامل".
+
+A crew string is split into terms on "+", "،", "," and "&", and on the
+conjunction "و" when splitting scores better than the whole term. Each
+term's count is read from its leading or trailing digits. The crew's
+confidence is that of its weakest term. Rows with no crew text are matched
+on the words of their description instead, with confidence scaled by
+DESCRIPTION_WEIGHT, as the activity only suggests a trade. Unmatched inputs
+keep their resolved terms for the report but suggest no crew.
+"""
+
+import re
+from collections import Counter
+from pathlib import Path
+
+from script_modules import load_script
+
+generate_templates = load_script("generate-templates")
+normalize = generate_templates.normalize_search_text
+
+# `code: '...'` followed, within the same object literal, by its names
+CREW_ROLE_RE = re.compile(r"code:\s*'([^']+)'[^}]*?nameAr:\s*'([^']*)'[^}]*?nameEn:\s*'([^']*)'")
+
+TERM_SPLIT_RE = re.compile(r'\s*[+،,&]\s*')
+CONJUNCTION_RE = re.compile(r'\s+و\s*')
+COUNT_RE = re.compile(r'^(\d+)\s*(.*)$|^(.*?)\s*(\d+)$')
+PLURAL_SUFFIXES = ("ين", "ون")
+# Helper words that become the lead tradesman's assistant (as in parse_crew)
+HELPER_WORDS = frozenset(normalize(word) for word in ("مساعد", "مساعدين", "عامل", "عمال"))
+MIN_DESCRIPTION_WORD = 3
+RESCORE_CANDIDATES = 8
+
+ACCEPT_CONFIDENCE = 0.7
+REVIEW_CONFIDENCE = 0.5
+DESCRIPTION_WEIGHT = 0.8
+STATUSES = ("parsed", "matched", "review", "unmatched")
+
+def load_crew_roles(path=generate_templates.CREW_ROLES_PATH):
+    """[(code, nameAr, nameEn)] of crew-roles.ts, first definition of a code only"""
+    roles = {}
+    for code, name_ar, name_en in CREW_ROLE_RE.findall(Path(path).read_text(encoding='utf-8')):
+        roles.setdefault(code, (code, name_ar, name_en))
+    return list(roles.values())
+
+def padded_grams(key):
+    return generate_templates.search_grams(f" {key} ")
+
+def dice(grams, other):
+    return 2 * len(grams & other) / (len(grams) + len(other)) if grams or other else 0.0
+
+def word_score(words, other):
+    """Mean over the words of the longer list of their best Dice against a word of the other"""
+    if len(words) < len(other):
+        words, other = other, words
+    return sum(max((dice(word, candidate) for candidate in other), default=0.0) for word in words) / len(words)
+
+class CrewIndex:
+    """Trigram index over role names; `aliases` are (normalized name, roleCode, default qty)"""
+    __slots__ = ("aliases", "exact", "postings", "sizes", "words", "codes", "assistants", "cache")
+
+    def __init__(self, roles):
+        names = {}
+        for code, name_ar, name_en in roles:
+            for name in (*name_ar.split('/'), name_en):
+                key = normalize(name)
+                if key:
+                    names.setdefault(key, (code, 1))
+        for word, role in generate_templates.CREW_WORDS.items():
+            code, _, qty = generate_templates.CREW_ROLES[role]
+            names[normalize(word)] = (code, qty)
+
+        self.aliases = [(key, code, qty) for key, (code, qty) in names.items()]
+        self.exact = {key: alias for alias, (key, _, _) in enumerate(self.aliases)}
+        self.postings = {}
+        self.sizes = []
+        self.words = []
+        for alias, (key, _, _) in enumerate(self.aliases):
+            grams = padded_grams(key)
+            self.sizes.append(len(grams))
+            self.words.append([padded_grams(word) for word in key.split()])
+            for gram in grams:
+                self.postings.setdefault(gram, []).append(alias)
+        self.codes = {code for code, _, _ in roles}
+        # Lead role -> the role its bare helpers are priced as
+        self.assistants = {
+            generate_templates.CREW_ROLES[word][0]: code
+            for word, code in generate_templates.CREW_ASSISTANTS.items()
+        }
+        self.cache = {}
+
+    def best_alias(self, key):
+        """(alias, score) of the name closest to a normalized key; (None, 0.0) if nothing shares a trigram"""
+        if key in self.cache:
+            return self.cache[key]
+        alias = self.exact.get(key)
+        if alias is not None:
+            found = (alias, 1.0)
+        else:
+            grams = padded_grams(key)
+            shared = Counter()
+            for gram in grams:
+                shared.update(self.postings.get(gram, ()))
+            ranked = sorted(((2 * count / (len(grams) + self.sizes[alias]), alias)
+                             for alias, count in shared.items()), reverse=True)[:RESCORE_CANDIDATES]
+            words = [padded_grams(word) for word in key.split()]
+            found = max(((alias, (score + word_score(words, self.words[alias])) / 2) for score, alias in ranked),
+                        key=lambda candidate: candidate[1], default=(None, 0.0))
+        self.cache[key] = found
+        return found
+
+    def assistant_of(self, lead):
+        if lead in self.assistants:
+            return self.assistants[lead]
+        code = f"{lead}-ASST"
+        return code if code in self.codes else None
+
+def split_count(term):
+    """(count or None, role words) of a crew term"""
+    term = term.strip()
+    # Arabic-Indic digits read as ASCII ones
+    digits = normalize(term) if not term.isascii() else term
+    match = COUNT_RE.match(digits.strip())
+    if not match:
+        return None, term
+    if match.group(1):
+        return int(match.group(1)), match.group(2)
+    return int(match.group(4)), match.group(3)
+
+def resolve_term(index, term):
+    """{text, roleCode, qty, alias, confidence} of one crew term, roleCode None if nothing matched"""
+    count, words = split_count(term)
+    key = normalize(words)
+    result = {"text": term.strip(), "roleCode": None, "qty": count or 1, "alias": None, "confidence": 0.0}
+    if not key:
+        return result
+    candidates = [key] + [key[:-len(suffix)] for suffix in PLURAL_SUFFIXES if key.endswith(suffix) and len(key) > 4]
+    alias, score = max((index.best_alias(candidate) for candidate in candidates), key=lambda found: found[1])
+    if alias is None:
+        return result
+    name, code, default_qty = index.aliases[alias]
+    return dict(result, roleCode=code, qty=count or default_qty, alias=name, confidence=round(score, 3))
+
+def crew_terms(index, text):
+    """Resolved terms of a crew string"""
+    terms = []
+    for part in TERM_SPLIT_RE.split(generate_templates.clean_text(text)):
+        if not part.strip():
+            continue
+        whole = resolve_term(index, part)
+        pieces = [piece for piece in CONJUNCTION_RE.split(part) if piece.strip()]
+        if len(pieces) > 1:
+            split = [resolve_term(index, piece) for piece in pieces]
+            if min(term["confidence"] for term in split) > whole["confidence"]:
+                terms.extend(split)
+                continue
+        terms.append(whole)
+    if terms and terms[0]["roleCode"]:
+        assistant = index.assistant_of(terms[0]["roleCode"])
+        for term in terms[1:]:
+            if assistant and term["alias"] in HELPER_WORDS:
+                term["roleCode"] = assistant
+    return terms
+
+def status_for(confidence, accept=ACCEPT_CONFIDENCE, review=REVIEW_CONFIDENCE):
+    if confidence >= accept:
+        return "matched"
+    return "review" if confidence >= review else "unmatched"
+
+def resolve_crew(index, text, accept=ACCEPT_CONFIDENCE, review=REVIEW_CONFIDENCE):
+    """Crew of a crew string: parse_crew() when it understands it, the fuzzy match otherwise"""
+    parsed = generate_templates.parse_crew(text)
+    if parsed:
+        return {"source": "crew", "status": "parsed", "confidence": 1.0, "crew": parsed, "terms": []}
+    terms = crew_terms(index, text)
+    confidence = min((term["confidence"] for term in terms), default=0.0)
+    status = status_for(confidence, accept, review)
+    crew = [
+        {"roleCode": term["roleCode"], "qty": term["qty"], "description": term["text"]}
+        for term in terms if term["roleCode"]
+    ] if status != "unmatched" else []
+    return {"source": "crew", "status": status, "confidence": confidence, "crew": crew, "terms": terms}
+
+def resolve_description(index, description, accept=ACCEPT_CONFIDENCE, review=REVIEW_CONFIDENCE):
+    """A one-role crew suggested by the closest role name among the description's words"""
+    best = None
+    for word in normalize(description).split():
+        if len(word) < MIN_DESCRIPTION_WORD or word.isdigit():
+            continue
+        term = resolve_term(index, word)
+        if term["roleCode"] and (best is None or term["confidence"] > best["confidence"]):
+            best = term
+    if best is None:
+        return {"source": "description", "status": "unmatched", "confidence": 0.0, "crew": [], "terms": []}
+    confidence = round(best["confidence"] * DESCRIPTION_WEIGHT, 3)
+    status = status_for(confidence, accept, review)
+    crew = [{"roleCode": best["roleCode"], "qty": 1, "description": best["alias"]}] if status != "unmatched" else []
+    return {"source": "description", "status": status, "confidence": confidence, "crew": crew, "terms": [best]}
+
+def resolve_batch(index, entries, accept=ACCEPT_CONFIDENCE, review=REVIEW_CONFIDENCE):
+    """Resolve (crew text, description) pairs; each distinct pair is resolved once.
+
+    The crew text is used when there is one, the description otherwise.
+    """
+    resolved = {}
+    results = []
+    for crew_text, description in entries:
+        key = (generate_templates.clean_text(crew_text), description if not crew_text else None)
+        if key not in resolved:
+            if key[0]:
+                resolved[key] = resolve_crew(index, crew_text, accept, review)
+            else:
+                resolved[key] = resolve_description(index, description or "", accept, review)
+        results.append(resolved[key])
+    return results
+
+def review_report(rows, results):
+    """Counts per status and the distinct inputs to review, least confident first.
+
+    `rows` are dicts describing each input (text, category, ...), in the
+    order of `results`; identical inputs are reported once with their count.
+    """
+    counts = Counter(result["status"] for result in results)
+    distinct = {}
+    for row, result in zip(rows, results):
+        entry = distinct.get(id(result))
+        if entry is None:
+            distinct[id(result)] = dict(row, occurrences=1, **result)
+        else:
+            entry["occurrences"] += 1
+    roles = Counter(member["roleCode"] for entry in distinct.values() if entry["status"] != "parsed"
+                    for member in entry["crew"])
+
+    def entries(*statuses):
+        selected = [entry for entry in distinct.values() if entry["status"] in statuses]
+        return sorted(selected, key=lambda entry: entry["confidence"])
+
+    return {
+        "lines": len(results),
+        "distinct": len(distinct),
+        "counts": {status: counts.get(status, 0) for status in STATUSES},
+        "suggestedRoles": dict(roles.most_common()),
+        "review": entries("review", "unmatched"),
+        "matched": entries("matched"),
+    }
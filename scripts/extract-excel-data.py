@@ -4,23 +4,769 @@ Extract data from Excel files and generate seed data for Smart Estimate module
 """
 
 import msoffcrypto
-import pandas as pd
+import olefile
+import openpyxl
+import argparse
+import glob
+import hashlib
 import io
 import json
+import mmap
+import os
 import re
-from datetime import datetime
+import resource
+import struct
+import sys
+import tempfile
+import zipfile
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+from datetime import date, datetime
+from pathlib import Path
+
+import rate_store
+from seed_sql import write_changeset_sql, write_sql_dir
+from seed_store import diff_seeds, load_seed, seed_base, seed_exists, write_seed_dir, write_seed_json
+from stage_profile import StageRecorder, add_profile_arguments, finish_profile, recorder_from_args
 
 PASSWORD = "BETA"
 
-def decrypt_excel(file_path):
-    """Decrypt password-protected Excel file"""
-    decrypted = io.BytesIO()
+# Decrypted workbooks are cached outside the repo: they are the plaintext of
+# password-protected files and must never be committed.
+CACHE_DIR = Path(os.environ.get("FCC_CACHE_DIR", Path.home() / ".cache" / "future-cost-control")) / "workbooks"
+CACHE_MAX_BYTES = 512 * 1024 * 1024
+HASH_CHUNK_BYTES = 1024 * 1024
+
+# Rate history appended to with --history
+HISTORY_PATH = Path(__file__).parent / "rate-history.sqlite"
+
+# Agile (ECMA-376) encryption: the package is AES-CBC in segments of this size,
+# each with its own IV
+PACKAGE_SEGMENT_BYTES = 4096
+
+# With --spool, workbooks whose encrypted file is above this size are decrypted
+# to a temp file that the reader memory-maps, instead of into a BytesIO.
+SPOOL_MAX_BYTES = 16 * 1024 * 1024
+
+SPREADSHEET_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+RELATIONSHIP_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+PACKAGE_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+
+# Parts every sheet depends on: cell strings and the number formats that
+# decide whether a value reads back as a number or a date.
+SHARED_PARTS = ("xl/sharedStrings.xml", "xl/styles.xml")
+
+# Header rows are looked for in the first rows of each sheet only, so sheets
+# that are not rate/template tables are skipped without reading them fully.
+HEADER_SCAN_ROWS = 20
+
+RATE_COLUMNS = {
+    "code": ("الكود", "كود", "code"),
+    "name_ar": ("البيان", "البند", "الاسم", "name_ar"),
+    "name_en": ("الاسم بالانجليزية", "name_en", "english name"),
+    "unit": ("الوحدة", "unit"),
+    "rate": ("السعر", "الفئة", "المعدل", "rate"),
+    "type": ("النوع", "type"),
+    "components": ("المكونات", "components"),
+    "waste_factor": ("معامل الهالك", "الهالك", "waste_factor"),
+}
+
+TEMPLATE_COLUMNS = {
+    "rateCode": ("كود السعر", "كود المورد", "ratecode", "rate_code"),
+    "qty": ("الكمية", "المعدل", "qty", "quantity"),
+    "description": ("الوصف", "البيان", "description"),
+}
+
+TEMPLATE_FIELDS = {
+    "code": ("الكود", "كود البند", "code"),
+    "name_ar": ("البند", "اسم البند", "name_ar"),
+    "name_en": ("الاسم بالانجليزية", "name_en"),
+    "unit": ("الوحدة", "unit"),
+    "category": ("التصنيف", "category"),
+}
+
+INDIRECT_COLUMNS = {
+    "code": ("الكود", "كود", "code"),
+    "name_ar": ("البيان", "البند", "name_ar"),
+    "name_en": ("الاسم بالانجليزية", "name_en"),
+    "percentage": ("النسبة", "percentage"),
+    "applies_to": ("يطبق على", "applies_to"),
+}
+
+RATE_TYPES = {
+    "LAB-": "LABOR",
+    "MAT-": "MATERIAL",
+    "EQP-": "EQUIPMENT",
+}
+
+RATE_TYPE_NAMES = {
+    "عمالة": "LABOR",
+    "مواد": "MATERIAL",
+    "معدات": "EQUIPMENT",
+}
+
+TEMPLATE_SECTIONS = {
+    "LABOR": "labor",
+    "MATERIAL": "materials",
+    "EQUIPMENT": "equipment",
+}
+
+class MappedWorkbook(mmap.mmap):
+    """Read-only mmap that zipfile accepts as a seekable file (Python < 3.13)"""
+
+    def seekable(self):
+        return True
+
+def package_chunks(ole):
+    """The EncryptedPackage stream of an OLE container, sector by sector
+
+    olefile's openstream() joins every sector into one bytes object and then
+    copies it, which is the memory peak of decryption; the stream's FAT chain
+    is walked here instead. Streams under the mini-stream cutoff are small
+    and read with olefile.
+    """
+    entry = next(entry for entry in ole.direntries
+                 if entry is not None and entry.entry_type == olefile.STGTY_STREAM and entry.name == "EncryptedPackage")
+    if entry.size < ole.minisectorcutoff:
+        with ole.openstream("EncryptedPackage") as stream:
+            yield stream.read()
+        return
+    remaining = entry.size
+    sector = entry.isectStart
+    while remaining > 0 and sector != olefile.ENDOFCHAIN:
+        # Sector 0 starts after the header, which takes one sector
+        ole.fp.seek(ole.sectorsize * (sector + 1))
+        data = ole.fp.read(min(ole.sectorsize, remaining))
+        if not data:
+            break
+        yield data
+        remaining -= len(data)
+        sector = ole.fat[sector]
+
+def decrypt_package(office_file, out):
+    """Decrypt an agile-encrypted package into `out` one segment at a time
+
+    msoffcrypto reads the whole encrypted package and assembles the whole
+    plaintext in memory before writing it; this reads the package sector by
+    sector and writes each 4096-byte segment as it is decrypted, with the
+    same IV per segment (the key-data salt plus the segment index, hashed).
+    Other encryption types fall back to msoffcrypto.
+    """
+    if office_file.type != "agile":
+        office_file.decrypt(out)
+        return
+    info = office_file.info
+    algorithm = info["keyDataHashAlgorithm"].lower()
+    chunks = package_chunks(office_file.file)
+    pending = bytearray()
+
+    def read(size):
+        while len(pending) < size:
+            chunk = next(chunks, b'')
+            if not chunk:
+                break
+            pending.extend(chunk)
+        data = bytes(pending[:size])
+        del pending[:size]
+        return data
+
+    remaining = struct.unpack("<Q", read(8))[0]
+    index = 0
+    while remaining > 0:
+        segment = read(PACKAGE_SEGMENT_BYTES)
+        if not segment:
+            break
+        iv = hashlib.new(algorithm, info["keyDataSalt"] + struct.pack("<I", index)).digest()[:16]
+        decryptor = Cipher(algorithms.AES(office_file.secret_key), modes.CBC(iv)).decryptor()
+        plain = decryptor.update(segment) + decryptor.finalize()
+        out.write(plain[:remaining])
+        remaining -= len(plain)
+        index += 1
+
+def decrypt_excel(file_path, password=PASSWORD, spool=False):
+    """Decrypt password-protected Excel file
+
+    With spool=True a workbook whose encrypted file exceeds SPOOL_MAX_BYTES
+    (the plaintext is never larger) is decrypted straight into a temp file
+    that is then memory-mapped read-only, so the decrypted copy is paged
+    from disk rather than held on the heap. decrypt_package() itself only
+    holds one segment of the ciphertext and plaintext at a time.
+    """
+    to_disk = spool and os.path.getsize(file_path) > SPOOL_MAX_BYTES
+    decrypted = tempfile.TemporaryFile() if to_disk else io.BytesIO()
     with open(file_path, 'rb') as file:
         office_file = msoffcrypto.OfficeFile(file)
-        office_file.load_key(password=PASSWORD)
-        office_file.decrypt(decrypted)
+        office_file.load_key(password=password)
+        decrypt_package(office_file, decrypted)
+    if to_disk:
+        decrypted.flush()
+        mapped = MappedWorkbook(decrypted.fileno(), 0, access=mmap.ACCESS_READ)
+        # The mapping keeps the pages alive after the temp file is closed
+        decrypted.close()
+        return mapped
+    decrypted.seek(0)
     return decrypted
 
+def peak_rss_mb(who=resource.RUSAGE_SELF):
+    """Peak resident set size of this process in MB
+
+    With who=RUSAGE_CHILDREN, that of its largest finished child process,
+    which after a pooled extraction is the largest worker.
+    """
+    peak = resource.getrusage(who).ru_maxrss
+    # ru_maxrss is bytes on macOS and kilobytes on Linux
+    if sys.platform == "darwin":
+        return peak / (1024 * 1024)
+    return peak / 1024
+
+def file_sha256(file_path):
+    """Hash a file's content in chunks"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as file:
+        for chunk in iter(lambda: file.read(HASH_CHUNK_BYTES), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def cache_key(file_path, password):
+    """Cache key from the workbook content hash and the key identity.
+
+    The password itself is never written to disk, only a hash of it.
+    """
+    key_id = hashlib.sha256(password.encode('utf-8')).hexdigest()[:16]
+    return f"{file_sha256(file_path)}-{key_id}"
+
+def evict_cache(cache_dir, max_bytes, keep=()):
+    """Drop least recently used entries until the cache fits in max_bytes.
+
+    Entries in `keep` are never dropped. Readers hold their entry open, so
+    dropping one another worker is reading only unlinks its name; where open
+    files cannot be deleted (Windows) the entry is skipped instead.
+    """
+    entries = []
+    for entry in cache_dir.glob("*.xlsx"):
+        try:
+            stat = entry.stat()
+        except FileNotFoundError:
+            # Evicted by a parallel worker between glob and stat
+            continue
+        entries.append((stat.st_mtime, stat.st_size, entry))
+    total = sum(size for _, size, _ in entries)
+    for _, size, entry in sorted(entries, key=lambda item: item[0]):
+        if total <= max_bytes:
+            break
+        if entry in keep:
+            continue
+        try:
+            entry.unlink(missing_ok=True)
+        except OSError:
+            continue
+        total -= size
+
+def decrypt_excel_cached(file_path, password=PASSWORD, cache_dir=CACHE_DIR, max_bytes=CACHE_MAX_BYTES):
+    """Open the decrypted workbook, decrypting only on a cache miss
+
+    Returns an open binary file; the caller closes it. A workbook that alone
+    exceeds max_bytes (the encrypted file is at least as large as its
+    plaintext) is decrypted in memory and not cached.
+    """
+    if os.path.getsize(file_path) > max_bytes:
+        print(f"  {Path(file_path).name} exceeds the cache size, decrypting in memory")
+        return decrypt_excel(file_path, password)
+    cache_dir = Path(cache_dir)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    cached = cache_dir / f"{cache_key(file_path, password)}.xlsx"
+    try:
+        workbook = open(cached, 'rb')
+    except FileNotFoundError:
+        pass
+    else:
+        # Touch on hit so eviction order is least recently used, not oldest
+        try:
+            os.utime(cached)
+        except FileNotFoundError:
+            pass
+        print(f"  Decrypted workbook cache hit: {cached.name}")
+        return workbook
+
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as decrypted, open(file_path, 'rb') as file:
+            office_file = msoffcrypto.OfficeFile(file)
+            office_file.load_key(password=password)
+            decrypt_package(office_file, decrypted)
+        # Opened before it is published, so a parallel eviction cannot pull it away
+        workbook = open(tmp_path, 'rb')
+        os.replace(tmp_path, cached)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+    evict_cache(cache_dir, max_bytes, keep={cached})
+    return workbook
+
+def normalize_header(value):
+    """Normalize a header cell for alias matching"""
+    if value is None:
+        return ""
+    text = re.sub(r'[\u200e\u200f\u202a-\u202e:]', '', str(value))
+    return " ".join(text.split()).lower()
+
+def match_header(row, columns):
+    """Map field names to column indexes if the row is a header for `columns`"""
+    positions = {}
+    for index, cell in enumerate(row):
+        text = normalize_header(cell)
+        for field, aliases in columns.items():
+            if field not in positions and text in aliases:
+                positions[field] = index
+                break
+    return positions
+
+def cell_text(row, index):
+    """Return a stripped string cell value or None"""
+    if index is None or index >= len(row) or row[index] is None:
+        return None
+    text = re.sub(r'[\u200e\u200f\u202a-\u202e]', '', str(row[index])).strip()
+    return text or None
+
+def cell_number(row, index):
+    """Return a numeric cell value or None"""
+    if index is None or index >= len(row) or row[index] is None:
+        return None
+    value = row[index]
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return value
+    try:
+        number = float(str(value).replace(',', '').strip())
+    except ValueError:
+        return None
+    return int(number) if number.is_integer() else number
+
+def rate_type_for(code, declared=None):
+    """Resolve LABOR/MATERIAL/EQUIPMENT from a type cell or the code prefix"""
+    if declared:
+        declared = declared.strip()
+        if declared.upper() in TEMPLATE_SECTIONS:
+            return declared.upper()
+        if declared in RATE_TYPE_NAMES:
+            return RATE_TYPE_NAMES[declared]
+    for prefix, rate_type in RATE_TYPES.items():
+        if code.startswith(prefix):
+            return rate_type
+    return None
+
+def parse_rate_rows(rows, columns):
+    """Parse rate rows below a rate header"""
+    rates = []
+    for row in rows:
+        code = cell_text(row, columns.get("code"))
+        rate = cell_number(row, columns.get("rate"))
+        if not code or rate is None:
+            continue
+        rate_type = rate_type_for(code, cell_text(row, columns.get("type")))
+        if rate_type is None:
+            continue
+        record = {
+            "code": code,
+            "name_ar": cell_text(row, columns.get("name_ar")) or "",
+            "name_en": cell_text(row, columns.get("name_en")) or "",
+            "unit": cell_text(row, columns.get("unit")) or "",
+            "rate": rate,
+            "type": rate_type,
+        }
+        components = cell_text(row, columns.get("components"))
+        if components:
+            record["components"] = components
+        waste_factor = cell_number(row, columns.get("waste_factor"))
+        if waste_factor is not None:
+            record["waste_factor"] = waste_factor
+        rates.append(record)
+    return rates
+
+def parse_template_rows(fields, rows, columns):
+    """Parse component rows of a BOQ template sheet"""
+    template = {
+        "code": fields["code"],
+        "name_ar": fields.get("name_ar", ""),
+        "name_en": fields.get("name_en", ""),
+        "unit": fields.get("unit", ""),
+        "category": fields.get("category", ""),
+        "materials": [],
+        "labor": [],
+        "equipment": [],
+    }
+    for row in rows:
+        rate_code = cell_text(row, columns.get("rateCode"))
+        qty = cell_number(row, columns.get("qty"))
+        if not rate_code or qty is None:
+            continue
+        rate_type = rate_type_for(rate_code)
+        if rate_type is None:
+            continue
+        template[TEMPLATE_SECTIONS[rate_type]].append({
+            "rateCode": rate_code,
+            "qty": qty,
+            "description": cell_text(row, columns.get("description")) or "",
+        })
+    return template
+
+def parse_indirect_rows(rows, columns):
+    """Parse indirect cost rows below an indirect header"""
+    indirect_costs = []
+    for row in rows:
+        code = cell_text(row, columns.get("code"))
+        percentage = cell_number(row, columns.get("percentage"))
+        if not code or percentage is None:
+            continue
+        applies_to = cell_text(row, columns.get("applies_to")) or "ALL"
+        indirect_costs.append({
+            "code": code,
+            "name_ar": cell_text(row, columns.get("name_ar")) or "",
+            "name_en": cell_text(row, columns.get("name_en")) or "",
+            "percentage": percentage,
+            "applies_to": [part.strip() for part in applies_to.split(',') if part.strip()],
+        })
+    return indirect_costs
+
+def parse_sheet(rows):
+    """Classify a sheet from its header and parse its records.
+
+    `rows` is a row iterator; only the header scan is buffered, the data rows
+    are consumed as they stream. Returns (kind, records) or (None, []).
+    """
+    fields = {}
+    for _, row in zip(range(HEADER_SCAN_ROWS), rows):
+        columns = match_header(row, TEMPLATE_COLUMNS)
+        if "rateCode" in columns and "qty" in columns:
+            if not fields.get("code"):
+                return None, []
+            return "boq_templates", [parse_template_rows(fields, rows, columns)]
+        columns = match_header(row, INDIRECT_COLUMNS)
+        if "code" in columns and "percentage" in columns:
+            return "indirect_costs", parse_indirect_rows(rows, columns)
+        columns = match_header(row, RATE_COLUMNS)
+        if "code" in columns and "rate" in columns:
+            return "rates", parse_rate_rows(rows, columns)
+        # Label/value pairs above a template's component table
+        label = normalize_header(row[0]) if row else ""
+        for field, aliases in TEMPLATE_FIELDS.items():
+            if label in aliases and len(row) > 1:
+                fields[field] = cell_text(row, 1) or ""
+                break
+    return None, []
+
+def hashed_rows(rows, digest):
+    """Pass rows through while feeding them to a running hash
+
+    Trailing empty cells are left out of the hash: how far rows are padded
+    depends on the sheet's recorded dimension, not on its content.
+    """
+    for row in rows:
+        end = len(row)
+        while end and row[end - 1] is None:
+            end -= 1
+        digest.update(repr(row[:end]).encode('utf-8'))
+        yield row
+
+def iter_workbook_sheets(stream, skip=()):
+    """Yield (sheet_name, kind, records, values_hash) for each sheet, one sheet at a time
+
+    values_hash fingerprints the sheet's whole used range and is only computed
+    for sheets that hold records. Sheets named in `skip` are yielded as
+    (name, None, None, None) without reading their rows.
+    """
+    workbook = openpyxl.load_workbook(stream, read_only=True, data_only=True)
+    try:
+        for sheet in workbook.worksheets:
+            if sheet.title in skip:
+                yield sheet.title, None, None, None
+                continue
+            digest = hashlib.sha256()
+            rows = hashed_rows(sheet.iter_rows(values_only=True), digest)
+            kind, records = parse_sheet(rows)
+            if kind is None:
+                yield sheet.title, None, [], None
+                continue
+            for _ in rows:
+                pass
+            yield sheet.title, kind, records, digest.hexdigest()
+    finally:
+        workbook.close()
+
+def sheet_part_fingerprints(stream):
+    """Fingerprint each sheet's XML part from the zip directory.
+
+    CRC and size come from the central directory, so nothing is decompressed.
+    Returns ({sheet_name: fingerprint}, shared_fingerprint), or ({}, None) if
+    the package layout is not the standard one.
+    """
+    try:
+        with zipfile.ZipFile(stream) as archive:
+            names = set(archive.namelist())
+
+            def part(name):
+                info = archive.getinfo(name)
+                return f"{info.CRC:08x}:{info.file_size}"
+
+            workbook = ET.fromstring(archive.read("xl/workbook.xml"))
+            rels = ET.fromstring(archive.read("xl/_rels/workbook.xml.rels"))
+            targets = {rel.get("Id"): rel.get("Target") for rel in rels.iter(f"{{{PACKAGE_REL_NS}}}Relationship")}
+            sheets = {}
+            for sheet in workbook.iter(f"{{{SPREADSHEET_NS}}}sheet"):
+                target = targets.get(sheet.get(f"{{{RELATIONSHIP_NS}}}id"), "")
+                name = target.lstrip("/") if target.startswith("/") else f"xl/{target}"
+                if name in names:
+                    sheets[sheet.get("name")] = part(name)
+            shared = ",".join(part(name) for name in SHARED_PARTS if name in names)
+    except (KeyError, ET.ParseError, zipfile.BadZipFile):
+        return {}, None
+    return sheets, shared
+
+def reference_rates():
+    """Hand-maintained rate catalog used for English names and as a fallback"""
+    return extract_labor_rates() + extract_material_rates() + extract_equipment_rates()
+
+def reusable_sheets(previous, parts, shared):
+    """Previous sheets that can be reused without reading them.
+
+    A sheet qualifies when the shared parts and its own XML part are unchanged
+    and its records were recorded with its fingerprint (older fingerprint
+    files only listed codes).
+    """
+    if not previous or shared is None or previous.get("shared") != shared:
+        return {}
+    return {
+        sheet["title"]: sheet
+        for sheet in previous["sheets"]
+        if parts.get(sheet["title"]) == sheet["part"] and "records" in sheet
+    }
+
+def extract_workbook(file_path, password=PASSWORD, cache_dir=CACHE_DIR, cache_max_bytes=CACHE_MAX_BYTES, spool=False,
+                     previous=None, recorder=None):
+    """Extract rates, BOQ templates and indirect costs from an encrypted workbook
+
+    Pass cache_dir=None to bypass the decrypted-workbook cache; the workbook
+    is then decrypted in memory, or into a memory-mapped temp file with spool=True.
+
+    `previous` is this workbook's entry from the last run's fingerprint file, or
+    its last extraction. Sheets whose fingerprint is unchanged are spliced from
+    the records this workbook produced for them then instead of re-parsed, so
+    what other workbooks contributed to the merged seed never leaks in. The
+    returned "sheets" list holds the fingerprints and records to keep for next time.
+    `recorder` (a StageRecorder) times the decrypt and sheet_parse stages.
+    """
+    recorder = recorder or StageRecorder()
+    with recorder.stage("decrypt") as stats:
+        if cache_dir is None:
+            workbook = decrypt_excel(file_path, password, spool)
+        else:
+            workbook = decrypt_excel_cached(file_path, password, cache_dir, cache_max_bytes)
+        stats["bytes"] = os.path.getsize(file_path)
+
+    # A cached workbook is an open file; closing it lets eviction reclaim the entry
+    with workbook:
+        parts, shared = sheet_part_fingerprints(workbook)
+        reusable = reusable_sheets(previous, parts, shared)
+        previous_values = {sheet["title"]: sheet["values"] for sheet in (previous or {}).get("sheets", [])}
+
+        reference = {rate["code"]: rate for rate in reference_rates()}
+        extracted = {"rates": [], "boq_templates": [], "indirect_costs": [], "shared": shared, "sheets": []}
+        with recorder.stage("sheet_parse") as stats:
+            for sheet_name, kind, records, values in iter_workbook_sheets(workbook, skip=reusable):
+                if sheet_name in reusable:
+                    sheet = dict(reusable[sheet_name], status="reused")
+                    kind, records = sheet["kind"], sheet["records"]
+                elif kind is None:
+                    continue
+                else:
+                    if kind == "rates":
+                        for record in records:
+                            if not record["name_en"] and record["code"] in reference:
+                                record["name_en"] = reference[record["code"]]["name_en"]
+                    status = "reused" if previous_values.get(sheet_name) == values else "rebuilt"
+                    sheet = {
+                        "title": sheet_name,
+                        "part": parts.get(sheet_name),
+                        "values": values,
+                        "kind": kind,
+                        "records": records,
+                        "status": status,
+                    }
+                extracted[kind].extend(records)
+                extracted["sheets"].append(sheet)
+                print(f"  {Path(file_path).name} / {sheet_name}: {len(records)} {kind} ({sheet['status']})")
+                stats["rows"] = stats.get("rows", 0) + len(records)
+    return extracted
+
+def expand_workbook_paths(specs):
+    """Expand files, directories and glob patterns into a sorted list of workbooks"""
+    paths = set()
+    for spec in specs:
+        if os.path.isdir(spec):
+            paths.update(str(path) for path in Path(spec).glob("*.xlsx"))
+        elif glob.has_magic(spec):
+            paths.update(glob.glob(spec, recursive=True))
+        else:
+            paths.add(spec)
+    # Excel lock files (~$name.xlsx) appear next to open workbooks
+    return sorted(path for path in paths if not Path(path).name.startswith("~$"))
+
+def runs_in_pool(paths, jobs, recorder=None):
+    """Whether extract_workbooks() hands the workbooks to worker processes
+
+    A cProfile-ing recorder keeps them in this process: profiles cannot be
+    merged across processes the way stage times are.
+    """
+    return len(paths) > 1 and jobs != 1 and not (recorder and recorder.profile)
+
+def extract_workbook_stages(path, password, cache_dir, cache_max_bytes, spool, previous, trace_memory):
+    """extract_workbook() in a worker process with its own recorder; returns (extracted, its stages)"""
+    recorder = StageRecorder(enabled=True, trace_memory=trace_memory)
+    extracted = extract_workbook(path, password, cache_dir, cache_max_bytes, spool, previous, recorder)
+    return extracted, recorder.stages
+
+def extract_workbooks(paths, password=PASSWORD, cache_dir=CACHE_DIR, cache_max_bytes=CACHE_MAX_BYTES,
+                      spool=False, jobs=None, previous=None, recorder=None):
+    """Extract several workbooks in a process pool, one worker per workbook.
+
+    Returns [(path, extracted)] in the order of `paths` regardless of which
+    worker finishes first, so merging stays deterministic. `previous` maps
+    each workbook_key() to its fingerprints from the last run (see extract_workbook).
+    With an enabled `recorder` each worker records its own stages and they
+    are merged into `recorder`; one that also profiles runs the workbooks in
+    this process, one after the other (see runs_in_pool).
+    """
+    previous = previous or {}
+    if not runs_in_pool(paths, jobs, recorder):
+        return [
+            (path, extract_workbook(path, password, cache_dir, cache_max_bytes, spool,
+                                    previous.get(workbook_key(path)), recorder))
+            for path in paths
+        ]
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        if not (recorder and recorder.enabled):
+            futures = [
+                pool.submit(extract_workbook, path, password, cache_dir, cache_max_bytes, spool,
+                            previous.get(workbook_key(path)))
+                for path in paths
+            ]
+            return [(path, future.result()) for path, future in zip(paths, futures)]
+        futures = [
+            pool.submit(extract_workbook_stages, path, password, cache_dir, cache_max_bytes, spool,
+                        previous.get(workbook_key(path)), recorder.trace_memory)
+            for path in paths
+        ]
+        results = []
+        for path, future in zip(paths, futures):
+            extracted, stages = future.result()
+            recorder.merge(stages)
+            results.append((path, extracted))
+        return results
+
+def merge_extractions(results):
+    """Merge per-workbook extractions into one seed.
+
+    Records are keyed by code; the first workbook in path order wins and any
+    later workbook with a different record for the same code is reported as
+    a conflict. Identical duplicates are dropped silently.
+    """
+    merged = {"rates": [], "boq_templates": [], "indirect_costs": []}
+    owners = {}
+    conflicts = []
+    for path, extracted in results:
+        for kind, records in merged.items():
+            for record in extracted[kind]:
+                key = (kind, record["code"])
+                if key not in owners:
+                    owners[key] = (path, record)
+                    records.append(record)
+                    continue
+                owner_path, owner = owners[key]
+                if owner != record:
+                    conflicts.append({
+                        "kind": kind,
+                        "code": record["code"],
+                        "kept": owner_path,
+                        "ignored": path,
+                        "fields": sorted(field for field in owner.keys() | record.keys()
+                                         if owner.get(field) != record.get(field)),
+                    })
+
+    type_order = list(TEMPLATE_SECTIONS)
+    merged["rates"].sort(key=lambda rate: type_order.index(rate["type"]))
+    if not merged["indirect_costs"]:
+        merged["indirect_costs"] = extract_indirect_costs()
+    return merged, conflicts
+
+def fingerprint_path(output_path):
+    """Sheet fingerprints live next to the seed they describe"""
+    output_path = Path(output_path)
+    return output_path.with_name(f"{output_path.stem}.fingerprints.json")
+
+def workbook_key(path):
+    """Fingerprints are keyed by resolved path, however the workbook was named on the command line"""
+    return str(Path(path).resolve())
+
+def load_previous_run(output_path):
+    """Load the last run's per-workbook sheet fingerprints and records, if recorded"""
+    fingerprints = fingerprint_path(output_path)
+    if not fingerprints.exists():
+        return {}
+    with open(fingerprints, 'r', encoding='utf-8') as f:
+        return json.load(f)["workbooks"]
+
+def write_fingerprints(output_path, results):
+    """Record each workbook's sheet fingerprints and records for the next incremental run"""
+    workbooks = {
+        workbook_key(path): {
+            "shared": extracted["shared"],
+            "sheets": [
+                {key: value for key, value in sheet.items() if key != "status"}
+                for sheet in extracted["sheets"]
+            ],
+        }
+        for path, extracted in results
+    }
+    with open(fingerprint_path(output_path), 'w', encoding='utf-8') as f:
+        json.dump({"generated_at": datetime.now().isoformat(), "workbooks": workbooks}, f, ensure_ascii=False, indent=2)
+
+def print_sheet_summary(results):
+    """Print which sheets were reused from the last run and which were rebuilt"""
+    for status in ("reused", "rebuilt"):
+        sheets = [
+            f"{Path(path).name} / {sheet['title']}"
+            for path, extracted in results
+            for sheet in extracted["sheets"]
+            if sheet["status"] == status
+        ]
+        print(f"{status.capitalize()} sheets ({len(sheets)}): {', '.join(sheets) or '-'}")
+
+def write_changeset(changeset_dir, changeset):
+    """Write the changeset as JSON and as SQL to apply to a database loaded from the previous seed"""
+    changeset_dir = Path(changeset_dir)
+    changeset_dir.mkdir(parents=True, exist_ok=True)
+    with open(changeset_dir / "changeset.json", 'w', encoding='utf-8') as f:
+        json.dump(changeset, f, ensure_ascii=False, indent=2)
+    write_changeset_sql(changeset_dir / "changeset.sql", changeset)
+
+def print_changeset_summary(changeset_dir, changeset):
+    counts = ", ".join(
+        f"{section} +{summary['inserted']} ~{summary['updated']} -{summary['retired']}"
+        for section, summary in changeset["summary"].items()
+    )
+    print(f"✓ Changeset in {changeset_dir}: {counts}")
+
+def print_conflicts(conflicts):
+    """Print codes that appear with different values in more than one workbook"""
+    if not conflicts:
+        return
+    print(f"\n⚠ {len(conflicts)} conflicting codes across workbooks (first workbook kept):")
+    for conflict in conflicts:
+        print(f"  {conflict['kind']} {conflict['code']}: kept {conflict['kept']}, "
+              f"ignored {conflict['ignored']} (differs in {', '.join(conflict['fields'])})")
+
 def extract_labor_rates():
     """Extract labor rates from Sheet 16"""
     # Data extracted from Excel Sheet 16
@@ -369,38 +1115,117 @@ def extract_indirect_costs():
     ]
     return indirect_costs
 
-def main():
-    print("Extracting data from Excel files...")
+def parse_args():
+    parser = argparse.ArgumentParser(description="Extract Smart Estimate seed data from the cost workbook")
+    parser.add_argument("workbooks", nargs="*",
+                        help="Password-protected .xlsx workbooks, directories of workbooks, or glob patterns")
+    parser.add_argument("--jobs", type=int, default=None,
+                        help="Worker processes for multi-workbook extraction (default: CPU count)")
+    parser.add_argument("--password", default=PASSWORD, help="Workbook password")
+    parser.add_argument("--no-cache", action="store_true", help="Always decrypt, bypassing the decrypted-workbook cache")
+    parser.add_argument("--cache-dir", default=str(CACHE_DIR), help="Decrypted-workbook cache directory")
+    parser.add_argument("--cache-size-mb", type=int, default=CACHE_MAX_BYTES // (1024 * 1024),
+                        help="Evict least recently used cache entries above this size")
+    parser.add_argument("--spool", action="store_true",
+                        help="Decrypt to a memory-mapped temp file instead of memory; bypasses the cache like --no-cache")
+    parser.add_argument("--format", choices=("ndjson", "json"), default="ndjson",
+                        help="ndjson: a seed directory with one file per section and a manifest; "
+                             "json: the single indented seed-data.json (compatibility)")
+    parser.add_argument("--output", default=None,
+                        help="Seed directory (ndjson) or file (json) to write "
+                             "(default: scripts/seed-data or scripts/seed-data.json)")
+    parser.add_argument("--full", action="store_true",
+                        help="Re-parse every sheet, ignoring fingerprints from the previous run")
+    parser.add_argument("--sql-dir", default=None,
+                        help="Also write per-table COPY files, load.sql and batched inserts.sql for Postgres")
+    parser.add_argument("--changeset", default=None, metavar="DIR",
+                        help="Diff against the seed being replaced and write changeset.json and changeset.sql "
+                             "(upserts of inserted/updated records, deactivation of retired ones) to DIR")
+    parser.add_argument("--history", nargs="?", const=str(HISTORY_PATH), default=None, metavar="STORE",
+                        help=f"Also append the extracted rates to a rate history store (default store: {HISTORY_PATH})")
+    parser.add_argument("--effective-date", default=date.today().isoformat(),
+                        help="Date the extracted rates take effect in the history, with --history (YYYY-MM-DD)")
+    add_profile_arguments(parser)
+    return parser.parse_args()
 
-    # Combine all rates
-    all_rates = []
-    all_rates.extend(extract_labor_rates())
-    all_rates.extend(extract_material_rates())
-    all_rates.extend(extract_equipment_rates())
+def default_output(seed_format):
+    name = "seed-data.json" if seed_format == "json" else "seed-data"
+    return str(Path(__file__).parent / name)
 
-    # Get BOQ templates
-    boq_templates = extract_boq_templates()
+def main():
+    args = parse_args()
+    output_path = args.output or default_output(args.format)
+    recorder = recorder_from_args(args)
+    serialized = False
 
-    # Get indirect costs
-    indirect_costs = extract_indirect_costs()
+    if args.workbooks:
+        paths = expand_workbook_paths(args.workbooks)
+        if not paths:
+            raise SystemExit(f"No workbooks found in: {' '.join(args.workbooks)}")
+        print(f"Extracting data from {len(paths)} workbook(s)...")
+        serialized = runs_in_pool(paths, args.jobs) and not runs_in_pool(paths, args.jobs, recorder)
+        if serialized:
+            print("⚠ --cprofile extracts the workbooks one after another in this process; --jobs is ignored")
+        # A spooled workbook is decrypted on every run, so it never goes through the cache
+        cache_dir = None if args.no_cache or args.spool else args.cache_dir
+        previous = {} if args.full else load_previous_run(output_path)
+        results = extract_workbooks(paths, args.password, cache_dir, args.cache_size_mb * 1024 * 1024,
+                                    args.spool, args.jobs, previous, recorder)
+        with recorder.stage("transform") as stats:
+            extracted, conflicts = merge_extractions(results)
+            stats["rows"] = sum(len(extracted[kind]) for kind in ("rates", "boq_templates", "indirect_costs"))
+        print_conflicts(conflicts)
+        all_rates = extracted["rates"]
+        boq_templates = extracted["boq_templates"]
+        indirect_costs = extracted["indirect_costs"]
+    else:
+        print("No workbook given, using the reference catalog...")
+        all_rates = reference_rates()
+        boq_templates = extract_boq_templates()
+        indirect_costs = extract_indirect_costs()
 
-    # Generate JSON output
-    output = {
+    # Save the seed, section by section
+    sections = {
         "rates": all_rates,
         "boq_templates": boq_templates,
         "indirect_costs": indirect_costs,
-        "generated_at": datetime.now().isoformat(),
     }
-
-    # Save to JSON file
-    output_path = "/Users/walidelhelw/AI/Future/future-cost-control/scripts/seed-data.json"
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(output, f, ensure_ascii=False, indent=2)
+    if args.changeset:
+        with recorder.stage("diff"):
+            # Read the previous seed before it is replaced
+            previous_seed = load_seed(output_path) if seed_exists(output_path) else {}
+            changeset = diff_seeds(previous_seed, sections, seed_base(output_path) if previous_seed else None)
+    with recorder.stage("write") as stats:
+        if args.format == "json":
+            write_seed_json(output_path, sections)
+        else:
+            write_seed_dir(output_path, sections)
+        if args.workbooks:
+            write_fingerprints(output_path, results)
+        if args.sql_dir:
+            table_counts = write_sql_dir(args.sql_dir, sections)
+        if args.changeset:
+            write_changeset(args.changeset, changeset)
+        stats["rows"] = sum(len(records) for records in sections.values())
+    if args.history:
+        with recorder.stage("history") as stats:
+            history = rate_store.connect(args.history)
+            versions = rate_store.append_snapshot(history, all_rates, args.effective_date,
+                                                  source=" ".join(args.workbooks) or "reference catalog")
+            history.close()
+            stats["rows"] = versions
 
     print(f"\n✓ Extracted {len(all_rates)} rates")
     print(f"✓ Extracted {len(boq_templates)} BOQ templates")
     print(f"✓ Extracted {len(indirect_costs)} indirect cost configs")
     print(f"\n✓ Saved to: {output_path}")
+    if args.sql_dir:
+        tables = ", ".join(f"{table} ({count})" for table, count in table_counts.items())
+        print(f"✓ Postgres load files in {args.sql_dir}: {tables}")
+    if args.changeset:
+        print_changeset_summary(args.changeset, changeset)
+    if args.history:
+        print(f"✓ Rate history {args.history}: {versions} changed rates effective {args.effective_date}")
 
     # Print summary
     print("\n" + "="*60)
@@ -410,6 +1235,17 @@ def main():
     print(f"Material rates: {len([r for r in all_rates if r['type'] == 'MATERIAL'])}")
     print(f"Equipment rates: {len([r for r in all_rates if r['type'] == 'EQUIPMENT'])}")
     print(f"BOQ Templates: {len(boq_templates)}")
+    if args.workbooks:
+        print_sheet_summary(results)
+    # With a process pool the workbooks are parsed in the workers, not here
+    peak, worker_peak = peak_rss_mb(), None
+    if args.workbooks and runs_in_pool(paths, args.jobs, recorder):
+        worker_peak = peak_rss_mb(resource.RUSAGE_CHILDREN)
+        print(f"Peak memory: {peak:.1f} MB main process, {worker_peak:.1f} MB largest worker")
+    else:
+        print(f"Peak memory: {peak:.1f} MB")
+    finish_profile(recorder, args, "extract-excel-data", workbooks=args.workbooks, peakRssMB=peak,
+                   workerPeakRssMB=worker_peak, serialized=serialized)
 
 if __name__ == "__main__":
     main()
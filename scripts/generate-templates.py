@@ -1,90 +1,115 @@
 #!/usr/bin/env python3
 """
-Generate productivity-templates.ts from extracted-productivity.json
+Generate productivity-templates.ts and its per-category modules from extracted-productivity.json
 """
 
+import argparse
 import json
 import re
+import statistics
+import unicodedata
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 
-# Load extracted data
-data_path = Path(__file__).parent.parent / "src/data/extracted-productivity.json"
-with open(data_path, 'r', encoding='utf-8') as f:
-    items = json.load(f)
+from seed_store import atomic_writer
+from stage_profile import StageRecorder, add_profile_arguments, finish_profile, recorder_from_args
+
+DATA_PATH = Path(__file__).parent.parent / "src/data/extracted-productivity.json"
+OUTPUT_PATH = Path(__file__).parent.parent / "src/data/productivity-templates.ts"
+CREW_ROLES_PATH = Path(__file__).parent.parent / "src/data/crew-roles.ts"
+
+# RTL/LTR marks and embeddings left over from the Excel export
+BIDI_MARKS_RE = re.compile(r'[\u200e\u200f\u202a-\u202e]')
 
 def clean_text(text):
     """Remove RTL markers and extra whitespace"""
     if not text:
         return ""
-    # Remove RTL/LTR markers
-    text = re.sub(r'[\u200e\u200f\u202a-\u202e]', '', text)
-    return text.strip()
+    return BIDI_MARKS_RE.sub('', text).strip()
 
-def parse_crew(crew_str):
-    """Parse crew string into structured format"""
-    if not crew_str:
-        return []
+# Crew notation: terms of an optional count and a role word, joined by "+"
+# or the conjunction "و" (which may be glued to the next term: "و4مساعد").
+# Each role maps to (roleCode, description, default qty).
+CREW_ROLES = {
+    'صناعي': ('LAB-PLUMBER', 'صناعي', 1),
+    'كهربائي': ('LAB-ELECTRICIAN', 'كهربائي', 1),
+    'نجار': ('LAB-CARPENTER-FW', 'نجار', 1),
+    'نحات': ('LAB-DEMOLITION', 'نحات', 1),
+    'ماكينة': ('EQP-COMPRESSOR', 'ماكينة', 1),
+    'عامل': ('LAB-GENERAL', 'عامل', 1),
+    'مساعد': ('LAB-GENERAL', 'مساعد', 1),
+    'مجموعة عمل': ('LAB-GENERAL', 'مجموعة عمل', 3),
+}
 
-    crew_str = clean_text(crew_str)
-    if not crew_str:
-        return []
+# Spelling variants in the sheets (final ى for ي, plurals) and their role word
+CREW_WORDS = {
+    'صناعي': 'صناعي', 'صناعيى': 'صناعي', 'صنايعي': 'صناعي', 'صنايعى': 'صناعي',
+    'كهربائي': 'كهربائي', 'كهربائى': 'كهربائي',
+    'نجار': 'نجار', 'نجارين': 'نجار',
+    'نحات': 'نحات', 'نحاتين': 'نحات',
+    'ماكينة': 'ماكينة', 'ماكينه': 'ماكينة',
+    'عامل': 'عامل', 'عمال': 'عامل',
+    'مساعد': 'مساعد', 'مساعدين': 'مساعد',
+    'مجموعة عمل': 'مجموعة عمل', 'مجموعه عمل': 'مجموعة عمل',
+}
+
+# Tradesmen whose helpers are priced as their own assistant role
+CREW_ASSISTANTS = {
+    'صناعي': 'LAB-PLUMBER-ASST',
+    'كهربائي': 'LAB-ELECTRICIAN-ASST',
+    'نجار': 'LAB-GENERAL',
+}
+
+# Longest crew the grammar accepts; every term gets its own capture groups so
+# a single fullmatch both validates the string and extracts all terms.
+MAX_CREW_TERMS = 6
+
+def _crew_grammar():
+    words = '|'.join(sorted((re.escape(word) for word in CREW_WORDS), key=len, reverse=True))
+    term = rf'(\d+)?\s*({words})'
+    pattern = ''
+    for _ in range(MAX_CREW_TERMS - 1):
+        pattern = rf'(?:\s*(?:\+|و)\s*{term}{pattern})?'
+    return re.compile(term + pattern)
 
+CREW_GRAMMAR_RE = _crew_grammar()
+
+@lru_cache(maxsize=65536)
+def _parse_crew_cached(crew_str):
+    """Parse a raw crew string into a tuple of (roleCode, qty, description)"""
+    match = CREW_GRAMMAR_RE.fullmatch(clean_text(crew_str))
+    if not match:
+        return ()
+
+    groups = match.groups()
+    lead = CREW_WORDS[groups[1]]
     crew = []
+    for position in range(0, len(groups), 2):
+        count, word = groups[position:position + 2]
+        if word is None:
+            break
+        role = CREW_WORDS[word]
+        role_code, description, default_qty = CREW_ROLES[role]
+        if position and lead in CREW_ASSISTANTS and role in ('مساعد', 'عامل'):
+            # A tradesman's helpers are only counted when the sheet gives
+            # their number ("صناعيى و4مساعد"); "صناعيى ومساعد" has always
+            # priced as the tradesman alone.
+            if not count:
+                continue
+            role_code = CREW_ASSISTANTS[lead]
+        crew.append((role_code, int(count) if count else default_qty, description))
+    return tuple(crew)
 
-    # Common patterns
-    patterns = [
-        (r'(\d+)\s*عامل', 'LAB-GENERAL', 'عامل'),
-        (r'(\d+)\s*مساعد', 'LAB-GENERAL', 'مساعد'),
-        (r'صناعيى\s*و\s*(\d+)\s*مساعد', 'LAB-PLUMBER', 'صناعي'),  # Will add assistants
-        (r'كهربائى\s*و\s*(\d+)\s*مساعد', 'LAB-ELECTRICIAN', 'كهربائي'),
-        (r'نجار\s*\+\s*(\d+)\s*عامل', 'LAB-CARPENTER-FW', 'نجار'),
-        (r'نحات\s*\+\s*عامل', 'LAB-DEMOLITION', 'نحات'),
-        (r'(\d+)\s*نحات', 'LAB-DEMOLITION', 'نحات'),
-        (r'نحات', 'LAB-DEMOLITION', 'نحات'),
-        (r'ماكينة\s*\+\s*عامل', 'LAB-GENERAL', 'عامل'),
-        (r'مجموعة عمل', 'LAB-GENERAL', 'مجموعة عمل'),
+def parse_crew(crew_str):
+    """Parse crew string into structured format"""
+    if not crew_str:
+        return []
+    return [
+        {'roleCode': role_code, 'qty': qty, 'description': description}
+        for role_code, qty, description in _parse_crew_cached(crew_str)
     ]
 
-    # Try to match patterns
-    if 'صناعيى و' in crew_str:
-        crew.append({'roleCode': 'LAB-PLUMBER', 'qty': 1, 'description': 'صناعي'})
-        match = re.search(r'(\d+)\s*مساعد', crew_str)
-        if match:
-            crew.append({'roleCode': 'LAB-PLUMBER-ASST', 'qty': int(match.group(1)), 'description': 'مساعد'})
-    elif 'كهربائى و' in crew_str:
-        crew.append({'roleCode': 'LAB-ELECTRICIAN', 'qty': 1, 'description': 'كهربائي'})
-        match = re.search(r'(\d+)\s*مساعد', crew_str)
-        if match:
-            crew.append({'roleCode': 'LAB-ELECTRICIAN-ASST', 'qty': int(match.group(1)), 'description': 'مساعد'})
-    elif 'صناعيى ومساعد' in crew_str:
-        crew.append({'roleCode': 'LAB-CRAFTSMAN', 'qty': 1, 'description': 'صناعي'})
-        crew.append({'roleCode': 'LAB-GENERAL', 'qty': 1, 'description': 'مساعد'})
-    elif 'نجار+' in crew_str or 'نجار +' in crew_str:
-        crew.append({'roleCode': 'LAB-CARPENTER-FW', 'qty': 1, 'description': 'نجار'})
-        match = re.search(r'(\d+)\s*عامل', crew_str)
-        if match:
-            crew.append({'roleCode': 'LAB-GENERAL', 'qty': int(match.group(1)), 'description': 'عامل'})
-    elif 'نحات+عامل' in crew_str or 'نحات + عامل' in crew_str:
-        crew.append({'roleCode': 'LAB-DEMOLITION', 'qty': 1, 'description': 'نحات'})
-        crew.append({'roleCode': 'LAB-GENERAL', 'qty': 1, 'description': 'عامل'})
-    elif re.match(r'^\d+نحات$', crew_str.replace(' ', '')):
-        match = re.search(r'(\d+)', crew_str)
-        if match:
-            crew.append({'roleCode': 'LAB-DEMOLITION', 'qty': int(match.group(1)), 'description': 'نحات'})
-    elif crew_str == 'نحات':
-        crew.append({'roleCode': 'LAB-DEMOLITION', 'qty': 1, 'description': 'نحات'})
-    elif 'ماكينة' in crew_str:
-        crew.append({'roleCode': 'EQP-COMPRESSOR', 'qty': 1, 'description': 'ماكينة'})
-        crew.append({'roleCode': 'LAB-GENERAL', 'qty': 1, 'description': 'عامل'})
-    elif 'مجموعة عمل' in crew_str:
-        crew.append({'roleCode': 'LAB-GENERAL', 'qty': 3, 'description': 'مجموعة عمل'})
-    elif re.match(r'^\d+عامل$', crew_str.replace(' ', '')):
-        match = re.search(r'(\d+)', crew_str)
-        if match:
-            crew.append({'roleCode': 'LAB-GENERAL', 'qty': int(match.group(1)), 'description': 'عامل'})
-
-    return crew
-
 def generate_id(category, index, description):
     """Generate unique ID"""
     prefix_map = {
@@ -117,28 +142,318 @@ def generate_code(category, index):
     prefix = prefix_map.get(category, 'GEN')
     return f"{prefix}-{index:03d}"
 
-# Group by category
-by_category = {}
-for item in items:
-    cat = item['category']
-    if cat not in by_category:
-        by_category[cat] = []
-    by_category[cat].append(item)
+category_names = {
+    'site-services': 'أعمال تخديمية - Site Services',
+    'pipe-installation': 'تركيب المواسير - Pipe Installation',
+    'electrical': 'أعمال الكهرباء - Electrical Works',
+    'steel-works': 'أعمال الحديد - Steel Works',
+    'metal-works': 'الأعمال المعدنية - Metal Works',
+    'carpentry': 'أعمال الخشب - Carpentry',
+    'aluminum': 'أعمال الألومنيوم - Aluminum Works',
+    'landscape': 'أعمال الاند اسكيب - Landscape',
+    'elevator': 'أعمال الأسانسير - Elevator Works',
+}
 
-# Generate TypeScript
-output = '''/**
- * Productivity Templates - BOQTemplate Data with Productivity Rates
- *
- * Contains ALL productivity data extracted from the Excel workbook (الانتاجيات).
- * Total: ''' + str(len(items)) + ''' templates from 9 sheets.
- *
- * Each template includes:
- * - productivity_rate: units produced per crew per day
- * - crew: labor roles needed with quantities
- * - source: origin of the productivity data (sheet name)
+def group_by_category(items):
+    """Group items by category, keeping first-seen order"""
+    by_category = {}
+    for item in items:
+        cat = item['category']
+        if cat not in by_category:
+            by_category[cat] = []
+        by_category[cat].append(item)
+    return by_category
+
+def index_runs(indexes):
+    """Compress sorted array indexes into [start, count] runs"""
+    runs = []
+    for index in indexes:
+        if runs and runs[-1][0] + runs[-1][1] == index:
+            runs[-1][1] += 1
+        else:
+            runs.append([index, 1])
+    return runs
+
+def render_lookup_indexes(rows):
+    """Render lookup indexes over productivityTemplates.
+
+    `rows` holds (categoryId, source, isActive) in array order. Category and
+    source members are emitted as runs of array positions, which stay a few
+    bytes per category since the array is grouped by category. The id/code
+    maps are built once at module load from the id/code columns: emitting
+    them would repeat every key already in the data.
+    """
+    by_category = {}
+    by_source = {}
+    for index, (cat_id, source, is_active) in enumerate(rows):
+        if is_active:
+            by_category.setdefault(cat_id, []).append(index)
+            by_source.setdefault(source, []).append(index)
+
+    def runs_map(mapping):
+        return ',\n'.join(
+            f"  ['{key}', [{', '.join(f'[{start}, {count}]' for start, count in index_runs(indexes))}]]"
+            for key, indexes in mapping.items()
+        )
+
+    return f'''// ========================================
+// Lookup Indexes (built by generate-templates.py)
+// ========================================
+
+// Active templates per category/source as [start, count] runs of array positions
+const activeRunsByCategory = new Map<string, [number, number][]>([
+{runs_map(by_category)}
+]);
+
+const activeRunsBySource = new Map<string, [number, number][]>([
+{runs_map(by_source)}
+]);
+''' + '''
+// First occurrence wins, as with the .find() lookups these replace
+function buildKeyIndex(keys: string[]): Map<string, number> {
+  const index = new Map<string, number>();
+  keys.forEach((key, i) => {
+    if (!index.has(key)) index.set(key, i);
+  });
+  return index;
+}
+
+const templateIndexById = buildKeyIndex(templateIds);
+const templateIndexByCode = buildKeyIndex(templateCodes);
+
+function templatesInRuns(runs: [number, number][] | undefined): ProductivityTemplate[] {
+  const templates: ProductivityTemplate[] = [];
+  for (const [start, count] of runs ?? []) {
+    for (let i = start; i < start + count; i++) templates.push(templateAt(i));
+  }
+  return templates;
+}
+'''
+
+# Search normalization, mirrored by normalizeSearchText() in the generated TS:
+# drop harakat, tatweel and bidi marks, fold letter variants, and reduce
+# everything that is not an Arabic letter, a-z or a digit to single spaces.
+SEARCH_STRIP_PATTERN = r'[\u064b-\u065f\u0670\u0640\u200c-\u200f\u202a-\u202e]'
+SEARCH_SPLIT_PATTERN = r'[^0-9a-z\u0621-\u064a]+'
+SEARCH_CHAR_MAP = {
+    'أ': 'ا', 'إ': 'ا', 'آ': 'ا', 'ٱ': 'ا',
+    'ى': 'ي', 'ی': 'ي', 'ئ': 'ي',
+    'ة': 'ه', 'ؤ': 'و', 'ک': 'ك',
+    **{chr(0x0660 + d): str(d) for d in range(10)},
+    **{chr(0x06F0 + d): str(d) for d in range(10)},
+}
+SEARCH_STRIP_RE = re.compile(SEARCH_STRIP_PATTERN)
+SEARCH_SPLIT_RE = re.compile(SEARCH_SPLIT_PATTERN)
+SEARCH_TRANSLATION = str.maketrans(SEARCH_CHAR_MAP)
+SEARCH_GRAM = 3
+
+def normalize_search_text(text):
+    """Normalize Arabic/English text for search keys and queries"""
+    text = unicodedata.normalize('NFKC', text or '').lower()
+    text = SEARCH_STRIP_RE.sub('', text).translate(SEARCH_TRANSLATION)
+    return SEARCH_SPLIT_RE.sub(' ', text).strip()
+
+def search_grams(key):
+    """Distinct character n-grams of a normalized key"""
+    return {key[i:i + SEARCH_GRAM] for i in range(len(key) - SEARCH_GRAM + 1)}
+
+def wrap_entries(entries, per_line=8, indent='  '):
+    """Join TS literal entries, a few per line"""
+    lines = [', '.join(entries[i:i + per_line]) for i in range(0, len(entries), per_line)]
+    return ',\n'.join(f"{indent}{line}" for line in lines)
+
+def to_base36(value):
+    digits = '0123456789abcdefghijklmnopqrstuvwxyz'
+    text = ''
+    while True:
+        value, digit = divmod(value, 36)
+        text = digits[digit] + text
+        if not value:
+            return text
+
+def render_search_index(search_keys):
+    """Render normalized search keys and a trigram inverted index.
+
+    Postings are packed into one string, "gram:p,p,p|gram:...", with array
+    positions delta-encoded in base 36; grams never contain ':' or '|' since
+    normalized keys hold only letters, digits and spaces.
+    """
+    postings = {}
+    for index, key in enumerate(search_keys):
+        for gram in search_grams(key):
+            postings.setdefault(gram, []).append(index)
+
+    entries = []
+    for gram in sorted(postings):
+        previous = 0
+        deltas = []
+        for index in postings[gram]:
+            deltas.append(to_base36(index - previous))
+            previous = index
+        entries.append(f"{gram}:{','.join(deltas)}")
+
+    char_map = ', '.join(f"'{source}': '{target}'" for source, target in SEARCH_CHAR_MAP.items())
+    char_class = ''.join(SEARCH_CHAR_MAP)
+    keys = wrap_entries([f"'{key}'" for key in search_keys], per_line=4)
+    return f'''// ========================================
+// Search Index (built by generate-templates.py)
+// ========================================
+
+const SEARCH_CHAR_MAP: Record<string, string> = {{ {char_map} }};
+
+// Keep in sync with normalize_search_text() in scripts/generate-templates.py
+export function normalizeSearchText(text: string): string {{
+  return text
+    .normalize('NFKC')
+    .toLowerCase()
+    .replace(/{SEARCH_STRIP_PATTERN}/g, '')
+    .replace(/[{char_class}]/g, c => SEARCH_CHAR_MAP[c])
+    .replace(/{SEARCH_SPLIT_PATTERN}/g, ' ')
+    .trim();
+}}
+
+// Normalized nameAr per template, in array order (generated templates have no nameEn)
+const searchKeys: string[] = [
+{keys}
+];
+
+// {SEARCH_GRAM}-gram postings: "gram:p,p|..." with positions delta-encoded in base 36
+const searchIndexData = '{'|'.join(entries)}';
+const SEARCH_GRAM = {SEARCH_GRAM};
+''' + '''
+let searchPostings: Map<string, number[]> | null = null;
+
+function getSearchPostings(): Map<string, number[]> {
+  if (searchPostings) return searchPostings;
+  searchPostings = new Map();
+  for (const entry of searchIndexData.split('|')) {
+    const separator = entry.indexOf(':');
+    let position = 0;
+    searchPostings.set(
+      entry.slice(0, separator),
+      entry.slice(separator + 1).split(',').map(delta => (position += parseInt(delta, 36)))
+    );
+  }
+  return searchPostings;
+}
+
+function intersectSorted(a: number[], b: number[]): number[] {
+  const result: number[] = [];
+  let i = 0;
+  let j = 0;
+  while (i < a.length && j < b.length) {
+    if (a[i] === b[j]) {
+      result.push(a[i]);
+      i++;
+      j++;
+    } else if (a[i] < b[j]) {
+      i++;
+    } else {
+      j++;
+    }
+  }
+  return result;
+}
+'''
+
+def activity_key(name_ar, unit_ar):
+    """Key templates that describe the same activity in any source"""
+    return f"{normalize_search_text(name_ar)}|{normalize_search_text(unit_ar)}"
+
+def stat_number(value):
+    """Format a statistic as a TS number literal"""
+    return repr(round(value, 4))
+
+def render_activity_stats(activities):
+    """Render per-activity productivity statistics across sources.
+
+    `activities` holds (activityKey, nameAr, unitAr, productivityRate) in
+    array order. Templates sharing a key are one activity; the statistics are
+    computed here so comparison screens read them instead of recomputing.
+    """
+    groups = {}
+    for index, (key, name_ar, unit_ar, rate) in enumerate(activities):
+        group = groups.setdefault(key, {'nameAr': name_ar, 'unit': unit_ar, 'indexes': [], 'rates': []})
+        group['indexes'].append(index)
+        group['rates'].append(rate)
+
+    entries = []
+    for key, group in groups.items():
+        rates = group['rates']
+        entries.append(
+            f"  {{ activityKey: '{key}', nameAr: '{group['nameAr']}', unit: '{group['unit']}', "
+            f"templateIndexes: [{', '.join(map(str, group['indexes']))}], count: {len(rates)}, "
+            f"mean: {stat_number(statistics.fmean(rates))}, median: {stat_number(statistics.median(rates))}, "
+            f"min: {stat_number(min(rates))}, max: {stat_number(max(rates))}, "
+            f"stdDev: {stat_number(statistics.pstdev(rates))} }}"
+        )
+
+    body = ',\n'.join(entries)
+    return f'''// ========================================
+// Activity Statistics (built by generate-templates.py)
+// ========================================
+
+// Templates with the same normalized name and unit are one activity, whatever
+// their source. stdDev is the population standard deviation of the rates.
+export interface ActivityProductivityStats {{
+  activityKey: string;
+  nameAr: string;
+  unit: string;
+  templateIndexes: number[];
+  count: number;
+  mean: number;
+  median: number;
+  min: number;
+  max: number;
+  stdDev: number;
+}}
+
+export const activityProductivityStats: ActivityProductivityStats[] = [
+{body}
+];
+''' + '''
+const activityByTemplate: number[] = [];
+activityProductivityStats.forEach((stats, activity) => {
+  for (const i of stats.templateIndexes) activityByTemplate[i] = activity;
+});
+'''
+
+def template_records(items, crew_rates=None):
+    """Template fields in productivityTemplates order (grouped by category).
+
+    Daily crew cost is the crew joined with `crew_rates` (crew-roles.ts by
+    default); roles without a rate count as 0, as in the TS helpers.
+    """
+    if crew_rates is None:
+        crew_rates = load_crew_rates()
+    records = []
+    for cat_id, cat_items in group_by_category(items).items():
+        for idx, item in enumerate(cat_items, 1):
+            crew = parse_crew(item.get('crew', ''))
+            productivity = item['productivity']
+            daily_crew_cost = sum(c['qty'] * crew_rates.get(c['roleCode'], 0.0) for c in crew)
+            records.append({
+                'id': generate_id(cat_id, idx, item['description']),
+                'code': generate_code(cat_id, idx),
+                'nameAr': clean_text(item['description']),
+                'categoryId': cat_id,
+                'unitAr': clean_text(item['unit']),
+                'productivityRate': productivity,
+                'crewSize': sum(c['qty'] for c in crew) if crew else 1,
+                'crew': crew,
+                'dailyCrewCost': daily_crew_cost,
+                'laborCostPerUnit': daily_crew_cost / productivity if productivity > 0 else 0.0,
+                'source': item['sheet'],
+                'notes': item.get('note', ''),
+            })
+    return records
+
+COMMON_TS = '''/**
+ * Productivity template types and row helpers shared by the per-category
+ * modules. Generated by scripts/generate-templates.py.
  */
 
-import type { ComponentItem } from '@/lib/supabase';
+import { CREW_RATE_TABLE_VERSION, getCrewRoleByCode } from '@/data/crew-roles';
 
 export interface ProductivityTemplate {
   id: string;
@@ -151,6 +466,8 @@ export interface ProductivityTemplate {
   productivityRate: number;
   crewSize: number;
   crew: CrewMember[];
+  dailyCrewCost?: number;     // sum of crew qty x daily rate
+  laborCostPerUnit?: number;  // dailyCrewCost / productivityRate
   source: ProductivitySource;
   sourceRef?: string;
   notes?: string;
@@ -179,97 +496,365 @@ export type ProductivitySource =
   | 'اعمال الاند اسكيب'
   | 'اعمال الاسانسير';
 
+// Crew rate table the dailyCrewCost/laborCostPerUnit columns were computed from
+export const TEMPLATE_CREW_RATES_VERSION = '%(crew_rates_version)s';
+
+function hasCurrentCrewCosts(template: ProductivityTemplate): boolean {
+  return template.dailyCrewCost !== undefined && TEMPLATE_CREW_RATES_VERSION === CREW_RATE_TABLE_VERSION;
+}
+
 /**
- * Productivity Templates Database
- * Extracted from Excel: الانتاجيات
+ * Daily crew cost of a template: the generated column while crew-roles.ts
+ * still has the rates it was computed from, otherwise summed per member.
  */
-export const productivityTemplates: ProductivityTemplate[] = [
-'''
+export function getDailyCrewCost(template: ProductivityTemplate): number {
+  if (hasCurrentCrewCosts(template)) return template.dailyCrewCost!;
+  return template.crew.reduce(
+    (sum, member) => sum + (getCrewRoleByCode(member.roleCode)?.dailyRate ?? 0) * member.qty,
+    0
+  );
+}
 
-category_names = {
-    'site-services': 'أعمال تخديمية - Site Services',
-    'pipe-installation': 'تركيب المواسير - Pipe Installation',
-    'electrical': 'أعمال الكهرباء - Electrical Works',
-    'steel-works': 'أعمال الحديد - Steel Works',
-    'metal-works': 'الأعمال المعدنية - Metal Works',
-    'carpentry': 'أعمال الخشب - Carpentry',
-    'aluminum': 'أعمال الألومنيوم - Aluminum Works',
-    'landscape': 'أعمال الاند اسكيب - Landscape',
-    'elevator': 'أعمال الأسانسير - Elevator Works',
+export function getLaborCostPerUnit(template: ProductivityTemplate): number {
+  if (hasCurrentCrewCosts(template) && template.laborCostPerUnit !== undefined) return template.laborCostPerUnit;
+  return template.productivityRate > 0 ? getDailyCrewCost(template) / template.productivityRate : 0;
+}
+
+/**
+ * One category's templates stored column-wise: units, sources, role codes,
+ * crew descriptions and whole crews are interned into tables, and the
+ * per-template columns hold positions in them.
+ */
+export interface TemplateColumns {
+  categoryId: string;
+  units: string[];
+  sources: ProductivitySource[];
+  roleCodes: string[];
+  crewDescriptions: string[];
+  crews: number[][];          // flat [role, qty, description] triples
+  crewDailyCosts: number[];
+  ids: string[];
+  codes: string[];
+  names: string[];
+  unit: number[];
+  source: number[];
+  crew: number[];
+  productivityRate: number[];
+  laborCostPerUnit: number[];
+  notes: Record<number, string>;
+}
+
+export function hydrateTemplate(columns: TemplateColumns, i: number): ProductivityTemplate {
+  const crew: CrewMember[] = [];
+  const members = columns.crews[columns.crew[i]];
+  for (let m = 0; m < members.length; m += 3) {
+    crew.push({
+      roleCode: columns.roleCodes[members[m]],
+      qty: members[m + 1],
+      description: columns.crewDescriptions[members[m + 2]]
+    });
+  }
+  const unit = columns.units[columns.unit[i]];
+  const source = columns.sources[columns.source[i]];
+  return {
+    id: columns.ids[i],
+    code: columns.codes[i],
+    nameAr: columns.names[i],
+    categoryId: columns.categoryId,
+    unit,
+    unitAr: unit,
+    productivityRate: columns.productivityRate[i],
+    crewSize: crew.length ? crew.reduce((sum, member) => sum + member.qty, 0) : 1,
+    crew,
+    dailyCrewCost: columns.crewDailyCosts[columns.crew[i]],
+    laborCostPerUnit: columns.laborCostPerUnit[i],
+    source,
+    sourceRef: source,
+    ...(i in columns.notes ? { notes: columns.notes[i] } : {}),
+    isActive: true
+  };
+}
+
+export interface LazyTemplates {
+  templates: ProductivityTemplate[];
+  templateAt: (i: number) => ProductivityTemplate;
 }
 
-for cat_id, cat_items in by_category.items():
-    cat_name = category_names.get(cat_id, cat_id)
-    output += f'''  // ========================================
-  // {cat_name}
-  // ========================================
+/**
+ * An array view over `count` rows built by `build` on first access and
+ * cached, so every access returns the same object. Indexing, iteration and
+ * array methods all go through the cache.
+ */
+export function lazyTemplates(count: number, build: (i: number) => ProductivityTemplate): LazyTemplates {
+  const rows: (ProductivityTemplate | undefined)[] = new Array(count).fill(undefined);
+
+  function templateAt(i: number): ProductivityTemplate {
+    let template = rows[i];
+    if (template === undefined) template = rows[i] = build(i);
+    return template;
+  }
+
+  const templates = new Proxy(rows as ProductivityTemplate[], {
+    get(target, key, receiver) {
+      // Built rows and array members resolve directly; only unbuilt rows are parsed as indexes
+      const value = Reflect.get(target, key, receiver);
+      if (value !== undefined || typeof key !== 'string') return value;
+      const i = Number(key);
+      return Number.isInteger(i) && i >= 0 && i < count && String(i) === key ? templateAt(i) : value;
+    }
+  });
+  return { templates, templateAt };
+}
 '''
 
-    for idx, item in enumerate(cat_items, 1):
-        template_id = generate_id(cat_id, idx, item['description'])
-        code = generate_code(cat_id, idx)
-        name_ar = clean_text(item['description'])
-        unit_ar = clean_text(item['unit'])
-        productivity = item['productivity']
-        crew = parse_crew(item.get('crew', ''))
-        crew_size = sum(c['qty'] for c in crew) if crew else 1
-        source = item['sheet']
-        note = item.get('note', '')
+def write_object_rows(out, category, records):
+    """Emit a category module as one object literal per template"""
+    out.write(f'''import type {{ ProductivityTemplate }} from './common';
 
+export const templates: ProductivityTemplate[] = [
+''')
+    for record in records:
         crew_str = ',\n      '.join([
             f"{{ roleCode: '{c['roleCode']}', qty: {c['qty']}, description: '{c['description']}' }}"
-            for c in crew
-        ]) if crew else ''
-
-        output += f'''  {{
-    id: '{template_id}',
-    code: '{code}',
-    nameAr: '{name_ar}',
-    categoryId: '{cat_id}',
-    unit: '{unit_ar}',
-    unitAr: '{unit_ar}',
-    productivityRate: {productivity},
-    crewSize: {crew_size},
+            for c in record['crew']
+        ])
+        notes = f"\n    notes: '{record['notes']}'," if record['notes'] else ''
+        out.write(f'''  {{
+    id: '{record['id']}',
+    code: '{record['code']}',
+    nameAr: '{record['nameAr']}',
+    categoryId: '{record['categoryId']}',
+    unit: '{record['unitAr']}',
+    unitAr: '{record['unitAr']}',
+    productivityRate: {record['productivityRate']},
+    crewSize: {record['crewSize']},
     crew: [{crew_str}],
-    source: '{source}',
-    sourceRef: '{source}','''
+    dailyCrewCost: {js_number(record['dailyCrewCost'])},
+    laborCostPerUnit: {js_number(round(record['laborCostPerUnit'], 4))},
+    source: '{record['source']}',
+    sourceRef: '{record['source']}',{notes}
+    isActive: true
+  }},
+''')
+    out.write('''];
 
-        if note:
-            output += f"\n    notes: '{note}',"
+export function templateAt(i: number): ProductivityTemplate {
+  return templates[i];
+}
 
-        output += '''
-    isActive: true
-  },
-'''
+export const templateIds = templates.map(t => t.id);
+export const templateCodes = templates.map(t => t.code);
+''')
+
+def intern(values):
+    """Distinct values in first-seen order, and each value's position among them"""
+    table = {}
+    positions = [table.setdefault(value, len(table)) for value in values]
+    return list(table), positions
+
+def write_column(out, name, entries, per_line=10):
+    out.write(f"  {name}: [\n{wrap_entries(entries, per_line, indent='    ')}\n  ],\n")
+
+def write_columnar_rows(out, category, records):
+    """Emit a category module as TemplateColumns behind a lazily hydrating array.
 
-output += '''];
+    Each column is written as soon as it is built.
+    """
+    roles, role_of = intern(m['roleCode'] for r in records for m in r['crew'])
+    descriptions, description_of = intern(m['description'] for r in records for m in r['crew'])
+    crew_keys = []
+    member = 0
+    for record in records:
+        key = []
+        for m in record['crew']:
+            key += [role_of[member], m['qty'], description_of[member]]
+            member += 1
+        crew_keys.append(tuple(key))
+    crews, crew_of = intern(crew_keys)
+    crew_costs = {}
+    for record, crew in zip(records, crew_of):
+        crew_costs.setdefault(crew, record['dailyCrewCost'])
+    units, unit_of = intern(r['unitAr'] for r in records)
+    sources, source_of = intern(r['source'] for r in records)
 
+    out.write(f'''import {{ hydrateTemplate, lazyTemplates, type TemplateColumns }} from './common';
+
+const columns: TemplateColumns = {{
+  categoryId: '{category}',
+''')
+    write_column(out, 'units', [f"'{value}'" for value in units], per_line=6)
+    write_column(out, 'sources', [f"'{value}'" for value in sources], per_line=6)
+    write_column(out, 'roleCodes', [f"'{value}'" for value in roles], per_line=6)
+    write_column(out, 'crewDescriptions', [f"'{value}'" for value in descriptions], per_line=6)
+    write_column(out, 'crews', [f"[{', '.join(map(str, crew))}]" for crew in crews], per_line=6)
+    write_column(out, 'crewDailyCosts', [js_number(crew_costs[i]) for i in range(len(crews))])
+    write_column(out, 'ids', [f"'{r['id']}'" for r in records])
+    write_column(out, 'codes', [f"'{r['code']}'" for r in records])
+    write_column(out, 'names', [f"'{r['nameAr']}'" for r in records], per_line=4)
+    write_column(out, 'unit', [str(i) for i in unit_of], per_line=40)
+    write_column(out, 'source', [str(i) for i in source_of], per_line=40)
+    write_column(out, 'crew', [str(i) for i in crew_of], per_line=40)
+    write_column(out, 'productivityRate', [str(r['productivityRate']) for r in records])
+    write_column(out, 'laborCostPerUnit', [js_number(round(r['laborCostPerUnit'], 4)) for r in records])
+    notes = [f"{i}: '{r['notes']}'" for i, r in enumerate(records) if r['notes']]
+    notes_body = f"{{\n{wrap_entries(notes, per_line=2, indent='    ')}\n  }}" if notes else '{}'
+    out.write(f'''  notes: {notes_body}
+}};
+
+export const {{ templates, templateAt }} = lazyTemplates(columns.ids.length, i => hydrateTemplate(columns, i));
+export const templateIds = columns.ids;
+export const templateCodes = columns.codes;
+''')
+
+TEMPLATE_LAYOUTS = {
+    'objects': write_object_rows,
+    'columnar': write_columnar_rows,
+}
+DEFAULT_LAYOUT = 'columnar'
+
+def module_name(category):
+    """TS identifier for a category module (site-services -> siteServices)"""
+    name = re.sub(r'[^0-9a-zA-Z]+(.)?', lambda m: (m.group(1) or '').upper(), category)
+    return name if name and not name[0].isdigit() else f"category{name}"
+
+def write_category_ts(out, category, records, layout=DEFAULT_LAYOUT):
+    out.write(f'''/**
+ * Productivity templates: {category_names.get(category, category)}
+ * Generated by scripts/generate-templates.py ({len(records)} templates).
+ */
+
+''')
+    TEMPLATE_LAYOUTS[layout](out, category, records)
+
+def write_manifest_ts(out, categories):
+    """Counts, labels and sources per category module; `categories` maps id -> records"""
+    entries = []
+    for category, records in categories.items():
+        sources = ', '.join(f"'{source}'" for source in dict.fromkeys(r['source'] for r in records))
+        entries.append(
+            f"  {{ categoryId: '{category}', label: '{category_names.get(category, category)}', "
+            f"count: {len(records)}, activeCount: {len(records)}, sources: [{sources}] }}"
+        )
+    body = ',\n'.join(entries)
+    total = sum(len(records) for records in categories.values())
+    out.write(f'''/**
+ * Productivity template manifest: what each category module holds, without
+ * loading any templates. Generated by scripts/generate-templates.py.
+ */
+
+import type {{ ProductivitySource }} from './common';
+
+export interface TemplateCategoryManifest {{
+  categoryId: string;
+  label: string;
+  count: number;
+  activeCount: number;
+  sources: ProductivitySource[];
+}}
+
+export const templateCategoryManifest: TemplateCategoryManifest[] = [
+{body}
+];
+
+/** Every category id, in manifest order */
+export const templateCategoryIds: string[] = templateCategoryManifest.map(category => category.categoryId);
+
+export const MANIFEST_TOTAL_TEMPLATES = {total};
+export const MANIFEST_ACTIVE_TEMPLATES = {total};
+''')
+
+def write_loaders_ts(out, categories):
+    loaders = ',\n'.join(f"  '{category}': () => import('./{category}')" for category in categories)
+    out.write(f'''/**
+ * Async loaders for the per-category template modules; each category is its
+ * own chunk, fetched the first time it is needed. Generated by
+ * scripts/generate-templates.py.
+ */
+
+import type {{ ProductivityTemplate }} from './common';
+import {{ templateCategoryIds }} from './manifest';
+
+const categoryLoaders: Record<string, () => Promise<{{ templates: ProductivityTemplate[] }}>> = {{
+{loaders}
+}};
+
+export function loadCategoryTemplates(categoryId: string): Promise<ProductivityTemplate[]> {{
+  const load = categoryLoaders[categoryId];
+  return load ? load().then(loaded => loaded.templates) : Promise.resolve([]);
+}}
+
+/** Templates of the given categories, in the order the categories are listed */
+export async function loadTemplates(categoryIds: string[]): Promise<ProductivityTemplate[]> {{
+  const parts = await Promise.all(categoryIds.map(loadCategoryTemplates));
+  return parts.flat();
+}}
+
+export function loadAllTemplates(): Promise<ProductivityTemplate[]> {{
+  return loadTemplates(templateCategoryIds);
+}}
+''')
+
+TEMPLATE_HELPERS = '''
 // ========================================
 // Helper Functions
 // ========================================
 
 export function getTemplateById(id: string): ProductivityTemplate | undefined {
-  return productivityTemplates.find(t => t.id === id);
+  const index = templateIndexById.get(id);
+  return index === undefined ? undefined : templateAt(index);
 }
 
 export function getTemplateByCode(code: string): ProductivityTemplate | undefined {
-  return productivityTemplates.find(t => t.code === code);
+  const index = templateIndexByCode.get(code);
+  return index === undefined ? undefined : templateAt(index);
 }
 
 export function getTemplatesByCategory(categoryId: string): ProductivityTemplate[] {
-  return productivityTemplates.filter(t => t.categoryId === categoryId && t.isActive);
+  return templatesInRuns(activeRunsByCategory.get(categoryId));
 }
 
 export function getTemplatesBySource(source: ProductivitySource): ProductivityTemplate[] {
-  return productivityTemplates.filter(t => t.source === source && t.isActive);
+  return templatesInRuns(activeRunsBySource.get(source));
 }
 
 export function searchTemplates(query: string): ProductivityTemplate[] {
-  const lowerQuery = query.toLowerCase();
-  return productivityTemplates.filter(t =>
-    t.nameAr.includes(query) ||
-    (t.nameEn?.toLowerCase().includes(lowerQuery))
-  );
+  const normalized = normalizeSearchText(query);
+  if (!normalized) {
+    if (!query.trim()) return productivityTemplates.slice();
+    // Punctuation-only queries ("–", "(") normalize to nothing; match them as typed
+    const lowerQuery = query.toLowerCase();
+    return productivityTemplates.filter(t =>
+      t.nameAr.includes(query) ||
+      (t.nameEn?.toLowerCase().includes(lowerQuery))
+    );
+  }
+
+  // Intersect the postings of every query gram, rarest first, then confirm
+  // the candidates contain the whole query. Queries shorter than a gram
+  // fall back to scanning the normalized keys.
+  let candidates: number[] | null = null;
+  if (normalized.length >= SEARCH_GRAM) {
+    const postings = getSearchPostings();
+    const grams = new Set<string>();
+    for (let i = 0; i + SEARCH_GRAM <= normalized.length; i++) grams.add(normalized.slice(i, i + SEARCH_GRAM));
+    const lists = Array.from(grams, gram => postings.get(gram) ?? []).sort((a, b) => a.length - b.length);
+    for (const list of lists) {
+      candidates = candidates ? intersectSorted(candidates, list) : list;
+      if (candidates.length === 0) return [];
+    }
+  }
+
+  const matches: ProductivityTemplate[] = [];
+  if (candidates) {
+    for (const i of candidates) {
+      if (searchKeys[i].includes(normalized)) matches.push(templateAt(i));
+    }
+  } else {
+    searchKeys.forEach((key, i) => {
+      if (key.includes(normalized)) matches.push(templateAt(i));
+    });
+  }
+  return matches;
 }
 
 export function templateToBOQTemplate(template: ProductivityTemplate): {
@@ -314,12 +899,19 @@ export interface MultiSourceProductivity {
     crewSize: number;
   }[];
   averageRate: number;
+  stats: ActivityProductivityStats;
+}
+
+export function getActivityStats(code: string): ActivityProductivityStats | undefined {
+  const index = templateIndexByCode.get(code);
+  return index === undefined ? undefined : activityProductivityStats[activityByTemplate[index]];
 }
 
 export function getMultiSourceComparison(code: string): MultiSourceProductivity | null {
-  const templates = productivityTemplates.filter(t => t.code.startsWith(code.split('-').slice(0, 2).join('-')));
-  if (templates.length === 0) return null;
+  const stats = getActivityStats(code);
+  if (!stats) return null;
 
+  const templates = stats.templateIndexes.map(templateAt);
   const primary = templates[0];
   return {
     code: primary.code,
@@ -330,18 +922,224 @@ export function getMultiSourceComparison(code: string): MultiSourceProductivity
       productivityRate: t.productivityRate,
       crewSize: t.crewSize
     })),
-    averageRate: templates.reduce((sum, t) => sum + t.productivityRate, 0) / templates.length
+    averageRate: stats.mean,
+    stats
   };
 }
 
 // Export count for reference
 export const TOTAL_TEMPLATES = productivityTemplates.length;
-export const ACTIVE_TEMPLATES = productivityTemplates.filter(t => t.isActive).length;
+// Counted from the active runs so the columnar layout does not hydrate every row
+export const ACTIVE_TEMPLATES = Array.from(activeRunsByCategory.values()).reduce(
+  (total, runs) => total + runs.reduce((sum, [, count]) => sum + count, 0),
+  0
+);
 '''
 
-# Write output
-output_path = Path(__file__).parent.parent / "src/data/productivity-templates.ts"
-with open(output_path, 'w', encoding='utf-8') as f:
-    f.write(output)
+def write_templates_ts(out, categories, layout=DEFAULT_LAYOUT, modules_dir='productivity-templates'):
+    """Write the aggregate productivity-templates.ts over the category modules.
+
+    `categories` maps category id -> records, in productivityTemplates order;
+    the lookup, search and statistics indexes are over the whole catalog.
+    """
+    records = [record for category_records in categories.values() for record in category_records]
+    names = {category: module_name(category) for category in categories}
+    imports = '\n'.join(f"import * as {names[c]} from './{modules_dir}/{c}';" for c in categories)
+    starts = []
+    position = 0
+    for category_records in categories.values():
+        starts.append(position)
+        position += len(category_records)
+    common_imports = 'lazyTemplates, type ProductivitySource' if layout == 'columnar' else 'type ProductivitySource'
+
+    out.write(f'''/**
+ * Productivity Templates - BOQTemplate Data with Productivity Rates
+ *
+ * Contains ALL productivity data extracted from the Excel workbook (الانتاجيات).
+ * Total: {len(records)} templates from 9 sheets.
+ *
+ * Each template includes:
+ * - productivity_rate: units produced per crew per day
+ * - crew: labor roles needed with quantities
+ * - source: origin of the productivity data (sheet name)
+ * - dailyCrewCost / laborCostPerUnit: crew cost from crew-roles.ts rates,
+ *   valid while CREW_RATE_TABLE_VERSION matches TEMPLATE_CREW_RATES_VERSION
+ *
+ * The templates live in one module per category under
+ * ./{modules_dir}/; this module combines them and indexes the whole
+ * catalog. Pages that only need some categories should use the loaders and
+ * manifest in that directory instead of importing this module.
+ */
+
+import type {{ ComponentItem }} from '@/lib/supabase';
+import {{ {common_imports}, type ProductivityTemplate }} from './{modules_dir}/common';
+{imports}
+
+export type {{ CrewMember, ProductivitySource, ProductivityTemplate }} from './{modules_dir}/common';
+export {{ TEMPLATE_CREW_RATES_VERSION, getDailyCrewCost, getLaborCostPerUnit }} from './{modules_dir}/common';
+
+// Category modules in productivityTemplates order
+const categoryModules = [{', '.join(names.values())}];
+
+const templateIds = categoryModules.flatMap(category => category.templateIds);
+const templateCodes = categoryModules.flatMap(category => category.templateCodes);
+
+''')
+    if layout == 'columnar':
+        out.write(f'''// Position in productivityTemplates of each category module's first template
+const categoryStarts = [{', '.join(map(str, starts))}];
+
+function categoryTemplateAt(i: number): ProductivityTemplate {{
+  let k = categoryStarts.length - 1;
+  while (categoryStarts[k] > i) k--;
+  return categoryModules[k].templateAt(i - categoryStarts[k]);
+}}
+
+const catalog = lazyTemplates(templateIds.length, categoryTemplateAt);
+const templateAt = catalog.templateAt;
+
+/**
+ * Productivity Templates Database
+ * Extracted from Excel: الانتاجيات
+ *
+ * An array view over the category modules; rows are built on first access.
+ */
+export const productivityTemplates: ProductivityTemplate[] = catalog.templates;
+
+''')
+    else:
+        out.write('''/**
+ * Productivity Templates Database
+ * Extracted from Excel: الانتاجيات
+ */
+export const productivityTemplates: ProductivityTemplate[] = categoryModules.flatMap(category => category.templates);
+
+function templateAt(i: number): ProductivityTemplate {
+  return productivityTemplates[i];
+}
+
+''')
+    out.write(render_lookup_indexes([(r['categoryId'], r['source'], True) for r in records]))
+    out.write('\n' + render_search_index([normalize_search_text(r['nameAr']) for r in records]))
+    out.write('\n' + render_activity_stats([
+        (activity_key(r['nameAr'], r['unitAr']), r['nameAr'], r['unitAr'], r['productivityRate'])
+        for r in records
+    ]))
+    out.write(TEMPLATE_HELPERS)
+
+def write_template_modules(output_path, items, crew_rates=None, layout=DEFAULT_LAYOUT, recorder=None):
+    """Write productivity-templates.ts and its per-category modules.
+
+    The category modules, common.ts, manifest.ts and loaders.ts go in the
+    directory named after the output (productivity-templates/ next to
+    productivity-templates.ts). Each file is streamed to a temp file and
+    renamed into place; modules of categories no longer in the data are
+    removed. Returns the paths written.
+
+    `recorder` (a StageRecorder) times the crew_parse, transform, emit and
+    write stages; write excludes the rendering nested in it, so it is the
+    cost of creating, syncing and renaming the files.
+    """
+    recorder = recorder or StageRecorder()
+    if crew_rates is None:
+        crew_rates = load_crew_rates()
+    output_path = Path(output_path)
+    modules_dir = output_path.with_suffix('')
+    modules_dir.mkdir(parents=True, exist_ok=True)
+    if recorder.enabled:
+        # Parsed once here so the stage is measured on its own; template_records() then hits the cache
+        with recorder.stage("crew_parse") as stats:
+            for item in items:
+                parse_crew(item.get('crew', ''))
+            stats["rows"] = len(items)
+    categories = {}
+    with recorder.stage("transform") as stats:
+        for record in template_records(items, crew_rates):
+            categories.setdefault(record['categoryId'], []).append(record)
+        stats["rows"] = len(items)
+
+    written = []
+
+    @contextmanager
+    def module_writer(path, rows=0):
+        written.append(path)
+        with recorder.stage("write") as stats, atomic_writer(path) as f:
+            stats["files"] = 1
+            with recorder.stage("emit") as emitted:
+                yield f
+                emitted["rows"] = rows
+
+    with module_writer(modules_dir / "common.ts") as f:
+        f.write(COMMON_TS % {'crew_rates_version': crew_rate_table_version(crew_rates)})
+    for category, records in categories.items():
+        with module_writer(modules_dir / f"{category}.ts", len(records)) as f:
+            write_category_ts(f, category, records, layout)
+    with module_writer(modules_dir / "manifest.ts") as f:
+        write_manifest_ts(f, categories)
+    with module_writer(modules_dir / "loaders.ts") as f:
+        write_loaders_ts(f, categories)
+    with recorder.stage("write"):
+        for path in modules_dir.glob("*.ts"):
+            if path not in written:
+                path.unlink()
+    with module_writer(output_path) as f:
+        write_templates_ts(f, categories, layout, modules_dir.name)
+    return written
+
+def load_items(data_path=DATA_PATH):
+    """Load extracted productivity rows"""
+    with open(data_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+# `code: '...'` followed, within the same object literal, by `dailyRate: N`
+CREW_RATE_RE = re.compile(r"code:\s*'([^']+)'[^}]*?dailyRate:\s*([\d.]+)")
+
+def load_crew_rates(path=CREW_ROLES_PATH):
+    """Daily rate per roleCode from crew-roles.ts"""
+    source = Path(path).read_text(encoding='utf-8')
+    rates = {}
+    for code, rate in CREW_RATE_RE.findall(source):
+        # First definition wins, as getCrewRoleByCode() uses .find()
+        rates.setdefault(code, float(rate))
+    return rates
+
+def js_number(value):
+    """Format a number the way JS template literals do (350, not 350.0)"""
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+def crew_rate_table_version(crew_rates):
+    """FNV-1a stamp of the rate table; mirrors crewRateTableVersion() in crew-roles.ts"""
+    text = ';'.join(sorted(f"{code}={js_number(rate)}" for code, rate in crew_rates.items()))
+    value = 0x811c9dc5
+    for char in text:
+        value = ((value ^ ord(char)) * 0x01000193) & 0xffffffff
+    return f"{value:08x}"
+
+def synthetic_items(items, count):
+    """Cycle the sheet rows up to `count` items, for benchmarking larger catalogs"""
+    return [dict(items[i % len(items)]) for i in range(count)]
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Generate productivity-templates.ts")
+    parser.add_argument("--output", default=str(OUTPUT_PATH), help="TypeScript file to write")
+    parser.add_argument("--synthetic", type=int, metavar="N",
+                        help="Replicate the sheet rows up to N templates (benchmarks only)")
+    parser.add_argument("--layout", choices=sorted(TEMPLATE_LAYOUTS), default=DEFAULT_LAYOUT,
+                        help="columnar: parallel arrays with lazily built rows; objects: one literal per template")
+    add_profile_arguments(parser)
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    items = load_items()
+    if args.synthetic:
+        items = synthetic_items(items, args.synthetic)
+
+    recorder = recorder_from_args(args)
+    written = write_template_modules(args.output, items, layout=args.layout, recorder=recorder)
+    print(f"Generated {len(items)} templates ({args.layout}) to {args.output}")
+    print(f"  {len(written) - 1} modules in {Path(args.output).with_suffix('')}")
+    finish_profile(recorder, args, "generate-templates", templates=len(items), layout=args.layout)
 
-print(f"Generated {len(items)} templates to {output_path}")
+if __name__ == "__main__":
+    main()
@@ -13,6 +13,9 @@ const sources = [
     code: (item) => item.code,
     nameAr: (item) => item.nameAr,
     nameEn: (item) => item.nameEn ?? null,
+    // Crew and unit labor costs are derived from crew-roles.ts rates at build
+    // time; stored here they would go stale when the rates change
+    payload: ({ dailyCrewCost, laborCostPerUnit, ...item }) => item,
   },
   {
     file: "src/data/boq-items.ts",
@@ -48,8 +51,18 @@ const sources = [
   },
 ];
 
-function loadExport(file, exportName) {
-  const source = fs.readFileSync(path.join(root, file), "utf8");
+// Relative and "@/" imports are loaded too (productivity-templates.ts is
+// assembled from per-category modules); package imports are stubbed
+function resolveImport(fromFile, specifier) {
+  const base = specifier.startsWith("@/")
+    ? path.join(root, "src", specifier.slice(2))
+    : path.resolve(path.dirname(fromFile), specifier);
+  return [base, `${base}.ts`].find((candidate) => fs.existsSync(candidate) && fs.statSync(candidate).isFile());
+}
+
+function loadModule(modulePath, cache = new Map()) {
+  if (cache.has(modulePath)) return cache.get(modulePath).exports;
+  const source = fs.readFileSync(modulePath, "utf8");
   const output = ts.transpileModule(source, {
     compilerOptions: {
       esModuleInterop: true,
@@ -57,13 +70,22 @@ function loadExport(file, exportName) {
       target: ts.ScriptTarget.ES2020,
     },
   }).outputText;
+  const module = { exports: {} };
+  cache.set(modulePath, module);
   const context = {
-    exports: {},
-    module: { exports: {} },
-    require: () => ({}),
+    exports: module.exports,
+    module,
+    require: (specifier) => {
+      const target = /^(\.|@\/)/.test(specifier) ? resolveImport(modulePath, specifier) : null;
+      return target ? loadModule(target, cache) : {};
+    },
   };
-  vm.runInNewContext(output, context, { filename: file });
-  return context.module.exports[exportName] ?? context.exports[exportName];
+  vm.runInNewContext(output, context, { filename: modulePath });
+  return module.exports;
+}
+
+function loadExport(file, exportName) {
+  return loadModule(path.join(root, file))[exportName];
 }
 
 function sql(value) {
@@ -80,7 +102,7 @@ for (const source of sources) {
       code: source.code(item),
       nameAr: source.nameAr(item),
       nameEn: source.nameEn(item),
-      payload: item,
+      payload: source.payload ? source.payload(item) : item,
       source: source.file,
     });
   }
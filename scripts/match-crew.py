@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Resolve crew strings parse_crew() does not understand and report them for review
+
+By default this checks the rows of extracted-productivity.json whose crew
+parses to nothing, which generate-templates.py emits with an empty crew and
+no labor cost. Rows with a crew string are matched term by term against the
+crew-roles.ts catalog; rows without one on their description (see
+crew_matcher.py). --lines takes a file of crew strings instead, one per
+line, such as the crew column of imported field reports; strings the parser
+understands are counted as parsed.
+
+Each distinct input is resolved once and reported with its confidence:
+matched (>= --accept), review (>= --review) or unmatched.
+"""
+
+import argparse
+import json
+import random
+import time
+
+from crew_matcher import (ACCEPT_CONFIDENCE, REVIEW_CONFIDENCE, HELPER_WORDS, CrewIndex, load_crew_roles,
+                          resolve_batch, review_report)
+from script_modules import load_script
+
+generate_templates = load_script("generate-templates")
+
+DEFAULT_LIMIT = 30
+
+def template_entries(items):
+    """(rows, entries) for the productivity rows whose crew does not parse"""
+    rows, entries = [], []
+    for item in items:
+        if generate_templates.parse_crew(item.get('crew', '')):
+            continue
+        rows.append({
+            "text": generate_templates.clean_text(item.get('crew', '')),
+            "description": generate_templates.clean_text(item['description']),
+            "category": item['category'],
+        })
+        entries.append((item.get('crew', ''), item['description']))
+    return rows, entries
+
+def line_entries(path):
+    """(rows, entries) for a file of crew strings, one per line"""
+    with open(path, 'r', encoding='utf-8') as f:
+        lines = [line.rstrip('\n') for line in f if line.strip()]
+    return [{"text": line} for line in lines], [(line, None) for line in lines]
+
+def noisy(name, rng):
+    """A role name with a typical typo: a dropped, doubled or swapped letter, or a folded ي/ة"""
+    edit = rng.randrange(4)
+    position = rng.randrange(len(name))
+    if edit == 0 and len(name) > 4:
+        return name[:position] + name[position + 1:]
+    if edit == 1:
+        return name[:position] + name[position] + name[position:]
+    if edit == 2 and position < len(name) - 1:
+        return name[:position] + name[position + 1] + name[position] + name[position + 2:]
+    return name.replace('ي', 'ى').replace('ة', 'ه')
+
+def bench(index, count, accept, review):
+    """Time resolve_batch() on `count` synthetic field-report crews and score them against their source roles"""
+    rng = random.Random(5)
+    names = [(key, code) for key, code, _ in index.aliases
+             if key not in HELPER_WORDS and not key.isascii() and len(key) > 3]
+    lines, truth = [], []
+    for _ in range(count):
+        members = rng.sample(names, rng.randint(1, 3))
+        lines.append(" + ".join(f"{rng.randint(1, 6)} {noisy(key, rng)}" for key, _ in members))
+        truth.append([code for _, code in members])
+
+    began = time.perf_counter()
+    results = resolve_batch(index, [(line, None) for line in lines], accept, review)
+    seconds = time.perf_counter() - began
+    accepted = [(result, codes) for result, codes in zip(results, truth) if result["status"] == "matched"]
+    correct = sum(1 for result, codes in accepted if [member["roleCode"] for member in result["crew"]] == codes)
+    any_correct = sum(1 for result, codes in zip(results, truth)
+                      if [member["roleCode"] for member in result["crew"]] == codes)
+    print(f"{count:,} crew lines ({len(set(lines)):,} distinct) in {seconds:.2f} s "
+          f"({count / seconds:,.0f} lines/s), {len(index.aliases)} role names indexed")
+    print(f"  accepted {len(accepted):,} ({len(accepted) / count:.0%}), "
+          f"{correct / max(len(accepted), 1):.1%} of them correct; "
+          f"{any_correct / count:.1%} correct overall")
+
+def print_report(report, limit):
+    counts = ", ".join(f"{count} {status}" for status, count in report["counts"].items())
+    print(f"{report['lines']} lines ({report['distinct']} distinct): {counts}")
+    for entry in report["matched"][:limit]:
+        crew = " + ".join(f"{member['qty']} {member['roleCode']}" for member in entry["crew"])
+        print(f"✓ {entry['confidence']:.2f} {entry['text'] or entry.get('description')} -> {crew}")
+    for entry in report["review"][:limit]:
+        crew = " + ".join(f"{member['qty']} {member['roleCode']}" for member in entry["crew"]) or "-"
+        marker = "?" if entry["status"] == "review" else "✗"
+        print(f"{marker} {entry['confidence']:.2f} {entry['text'] or entry.get('description')} -> {crew}")
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Fuzzy-match crew strings against crew-roles.ts")
+    parser.add_argument("--data", default=str(generate_templates.DATA_PATH),
+                        help="Productivity rows whose unparsed crews are checked")
+    parser.add_argument("--lines", help="File of crew strings to resolve instead, one per line")
+    parser.add_argument("--crew-roles", default=str(generate_templates.CREW_ROLES_PATH))
+    parser.add_argument("--accept", type=float, default=ACCEPT_CONFIDENCE,
+                        help="Confidence from which a match is accepted")
+    parser.add_argument("--review", type=float, default=REVIEW_CONFIDENCE,
+                        help="Confidence from which a match is suggested for review")
+    parser.add_argument("--output", help="Write the review report as JSON")
+    parser.add_argument("--limit", type=int, default=DEFAULT_LIMIT, help="Entries printed per list")
+    parser.add_argument("--bench", type=int, metavar="N", help="Time and score N synthetic noisy crew lines")
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    index = CrewIndex(load_crew_roles(args.crew_roles))
+    if args.bench:
+        bench(index, args.bench, args.accept, args.review)
+        return
+
+    if args.lines:
+        rows, entries = line_entries(args.lines)
+    else:
+        rows, entries = template_entries(generate_templates.load_items(args.data))
+    results = resolve_batch(index, entries, args.accept, args.review)
+    report = review_report(rows, results)
+    print_report(report, args.limit)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"✓ Saved to: {args.output}")
+
+if __name__ == "__main__":
+    main()
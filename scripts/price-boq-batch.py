@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+Price every BOQ template in the seed against many rate scenarios at once
+
+The templates' components become one sparse consumption matrix per section
+(materials, labor, equipment: templates x rate codes, qty per unit), so a
+batch of scenario rate vectors is priced with a gather and a segmented sum
+instead of a lookup per component. The direct -> indirect -> profit ->
+contingency chain is the one calculateEstimateItem() applies in
+src/lib/calculations.ts.
+"""
+
+import argparse
+import csv
+import json
+import time
+from pathlib import Path
+
+import numpy as np
+
+from seed_store import is_seed_dir, load_seed, seed_exists
+
+SCRIPTS_DIR = Path(__file__).parent
+
+# Keep in sync with DEFAULT_COST_CONFIG in src/lib/calculations.ts
+COST_CONFIG = {
+    "indirectRate": 0.15,
+    "profitMargin": 0.20,
+    "contingency": 0.05,
+}
+
+COMPONENT_SECTIONS = ("materials", "labor", "equipment")
+
+# indirect_costs entry priced as contingency rather than overhead
+CONTINGENCY_CODE = "IND-CONT"
+
+# Scenarios priced together; bounds the (scenarios x components) gather
+SCENARIO_CHUNK = 256
+
+RESULT_FIELDS = ("materialCost", "laborCost", "equipmentCost", "directCost",
+                 "indirectCost", "profit", "contingency", "sellingRate")
+
+def default_seed_path():
+    """The sectioned seed if it has been written, else the legacy seed-data.json"""
+    seed_dir = SCRIPTS_DIR / "seed-data"
+    return seed_dir if is_seed_dir(seed_dir) else SCRIPTS_DIR / "seed-data.json"
+
+def build_catalog(seed):
+    """Index rate codes and build the per-section consumption matrices.
+
+    Codes referenced by a template but missing from the rates are kept as
+    columns with a base rate of 0, which is what rateLookup() falling through
+    to `?? 0` prices them at; they are listed in `unresolved`.
+    """
+    templates = seed["boq_templates"]
+    rate_codes = [rate["code"] for rate in seed["rates"]]
+    column = {code: index for index, code in enumerate(rate_codes)}
+    base_rates = [float(rate["rate"]) for rate in seed["rates"]]
+    unresolved = []
+
+    matrices = {}
+    for section in COMPONENT_SECTIONS:
+        indptr = [0]
+        indices = []
+        data = []
+        for template in templates:
+            for component in template.get(section, []):
+                code = component["rateCode"]
+                if code not in column:
+                    column[code] = len(rate_codes)
+                    rate_codes.append(code)
+                    base_rates.append(0.0)
+                    unresolved.append(code)
+                indices.append(column[code])
+                data.append(float(component["qty"]))
+            indptr.append(len(indices))
+        matrices[section] = {
+            "indptr": np.array(indptr, dtype=np.int64),
+            "indices": np.array(indices, dtype=np.int64),
+            "data": np.array(data, dtype=np.float64),
+        }
+
+    return {
+        "template_codes": [template["code"] for template in templates],
+        "categories": [template.get("category") for template in templates],
+        "rate_codes": rate_codes,
+        "column": column,
+        "base_rates": np.array(base_rates, dtype=np.float64),
+        "matrices": matrices,
+        "unresolved": unresolved,
+    }
+
+def sparse_rows_dot(matrix, rates):
+    """Multiply a CSR consumption matrix by each scenario's rate vector.
+
+    `rates` is (scenarios, rate codes); returns (scenarios, templates).
+    """
+    indptr, indices, data = matrix["indptr"], matrix["indices"], matrix["data"]
+    result = np.zeros((rates.shape[0], len(indptr) - 1))
+    if len(indices) == 0:
+        return result
+    costs = rates[:, indices] * data
+    starts = indptr[:-1]
+    # reduceat needs strictly increasing in-range offsets, so sum only the
+    # templates that have components; the rest stay 0
+    filled = starts < indptr[1:]
+    result[:, filled] = np.add.reduceat(costs, starts[filled], axis=1)
+    return result
+
+def cost_rates(catalog, seed=None, config=COST_CONFIG, seed_indirect=False):
+    """Per-template indirect/profit/contingency rates.
+
+    By default every template gets DEFAULT_COST_CONFIG. With `seed_indirect`
+    the overhead rate is the sum of the seed's indirect_costs that apply to
+    the template ("ALL" or its category) and contingency is IND-CONT.
+    """
+    count = len(catalog["template_codes"])
+    indirect = np.full(count, config["indirectRate"])
+    profit = np.full(count, config["profitMargin"])
+    contingency = np.full(count, config["contingency"])
+    if seed_indirect:
+        indirect[:] = 0.0
+        contingency[:] = 0.0
+        categories = np.array(catalog["categories"], dtype=object)
+        for cost in seed["indirect_costs"]:
+            applies_to = cost.get("applies_to") or ["ALL"]
+            mask = np.ones(count, dtype=bool) if "ALL" in applies_to else np.isin(categories, applies_to)
+            target = contingency if cost["code"] == CONTINGENCY_CODE else indirect
+            target[mask] += cost["percentage"]
+    return indirect, profit, contingency
+
+def price_batch(catalog, rates, indirect, profit_margin, contingency_rate):
+    """Price every template under every scenario; arrays are (scenarios, templates)"""
+    materials = sparse_rows_dot(catalog["matrices"]["materials"], rates)
+    labor = sparse_rows_dot(catalog["matrices"]["labor"], rates)
+    equipment = sparse_rows_dot(catalog["matrices"]["equipment"], rates)
+    direct = materials + labor + equipment
+    indirect_cost = direct * indirect
+    before_profit = direct + indirect_cost
+    profit = before_profit * profit_margin
+    before_contingency = before_profit + profit
+    contingency = before_contingency * contingency_rate
+    return {
+        "materialCost": materials,
+        "laborCost": labor,
+        "equipmentCost": equipment,
+        "directCost": direct,
+        "indirectCost": indirect_cost,
+        "profit": profit,
+        "contingency": contingency,
+        "sellingRate": before_contingency + contingency,
+    }
+
+def price_scenarios(catalog, rates, cost_rates_by_template, chunk=SCENARIO_CHUNK):
+    """price_batch() over scenario chunks, concatenated"""
+    parts = [
+        price_batch(catalog, rates[start:start + chunk], *cost_rates_by_template)
+        for start in range(0, rates.shape[0], chunk)
+    ]
+    return {field: np.concatenate([part[field] for part in parts]) for field in RESULT_FIELDS}
+
+def price_template(template, rate_lookup, config=COST_CONFIG):
+    """Scalar pricing of one template, as calculateEstimateItem() does it"""
+    subtotals = [
+        sum(component["qty"] * (rate_lookup(component["rateCode"]) or 0) for component in template.get(section, []))
+        for section in COMPONENT_SECTIONS
+    ]
+    direct = sum(subtotals)
+    before_profit = direct * (1 + config["indirectRate"])
+    before_contingency = before_profit * (1 + config["profitMargin"])
+    return before_contingency * (1 + config["contingency"])
+
+def scenario_from_overrides(catalog, overrides):
+    """A rate vector: the base rates with `overrides` ({rateCode: rate}) applied"""
+    rates = catalog["base_rates"].copy()
+    for code, rate in overrides.items():
+        if code in catalog["column"]:
+            rates[catalog["column"][code]] = float(rate)
+    return rates
+
+def load_scenarios(path):
+    """Read named rate overrides from a file.
+
+    A seed (directory or seed-data.json) is one scenario named after the
+    file; a .json file maps scenario names to {rateCode: rate}; a .csv file
+    has scenario,rate_code,rate rows.
+    """
+    path = Path(path)
+    if is_seed_dir(path) or (path.suffix == ".json" and "rates" in json.loads(path.read_text(encoding='utf-8'))):
+        rates = load_seed(path, ("rates",))["rates"]
+        return {path.stem: {rate["code"]: rate["rate"] for rate in rates}}
+    if path.suffix == ".json":
+        return json.loads(path.read_text(encoding='utf-8'))
+    scenarios = {}
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        for row in csv.DictReader(f):
+            scenarios.setdefault(row["scenario"], {})[row["rate_code"]] = float(row["rate"])
+    return scenarios
+
+def synthetic_scenarios(catalog, count, spread, seed=0):
+    """Base rates scaled per code by uniform factors in [1 - spread, 1 + spread]"""
+    rng = np.random.default_rng(seed)
+    factors = rng.uniform(1 - spread, 1 + spread, size=(count, len(catalog["base_rates"])))
+    return catalog["base_rates"] * factors
+
+def check_against_scalar(catalog, seed, rates, results, config=COST_CONFIG):
+    """Largest difference between the vectorized and scalar selling rates of the first scenario"""
+    first = rates[0]
+    lookup = lambda code: first[catalog["column"][code]]
+    expected = np.array([price_template(template, lookup, config) for template in seed["boq_templates"]])
+    return float(np.max(np.abs(results["sellingRate"][0] - expected))) if len(expected) else 0.0
+
+def write_results(path, names, catalog, results):
+    """Write selling rates as CSV (scenario x template) or every field as .npz"""
+    path = Path(path)
+    if path.suffix == ".npz":
+        np.savez_compressed(path, scenarios=np.array(names), templates=np.array(catalog["template_codes"]), **results)
+        return
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(["scenario", *catalog["template_codes"]])
+        for name, row in zip(names, results["sellingRate"]):
+            writer.writerow([name, *(f"{value:.4f}" for value in row)])
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Price the BOQ template catalog against many rate scenarios")
+    parser.add_argument("--seed", default=None, help="Seed directory or seed-data.json (default: scripts/seed-data)")
+    parser.add_argument("--scenarios", nargs="*", default=[],
+                        help="Seeds, scenario JSON ({name: {rateCode: rate}}) or CSV (scenario,rate_code,rate)")
+    parser.add_argument("--synthetic", type=int, default=0, metavar="N",
+                        help="Add N scenarios with every rate jittered by up to --spread")
+    parser.add_argument("--spread", type=float, default=0.15, help="Relative jitter for --synthetic scenarios")
+    parser.add_argument("--seed-indirect", action="store_true",
+                        help="Take overhead and contingency from the seed's indirect_costs instead of "
+                             "DEFAULT_COST_CONFIG")
+    parser.add_argument("--check", action="store_true",
+                        help="Compare the base scenario with scalar per-template pricing")
+    parser.add_argument("--output", help="Write results to .csv (selling rates) or .npz (all fields)")
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    seed_path = args.seed or default_seed_path()
+    if not seed_exists(seed_path):
+        raise SystemExit(f"No seed at {seed_path}; run extract-excel-data.py first")
+    seed = load_seed(seed_path)
+    catalog = build_catalog(seed)
+    if catalog["unresolved"]:
+        print(f"⚠ Rate codes not in the seed (priced at 0 unless a scenario sets them): "
+              f"{', '.join(catalog['unresolved'])}")
+
+    names = ["base"]
+    vectors = [catalog["base_rates"]]
+    for path in args.scenarios:
+        for name, overrides in load_scenarios(path).items():
+            names.append(name)
+            vectors.append(scenario_from_overrides(catalog, overrides))
+    rates = np.vstack(vectors)
+    if args.synthetic:
+        rates = np.vstack([rates, synthetic_scenarios(catalog, args.synthetic, args.spread)])
+        names += [f"synthetic-{i + 1}" for i in range(args.synthetic)]
+
+    start = time.perf_counter()
+    results = price_scenarios(catalog, rates, cost_rates(catalog, seed, seed_indirect=args.seed_indirect))
+    elapsed = time.perf_counter() - start
+
+    nnz = sum(len(matrix["data"]) for matrix in catalog["matrices"].values())
+    print(f"Priced {len(catalog['template_codes'])} templates x {len(names)} scenarios "
+          f"({nnz} components, {len(catalog['rate_codes'])} rate codes) in {elapsed * 1000:.1f} ms")
+    if args.check and not args.seed_indirect:
+        print(f"Max difference from scalar pricing: {check_against_scalar(catalog, seed, rates, results):.2e}")
+    if args.output:
+        write_results(args.output, names, catalog, results)
+        print(f"✓ Saved to: {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Query the rate history store and escalate a BOQ between two dates
+
+  append    record a seed as the rates in force from --date
+  snapshots list the recorded snapshots
+  at        rates of the given codes on --date
+  history   every recorded version of the given codes
+  escalate  calculateEscalation() of a BOQ between --from and --to
+  bench     fill a temporary store with monthly snapshots and time queries
+
+extract-excel-data.py --history appends each extraction to the store itself.
+"""
+
+import argparse
+import json
+import random
+import statistics
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+
+import rate_store
+from script_modules import load_script
+from seed_store import load_seed
+
+SCRIPTS_DIR = Path(__file__).parent
+DEFAULT_STORE = SCRIPTS_DIR / "rate-history.sqlite"
+DEFAULT_SEED = SCRIPTS_DIR / "seed-data"
+
+def month_starts(first, count):
+    """`count` first-of-month dates from `first`"""
+    dates = []
+    year, month = first.year, first.month
+    for _ in range(count):
+        dates.append(date(year, month, 1))
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return dates
+
+def synthetic_history(conn, codes, months, change_share, seed=0):
+    """Monthly snapshots where `change_share` of the rates move a few percent each month"""
+    rng = random.Random(seed)
+    rates = {code: round(rng.uniform(10, 5000), 2) for code in range(codes)}
+    dates = month_starts(date(2015, 1, 1), months)
+    for effective in dates:
+        for code in rng.sample(range(codes), int(codes * change_share)):
+            rates[code] = round(rates[code] * rng.uniform(0.97, 1.08), 2)
+        rate_store.append_snapshot(
+            conn, [{"code": f"RATE-{code:06d}", "rate": rate, "unit": "u"} for code, rate in rates.items()],
+            effective, source="synthetic")
+    return dates
+
+def bench(args):
+    with tempfile.TemporaryDirectory(prefix="rate-history-") as tmp:
+        conn = rate_store.connect(Path(tmp) / "history.sqlite")
+        start = time.perf_counter()
+        dates = synthetic_history(conn, args.codes, args.months, args.change_share)
+        build = time.perf_counter() - start
+        versions = conn.execute("SELECT COUNT(*) FROM rate_versions").fetchone()[0]
+        size = (Path(tmp) / "history.sqlite").stat().st_size
+        print(f"{args.months} monthly snapshots x {args.codes} codes in {build:.1f} s: "
+              f"{versions:,} versions, {size / 1024 / 1024:.1f} MB")
+
+        rng = random.Random(1)
+        timings = []
+        for _ in range(args.lookups):
+            code = f"RATE-{rng.randrange(args.codes):06d}"
+            at = rng.choice(dates)
+            began = time.perf_counter()
+            rate_store.rate_at(conn, code, at)
+            timings.append(time.perf_counter() - began)
+        timings.sort()
+        print(f"rate_at: p50 {timings[len(timings) // 2] * 1e6:.0f} us, "
+              f"p99 {timings[int(len(timings) * 0.99)] * 1e6:.0f} us")
+
+        lines = [(f"RATE-{rng.randrange(args.codes):06d}", rng.uniform(1, 500)) for _ in range(args.boq_lines)]
+        runs = []
+        for _ in range(5):
+            began = time.perf_counter()
+            result = rate_store.escalate_boq(conn, lines, dates[0], dates[-1])
+            runs.append(time.perf_counter() - began)
+        print(f"escalate_boq, {len(lines)} lines {dates[0]} -> {dates[-1]}: "
+              f"{statistics.median(runs) * 1000:.1f} ms (escalation {result['escalation']:,.0f})")
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Rate history queries and BOQ escalation")
+    parser.add_argument("--store", default=str(DEFAULT_STORE), help="Rate history SQLite file")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    append = commands.add_parser("append", help="Record a seed's rates as in force from --date")
+    append.add_argument("--seed", default=str(DEFAULT_SEED))
+    append.add_argument("--date", default=date.today().isoformat(), help="Effective date (YYYY-MM-DD)")
+
+    commands.add_parser("snapshots", help="List the recorded snapshots")
+
+    at = commands.add_parser("at", help="Rates in force on --date")
+    at.add_argument("codes", nargs="+")
+    at.add_argument("--date", default=date.today().isoformat())
+
+    history = commands.add_parser("history", help="Every recorded version of the codes")
+    history.add_argument("codes", nargs="+")
+
+    escalate = commands.add_parser("escalate", help="Escalate a BOQ between two dates")
+    escalate.add_argument("--boq", required=True,
+                          help="CSV with code,quantity columns or JSON [{code, quantity}]; "
+                               "codes are BOQ templates of --seed or rate codes")
+    escalate.add_argument("--from", dest="start", required=True, help="Base date (YYYY-MM-DD)")
+    escalate.add_argument("--to", dest="end", required=True, help="Current date (YYYY-MM-DD)")
+    escalate.add_argument("--seed", default=str(DEFAULT_SEED), help="Seed whose BOQ templates expand lines")
+    escalate.add_argument("--output", help="Write the per-line result as JSON")
+
+    benchmark = commands.add_parser("bench", help="Time queries over a synthetic multi-year store")
+    benchmark.add_argument("--codes", type=int, default=5000)
+    benchmark.add_argument("--months", type=int, default=120)
+    benchmark.add_argument("--change-share", type=float, default=0.1,
+                           help="Share of the rates that change each month")
+    benchmark.add_argument("--lookups", type=int, default=10000)
+    benchmark.add_argument("--boq-lines", type=int, default=5000)
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    if args.command == "bench":
+        bench(args)
+        return
+
+    conn = rate_store.connect(args.store)
+    if args.command == "append":
+        written = rate_store.append_snapshot(conn, load_seed(args.seed, ("rates",))["rates"], args.date,
+                                             source=str(args.seed))
+        print(f"✓ {args.date}: {written} rate versions recorded in {args.store}")
+    elif args.command == "snapshots":
+        for effective, generated_at, source, count, changed in rate_store.snapshots(conn):
+            print(f"{effective}  {count:>7} rates  {changed:>7} changed  {source or '-'}  ({generated_at})")
+    elif args.command == "at":
+        for code in args.codes:
+            rate = rate_store.rate_at(conn, code, args.date)
+            print(f"{code}: {'-' if rate is None else rate}")
+    elif args.command == "history":
+        for code in args.codes:
+            versions = ", ".join(f"{effective} {'retired' if rate is None else rate}"
+                                 for effective, rate in rate_store.rate_history(conn, code))
+            print(f"{code}: {versions or '-'}")
+    elif args.command == "escalate":
+        lines = load_script("simulate-boq").load_boq(args.boq)
+        templates = load_seed(args.seed, ("boq_templates",))["boq_templates"]
+        result = rate_store.escalate_boq(conn, lines, args.start, args.end, templates)
+        print(f"{len(lines)} lines, {result['from']} -> {result['to']}: base value {result['baseValue']:,.2f}, "
+              f"escalation {result['escalation']:,.2f}")
+        if result["missingRates"]:
+            print(f"⚠ No rate at one of the dates for: {', '.join(result['missingRates'])}")
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                json.dump(result, f, ensure_ascii=False, indent=2)
+            print(f"✓ Saved to: {args.output}")
+
+if __name__ == "__main__":
+    main()
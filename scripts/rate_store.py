@@ -0,0 +1,200 @@
+"""
+Versioned rate history: every extracted seed appended as a dated snapshot
+
+The store is a SQLite file with one row per rate *change*: a snapshot only
+adds rows for codes whose rate or unit differs from their latest version
+before its effective date, plus a row with a NULL rate for codes that
+disappeared (retired). Snapshots may be appended out of order: a backfilled
+or re-appended date re-stores the next snapshot's rows against it, so the
+catalog in force from each later date stays as recorded. rate_versions is
+keyed (code, effective_date) and
+stored WITHOUT ROWID, so the versions of a code are contiguous in the
+primary-key b-tree and "rate of X at date D" is a single index seek.
+
+Escalation follows calculateEscalation() in src/lib/calculations.ts:
+V2 = V1 x 0.85 x 0.05 x (new rate / old rate - 1).
+"""
+
+import sqlite3
+from datetime import date, datetime
+from pathlib import Path
+
+# Keep in sync with calculateEscalation() in src/lib/calculations.ts
+ESCALATION_SHARE = 0.85
+ESCALATION_FACTOR = 0.05
+
+COMPONENT_SECTIONS = ("materials", "labor", "equipment")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+  effective_date TEXT PRIMARY KEY,
+  generated_at TEXT NOT NULL,
+  source TEXT,
+  rate_count INTEGER NOT NULL,
+  changed INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS rate_versions (
+  code TEXT NOT NULL,
+  effective_date TEXT NOT NULL,
+  rate REAL,
+  unit TEXT,
+  type TEXT,
+  PRIMARY KEY (code, effective_date)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_rate_versions_date ON rate_versions(effective_date);
+"""
+
+RATE_AT_SQL = """
+SELECT rate FROM rate_versions
+WHERE code = ? AND effective_date <= ?
+ORDER BY effective_date DESC LIMIT 1
+"""
+
+def iso_date(value):
+    """A date, datetime or 'YYYY-MM-DD' string as 'YYYY-MM-DD'"""
+    if isinstance(value, datetime):
+        return value.date().isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    return date.fromisoformat(str(value)[:10]).isoformat()
+
+def connect(path):
+    """Open (creating if needed) a rate history store"""
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path)
+    conn.executescript(SCHEMA)
+    return conn
+
+def latest_versions(conn, before, inclusive=False):
+    """{code: (rate, unit, type)} of each code's latest version strictly before `before` (or on it, if inclusive)"""
+    # SQLite takes the bare columns from the row holding the MAX()
+    rows = conn.execute(
+        "SELECT code, rate, unit, type, MAX(effective_date) FROM rate_versions "
+        f"WHERE effective_date {'<=' if inclusive else '<'} ? GROUP BY code", (before,))
+    return {code: (rate, unit, rate_type) for code, rate, unit, rate_type, _ in rows}
+
+def rate_catalog(rates):
+    """{code: (rate, unit, type)} of seed rate records"""
+    return {rate["code"]: (float(rate["rate"]), rate.get("unit") or None, rate.get("type")) for rate in rates}
+
+def version_rows(before, catalog):
+    """(code, rate, unit, type) rows turning the versions `before` into `catalog`: changed and new codes, then retired ones"""
+    rows = [(code, rate, unit, rate_type) for code, (rate, unit, rate_type) in catalog.items()
+            if before.get(code, (None, None))[:2] != (rate, unit)]
+    rows.extend((code, None, None, None) for code, (rate, _, _) in before.items()
+                if rate is not None and code not in catalog)
+    return rows
+
+def write_versions(conn, effective_date, rows):
+    conn.execute("DELETE FROM rate_versions WHERE effective_date = ?", (effective_date,))
+    conn.executemany("INSERT INTO rate_versions (code, effective_date, rate, unit, type) VALUES (?, ?, ?, ?, ?)",
+                     [(code, effective_date, rate, unit, rate_type) for code, rate, unit, rate_type in rows])
+
+def append_snapshot(conn, rates, effective_date, source=None, generated_at=None):
+    """Record the seed's `rates` as the catalog in force from `effective_date`.
+
+    A date that is already recorded has its snapshot replaced. If a later
+    snapshot follows, its rows are re-stored against the new catalog, since
+    it only holds what changed since the snapshot before it; the catalog in
+    force from that later date on is unchanged. Returns the number of
+    versions written for `effective_date` (changed, new and retired codes).
+    """
+    effective_date = iso_date(effective_date)
+    catalog = rate_catalog(rates)
+    rows = version_rows(latest_versions(conn, effective_date), catalog)
+    following = conn.execute("SELECT MIN(effective_date) FROM snapshots WHERE effective_date > ?",
+                             (effective_date,)).fetchone()[0]
+
+    with conn:
+        if following:
+            # Read before this snapshot is rewritten: the catalog the next one must keep
+            in_force = {code: version for code, version in latest_versions(conn, following, inclusive=True).items()
+                        if version[0] is not None}
+            following_rows = version_rows(catalog, in_force)
+            write_versions(conn, following, following_rows)
+            conn.execute("UPDATE snapshots SET changed = ? WHERE effective_date = ?",
+                         (len(following_rows), following))
+        write_versions(conn, effective_date, rows)
+        conn.execute(
+            "INSERT OR REPLACE INTO snapshots (effective_date, generated_at, source, rate_count, changed) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (effective_date, generated_at or datetime.now().isoformat(), source, len(catalog), len(rows)))
+    return len(rows)
+
+def rate_at(conn, code, at):
+    """Rate of `code` in force on `at`, or None (unknown then, or retired)"""
+    row = conn.execute(RATE_AT_SQL, (code, iso_date(at))).fetchone()
+    return row[0] if row else None
+
+def rates_at(conn, codes, at):
+    """{code: rate} in force on `at` for many codes; codes without a rate then are left out"""
+    at = iso_date(at)
+    rates = {}
+    for code in dict.fromkeys(codes):
+        row = conn.execute(RATE_AT_SQL, (code, at)).fetchone()
+        if row and row[0] is not None:
+            rates[code] = row[0]
+    return rates
+
+def rate_history(conn, code):
+    """[(effective_date, rate)] of every recorded version of `code`, oldest first"""
+    return conn.execute(
+        "SELECT effective_date, rate FROM rate_versions WHERE code = ? ORDER BY effective_date", (code,)
+    ).fetchall()
+
+def snapshots(conn):
+    return conn.execute(
+        "SELECT effective_date, generated_at, source, rate_count, changed FROM snapshots ORDER BY effective_date"
+    ).fetchall()
+
+def escalation(base_value, old_rate, new_rate):
+    """calculateEscalation(): adjustment on `base_value` for a rate moving from old to new"""
+    if not old_rate:
+        return 0.0
+    return base_value * ESCALATION_SHARE * ESCALATION_FACTOR * (new_rate / old_rate - 1)
+
+def expand_boq(lines, templates=None):
+    """(line, rate code, quantity of that rate) for each BOQ line.
+
+    A line whose code is a BOQ template expands into its components
+    (line quantity x component qty); any other code is taken as a rate code.
+    """
+    by_code = {template["code"]: template for template in templates or []}
+    for line, (code, quantity) in enumerate(lines):
+        template = by_code.get(code)
+        if template is None:
+            yield line, code, quantity
+            continue
+        for section in COMPONENT_SECTIONS:
+            for component in template.get(section, []):
+                yield line, component["rateCode"], quantity * component["qty"]
+
+def escalate_boq(conn, lines, start, end, templates=None):
+    """Escalation of every BOQ line between two dates.
+
+    `lines` are (code, quantity) pairs; V1 of each rate is quantity x its
+    rate at `start`, and its adjustment is escalation(V1, rate at start,
+    rate at end). Rates missing at either date are listed and not escalated.
+    """
+    parts = list(expand_boq(lines, templates))
+    codes = [code for _, code, _ in parts]
+    old = rates_at(conn, codes, start)
+    new = rates_at(conn, codes, end)
+    results = [{"code": code, "quantity": quantity, "baseValue": 0.0, "escalation": 0.0}
+               for code, quantity in lines]
+    missing = set()
+    for line, code, quantity in parts:
+        if code not in old or code not in new:
+            missing.add(code)
+            continue
+        base_value = quantity * old[code]
+        results[line]["baseValue"] += base_value
+        results[line]["escalation"] += escalation(base_value, old[code], new[code])
+    return {
+        "from": iso_date(start),
+        "to": iso_date(end),
+        "baseValue": sum(result["baseValue"] for result in results),
+        "escalation": sum(result["escalation"] for result in results),
+        "lines": results,
+        "missingRates": sorted(missing),
+    }
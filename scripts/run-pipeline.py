@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+Run the data pipeline as a dependency graph of stages
+
+  extract       extract-excel-data.py: workbooks -> scripts/seed-data, its sheet
+                fingerprints and the Postgres load files in supabase/seed/smart_estimate
+  templates     generate-templates.py: extracted-productivity.json, crew-roles.ts
+                -> productivity-templates.ts and its modules
+  v2-reference  generate-v2-reference-data.mjs: productivity-templates.ts and the
+                other catalogs -> supabase/seed/v2_reference_data.sql
+
+Every file a stage writes is one of its outputs. The extraction therefore
+runs without --history: appending a dated rate snapshot stays a separate,
+explicit step (extract-excel-data.py --history or rate-history.py append).
+
+A stage depends on the stages that write its inputs. When its dependencies
+are done, its inputs (files, directories and the scripts it runs) and its
+command line are hashed; if that hash and its outputs match the last
+successful run recorded in scripts/pipeline.state.json, it is skipped. A
+stage whose upstream reran but wrote identical files is therefore skipped
+too. Stages with no dependency between them run concurrently (--jobs).
+
+The report lists each stage's status and time and the critical path: the
+chain of dependent stages that bounded the run's wall time, and the same
+for a full refresh from the last recorded time of every stage.
+"""
+
+import argparse
+import hashlib
+import json
+import subprocess
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime
+from pathlib import Path
+
+from seed_store import atomic_writer
+
+ROOT = Path(__file__).resolve().parent.parent
+STATE_PATH = ROOT / "scripts" / "pipeline.state.json"
+STATE_FORMAT = "fcc-pipeline-state/1"
+
+# Lines of a failed stage's output shown without --verbose
+FAILURE_TAIL_LINES = 20
+
+def pipeline_stages(workbooks=(), node="node"):
+    """The pipeline's stages; paths are relative to the repository root"""
+    return [
+        {
+            "name": "extract",
+            "command": [sys.executable, "scripts/extract-excel-data.py", *workbooks,
+                        "--sql-dir", "supabase/seed/smart_estimate"],
+            "inputs": [*workbooks, "scripts/extract-excel-data.py", "scripts/seed_store.py", "scripts/seed_sql.py",
+                       "scripts/rate_store.py", "scripts/stage_profile.py"],
+            "outputs": ["scripts/seed-data", "scripts/seed-data.fingerprints.json", "supabase/seed/smart_estimate"],
+        },
+        {
+            "name": "templates",
+            "command": [sys.executable, "scripts/generate-templates.py"],
+            "inputs": ["src/data/extracted-productivity.json", "src/data/crew-roles.ts",
+                       "scripts/generate-templates.py", "scripts/seed_store.py", "scripts/stage_profile.py"],
+            "outputs": ["src/data/productivity-templates.ts", "src/data/productivity-templates"],
+        },
+        {
+            "name": "v2-reference",
+            "command": [node, "scripts/generate-v2-reference-data.mjs"],
+            "inputs": ["src/data/productivity-templates.ts", "src/data/productivity-templates",
+                       "src/data/boq-items.ts", "src/data/crew-roles.ts", "src/data/condition-factors.ts",
+                       "src/data/risk-catalog.ts", "scripts/generate-v2-reference-data.mjs"],
+            "outputs": ["supabase/seed/v2_reference_data.sql"],
+        },
+    ]
+
+def contains(parent, path):
+    parent, path = Path(parent), Path(path)
+    return path == parent or parent in path.parents
+
+def stage_dependencies(stages):
+    """{stage: [stages writing one of its inputs]}; rejects shared outputs and cycles"""
+    writers = {}
+    for stage in stages:
+        for output in stage["outputs"]:
+            for other, owner in writers.items():
+                if contains(other, output) or contains(output, other):
+                    raise SystemExit(f"Stages {owner} and {stage['name']} both write {output}")
+            writers[output] = stage["name"]
+    dependencies = {
+        stage["name"]: sorted({
+            owner
+            for path in stage["inputs"]
+            for output, owner in writers.items()
+            if contains(output, path) and owner != stage["name"]
+        })
+        for stage in stages
+    }
+    visiting, done = set(), set()
+
+    def visit(name):
+        if name in done:
+            return
+        if name in visiting:
+            raise SystemExit(f"Pipeline stages form a cycle through {name}")
+        visiting.add(name)
+        for dependency in dependencies[name]:
+            visit(dependency)
+        visiting.discard(name)
+        done.add(name)
+
+    for name in dependencies:
+        visit(name)
+    return dependencies
+
+def with_upstream(targets, dependencies):
+    """The target stages and every stage they depend on"""
+    selected = set()
+    pending = list(targets)
+    while pending:
+        name = pending.pop()
+        if name not in selected:
+            selected.add(name)
+            pending.extend(dependencies[name])
+    return selected
+
+def hash_paths(paths, extra=()):
+    """Hash of the files under `paths` (missing paths included as such) and `extra` strings"""
+    digest = hashlib.sha256()
+    for value in extra:
+        digest.update(f"arg:{value}\0".encode('utf-8'))
+    for spec in paths:
+        path = ROOT / spec
+        if path.is_dir():
+            files = sorted(file for file in path.rglob("*") if file.is_file() and "__pycache__" not in file.parts)
+        elif path.is_file():
+            files = [path]
+        else:
+            digest.update(f"missing:{spec}\0".encode('utf-8'))
+            continue
+        for file in files:
+            digest.update(f"file:{spec}/{file.relative_to(path).as_posix()}\0".encode('utf-8'))
+            with open(file, 'rb') as f:
+                digest.update(hashlib.file_digest(f, "sha256").digest())
+    return digest.hexdigest()
+
+def run_stage(stage, previous, force=False, dry_run=False):
+    """Run a stage unless its inputs and outputs match `previous` (its last recorded run)"""
+    # The interpreter path is left out so the hash carries across machines
+    inputs = hash_paths(stage["inputs"], stage["command"][1:])
+    if not force and previous and previous["inputs"] == inputs and previous["outputs"] == hash_paths(stage["outputs"]):
+        return {"status": "skipped", "seconds": 0.0, "record": previous}
+    if dry_run:
+        return {"status": "stale", "seconds": 0.0}
+
+    started = time.perf_counter()
+    try:
+        completed = subprocess.run(stage["command"], cwd=ROOT, capture_output=True, text=True)
+    except OSError as error:
+        return {"status": "failed", "seconds": time.perf_counter() - started, "output": str(error)}
+    seconds = time.perf_counter() - started
+    result = {"seconds": seconds, "output": completed.stdout + completed.stderr}
+    if completed.returncode:
+        return dict(result, status="failed", returncode=completed.returncode)
+    record = {
+        "inputs": inputs,
+        "outputs": hash_paths(stage["outputs"]),
+        "seconds": seconds,
+        "finished_at": datetime.now().isoformat(),
+    }
+    return dict(result, status="ran", record=record)
+
+def run_pipeline(stages, dependencies, state, jobs=None, force=False, dry_run=False, verbose=False):
+    """Run the stages in dependency order, independent ones concurrently; returns {stage: result}"""
+    pending = {stage["name"]: stage for stage in stages}
+    results = {}
+    running = {}
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        while pending or running:
+            for name, stage in list(pending.items()):
+                upstream = dependencies[name]
+                if any(dependency in pending or dependency in running.values() for dependency in upstream):
+                    continue
+                del pending[name]
+                waiting = [dependency for dependency in upstream
+                           if results[dependency]["status"] in ("failed", "blocked", "stale", "pending")]
+                if waiting:
+                    status = "pending" if dry_run else "blocked"
+                    results[name] = {"status": status, "seconds": 0.0, "start": 0.0, "after": waiting}
+                    print_stage_result(name, results[name], verbose)
+                    continue
+                running[pool.submit(run_stage, stage, state.get(name), force, dry_run)] = name
+                results[name] = {"start": time.perf_counter() - started}
+            if not running:
+                continue
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                results[name].update(future.result())
+                print_stage_result(name, results[name], verbose)
+    return results
+
+def print_stage_result(name, result, verbose=False):
+    status = result["status"]
+    detail = f"{result['seconds']:.2f} s" if status in ("ran", "failed") else ""
+    if "after" in result:
+        detail = f"after {', '.join(result['after'])}"
+    print(f"{'✓' if status in ('ran', 'skipped') else '⚠'} {name:14} {status:8} {detail}")
+    output = result.get("output", "").rstrip()
+    if output and (verbose or status == "failed"):
+        lines = output.splitlines()
+        if not verbose:
+            lines = lines[-FAILURE_TAIL_LINES:]
+        print("\n".join(f"    {line}" for line in lines))
+
+def critical_path(dependencies, seconds):
+    """(total seconds, [stages]) of the costliest chain of dependent stages"""
+    finish = {}
+    chain = {}
+
+    def visit(name):
+        if name not in finish:
+            upstream = max(dependencies[name], key=visit, default=None)
+            finish[name] = seconds.get(name, 0.0) + (finish[upstream] if upstream else 0.0)
+            chain[name] = (chain[upstream] if upstream else []) + [name]
+        return finish[name]
+
+    last = max(seconds, key=visit)
+    return finish[last], chain[last]
+
+def print_report(results, dependencies, state, wall):
+    ran = {name: result["seconds"] for name, result in results.items()}
+    total, path = critical_path({name: [d for d in dependencies[name] if d in ran] for name in ran}, ran)
+    counts = {status: sum(1 for result in results.values() if result["status"] == status)
+              for status in ("ran", "skipped", "stale", "failed", "blocked", "pending")}
+    print(f"\n{', '.join(f'{count} {status}' for status, count in counts.items() if count)} in {wall:.2f} s")
+    if total:
+        print(f"Critical path: {' -> '.join(path)} ({total:.2f} s)")
+    recorded = {name: record["seconds"] for name, record in state.items() if name in dependencies}
+    if recorded:
+        full, path = critical_path({name: [d for d in dependencies[name] if d in recorded] for name in recorded},
+                                   recorded)
+        print(f"Full refresh critical path: {' -> '.join(path)} ({full:.2f} s, "
+              f"{sum(recorded.values()):.2f} s of stage time)")
+
+def load_state(path):
+    if not Path(path).exists():
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)["stages"]
+
+def write_state(path, state):
+    with atomic_writer(path) as f:
+        json.dump({"format": STATE_FORMAT, "stages": state}, f, ensure_ascii=False, indent=2)
+
+def parse_args(stage_names):
+    parser = argparse.ArgumentParser(description="Run the data pipeline, skipping stages whose inputs are unchanged")
+    parser.add_argument("targets", nargs="*", metavar="STAGE",
+                        help=f"Stages to bring up to date, with their dependencies ({', '.join(stage_names)}; "
+                             "default: all)")
+    parser.add_argument("--workbooks", nargs="+", default=[],
+                        help="Workbooks for the extract stage (default: the reference catalog)")
+    parser.add_argument("--jobs", type=int, default=None, help="Stages run at the same time (default: CPU count)")
+    parser.add_argument("--force", action="store_true", help="Run every selected stage, ignoring recorded hashes")
+    parser.add_argument("--dry-run", action="store_true", help="Only report which stages are out of date")
+    parser.add_argument("--node", default="node", help="Node.js executable for the .mjs stages")
+    parser.add_argument("--state", default=str(STATE_PATH), help="Where the stage hashes are recorded")
+    parser.add_argument("--verbose", action="store_true", help="Print the output of every stage that ran")
+    args = parser.parse_args()
+    unknown = [target for target in args.targets if target not in stage_names]
+    if unknown:
+        parser.error(f"unknown stage {', '.join(unknown)} (choose from {', '.join(stage_names)})")
+    return args
+
+def main():
+    names = [stage["name"] for stage in pipeline_stages()]
+    args = parse_args(names)
+    stages = pipeline_stages(args.workbooks, args.node)
+    dependencies = stage_dependencies(stages)
+    selected = with_upstream(args.targets or names, dependencies)
+    stages = [stage for stage in stages if stage["name"] in selected]
+
+    state = load_state(args.state)
+    started = time.perf_counter()
+    results = run_pipeline(stages, dependencies, state, args.jobs, args.force, args.dry_run, args.verbose)
+    wall = time.perf_counter() - started
+    for name, result in results.items():
+        if "record" in result:
+            state[name] = result["record"]
+    if not args.dry_run:
+        write_state(args.state, state)
+    print_report(results, dependencies, state, wall)
+    if any(result["status"] in ("failed", "blocked") for result in results.values()):
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
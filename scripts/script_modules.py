@@ -0,0 +1,21 @@
+"""
+Import the data pipeline's hyphen-named scripts as modules
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).parent
+
+def load_script(name):
+    """Import scripts/<name>.py (e.g. "generate-templates") as a module"""
+    module_name = name.replace('-', '_')
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    spec = importlib.util.spec_from_file_location(module_name, SCRIPTS_DIR / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    # Registered before executing so process pools can pickle its functions
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
@@ -0,0 +1,383 @@
+"""
+Compact typed catalogs for the seed and a one-pass validator
+
+Rates and BOQ templates are stored column-wise instead of one dict per
+record: codes and names in lists, rates and quantities in float arrays, and
+units, types, categories and component descriptions interned into small
+tables referenced by integer ids. Template components are flattened into
+parallel arrays, with each template pointing at its first component (a
+CSR layout). Every catalog keeps a code -> row hash index.
+
+load_catalog() fills the catalogs from the seed sections (any iterables,
+e.g. seed_store.iter_section, so records are never all held as dicts) and
+checks each record as it is read: required fields, numeric ranges of the
+schema (002_smart_estimate_schema.sql), units, duplicate codes, template
+categories and the rate code of every component. A component referring to
+a rate not read yet is re-checked once the pass is over, so section order
+does not matter. Problems are collected, not raised, so one run reports all
+of them.
+"""
+
+import re
+from array import array
+
+SEVERITIES = ("error", "warning")
+
+RATE_TYPES = ("LABOR", "MATERIAL", "EQUIPMENT")
+# Keep in sync with RATE_TYPES/TEMPLATE_SECTIONS in extract-excel-data.py
+TYPE_PREFIXES = {"LABOR": "LAB-", "MATERIAL": "MAT-", "EQUIPMENT": "EQP-"}
+SECTIONS = ("materials", "labor", "equipment")
+SECTION_TYPES = {"materials": "MATERIAL", "labor": "LABOR", "equipment": "EQUIPMENT"}
+
+# Units of quantity; rates may also be per period (م²/يوم)
+QUANTITY_UNITS = frozenset(("م³", "م²", "م.ط", "م", "طن", "كجم", "لتر", "عدد", "يوم", "رحلة", "1000 طوبة", "دور"))
+UNIT_PERIODS = frozenset(("يوم", "شهر"))
+UNIT_ALIASES = {"م3": "م³", "م2": "م²", "مط": "م.ط", "م ط": "م.ط", "كغ": "كجم"}
+BIDI_MARKS_RE = re.compile(r'[\u200e\u200f\u202a-\u202e]')
+
+# DECIMAL(12,2) current_rate, DECIMAL(5,3) waste_factor, DECIMAL(5,4) percentage
+MAX_RATE = 10 ** 10
+MAX_WASTE_FACTOR = 100
+
+class Interned:
+    """Distinct values stored once and referred to by their position"""
+    __slots__ = ("values", "ids")
+
+    def __init__(self):
+        self.values = []
+        self.ids = {}
+
+    def id(self, value):
+        found = self.ids.get(value)
+        if found is None:
+            found = self.ids[value] = len(self.values)
+            self.values.append(value)
+        return found
+
+class RateTable:
+    """master_rates rows column-wise; `index` maps code -> row"""
+    __slots__ = ("codes", "names_ar", "names_en", "unit_ids", "type_ids", "rates", "waste_factors", "units", "index")
+
+    def __init__(self, units=None):
+        self.codes = []
+        self.names_ar = []
+        self.names_en = []
+        self.unit_ids = array('H')
+        self.type_ids = array('B')
+        self.rates = array('d')
+        # NaN where the record has no waste factor
+        self.waste_factors = array('d')
+        self.units = units or Interned()
+        self.index = {}
+
+    def __len__(self):
+        return len(self.codes)
+
+    def append(self, code, name_ar, name_en, unit, rate_type, rate, waste_factor=None):
+        row = len(self.codes)
+        self.codes.append(code)
+        self.names_ar.append(name_ar)
+        self.names_en.append(name_en)
+        self.unit_ids.append(self.units.id(unit))
+        self.type_ids.append(RATE_TYPES.index(rate_type))
+        self.rates.append(rate)
+        self.waste_factors.append(float("nan") if waste_factor is None else waste_factor)
+        self.index.setdefault(code, row)
+        return row
+
+    def type_of(self, code):
+        row = self.index.get(code)
+        return None if row is None else RATE_TYPES[self.type_ids[row]]
+
+    def record(self, row):
+        """Row `row` as the seed's rate dict"""
+        record = {
+            "code": self.codes[row],
+            "name_ar": self.names_ar[row],
+            "name_en": self.names_en[row],
+            "unit": self.units.values[self.unit_ids[row]],
+            "rate": self.rates[row],
+            "type": RATE_TYPES[self.type_ids[row]],
+        }
+        if self.waste_factors[row] == self.waste_factors[row]:
+            record["waste_factor"] = self.waste_factors[row]
+        return record
+
+class TemplateTable:
+    """boq_templates rows column-wise, components flattened; `index` maps code -> row"""
+    __slots__ = ("codes", "names_ar", "names_en", "unit_ids", "category_ids", "first_component",
+                 "component_rates", "component_sections", "component_qty", "component_descriptions",
+                 "units", "categories", "rate_codes", "descriptions", "index")
+
+    def __init__(self, units=None):
+        self.codes = []
+        self.names_ar = []
+        self.names_en = []
+        self.unit_ids = array('H')
+        self.category_ids = array('H')
+        # Components of template i are first_component[i]:first_component[i + 1]
+        self.first_component = array('I', [0])
+        self.component_rates = array('I')
+        self.component_sections = array('B')
+        self.component_qty = array('d')
+        self.component_descriptions = array('I')
+        self.units = units or Interned()
+        self.categories = Interned()
+        self.rate_codes = Interned()
+        self.descriptions = Interned()
+        self.index = {}
+
+    def __len__(self):
+        return len(self.codes)
+
+    def append(self, code, name_ar, name_en, unit, category):
+        row = len(self.codes)
+        self.codes.append(code)
+        self.names_ar.append(name_ar)
+        self.names_en.append(name_en)
+        self.unit_ids.append(self.units.id(unit))
+        self.category_ids.append(self.categories.id(category))
+        self.first_component.append(self.first_component[-1])
+        self.index.setdefault(code, row)
+        return row
+
+    def append_component(self, section, rate_code, qty, description):
+        """Add a component to the last appended template"""
+        self.component_rates.append(self.rate_codes.id(rate_code))
+        self.component_sections.append(SECTIONS.index(section))
+        self.component_qty.append(qty)
+        self.component_descriptions.append(self.descriptions.id(description))
+        self.first_component[-1] += 1
+
+    def record(self, row):
+        """Row `row` as the seed's template dict"""
+        record = {
+            "code": self.codes[row],
+            "name_ar": self.names_ar[row],
+            "name_en": self.names_en[row],
+            "unit": self.units.values[self.unit_ids[row]],
+            "category": self.categories.values[self.category_ids[row]],
+            **{section: [] for section in SECTIONS},
+        }
+        for component in range(self.first_component[row], self.first_component[row + 1]):
+            record[SECTIONS[self.component_sections[component]]].append({
+                "rateCode": self.rate_codes.values[self.component_rates[component]],
+                "qty": self.component_qty[component],
+                "description": self.descriptions.values[self.component_descriptions[component]],
+            })
+        return record
+
+class Catalog:
+    """The seed's rates and templates, its indirect costs and the problems found loading them"""
+    __slots__ = ("rates", "templates", "indirect_costs", "problems")
+
+    def __init__(self):
+        units = Interned()
+        self.rates = RateTable(units)
+        self.templates = TemplateTable(units)
+        self.indirect_costs = []
+        # (severity, section, code, field, message) tuples
+        self.problems = []
+
+    def problem(self, severity, section, code, field, message):
+        self.problems.append((severity, section, code, field, message))
+
+    def error_count(self):
+        return sum(1 for problem in self.problems if problem[0] == "error")
+
+def normalize_unit(unit):
+    """A unit without bidi marks, with the common ASCII spellings mapped (م2 -> م²)"""
+    unit = BIDI_MARKS_RE.sub('', unit or '').strip()
+    base, slash, period = unit.partition('/')
+    base = UNIT_ALIASES.get(base.strip(), base.strip())
+    return f"{base}/{period.strip()}" if slash else base
+
+def unit_problem(unit, per_period=False):
+    """Why `unit` is not a known unit, or None"""
+    if not unit:
+        return "missing unit"
+    base, slash, period = normalize_unit(unit).partition('/')
+    if base not in QUANTITY_UNITS:
+        return f"unknown unit {unit!r}"
+    if slash and not (per_period and period in UNIT_PERIODS):
+        return f"unexpected rate period in unit {unit!r}"
+    return None
+
+def is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool) and value == value
+
+def text(record, field):
+    value = record.get(field)
+    return value.strip() if isinstance(value, str) else ""
+
+def check_code(catalog, section, record, index, position):
+    """The record's code, or None (reported) if it has none; duplicates are reported too"""
+    code = text(record, "code")
+    if not code:
+        catalog.problem("error", section, f"#{position}", "code", "missing code")
+        return None
+    if code in index:
+        catalog.problem("error", section, code, "code", "duplicate code")
+    return code
+
+def load_rate(catalog, rate, position):
+    code = check_code(catalog, "rates", rate, catalog.rates.index, position)
+    if code is None:
+        return
+    rate_type = rate.get("type")
+    if rate_type not in RATE_TYPES:
+        catalog.problem("error", "rates", code, "type", f"unknown rate type {rate_type!r}")
+        return
+    if not code.startswith(TYPE_PREFIXES[rate_type]):
+        catalog.problem("error", "rates", code, "type", f"{rate_type} rate without the {TYPE_PREFIXES[rate_type]} prefix")
+    if not text(rate, "name_ar"):
+        catalog.problem("error", "rates", code, "name_ar", "missing Arabic name")
+    if not text(rate, "name_en"):
+        catalog.problem("warning", "rates", code, "name_en", "missing English name")
+    problem = unit_problem(rate.get("unit"), per_period=True)
+    if problem:
+        catalog.problem("error", "rates", code, "unit", problem)
+    value = rate.get("rate")
+    if not is_number(value) or not 0 <= value < MAX_RATE:
+        catalog.problem("error", "rates", code, "rate", f"rate {value!r} is not a number in [0, {MAX_RATE:.0e})")
+        value = float("nan")
+    elif value == 0:
+        catalog.problem("warning", "rates", code, "rate", "zero rate")
+    waste_factor = rate.get("waste_factor")
+    if waste_factor is not None and (not is_number(waste_factor) or not 1 <= waste_factor < MAX_WASTE_FACTOR):
+        catalog.problem("error", "rates", code, "waste_factor", f"waste factor {waste_factor!r} is not in [1, 100)")
+        waste_factor = None
+    catalog.rates.append(code, text(rate, "name_ar"), text(rate, "name_en"), normalize_unit(rate.get("unit")),
+                         rate_type, value, waste_factor)
+
+def check_component_rate(catalog, template_code, section, rate_code):
+    """Whether the component's rate exists (and is of its section's type); False if not read yet"""
+    rate_type = catalog.rates.type_of(rate_code)
+    if rate_type is None:
+        return False
+    if rate_type != SECTION_TYPES[section]:
+        catalog.problem("error", "boq_templates", template_code, section,
+                        f"{rate_code} is a {rate_type} rate listed under {section}")
+    return True
+
+def load_template(catalog, template, position, categories, unresolved):
+    code = check_code(catalog, "boq_templates", template, catalog.templates.index, position)
+    if code is None:
+        return
+    if not text(template, "name_ar"):
+        catalog.problem("error", "boq_templates", code, "name_ar", "missing Arabic name")
+    problem = unit_problem(template.get("unit"))
+    if problem:
+        catalog.problem("error", "boq_templates", code, "unit", problem)
+    category = text(template, "category")
+    if categories is not None and category not in categories:
+        catalog.problem("error", "boq_templates", code, "category", f"category {category!r} has no boq_categories row")
+    catalog.templates.append(code, text(template, "name_ar"), text(template, "name_en"),
+                             normalize_unit(template.get("unit")), category)
+    components = 0
+    for section in SECTIONS:
+        seen = set()
+        for component in template.get(section) or []:
+            rate_code = text(component, "rateCode")
+            qty = component.get("qty")
+            if not rate_code:
+                catalog.problem("error", "boq_templates", code, section, "component without a rate code")
+                continue
+            if not is_number(qty) or qty <= 0:
+                catalog.problem("error", "boq_templates", code, section, f"{rate_code} quantity {qty!r} is not positive")
+                continue
+            if rate_code in seen:
+                catalog.problem("warning", "boq_templates", code, section, f"{rate_code} listed twice")
+            seen.add(rate_code)
+            if not check_component_rate(catalog, code, section, rate_code):
+                unresolved.append((code, section, rate_code))
+            catalog.templates.append_component(section, rate_code, qty, text(component, "description"))
+            components += 1
+    if not components:
+        catalog.problem("warning", "boq_templates", code, "components", "template without components")
+
+def load_indirect_cost(catalog, indirect, position, scopes, index):
+    code = check_code(catalog, "indirect_costs", indirect, index, position)
+    if code is None:
+        return
+    index.add(code)
+    percentage = indirect.get("percentage")
+    if not is_number(percentage) or not 0 <= percentage < 1:
+        catalog.problem("error", "indirect_costs", code, "percentage", f"percentage {percentage!r} is not in [0, 1)")
+    applies_to = indirect.get("applies_to") or []
+    for scope in applies_to:
+        if scope not in scopes:
+            catalog.problem("warning", "indirect_costs", code, "applies_to", f"unknown scope {scope!r}")
+    catalog.indirect_costs.append(indirect)
+
+def load_catalog(sections, categories=None):
+    """Load and validate seed sections ({section: iterable of records}) in one pass.
+
+    `categories` are the template categories with a boq_categories row; None
+    skips that check. Returns a Catalog whose `problems` lists everything found.
+    """
+    catalog = Catalog()
+    unresolved = []
+    for position, rate in enumerate(sections.get("rates", ()), 1):
+        load_rate(catalog, rate, position)
+    for position, template in enumerate(sections.get("boq_templates", ()), 1):
+        load_template(catalog, template, position, categories, unresolved)
+    scopes = {"ALL", *RATE_TYPES, *catalog.templates.categories.values}
+    indirect_codes = set()
+    for position, indirect in enumerate(sections.get("indirect_costs", ()), 1):
+        load_indirect_cost(catalog, indirect, position, scopes, indirect_codes)
+    for code, section, rate_code in unresolved:
+        if not check_component_rate(catalog, code, section, rate_code):
+            catalog.problem("error", "boq_templates", code, section, f"rate {rate_code} does not exist")
+    return catalog
+
+def check_productivity(catalog, items, crew_codes, parse_crew, clean_text):
+    """Validate extracted productivity rows and the role codes of their parsed crews.
+
+    `crew_codes` are the role codes of crew-roles.ts; parse_crew and
+    clean_text are generate-templates.py's, passed in so this module does not
+    import the generator.
+    """
+    for position, item in enumerate(items, 1):
+        description = clean_text(item.get("description"))
+        label = description or f"#{position}"
+        if not description:
+            catalog.problem("error", "productivity", label, "description", "missing description")
+        problem = unit_problem(clean_text(item.get("unit")))
+        if problem:
+            catalog.problem("error", "productivity", label, "unit", problem)
+        productivity = item.get("productivity")
+        if not is_number(productivity) or productivity <= 0:
+            catalog.problem("error", "productivity", label, "productivity",
+                            f"productivity {productivity!r} is not positive")
+        crew_text = clean_text(item.get("crew"))
+        crew = parse_crew(item.get("crew", ""))
+        if not crew:
+            message = f"no crew parsed from {crew_text!r}" if crew_text else "no crew given"
+            catalog.problem("warning", "productivity", label, "crew", message)
+        for member in crew:
+            if member["roleCode"] not in crew_codes:
+                catalog.problem("error", "productivity", label, "crew", f"role {member['roleCode']} is not in crew-roles")
+
+def problem_report(catalog):
+    """The problems as dicts, with counts per severity and per (section, field)"""
+    problems = [
+        dict(zip(("severity", "section", "code", "field", "message"), problem))
+        for problem in catalog.problems
+    ]
+    by_field = {}
+    for problem in problems:
+        key = f"{problem['section']}.{problem['field']}"
+        by_field[key] = by_field.get(key, 0) + 1
+    return {
+        "records": {
+            "rates": len(catalog.rates),
+            "boq_templates": len(catalog.templates),
+            "components": len(catalog.templates.component_qty),
+            "indirect_costs": len(catalog.indirect_costs),
+        },
+        "counts": {severity: sum(1 for problem in problems if problem["severity"] == severity)
+                   for severity in SEVERITIES},
+        "byField": dict(sorted(by_field.items())),
+        "problems": problems,
+    }
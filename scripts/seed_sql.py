@@ -0,0 +1,237 @@
+"""
+Postgres load files for the Smart Estimate seed
+
+Each seed section maps to one table of 002_smart_estimate_schema.sql:
+rates -> master_rates, boq_templates -> boq_templates and indirect_costs ->
+indirect_cost_config. Records are written as text-format COPY files, one per
+table, plus load.sql, a psql script that \\copy-s each file into a temp
+staging table and upserts the staging rows by code in a single statement.
+
+inserts.sql holds the same upserts as multi-row INSERT ... VALUES statements
+of BATCH_ROWS rows, for clients without \\copy (SQL editors, `supabase db`).
+With rows_per_statement=1 write_insert_sql() gives the per-row INSERT path
+the COPY load is benchmarked against. write_changeset_sql() writes only the
+records of a seed changeset (see seed_store.diff_seeds), deactivating retired
+codes rather than deleting them.
+
+Every value is staged as text and cast in the upsert, so the COPY and VALUES
+paths share the same SELECT.
+"""
+
+import json
+from pathlib import Path
+
+from seed_store import atomic_writer
+
+LOAD_SCRIPT = "load.sql"
+INSERT_SCRIPT = "inserts.sql"
+BATCH_ROWS = 500
+SEED_SOURCE = "excel"
+
+# Top-level rate_categories seeded by the schema migration
+RATE_CATEGORY_CODES = {"LABOR": "LAB", "MATERIAL": "MAT", "EQUIPMENT": "EQP"}
+
+# Template categories of the workbook -> boq_categories codes
+BOQ_CATEGORY_CODES = {
+    "excavation": "EXC",
+    "concrete": "STR",
+    "masonry": "MAS",
+    "finishing": "FIN",
+    "waterproofing": "FIN",
+}
+
+def text_value(value):
+    """A record value as the text staged for it (None stays NULL)"""
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+    return str(value)
+
+def text_array(values):
+    """A Postgres array literal ('{"a","b"}') for a text[] column"""
+    items = ('"' + value.replace('\\', '\\\\').replace('"', '\\"') + '"' for value in values)
+    return "{" + ",".join(items) + "}"
+
+def rate_row(rate):
+    return (
+        rate["code"],
+        rate["name_ar"],
+        rate.get("name_en") or None,
+        rate.get("components"),
+        rate["unit"],
+        text_value(rate["rate"]),
+        text_value(rate.get("waste_factor")),
+        RATE_CATEGORY_CODES[rate["type"]],
+    )
+
+def template_row(template):
+    return (
+        template["code"],
+        template["name_ar"],
+        template.get("name_en") or None,
+        template["unit"],
+        BOQ_CATEGORY_CODES.get(template.get("category")),
+        text_value(template["materials"]),
+        text_value(template["labor"]),
+        text_value(template["equipment"]),
+    )
+
+def indirect_row(indirect):
+    return (
+        indirect["code"],
+        indirect["name_ar"],
+        indirect.get("name_en") or None,
+        text_value(indirect["percentage"]),
+        text_array(indirect.get("applies_to") or ["ALL"]),
+    )
+
+# Per section: target table, staged columns, the row builder, the target
+# columns with the expression filling each (`v` is the staged row) and any
+# join the expressions need. Upserted rows are marked active again, in case a
+# changeset retired their code earlier.
+TABLES = {
+    "rates": {
+        "table": "master_rates",
+        "staged": ("code", "name_ar", "name_en", "description", "unit", "current_rate", "waste_factor",
+                   "category_code"),
+        "row": rate_row,
+        "targets": (
+            ("code", "v.code"),
+            ("name_ar", "v.name_ar"),
+            ("name_en", "v.name_en"),
+            ("description", "v.description"),
+            ("unit", "v.unit"),
+            ("current_rate", "v.current_rate::numeric"),
+            ("waste_factor", "COALESCE(v.waste_factor::numeric, 1.000)"),
+            ("category_id", "c.id"),
+            ("source", f"'{SEED_SOURCE}'"),
+            ("is_active", "true"),
+        ),
+        "join": "JOIN rate_categories c ON c.code = v.category_code",
+    },
+    "boq_templates": {
+        "table": "boq_templates",
+        "staged": ("code", "name_ar", "name_en", "unit", "category_code", "materials", "labor", "equipment"),
+        "row": template_row,
+        "targets": (
+            ("code", "v.code"),
+            ("name_ar", "v.name_ar"),
+            ("name_en", "v.name_en"),
+            ("unit", "v.unit"),
+            ("category_id", "c.id"),
+            ("materials", "v.materials::jsonb"),
+            ("labor", "v.labor::jsonb"),
+            ("equipment", "v.equipment::jsonb"),
+            ("source", f"'{SEED_SOURCE}'"),
+            ("is_active", "true"),
+        ),
+        "join": "LEFT JOIN boq_categories c ON c.code = v.category_code",
+    },
+    "indirect_costs": {
+        "table": "indirect_cost_config",
+        "staged": ("code", "name_ar", "name_en", "percentage", "applies_to"),
+        "row": indirect_row,
+        "targets": (
+            ("code", "v.code"),
+            ("name_ar", "v.name_ar"),
+            ("name_en", "v.name_en"),
+            ("percentage", "v.percentage::numeric"),
+            ("applies_to", "v.applies_to::text[]"),
+            ("is_active", "true"),
+        ),
+        "join": "",
+    },
+}
+
+def copy_field(value):
+    """Escape a value for COPY's text format (tab-separated, \\N for NULL)"""
+    if value is None:
+        return "\\N"
+    return (value.replace("\\", "\\\\").replace("\t", "\\t")
+            .replace("\n", "\\n").replace("\r", "\\r"))
+
+def sql_literal(value):
+    if value is None:
+        return "NULL"
+    return "'" + value.replace("'", "''") + "'"
+
+def upsert_sql(spec, source):
+    """INSERT ... SELECT from `source` (aliased v), updating rows whose code exists"""
+    columns = ", ".join(column for column, _ in spec["targets"])
+    select = ", ".join(expression for _, expression in spec["targets"])
+    updates = ", ".join(f"{column} = EXCLUDED.{column}" for column, _ in spec["targets"] if column != "code")
+    join = f" {spec['join']}" if spec["join"] else ""
+    return (f"INSERT INTO {spec['table']} ({columns})\nSELECT {select}\nFROM {source}{join}\n"
+            f"ON CONFLICT (code) DO UPDATE SET {updates}, updated_at = NOW();\n")
+
+def stage_table(spec):
+    return f"stage_{spec['table']}"
+
+def write_copy_file(path, spec, records):
+    count = 0
+    with atomic_writer(path) as f:
+        for record in records:
+            f.write("\t".join(copy_field(value) for value in spec["row"](record)) + "\n")
+            count += 1
+    return count
+
+def write_load_script(path, sections):
+    """psql script that stages every COPY file and upserts it; run it from the files' directory"""
+    with atomic_writer(path) as f:
+        f.write("-- Generated by scripts/extract-excel-data.py. \\copy paths are relative to the\n"
+                "-- working directory: run from this directory (scripts/load-seed-sql.py does).\n")
+        for section in sections:
+            spec = TABLES[section]
+            stage = stage_table(spec)
+            columns = ", ".join(f"{column} text" for column in spec["staged"])
+            f.write(f"\nDROP TABLE IF EXISTS {stage};\nCREATE TEMP TABLE {stage} ({columns});\n")
+            f.write(f"\\copy {stage} FROM '{spec['table']}.copy'\n")
+            f.write(upsert_sql(spec, f"{stage} v"))
+
+def write_upserts(f, spec, records, rows_per_statement=BATCH_ROWS):
+    """Upsert `records` as INSERT ... SELECT FROM (VALUES ...) of `rows_per_statement` rows each"""
+    alias = f"v({', '.join(spec['staged'])})"
+    batch = []
+    for record in records:
+        batch.append("(" + ", ".join(sql_literal(value) for value in spec["row"](record)) + ")")
+        if len(batch) == rows_per_statement:
+            f.write(upsert_sql(spec, "(VALUES\n  " + ",\n  ".join(batch) + f"\n) AS {alias}"))
+            batch = []
+    if batch:
+        f.write(upsert_sql(spec, "(VALUES\n  " + ",\n  ".join(batch) + f"\n) AS {alias}"))
+
+def write_insert_sql(path, sections, rows_per_statement=BATCH_ROWS):
+    """Upserts of every record, `rows_per_statement` rows per statement"""
+    with atomic_writer(path) as f:
+        f.write("-- Generated by scripts/extract-excel-data.py.\n")
+        for section, records in sections.items():
+            write_upserts(f, TABLES[section], records, rows_per_statement)
+
+def write_changeset_sql(path, changeset):
+    """Upserts of the inserted and updated records, then deactivation of the retired codes"""
+    with atomic_writer(path) as f:
+        f.write("-- Generated by scripts/extract-excel-data.py --changeset. Apply in one transaction.\n")
+        for section, changes in changeset["sections"].items():
+            spec = TABLES[section]
+            records = changes["inserted"] + [change["record"] for change in changes["updated"]]
+            write_upserts(f, spec, records)
+            for start in range(0, len(changes["retired"]), BATCH_ROWS):
+                codes = ", ".join(sql_literal(code) for code in changes["retired"][start:start + BATCH_ROWS])
+                f.write(f"UPDATE {spec['table']} SET is_active = false, updated_at = NOW()\n"
+                        f"WHERE code IN ({codes}) AND is_active;\n")
+
+def write_sql_dir(sql_dir, sections):
+    """Write the COPY files, load.sql and inserts.sql; returns {table: row count}"""
+    sql_dir = Path(sql_dir)
+    sql_dir.mkdir(parents=True, exist_ok=True)
+    sections = {section: list(records) for section, records in sections.items() if section in TABLES}
+    counts = {
+        TABLES[section]["table"]: write_copy_file(sql_dir / f"{TABLES[section]['table']}.copy", TABLES[section], records)
+        for section, records in sections.items()
+    }
+    write_load_script(sql_dir / LOAD_SCRIPT, sections)
+    write_insert_sql(sql_dir / INSERT_SCRIPT, sections)
+    return counts
@@ -0,0 +1,204 @@
+"""
+Sectioned seed storage: one NDJSON file per section plus a small manifest
+
+A seed directory holds one NDJSON file per section (rates, boq_templates,
+indirect_costs; one JSON record per line) and manifest.json with the file
+name, record count and SHA-256 of each section. Section files are named after
+their content hash and the manifest is renamed into place last, so a reader
+that opens the manifest sees either the previous seed or the new one; section
+files no longer referenced are removed after the switch. Only files named
+like a section file are removed, so other files in the directory are safe.
+
+The older single-file layout (seed-data.json, indented) is still readable by
+the same helpers and can be written with write_seed_json().
+
+diff_seeds() compares two seeds record by record, keyed by code, and builds
+the changeset of inserted, updated and retired records between them.
+"""
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+SEED_SECTIONS = ("rates", "boq_templates", "indirect_costs")
+MANIFEST_NAME = "manifest.json"
+SEED_FORMAT = "fcc-seed-ndjson/1"
+CHANGESET_FORMAT = "fcc-seed-changeset/1"
+# Template fields holding component rows, compared row by row on rateCode
+COMPONENT_FIELDS = ("materials", "labor", "equipment")
+FILE_MODE = 0o644
+# <section>.<first 12 hex digits of its SHA-256>.ndjson, as write_section() names them
+SECTION_FILE_RE = re.compile(rf"^(?:{'|'.join(SEED_SECTIONS)})\.[0-9a-f]{{12}}\.ndjson$")
+
+@contextmanager
+def temp_writer(directory):
+    """Open a temp file in `directory`; yields (file, temp path) and removes it on error"""
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".seed.", suffix=".tmp")
+    try:
+        # mkstemp creates the file owner-only; seeds are shared artifacts
+        os.chmod(tmp_path, FILE_MODE)
+        with os.fdopen(fd, 'w', encoding='utf-8', newline='\n') as f:
+            yield f, tmp_path
+            f.flush()
+            os.fsync(f.fileno())
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+@contextmanager
+def atomic_writer(path):
+    """Open a temp file next to `path` and rename it over `path` on success"""
+    path = Path(path)
+    with temp_writer(path.parent) as (f, tmp_path):
+        yield f
+    os.replace(tmp_path, path)
+
+def write_section(seed_dir, section, records):
+    """Stream `records` to <section>.<hash>.ndjson and return its manifest entry"""
+    digest = hashlib.sha256()
+    count = 0
+    size = 0
+    with temp_writer(seed_dir) as (f, tmp_path):
+        for record in records:
+            line = json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n'
+            data = line.encode('utf-8')
+            digest.update(data)
+            size += len(data)
+            count += 1
+            f.write(line)
+    name = f"{section}.{digest.hexdigest()[:12]}.ndjson"
+    os.replace(tmp_path, Path(seed_dir) / name)
+    return {"file": name, "count": count, "bytes": size, "sha256": digest.hexdigest()}
+
+def write_seed_dir(seed_dir, sections, generated_at=None):
+    """Write each section as NDJSON, then the manifest that publishes them.
+
+    `sections` maps section names to iterables of records; they are consumed
+    one record at a time.
+    """
+    seed_dir = Path(seed_dir)
+    seed_dir.mkdir(parents=True, exist_ok=True)
+    manifest = {
+        "format": SEED_FORMAT,
+        "generated_at": generated_at or datetime.now().isoformat(),
+        "sections": {section: write_section(seed_dir, section, records) for section, records in sections.items()},
+    }
+    with atomic_writer(seed_dir / MANIFEST_NAME) as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+    current = {entry["file"] for entry in manifest["sections"].values()}
+    for path in seed_dir.glob("*.ndjson"):
+        if path.name not in current and SECTION_FILE_RE.match(path.name):
+            path.unlink(missing_ok=True)
+    return manifest
+
+def write_seed_json(path, sections, generated_at=None):
+    """Write the legacy single-file seed (indented JSON) atomically"""
+    output = {section: list(records) for section, records in sections.items()}
+    output["generated_at"] = generated_at or datetime.now().isoformat()
+    with atomic_writer(path) as f:
+        json.dump(output, f, ensure_ascii=False, indent=2)
+    return output
+
+def is_seed_dir(path):
+    return (Path(path) / MANIFEST_NAME).is_file()
+
+def seed_exists(path):
+    path = Path(path)
+    return is_seed_dir(path) or path.is_file()
+
+def read_manifest(seed_dir):
+    with open(Path(seed_dir) / MANIFEST_NAME, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def iter_section(seed_path, section):
+    """Yield the records of one section without loading the others.
+
+    `seed_path` is a seed directory or a legacy seed-data.json; the latter has
+    to be parsed whole, so only the directory layout actually streams.
+    """
+    seed_path = Path(seed_path)
+    if not is_seed_dir(seed_path):
+        with open(seed_path, 'r', encoding='utf-8') as f:
+            yield from json.load(f).get(section, [])
+        return
+    entry = read_manifest(seed_path)["sections"].get(section)
+    if entry is None:
+        return
+    with open(seed_path / entry["file"], 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+def load_seed(seed_path, sections=SEED_SECTIONS):
+    """Load the given sections of a seed into lists"""
+    return {section: list(iter_section(seed_path, section)) for section in sections}
+
+def component_changes(before, after):
+    """Component rows added, removed or changed between two versions of a template"""
+    changes = []
+    for field in COMPONENT_FIELDS:
+        old = {row["rateCode"]: row for row in before.get(field, [])}
+        new = {row["rateCode"]: row for row in after.get(field, [])}
+        for rate_code in sorted(old.keys() | new.keys()):
+            if rate_code not in old:
+                changes.append({"field": field, "rateCode": rate_code, "change": "added"})
+            elif rate_code not in new:
+                changes.append({"field": field, "rateCode": rate_code, "change": "removed"})
+            elif old[rate_code] != new[rate_code]:
+                changes.append({"field": field, "rateCode": rate_code, "change": "updated"})
+    return changes
+
+def diff_section(previous, current):
+    """Inserted records, updated records (with the fields that changed) and retired codes"""
+    old = {record["code"]: record for record in previous}
+    new_codes = set()
+    inserted = []
+    updated = []
+    for record in current:
+        new_codes.add(record["code"])
+        before = old.get(record["code"])
+        if before is None:
+            inserted.append(record)
+        elif before != record:
+            change = {
+                "code": record["code"],
+                "fields": sorted(field for field in before.keys() | record.keys()
+                                 if before.get(field) != record.get(field)),
+                "record": record,
+            }
+            components = component_changes(before, record)
+            if components:
+                change["components"] = components
+            updated.append(change)
+    retired = [record["code"] for record in previous if record["code"] not in new_codes]
+    return {"inserted": inserted, "updated": updated, "retired": retired}
+
+def diff_seeds(previous, current, base=None, generated_at=None):
+    """Changeset turning the `previous` seed into `current` (both {section: records}).
+
+    `base` identifies the seed the changeset applies to (e.g. its section
+    hashes), so a consumer can check it before applying.
+    """
+    sections = {section: diff_section(previous.get(section, []), records) for section, records in current.items()}
+    return {
+        "format": CHANGESET_FORMAT,
+        "generated_at": generated_at or datetime.now().isoformat(),
+        "base": base,
+        "summary": {
+            section: {kind: len(changes[kind]) for kind in ("inserted", "updated", "retired")}
+            for section, changes in sections.items()
+        },
+        "sections": sections,
+    }
+
+def seed_base(seed_path):
+    """Section hashes of a seed directory, to record as a changeset's base"""
+    if not is_seed_dir(seed_path):
+        return None
+    return {section: entry["sha256"] for section, entry in read_manifest(seed_path)["sections"].items()}
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Monte Carlo cost and duration of a BOQ priced from the productivity templates
+
+For each iteration, productivity is drawn per activity from a triangular
+distribution over the activity's cross-source spread (min / median / max of
+the templates sharing its name and unit), and each crew role's daily rate is
+drawn from a uniform band around its rate in crew-roles.ts. Line item cost is
+then (quantity / productivity) x daily crew cost, as in
+calculateProductivityCost(). Iterations are simulated in batches as
+(iterations x line items) arrays, never one draw at a time.
+"""
+
+import argparse
+import csv
+import json
+import time
+from pathlib import Path
+
+import numpy as np
+
+from script_modules import load_script
+
+generate_templates = load_script("generate-templates")
+
+# Relative band used when an activity has a single source (or no spread)
+PRODUCTIVITY_SPREAD = 0.2
+# Relative band for crew daily rates, unless --rate-bands overrides a role
+RATE_BAND = 0.1
+# Iterations simulated together; bounds the (iterations x items) arrays
+ITERATION_BATCH = 250
+PERCENTILES = (10, 50, 90)
+
+def activity_bounds(records, spread=PRODUCTIVITY_SPREAD):
+    """Triangular (low, mode, high) productivity per activity, and each record's activity.
+
+    Activities use the same key as the generated activityProductivityStats.
+    """
+    index_by_key = {}
+    activity_rates = []
+    activity_of = []
+    for record in records:
+        key = generate_templates.activity_key(record['nameAr'], record['unitAr'])
+        if key not in index_by_key:
+            index_by_key[key] = len(activity_rates)
+            activity_rates.append([])
+        activity_rates[index_by_key[key]].append(record['productivityRate'])
+        activity_of.append(index_by_key[key])
+
+    bounds = []
+    for rates in activity_rates:
+        low, mode, high = min(rates), float(np.median(rates)), max(rates)
+        if high <= low:
+            low, high = mode * (1 - spread), mode * (1 + spread)
+        bounds.append((low, mode, high))
+    return np.array(bounds, dtype=np.float64).reshape(-1, 3), np.array(activity_of, dtype=np.int64)
+
+def triangular(u, low, mode, high):
+    """Inverse CDF of the triangular distribution, elementwise (handles low == high)"""
+    width = high - low
+    safe_width = np.where(width > 0, width, 1.0)
+    split = (mode - low) / safe_width
+    rising = low + np.sqrt(u * safe_width * (mode - low))
+    falling = high - np.sqrt((1 - u) * safe_width * (high - mode))
+    return np.where(width > 0, np.where(u < split, rising, falling), mode)
+
+def load_boq(path):
+    """BOQ line items as (code, quantity) from CSV (code,quantity) or JSON [{code, quantity}]"""
+    path = Path(path)
+    if path.suffix == ".json":
+        return [(row["code"], float(row["quantity"])) for row in json.loads(path.read_text(encoding='utf-8'))]
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        return [(row["code"], float(row["quantity"])) for row in csv.DictReader(f)]
+
+def synthetic_boq(records, count, seed=0):
+    """`count` line items cycling over the templates, with random quantities"""
+    rng = np.random.default_rng(seed)
+    quantities = rng.uniform(10, 500, size=count).round(1)
+    return [(records[i % len(records)]['code'], float(quantities[i])) for i in range(count)]
+
+def build_model(records, boq, crew_rates, rate_bands, spread=PRODUCTIVITY_SPREAD, rate_band=RATE_BAND):
+    """Arrays describing the BOQ for simulate()"""
+    by_code = {record['code']: index for index, record in enumerate(records)}
+    missing = sorted({code for code, _ in boq if code not in by_code})
+    if missing:
+        raise SystemExit(f"Unknown template codes in BOQ: {', '.join(missing)}")
+
+    bounds, activity_of = activity_bounds(records, spread)
+    roles = sorted({member['roleCode'] for record in records for member in record['crew']})
+    role_index = {role: index for index, role in enumerate(roles)}
+    categories = sorted({record['categoryId'] for record in records})
+    category_index = {category: index for index, category in enumerate(categories)}
+
+    # crew[n, r]: role r's base daily cost in line item n (qty x daily rate)
+    crew = np.zeros((len(boq), len(roles)))
+    # in_category[n, k]: 1 when line item n belongs to category k
+    in_category = np.zeros((len(boq), len(categories)))
+    templates = np.zeros(len(boq), dtype=np.int64)
+    for n, (code, _) in enumerate(boq):
+        record = records[by_code[code]]
+        templates[n] = by_code[code]
+        in_category[n, category_index[record['categoryId']]] = 1.0
+        for member in record['crew']:
+            crew[n, role_index[member['roleCode']]] += member['qty'] * crew_rates.get(member['roleCode'], 0.0)
+
+    return {
+        "quantities": np.array([quantity for _, quantity in boq], dtype=np.float64),
+        "activity": activity_of[templates],
+        "bounds": bounds,
+        "crew": crew,
+        "bands": np.array([rate_bands.get(role, rate_band) for role in roles], dtype=np.float64),
+        "in_category": in_category,
+        "unpriced_items": int(np.count_nonzero(crew.sum(axis=1) == 0)),
+    }
+
+def simulate_batch(model, rng, size):
+    """Total cost, crew-days and duration for `size` iterations"""
+    low, mode, high = model["bounds"].T
+    productivity = triangular(rng.random((size, len(mode))), low, mode, high)[:, model["activity"]]
+    multipliers = rng.uniform(1 - model["bands"], 1 + model["bands"], size=(size, len(model["bands"])))
+    daily_cost = multipliers @ model["crew"].T
+    days = model["quantities"] / productivity
+
+    # Categories are worked in parallel, line items within a category in turn
+    duration = (days @ model["in_category"]).max(axis=1)
+    return np.einsum('ij,ij->i', days, daily_cost), days.sum(axis=1), duration
+
+def simulate(model, iterations, batch=ITERATION_BATCH, seed=0):
+    rng = np.random.default_rng(seed)
+    parts = [simulate_batch(model, rng, min(batch, iterations - start)) for start in range(0, iterations, batch)]
+    return {
+        name: np.concatenate([part[i] for part in parts])
+        for i, name in enumerate(("cost", "crewDays", "duration"))
+    }
+
+def baseline(model):
+    """Deterministic figures at the modal productivity and base rates"""
+    days = model["quantities"] / model["bounds"][model["activity"], 1]
+    per_category = days @ model["in_category"]
+    return {
+        "cost": float(days @ model["crew"].sum(axis=1)),
+        "crewDays": float(days.sum()),
+        "duration": float(per_category.max()),
+    }
+
+def summarize(samples):
+    return {
+        name: {
+            "mean": float(values.mean()),
+            **{f"p{p}": float(value) for p, value in zip(PERCENTILES, np.percentile(values, PERCENTILES))},
+        }
+        for name, values in samples.items()
+    }
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Monte Carlo P10/P50/P90 cost and duration for a BOQ")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--boq", help="BOQ line items: CSV with code,quantity columns or JSON [{code, quantity}]")
+    source.add_argument("--synthetic", type=int, metavar="N", help="Simulate N random line items (benchmarks)")
+    parser.add_argument("--iterations", type=int, default=100_000)
+    parser.add_argument("--batch", type=int, default=ITERATION_BATCH, help="Iterations simulated per batch")
+    parser.add_argument("--spread", type=float, default=PRODUCTIVITY_SPREAD,
+                        help="Productivity band for activities with a single source")
+    parser.add_argument("--rate-band", type=float, default=RATE_BAND, help="Daily rate band for every crew role")
+    parser.add_argument("--rate-bands", help="JSON file of {roleCode: band} overriding --rate-band")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("--output", help="Write the summary as JSON")
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    records = generate_templates.template_records(generate_templates.load_items())
+    boq = load_boq(args.boq) if args.boq else synthetic_boq(records, args.synthetic, args.seed)
+    rate_bands = json.loads(Path(args.rate_bands).read_text(encoding='utf-8')) if args.rate_bands else {}
+    model = build_model(records, boq, generate_templates.load_crew_rates(), rate_bands, args.spread, args.rate_band)
+
+    start = time.perf_counter()
+    samples = simulate(model, args.iterations, args.batch, args.seed)
+    elapsed = time.perf_counter() - start
+
+    report = {
+        "iterations": args.iterations,
+        "lineItems": len(boq),
+        "elapsedSeconds": round(elapsed, 3),
+        "baseline": baseline(model),
+        **summarize(samples),
+    }
+    print(f"Simulated {args.iterations} iterations x {len(boq)} line items in {elapsed:.2f} s")
+    if model["unpriced_items"]:
+        print(f"⚠ {model['unpriced_items']} line items have no priced crew (cost 0)")
+    for name, label in (("cost", "Cost (EGP)"), ("duration", "Duration (days)"), ("crewDays", "Crew-days")):
+        stats = report[name]
+        print(f"{label:16} P10 {stats['p10']:>14,.1f}  P50 {stats['p50']:>14,.1f}  P90 {stats['p90']:>14,.1f}"
+              f"  (deterministic {report['baseline'][name]:,.1f})")
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"✓ Saved to: {args.output}")
+
+if __name__ == "__main__":
+    main()
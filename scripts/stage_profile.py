@@ -0,0 +1,181 @@
+"""
+Opt-in per-stage instrumentation for the data pipeline scripts
+
+A StageRecorder times named stages (decrypt, sheet_parse, transform,
+crew_parse, emit, write, ...) entered with `with recorder.stage(name) as
+stats:`; the block can add counters such as stats["rows"]. Each stage
+accumulates calls, wall time and CPU time, both inclusive and exclusive of
+the stages nested in it. With trace_memory it also records the stage's peak
+traced allocation above what was allocated when it started (tracemalloc);
+with profile, each stage gets its own cProfile profiler, switched off while
+a nested stage runs, and the hottest stage's profile (by exclusive wall time)
+can be dumped for pstats/snakeviz.
+
+Stages recorded in worker processes can be folded in with merge(); their
+cProfile profiles cannot, so profiling runs everything in one process.
+
+A disabled recorder (the default) measures nothing, so the scripts can call
+stage() unconditionally.
+"""
+
+import cProfile
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+
+REPORT_FORMAT = "fcc-stage-profile/1"
+MB = 1024 * 1024
+
+class StageRecorder:
+    def __init__(self, enabled=False, trace_memory=False, profile=False):
+        self.enabled = enabled or trace_memory or profile
+        self.trace_memory = trace_memory
+        self.profile = profile
+        self.stages = {}
+        self.profilers = {}
+        self.active = []
+        self.started = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name):
+        """Measure the block as stage `name`; yields a dict for counters (rows, bytes, ...)"""
+        counters = {}
+        if not self.enabled:
+            yield counters
+            return
+
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        parent = self.active[-1] if self.active else None
+        frame = {"name": name, "child_wall": 0.0, "child_cpu": 0.0}
+        if self.trace_memory:
+            current, peak = tracemalloc.get_traced_memory()
+            self._raise_peaks(peak)
+            tracemalloc.reset_peak()
+            frame["memory_start"] = current
+            frame["peak"] = current
+        if self.profile:
+            if parent:
+                self.profilers[parent["name"]].disable()
+            self.profilers.setdefault(name, cProfile.Profile()).enable()
+        self.active.append(frame)
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        try:
+            yield counters
+        finally:
+            wall = time.perf_counter() - wall
+            cpu = time.process_time() - cpu
+            self.active.pop()
+            if self.profile:
+                self.profilers[name].disable()
+                if parent:
+                    self.profilers[parent["name"]].enable()
+            entry = self._entry(name)
+            entry["calls"] += 1
+            entry["wallSeconds"] += wall
+            entry["selfWallSeconds"] += wall - frame["child_wall"]
+            entry["cpuSeconds"] += cpu
+            entry["selfCpuSeconds"] += cpu - frame["child_cpu"]
+            for key, value in counters.items():
+                entry[key] = entry.get(key, 0) + value
+            if self.trace_memory:
+                current, peak = tracemalloc.get_traced_memory()
+                frame["peak"] = max(frame["peak"], peak)
+                self._raise_peaks(frame["peak"])
+                entry["peakAllocatedMB"] = max(entry.get("peakAllocatedMB", 0.0),
+                                               (frame["peak"] - frame["memory_start"]) / MB)
+                entry["retainedMB"] = entry.get("retainedMB", 0.0) + (current - frame["memory_start"]) / MB
+            if parent:
+                parent["child_wall"] += wall
+                parent["child_cpu"] += cpu
+
+    def _entry(self, name):
+        return self.stages.setdefault(name, {
+            "calls": 0, "wallSeconds": 0.0, "selfWallSeconds": 0.0, "cpuSeconds": 0.0, "selfCpuSeconds": 0.0,
+        })
+
+    def merge(self, stages):
+        """Fold stages recorded by another recorder, e.g. in a worker process, into this one
+
+        Times and counters add up, so a stage run in parallel workers reports
+        their summed time; peakAllocatedMB keeps the largest peak.
+        """
+        for name, other in stages.items():
+            entry = self._entry(name)
+            for key, value in other.items():
+                if key == "peakAllocatedMB":
+                    entry[key] = max(entry.get(key, 0.0), value)
+                else:
+                    entry[key] = entry.get(key, 0) + value
+
+    def _raise_peaks(self, peak):
+        """Fold the peak so far into the enclosing stages before it is reset"""
+        for frame in self.active:
+            frame["peak"] = max(frame["peak"], peak)
+
+    def hottest(self):
+        if not self.stages:
+            return None
+        return max(self.stages, key=lambda name: self.stages[name]["selfWallSeconds"])
+
+    def report(self, script, **extra):
+        return {
+            "format": REPORT_FORMAT,
+            "script": script,
+            "generated_at": datetime.now().isoformat(),
+            "totalWallSeconds": time.perf_counter() - self.started,
+            "traceMemory": self.trace_memory,
+            "profiled": self.profile,
+            "hottest": self.hottest(),
+            "stages": self.stages,
+            **extra,
+        }
+
+    def write_report(self, path, script, **extra):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.report(script, **extra), f, ensure_ascii=False, indent=2)
+
+    def dump_hottest_profile(self, path):
+        """Write the hottest stage's cProfile stats to `path`; returns the stage name"""
+        name = self.hottest()
+        if name is None or name not in self.profilers:
+            return None
+        self.profilers[name].dump_stats(path)
+        return name
+
+    def print_summary(self):
+        if not self.stages:
+            return
+        print(f"\n{'stage':14} {'calls':>6} {'wall s':>9} {'self s':>9} {'cpu s':>9} {'rows':>10} {'peak MB':>9}")
+        for name, entry in self.stages.items():
+            peak = f"{entry['peakAllocatedMB']:.1f}" if "peakAllocatedMB" in entry else "-"
+            print(f"{name:14} {entry['calls']:>6} {entry['wallSeconds']:>9.3f} {entry['selfWallSeconds']:>9.3f} "
+                  f"{entry['cpuSeconds']:>9.3f} {entry.get('rows', '-'):>10} {peak:>9}")
+
+def add_profile_arguments(parser):
+    """--profile-report/--profile-memory/--cprofile, shared by the pipeline scripts"""
+    parser.add_argument("--profile-report", metavar="PATH",
+                        help="Record per-stage wall/CPU time and row counts and write them as JSON")
+    parser.add_argument("--profile-memory", action="store_true",
+                        help="Also record each stage's peak allocation with tracemalloc (slower)")
+    parser.add_argument("--cprofile", metavar="PATH",
+                        help="Profile every stage with cProfile and dump the hottest stage's stats to PATH")
+
+def recorder_from_args(args):
+    return StageRecorder(enabled=bool(args.profile_report), trace_memory=args.profile_memory,
+                         profile=bool(args.cprofile))
+
+def finish_profile(recorder, args, script, **extra):
+    """Print the stage table and write whatever the profile arguments asked for"""
+    if not recorder.enabled:
+        return
+    recorder.print_summary()
+    dumped = recorder.dump_hottest_profile(args.cprofile) if args.cprofile else None
+    if dumped:
+        print(f"✓ cProfile stats of the hottest stage ({dumped}) saved to: {args.cprofile}")
+    if args.profile_report:
+        recorder.write_report(args.profile_report, script, cprofileStage=dumped, **extra)
+        print(f"✓ Stage report saved to: {args.profile_report}")
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Sweep condition-factor combinations across the whole productivity catalog
+
+A scenario picks at most one factor from each condition category (weather,
+site, access, complexity, schedule), as a site is in one weather band, one
+access situation and so on. Combined factors for every combination are built
+as one broadcasted outer product over the categories; combinations with the
+same combined factor give the same days and cost for every template, so they
+are collapsed into one scenario. Days and labor cost then follow
+calculateProductivityCost(): days = quantity / (productivity x factor) and
+cost = days x daily crew cost.
+"""
+
+import argparse
+import csv
+import re
+import time
+from pathlib import Path
+
+import numpy as np
+
+from script_modules import load_script
+
+generate_templates = load_script("generate-templates")
+
+CONDITION_FACTORS_PATH = Path(__file__).parent.parent / "src/data/condition-factors.ts"
+
+FACTOR_RE = re.compile(
+    r"id:\s*'([^']+)',\s*code:\s*'([^']+)',[^}]*?category:\s*'([^']+)',\s*factor:\s*([\d.]+)"
+)
+PRESET_RE = re.compile(r"id:\s*'([^']+)',[^}]*?factorIds:\s*\[([^\]]*)\]")
+
+# Combined factors closer than this are the same scenario
+FACTOR_DECIMALS = 9
+
+def load_condition_factors(path=CONDITION_FACTORS_PATH):
+    """Condition factors and presets from condition-factors.ts"""
+    source = Path(path).read_text(encoding='utf-8')
+    factors = [
+        {'id': factor_id, 'code': code, 'category': category, 'factor': float(factor)}
+        for factor_id, code, category, factor in FACTOR_RE.findall(source)
+    ]
+    presets = {
+        preset_id: re.findall(r"'([^']+)'", ids)
+        for preset_id, ids in PRESET_RE.findall(source[source.index('conditionPresets'):])
+    }
+    return factors, presets
+
+def factor_choices(factors, categories=None, factor_ids=None):
+    """Per category, the options (None for "no factor") and their factor values"""
+    choices = {}
+    for factor in factors:
+        if categories and factor['category'] not in categories:
+            continue
+        if factor_ids and factor['id'] not in factor_ids:
+            continue
+        options = choices.setdefault(factor['category'], ([None], [1.0]))
+        options[0].append(factor['id'])
+        options[1].append(factor['factor'])
+    return choices
+
+def combined_factors(choices):
+    """Combined factor of every combination, as a flat array over the category grid"""
+    combined = np.ones(())
+    for _, values in choices.values():
+        combined = np.multiply.outer(combined, np.array(values))
+    return combined.ravel()
+
+def combination_ids(choices, flat_index):
+    """Factor ids of the combination at `flat_index` in the combined_factors() grid"""
+    shape = [len(options) for options, _ in choices.values()]
+    picks = np.unravel_index(flat_index, shape)
+    return [options[pick] for (options, _), pick in zip(choices.values(), picks) if options[pick]]
+
+def unique_scenarios(choices):
+    """Distinct combined factors with a representative combination and how many map to each"""
+    combined = combined_factors(choices)
+    values, first, counts = np.unique(np.round(combined, FACTOR_DECIMALS), return_index=True, return_counts=True)
+    order = np.argsort(-values, kind='stable')
+    return [
+        {'factor': float(values[i]), 'combinations': int(counts[i]), 'example': combination_ids(choices, first[i])}
+        for i in order
+    ]
+
+def preset_scenarios(factors, presets):
+    by_id = {factor['id']: factor['factor'] for factor in factors}
+    return [
+        {'factor': float(np.prod([by_id[i] for i in ids if i in by_id])), 'combinations': 1,
+         'example': ids, 'preset': preset_id}
+        for preset_id, ids in presets.items()
+    ]
+
+def sweep(records, scenario_factors, quantity=1.0):
+    """Days and labor cost, (templates x scenarios), for `quantity` units of each template"""
+    productivity = np.array([record['productivityRate'] for record in records], dtype=np.float64)
+    daily_cost = np.array([record['dailyCrewCost'] for record in records], dtype=np.float64)
+    adjusted = np.multiply.outer(productivity, scenario_factors)
+    days = np.divide(quantity, adjusted, out=np.zeros_like(adjusted), where=adjusted > 0)
+    return days, days * daily_cost[:, None]
+
+def write_table(path, records, scenarios, days, cost):
+    """Scenarios plus days/cost per template as .npz (float32 matrices) or a long CSV"""
+    path = Path(path)
+    codes = [record['code'] for record in records]
+    if path.suffix == ".npz":
+        np.savez_compressed(
+            path,
+            templates=np.array(codes),
+            scenario_factors=np.array([s['factor'] for s in scenarios], dtype=np.float32),
+            scenario_combinations=np.array([s['combinations'] for s in scenarios], dtype=np.int32),
+            scenario_examples=np.array([' + '.join(s['example']) or '-' for s in scenarios]),
+            days=days.astype(np.float32),
+            labor_cost=cost.astype(np.float32),
+        )
+        return
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(["template", "scenario", "combined_factor", "factors", "days", "labor_cost"])
+        for s, scenario in enumerate(scenarios):
+            label = scenario.get('preset') or ' + '.join(scenario['example']) or '-'
+            for t, code in enumerate(codes):
+                writer.writerow([code, s, f"{scenario['factor']:.6g}", label,
+                                 f"{days[t, s]:.4f}", f"{cost[t, s]:.2f}"])
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Days and labor cost for every template under every condition scenario")
+    parser.add_argument("--categories", nargs="*", help="Condition categories to sweep (default: all)")
+    parser.add_argument("--factors", nargs="*", help="Only sweep these factor ids")
+    parser.add_argument("--presets", action="store_true", help="Also evaluate the condition presets")
+    parser.add_argument("--quantity", type=float, default=1.0, help="Quantity of each template, in its unit")
+    parser.add_argument("--synthetic", type=int, metavar="N", help="Replicate the sheet rows up to N templates")
+    parser.add_argument("--output", help="Results table: .npz (compact) or .csv (one row per template/scenario)")
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    items = generate_templates.load_items()
+    if args.synthetic:
+        items = generate_templates.synthetic_items(items, args.synthetic)
+    records = generate_templates.template_records(items)
+    factors, presets = load_condition_factors()
+
+    start = time.perf_counter()
+    choices = factor_choices(factors, args.categories, args.factors)
+    total = int(np.prod([len(options) for options, _ in choices.values()]))
+    scenarios = unique_scenarios(choices)
+    if args.presets:
+        scenarios += preset_scenarios(factors, presets)
+    factors_array = np.array([scenario['factor'] for scenario in scenarios])
+    days, cost = sweep(records, factors_array, args.quantity)
+    elapsed = time.perf_counter() - start
+
+    print(f"{total} factor combinations over {len(choices)} categories -> {len(scenarios)} distinct scenarios")
+    print(f"Swept {len(records)} templates x {len(scenarios)} scenarios in {elapsed * 1000:.1f} ms")
+    worst = scenarios[int(np.argmin(factors_array))]
+    print(f"Harshest scenario: {' + '.join(worst['example'])} (factor {worst['factor']:.3f}, "
+          f"{1 / worst['factor']:.1f}x the days and labor cost)")
+    if args.output:
+        write_table(args.output, records, scenarios, days, cost)
+        print(f"✓ Saved to: {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""
+Shared fixtures for the data pipeline script tests
+"""
+
+import io
+import sys
+from pathlib import Path
+
+import openpyxl
+import pytest
+from msoffcrypto.format.ooxml import OOXMLFile
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from script_modules import load_script  # noqa: E402
+
+PASSWORD = "BETA"
+RATE_HEADER = ["الكود", "البيان", "الوحدة", "السعر"]
+
+def write_workbook(path, sheets, password=PASSWORD):
+    """Write {sheet title: rows} as a password-protected .xlsx"""
+    workbook = openpyxl.Workbook(write_only=True)
+    for title, rows in sheets.items():
+        sheet = workbook.create_sheet(title)
+        for row in rows:
+            sheet.append(row)
+    plain = io.BytesIO()
+    workbook.save(plain)
+    plain.seek(0)
+    with open(path, 'wb') as out:
+        OOXMLFile(plain).encrypt(password, out)
+    return path
+
+def rate_sheet(rates):
+    """Rows of a rate sheet for {code: rate}"""
+    return [RATE_HEADER] + [[code, code, "يوم", rate] for code, rate in rates.items()]
+
+@pytest.fixture(scope="session")
+def extract_excel_data():
+    return load_script("extract-excel-data")
@@ -0,0 +1,64 @@
+import os
+
+from conftest import rate_sheet, write_workbook
+
+def run(extract_excel_data, output, paths, full=False):
+    """One extraction run as main() does it; returns (seed sections, conflicts, results)"""
+    previous = {} if full else extract_excel_data.load_previous_run(output)
+    results = extract_excel_data.extract_workbooks(paths, cache_dir=None, jobs=1, previous=previous)
+    extract_excel_data.write_fingerprints(output, results)
+    sections, conflicts = extract_excel_data.merge_extractions(results)
+    return sections, conflicts, results
+
+def statuses(results):
+    return [sheet["status"] for _, extracted in results for sheet in extracted["sheets"]]
+
+def rates(sections):
+    return {rate["code"]: rate["rate"] for rate in sections["rates"]}
+
+def test_incremental_run_still_reports_conflicts(extract_excel_data, tmp_path):
+    first = str(write_workbook(tmp_path / "a.xlsx", {"eq": rate_sheet({"EQP-MIXER": 999})}))
+    second = str(write_workbook(tmp_path / "b.xlsx", {"eq": rate_sheet({"EQP-MIXER": 350})}))
+    output = tmp_path / "seed-data"
+
+    _, conflicts, _ = run(extract_excel_data, output, [first, second], full=True)
+    _, again, results = run(extract_excel_data, output, [first, second])
+
+    assert statuses(results) == ["reused", "reused"]
+    assert [conflict["code"] for conflict in again] == [conflict["code"] for conflict in conflicts] == ["EQP-MIXER"]
+    assert results[1][1]["rates"][0]["rate"] == 350
+
+def test_code_dropped_by_winning_workbook_falls_back_to_the_other(extract_excel_data, tmp_path):
+    first = str(write_workbook(tmp_path / "a.xlsx", {"eq": rate_sheet({"EQP-MIXER": 999, "EQP-A": 1})}))
+    second = str(write_workbook(tmp_path / "b.xlsx", {"eq": rate_sheet({"EQP-MIXER": 350})}))
+    output = tmp_path / "seed-data"
+    run(extract_excel_data, output, [first, second], full=True)
+
+    write_workbook(first, {"eq": rate_sheet({"EQP-A": 1})})
+    sections, conflicts, results = run(extract_excel_data, output, [first, second])
+
+    assert statuses(results) == ["rebuilt", "reused"]
+    assert rates(sections) == {"EQP-A": 1, "EQP-MIXER": 350}
+    assert conflicts == []
+
+def test_fingerprints_match_relative_and_absolute_paths(extract_excel_data, tmp_path, monkeypatch):
+    path = write_workbook(tmp_path / "a.xlsx", {"eq": rate_sheet({"EQP-A": 1})})
+    output = tmp_path / "seed-data"
+    monkeypatch.chdir(tmp_path)
+
+    run(extract_excel_data, output, [os.path.relpath(path)], full=True)
+    _, _, results = run(extract_excel_data, output, [str(path)])
+
+    assert statuses(results) == ["reused"]
+
+def test_pooled_extraction_merges_worker_stages(extract_excel_data, tmp_path):
+    first = str(write_workbook(tmp_path / "a.xlsx", {"eq": rate_sheet({"EQP-A": 1})}))
+    second = str(write_workbook(tmp_path / "b.xlsx", {"eq": rate_sheet({"EQP-B": 2, "EQP-C": 3})}))
+    recorder = extract_excel_data.StageRecorder(enabled=True)
+
+    assert extract_excel_data.runs_in_pool([first, second], 2, recorder)
+    results = extract_excel_data.extract_workbooks([first, second], cache_dir=None, jobs=2, recorder=recorder)
+
+    assert [path for path, _ in results] == [first, second]
+    assert recorder.stages["decrypt"]["calls"] == 2
+    assert recorder.stages["sheet_parse"]["rows"] == 3
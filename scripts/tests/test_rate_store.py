@@ -0,0 +1,69 @@
+import pytest
+
+import rate_store
+
+def rates(**values):
+    return [{"code": code.replace("_", "-"), "rate": rate, "unit": "يوم", "type": "LABOR"}
+            for code, rate in values.items()]
+
+@pytest.fixture
+def store(tmp_path):
+    conn = rate_store.connect(tmp_path / "history.sqlite")
+    yield conn
+    conn.close()
+
+def test_unchanged_rates_are_not_stored_again(store):
+    assert rate_store.append_snapshot(store, rates(LAB_A=100, LAB_B=50), "2024-01-01") == 2
+    assert rate_store.append_snapshot(store, rates(LAB_A=100, LAB_B=60), "2024-02-01") == 1
+
+    assert rate_store.rate_history(store, "LAB-A") == [("2024-01-01", 100.0)]
+    assert rate_store.rate_at(store, "LAB-B", "2024-01-31") == 50
+    assert rate_store.rate_at(store, "LAB-B", "2024-02-01") == 60
+
+def test_retired_codes_have_no_rate(store):
+    rate_store.append_snapshot(store, rates(LAB_A=100, LAB_B=50), "2024-01-01")
+    rate_store.append_snapshot(store, rates(LAB_A=100), "2024-02-01")
+
+    assert rate_store.rate_at(store, "LAB-B", "2024-03-01") is None
+    assert rate_store.rates_at(store, ["LAB-A", "LAB-B"], "2024-03-01") == {"LAB-A": 100}
+
+def test_backfill_keeps_later_snapshot(store):
+    rate_store.append_snapshot(store, rates(LAB_A=100), "2024-01-01")
+    rate_store.append_snapshot(store, rates(LAB_A=100), "2024-03-01")
+
+    rate_store.append_snapshot(store, rates(LAB_A=150), "2024-02-01")
+
+    assert rate_store.rate_at(store, "LAB-A", "2024-01-15") == 100
+    assert rate_store.rate_at(store, "LAB-A", "2024-02-15") == 150
+    assert rate_store.rate_at(store, "LAB-A", "2024-03-01") == 100
+
+def test_reappending_a_date_keeps_later_snapshot(store):
+    rate_store.append_snapshot(store, rates(LAB_A=100), "2024-01-01")
+    rate_store.append_snapshot(store, rates(LAB_A=100), "2024-02-01")
+
+    rate_store.append_snapshot(store, rates(LAB_A=120), "2024-01-01")
+
+    assert rate_store.rate_at(store, "LAB-A", "2024-01-15") == 120
+    assert rate_store.rate_at(store, "LAB-A", "2024-02-01") == 100
+
+def test_backfill_keeps_later_retirements_and_additions(store):
+    rate_store.append_snapshot(store, rates(LAB_A=100, LAB_B=50), "2024-01-01")
+    rate_store.append_snapshot(store, rates(LAB_A=100), "2024-03-01")
+
+    rate_store.append_snapshot(store, rates(LAB_A=100, LAB_B=50, LAB_C=70), "2024-02-01")
+
+    assert rate_store.rates_at(store, ["LAB-A", "LAB-B", "LAB-C"], "2024-02-15") == {
+        "LAB-A": 100, "LAB-B": 50, "LAB-C": 70}
+    assert rate_store.rates_at(store, ["LAB-A", "LAB-B", "LAB-C"], "2024-03-01") == {"LAB-A": 100}
+    assert [changed for *_, changed in rate_store.snapshots(store)] == [2, 1, 2]
+
+def test_escalate_boq_expands_templates(store):
+    rate_store.append_snapshot(store, rates(LAB_A=100), "2024-01-01")
+    rate_store.append_snapshot(store, rates(LAB_A=120), "2024-06-01")
+    templates = [{"code": "T-1", "materials": [], "labor": [{"rateCode": "LAB-A", "qty": 2}], "equipment": []}]
+
+    result = rate_store.escalate_boq(store, [("T-1", 10), ("MAT-X", 1)], "2024-01-01", "2024-06-01", templates)
+
+    assert result["baseValue"] == 2000
+    assert result["escalation"] == pytest.approx(2000 * 0.85 * 0.05 * 0.2)
+    assert result["missingRates"] == ["MAT-X"]
@@ -0,0 +1,44 @@
+from seed_sql import copy_field, sql_literal, text_array, write_changeset_sql, write_insert_sql, write_sql_dir
+from seed_store import diff_seeds
+
+RATE = {"code": "LAB-A", "name_ar": "عامل\tصب", "name_en": "", "unit": "يوم", "rate": 100, "type": "LABOR"}
+TEMPLATE = {"code": "T-1", "name_ar": "خرسانة", "name_en": "Concrete", "unit": "م3", "category": "concrete",
+            "materials": [], "labor": [{"rateCode": "LAB-A", "qty": 2, "description": "O'Neil"}], "equipment": []}
+INDIRECT = {"code": "IND-SITE", "name_ar": "موقع", "name_en": "Site", "percentage": 0.08, "applies_to": ["ALL"]}
+SECTIONS = {"rates": [RATE], "boq_templates": [TEMPLATE], "indirect_costs": [INDIRECT]}
+
+def test_copy_fields_escape_text_format():
+    assert copy_field(None) == "\\N"
+    assert copy_field("a\tb\nc\\d") == "a\\tb\\nc\\\\d"
+
+def test_literals_and_arrays_are_quoted():
+    assert sql_literal("O'Neil") == "'O''Neil'"
+    assert sql_literal(None) == "NULL"
+    assert text_array(['a"b', "c"]) == '{"a\\"b","c"}'
+
+def test_sql_dir_has_one_copy_row_per_record(tmp_path):
+    counts = write_sql_dir(tmp_path, SECTIONS)
+
+    assert counts == {"master_rates": 1, "boq_templates": 1, "indirect_cost_config": 1}
+    rate_line = (tmp_path / "master_rates.copy").read_text(encoding="utf-8")
+    assert rate_line == "LAB-A\tعامل\\tصب\t\\N\t\\N\tيوم\t100\t\\N\tLAB\n"
+    load = (tmp_path / "load.sql").read_text(encoding="utf-8")
+    assert "\\copy stage_master_rates FROM 'master_rates.copy'" in load
+    assert load.count("ON CONFLICT (code) DO UPDATE") == 3
+
+def test_inserts_are_batched(tmp_path):
+    rates = [dict(RATE, code=f"LAB-{index}") for index in range(5)]
+
+    write_insert_sql(tmp_path / "inserts.sql", {"rates": rates}, rows_per_statement=2)
+
+    assert (tmp_path / "inserts.sql").read_text(encoding="utf-8").count("INSERT INTO master_rates") == 3
+
+def test_changeset_deactivates_retired_codes(tmp_path):
+    changeset = diff_seeds(SECTIONS, {"rates": [dict(RATE, rate=120)], "boq_templates": [], "indirect_costs": []})
+
+    write_changeset_sql(tmp_path / "changeset.sql", changeset)
+
+    sql = (tmp_path / "changeset.sql").read_text(encoding="utf-8")
+    assert sql.count("INSERT INTO master_rates") == 1
+    assert "UPDATE boq_templates SET is_active = false, updated_at = NOW()\nWHERE code IN ('T-1') AND is_active;" in sql
+    assert "WHERE code IN ('IND-SITE')" in sql
@@ -0,0 +1,40 @@
+from seed_store import diff_seeds, load_seed, read_manifest, write_seed_dir, write_seed_json
+
+RATE = {"code": "LAB-A", "name_ar": "عامل", "name_en": "Worker", "unit": "يوم", "rate": 100, "type": "LABOR"}
+
+def seed(rate=100):
+    return {"rates": [dict(RATE, rate=rate)], "boq_templates": [], "indirect_costs": []}
+
+def test_seed_dir_round_trips(tmp_path):
+    write_seed_dir(tmp_path, seed())
+
+    assert load_seed(tmp_path) == seed()
+    assert read_manifest(tmp_path)["sections"]["rates"]["count"] == 1
+
+def test_seed_dir_and_json_load_alike(tmp_path):
+    write_seed_dir(tmp_path / "seed-data", seed())
+    write_seed_json(tmp_path / "seed-data.json", seed())
+
+    assert load_seed(tmp_path / "seed-data") == load_seed(tmp_path / "seed-data.json")
+
+def test_rewrite_removes_only_replaced_section_files(tmp_path):
+    (tmp_path / "notes.ndjson").write_text("{}\n")
+    (tmp_path / "rates.backup.ndjson").write_text("{}\n")
+    first = write_seed_dir(tmp_path, seed(100))["sections"]["rates"]["file"]
+
+    second = write_seed_dir(tmp_path, seed(120))["sections"]["rates"]["file"]
+
+    names = {path.name for path in tmp_path.glob("*.ndjson")}
+    assert first not in names
+    assert {second, "notes.ndjson", "rates.backup.ndjson"} <= names
+
+def test_diff_seeds_reports_updates_and_retirements():
+    previous = seed(100)
+    current = {"rates": [dict(RATE, rate=120), dict(RATE, code="LAB-B")], "boq_templates": [], "indirect_costs": []}
+    previous["boq_templates"] = [{"code": "T-1", "materials": [], "labor": [], "equipment": []}]
+
+    changeset = diff_seeds(previous, current)
+
+    assert changeset["summary"]["rates"] == {"inserted": 1, "updated": 1, "retired": 0}
+    assert changeset["sections"]["rates"]["updated"][0]["fields"] == ["rate"]
+    assert changeset["sections"]["boq_templates"]["retired"] == ["T-1"]
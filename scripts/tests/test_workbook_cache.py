@@ -0,0 +1,66 @@
+import io
+
+import msoffcrypto
+
+from conftest import rate_sheet, write_workbook
+
+def read_all(workbook):
+    with workbook:
+        return workbook.read()
+
+def test_entry_over_the_cap_is_decrypted_in_memory(extract_excel_data, tmp_path):
+    path = write_workbook(tmp_path / "a.xlsx", {"rates": rate_sheet({"LAB-A": 100})})
+    cache = tmp_path / "cache"
+
+    workbook = extract_excel_data.decrypt_excel_cached(path, cache_dir=cache, max_bytes=0)
+
+    assert read_all(workbook).startswith(b"PK")
+    assert not cache.exists()
+
+def test_new_entry_survives_eviction(extract_excel_data, tmp_path):
+    paths = [write_workbook(tmp_path / f"{code}.xlsx", {"rates": rate_sheet({code: 100})})
+             for code in ("LAB-A", "LAB-B", "LAB-C")]
+    cache = tmp_path / "cache"
+    # Each entry fits, all three do not
+    max_bytes = max(path.stat().st_size for path in paths)
+
+    for path in paths:
+        workbook = extract_excel_data.decrypt_excel_cached(path, cache_dir=cache, max_bytes=max_bytes)
+        newest = cache / f"{extract_excel_data.cache_key(path, 'BETA')}.xlsx"
+        assert newest.exists()
+        assert read_all(workbook).startswith(b"PK")
+
+    extract_excel_data.evict_cache(cache, 0, keep={newest})
+    assert list(cache.glob("*.xlsx")) == [newest]
+
+def test_evicted_entry_stays_readable_while_open(extract_excel_data, tmp_path):
+    path = write_workbook(tmp_path / "a.xlsx", {"rates": rate_sheet({"LAB-A": 100})})
+    cache = tmp_path / "cache"
+    workbook = extract_excel_data.decrypt_excel_cached(path, cache_dir=cache)
+
+    extract_excel_data.evict_cache(cache, 0)
+
+    assert not list(cache.glob("*.xlsx"))
+    assert read_all(workbook).startswith(b"PK")
+
+def test_extract_workbook_reads_through_the_cache(extract_excel_data, tmp_path):
+    path = write_workbook(tmp_path / "a.xlsx", {"rates": rate_sheet({"LAB-A": 100})})
+    cache = tmp_path / "cache"
+
+    for _ in range(2):
+        extracted = extract_excel_data.extract_workbook(path, cache_dir=cache)
+        assert [rate["rate"] for rate in extracted["rates"]] == [100]
+    assert len(list(cache.glob("*.xlsx"))) == 1
+
+def test_streamed_decryption_matches_msoffcrypto(extract_excel_data, tmp_path):
+    rates = {f"LAB-{index}": index for index in range(2000)}
+    path = write_workbook(tmp_path / "a.xlsx", {"rates": rate_sheet(rates)})
+    expected = io.BytesIO()
+    with open(path, 'rb') as file:
+        office_file = msoffcrypto.OfficeFile(file)
+        office_file.load_key(password="BETA")
+        office_file.decrypt(expected)
+
+    for spool in (False, True):
+        workbook = extract_excel_data.decrypt_excel(path, spool=spool)
+        assert read_all(workbook) == expected.getvalue()
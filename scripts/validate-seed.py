@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Validate the seed and the productivity data in one pass and report every problem
+
+Checks the seed's rates, BOQ templates and indirect costs (schema, units,
+duplicate codes, template categories, component rate codes) and the
+productivity rows of extracted-productivity.json (units, rates and the
+crew-roles.ts role codes of their parsed crews). See seed_records.py.
+
+--bench N compares the memory of N synthetic rates (and their templates)
+held as dicts with the same records in the column catalogs, and times the
+validation pass.
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+from pathlib import Path
+
+from script_modules import load_script
+from seed_records import check_productivity, load_catalog, problem_report
+from seed_sql import BOQ_CATEGORY_CODES
+from seed_store import SEED_SECTIONS, iter_section
+
+generate_templates = load_script("generate-templates")
+
+DEFAULT_SEED = Path(__file__).parent / "seed-data"
+DEFAULT_LIMIT = 50
+
+def synthetic_lines(count, extract_excel_data):
+    """NDJSON lines of `count` rates copied from the reference catalog, with each copy's templates"""
+    rates = extract_excel_data.reference_rates()
+    templates = extract_excel_data.extract_boq_templates()
+    lines = {"rates": [], "boq_templates": [], "indirect_costs": []}
+    for copy in range(count // len(rates) + 1):
+        suffix = f"-{copy:05d}" if copy else ""
+        for rate in rates:
+            lines["rates"].append(json.dumps(dict(rate, code=rate["code"] + suffix), ensure_ascii=False))
+        for template in templates:
+            renamed = dict(template, code=template["code"] + suffix)
+            for section in ("materials", "labor", "equipment"):
+                renamed[section] = [dict(component, rateCode=component["rateCode"] + suffix)
+                                    for component in template[section]]
+            lines["boq_templates"].append(json.dumps(renamed, ensure_ascii=False))
+    lines["rates"] = lines["rates"][:count]
+    lines["indirect_costs"] = [json.dumps(indirect, ensure_ascii=False)
+                               for indirect in extract_excel_data.extract_indirect_costs()]
+    return lines
+
+def traced_mb(build):
+    """Memory still allocated by what build() returns, in MB, and build()'s result"""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = build()
+        return (tracemalloc.get_traced_memory()[0] - before) / (1024 * 1024), result
+    finally:
+        tracemalloc.stop()
+
+def bench(count):
+    lines = synthetic_lines(count, load_script("extract-excel-data"))
+    records = sum(len(section) for section in lines.values())
+
+    def parsed(section):
+        return (json.loads(line) for line in lines[section])
+
+    dict_mb, _ = traced_mb(lambda: {section: [json.loads(line) for line in lines[section]] for section in lines})
+    catalog_mb, catalog = traced_mb(lambda: load_catalog({section: parsed(section) for section in lines},
+                                                         set(BOQ_CATEGORY_CODES)))
+    timings = []
+    for _ in range(3):
+        began = time.perf_counter()
+        catalog = load_catalog({section: parsed(section) for section in lines}, set(BOQ_CATEGORY_CODES))
+        timings.append(time.perf_counter() - began)
+    seconds = min(timings)
+    print(f"{records:,} records ({len(catalog.rates):,} rates, {len(catalog.templates):,} templates, "
+          f"{len(catalog.templates.component_qty):,} components)")
+    print(f"  as dicts:     {dict_mb:8.1f} MB")
+    print(f"  as catalogs:  {catalog_mb:8.1f} MB ({catalog_mb / dict_mb:.0%})")
+    print(f"  parse + validate: {seconds:.2f} s ({records / seconds:,.0f} records/s), "
+          f"{len(catalog.problems):,} problems")
+
+def print_report(report, limit):
+    records = ", ".join(f"{count:,} {name}" for name, count in report["records"].items())
+    print(f"Checked {records}")
+    for key, count in report["byField"].items():
+        print(f"  {key}: {count}")
+    for problem in report["problems"][:limit]:
+        marker = "✗" if problem["severity"] == "error" else "⚠"
+        print(f"{marker} {problem['section']} {problem['code']} [{problem['field']}] {problem['message']}")
+    if len(report["problems"]) > limit:
+        print(f"... {len(report['problems']) - limit} more (see --report)")
+    print(f"{report['counts']['error']} errors, {report['counts']['warning']} warnings")
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Validate the seed and productivity data")
+    parser.add_argument("--seed", default=str(DEFAULT_SEED), help="Seed directory or seed-data.json")
+    parser.add_argument("--productivity", default=str(generate_templates.DATA_PATH),
+                        help="extracted-productivity.json to check")
+    parser.add_argument("--crew-roles", default=str(generate_templates.CREW_ROLES_PATH),
+                        help="crew-roles.ts with the known role codes")
+    parser.add_argument("--no-productivity", action="store_true", help="Only check the seed")
+    parser.add_argument("--report", help="Write every problem as JSON")
+    parser.add_argument("--limit", type=int, default=DEFAULT_LIMIT, help="Problems printed")
+    parser.add_argument("--bench", type=int, metavar="N",
+                        help="Compare dict and catalog memory for N synthetic rates and time validation")
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    if args.bench:
+        bench(args.bench)
+        return
+
+    catalog = load_catalog({section: iter_section(args.seed, section) for section in SEED_SECTIONS},
+                           set(BOQ_CATEGORY_CODES))
+    if not args.no_productivity:
+        check_productivity(catalog, generate_templates.load_items(args.productivity),
+                           generate_templates.load_crew_rates(args.crew_roles),
+                           generate_templates.parse_crew, generate_templates.clean_text)
+    report = problem_report(catalog)
+    print_report(report, args.limit)
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"✓ Saved to: {args.report}")
+    if report["counts"]["error"]:
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
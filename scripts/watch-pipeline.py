@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Watch the workbooks and template data and regenerate their outputs on save
+
+The watcher keeps each workbook's extracted records and sheet fingerprints
+in memory. When a workbook is saved, only that workbook is decrypted again
+(in memory) and only its changed sheets are re-parsed, using the same
+fingerprints as extract-excel-data.py's incremental runs. The other
+workbooks' records are reused, and the seed (plus --sql-dir) is rewritten
+only if the merged result changed. A change to extracted-productivity.json
+or crew-roles.ts regenerates productivity-templates.ts and its modules.
+
+Files are polled with os.stat() every --interval seconds. For a handful of
+files that is cheap, and it behaves the same on every platform and on
+shared drives where inotify events are not delivered. A burst of saves is
+handled once, after the watched files have been unchanged for --debounce
+seconds.
+"""
+
+import argparse
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+
+from script_modules import load_script
+from seed_sql import write_sql_dir
+from seed_store import load_seed, seed_exists, write_seed_dir, write_seed_json
+
+extract_excel_data = load_script("extract-excel-data")
+generate_templates = load_script("generate-templates")
+
+DEFAULT_INTERVAL = 0.2
+DEFAULT_DEBOUNCE = 0.3
+
+def file_signature(path):
+    """(mtime, size) of a file, or None while it does not exist"""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+def snapshot(paths):
+    return {str(path): file_signature(path) for path in paths}
+
+def watched_paths(args):
+    """Workbooks (patterns re-expanded, so new files are picked up) and the template inputs"""
+    workbooks = extract_excel_data.expand_workbook_paths(args.workbooks) if args.workbooks else []
+    return workbooks + [str(args.data), str(args.crew_roles)]
+
+def wait_for_changes(current, args):
+    """Block until a watched file changes, then until the files stay unchanged for --debounce"""
+    while True:
+        time.sleep(args.interval)
+        latest = snapshot(watched_paths(args))
+        if latest != current:
+            break
+    settled = time.monotonic()
+    while time.monotonic() - settled < args.debounce:
+        time.sleep(args.interval)
+        newer = snapshot(watched_paths(args))
+        if newer != latest:
+            latest, settled = newer, time.monotonic()
+    return latest
+
+def refresh_workbooks(state, workbooks, changed, args):
+    """Re-extract new and changed workbooks and forget removed ones"""
+    extracted = state["workbooks"]
+    for path in list(extracted):
+        if path not in workbooks or not os.path.exists(path):
+            del extracted[path]
+    for path in workbooks:
+        if (path in extracted and path not in changed) or not os.path.exists(path):
+            continue
+        previous = extracted.get(path) or state["fingerprints"].get(extract_excel_data.workbook_key(path))
+        extracted[path] = extract_excel_data.extract_workbook(path, args.password, cache_dir=None, previous=previous)
+
+def refresh_seed(state, args):
+    """Merge the in-memory extractions and write the seed if it changed; returns whether it did"""
+    results = [(path, state["workbooks"][path]) for path in sorted(state["workbooks"])]
+    if results:
+        sections, conflicts = extract_excel_data.merge_extractions(results)
+        extract_excel_data.print_conflicts(conflicts)
+    else:
+        sections = {
+            "rates": extract_excel_data.reference_rates(),
+            "boq_templates": extract_excel_data.extract_boq_templates(),
+            "indirect_costs": extract_excel_data.extract_indirect_costs(),
+        }
+    if sections == state["seed"]:
+        return False
+    if args.format == "json":
+        write_seed_json(args.output, sections)
+    else:
+        write_seed_dir(args.output, sections)
+    if results:
+        extract_excel_data.write_fingerprints(args.output, results)
+    if args.sql_dir:
+        write_sql_dir(args.sql_dir, sections)
+    state["seed"] = sections
+    return True
+
+def refresh_templates(state, args):
+    """Regenerate the template modules if their inputs changed; returns whether they did"""
+    inputs = (generate_templates.load_items(args.data), generate_templates.load_crew_rates(args.crew_roles))
+    if inputs == state["templates"]:
+        return False
+    items, crew_rates = inputs
+    generate_templates.write_template_modules(args.templates, items, crew_rates, args.layout)
+    state["templates"] = inputs
+    return True
+
+def initial_state(args):
+    """Start from the seed on disk and its fingerprints, so unchanged sheets are not re-parsed"""
+    state = {"workbooks": {}, "fingerprints": {}, "seed": None, "templates": None}
+    if seed_exists(args.output):
+        state["fingerprints"] = extract_excel_data.load_previous_run(args.output)
+        state["seed"] = load_seed(args.output)
+    return state
+
+def run_cycle(state, changed, current, args):
+    """Refresh whatever depends on the changed files; a failure keeps the previous outputs"""
+    started = time.perf_counter()
+    refreshed = []
+    workbooks = [path for path in current if path not in (str(args.data), str(args.crew_roles))]
+    try:
+        if state["seed"] is None or set(workbooks) & changed or set(state["workbooks"]) - set(workbooks):
+            refresh_workbooks(state, workbooks, changed, args)
+            if refresh_seed(state, args):
+                refreshed.append(f"seed ({args.output})")
+        if {str(args.data), str(args.crew_roles)} & changed:
+            if refresh_templates(state, args):
+                refreshed.append(f"templates ({args.templates})")
+    except Exception as error:
+        # Usually a workbook caught mid-save; the next save retries
+        print(f"⚠ {type(error).__name__}: {error} - previous outputs kept")
+        return
+    elapsed = time.perf_counter() - started
+    print(f"✓ {datetime.now():%H:%M:%S} {', '.join(refreshed) or 'no output changed'} in {elapsed:.2f} s")
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Regenerate the seed and productivity templates when their inputs change")
+    parser.add_argument("workbooks", nargs="*",
+                        help="Password-protected .xlsx workbooks, directories of workbooks, or glob patterns")
+    parser.add_argument("--password", default=extract_excel_data.PASSWORD, help="Workbook password")
+    parser.add_argument("--format", choices=("ndjson", "json"), default="ndjson", help="Seed format to write")
+    parser.add_argument("--output", default=None,
+                        help="Seed directory (ndjson) or file (json) (default: scripts/seed-data or scripts/seed-data.json)")
+    parser.add_argument("--sql-dir", default=None, help="Also refresh the Postgres load files in this directory")
+    parser.add_argument("--data", default=str(generate_templates.DATA_PATH), help="Extracted productivity rows")
+    parser.add_argument("--crew-roles", default=str(generate_templates.CREW_ROLES_PATH), help="crew-roles.ts")
+    parser.add_argument("--templates", default=str(generate_templates.OUTPUT_PATH),
+                        help="productivity-templates.ts to regenerate")
+    parser.add_argument("--layout", choices=sorted(generate_templates.TEMPLATE_LAYOUTS),
+                        default=generate_templates.DEFAULT_LAYOUT)
+    parser.add_argument("--interval", type=float, default=DEFAULT_INTERVAL, help="Seconds between polls")
+    parser.add_argument("--debounce", type=float, default=DEFAULT_DEBOUNCE,
+                        help="Seconds the files must stay unchanged before regenerating")
+    args = parser.parse_args()
+    args.output = args.output or extract_excel_data.default_output(args.format)
+    return args
+
+def main():
+    args = parse_args()
+    state = initial_state(args)
+    current = snapshot(watched_paths(args))
+    print(f"Building from {len(current) - 2} workbook(s) and {Path(args.data).name}...")
+    run_cycle(state, set(current), current, args)
+    print("Watching for changes (Ctrl+C to stop)...")
+    try:
+        while True:
+            latest = wait_for_changes(current, args)
+            changed = {path for path in latest.keys() | current.keys() if latest.get(path) != current.get(path)}
+            print(f"\n↻ Changed: {', '.join(sorted(Path(path).name for path in changed))}")
+            current = latest
+            run_cycle(state, changed, current, args)
+    except KeyboardInterrupt:
+        print("\nStopped")
+
+if __name__ == "__main__":
+    main()
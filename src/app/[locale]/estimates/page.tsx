@@ -65,8 +65,8 @@ import {
 } from "@/lib/calculations";
 import type { EstimateStatus } from "@/lib/supabase";
 import { Tabs, TabsContent, TabsList, TabsTrigger } from "@/components/ui/tabs";
-import { ProductivityTemplateSelector, type LaborItem } from "@/components/productivity";
-import type { ProductivityTemplate } from "@/data/productivity-templates";
+import { ProductivityTemplateSelector, type LaborItem } from "@/components/productivity/ProductivityTemplateSelector";
+import type { ProductivityTemplate } from "@/data/productivity-templates/common";
 import { getCrewRoleByCode } from "@/data/crew-roles";
 
 interface EstimateItemData {
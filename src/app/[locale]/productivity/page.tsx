@@ -6,13 +6,12 @@ import { Zap, Calculator, Database, Info } from "lucide-react";
 import { Card, CardContent, CardHeader, CardTitle, CardDescription } from "@/components/ui/card";
 import { Tabs, TabsContent, TabsList, TabsTrigger } from "@/components/ui/tabs";
 import { Badge } from "@/components/ui/badge";
-import {
-  ProductivityTable,
-  ProductivityCalculator,
-  CrewComposition
-} from "@/components/productivity";
+import { ProductivityTable } from "@/components/productivity/ProductivityTable";
+import { ProductivityCalculator } from "@/components/productivity/ProductivityCalculator";
+import { CrewComposition } from "@/components/productivity/CrewComposition";
 import { formatNumber } from "@/lib/utils";
-import { productivityTemplates, getTemplateById, type ProductivityTemplate } from "@/data/productivity-templates";
+import type { ProductivityTemplate } from "@/data/productivity-templates/common";
+import { MANIFEST_ACTIVE_TEMPLATES } from "@/data/productivity-templates/manifest";
 import { productivityCategories } from "@/data/productivity-categories";
 import { crewRoles, crewRoleCategoryLabels } from "@/data/crew-roles";
 
@@ -29,7 +28,7 @@ export default function ProductivityPage() {
   };
 
   // Stats for overview
-  const totalTemplates = productivityTemplates.filter(t => t.isActive).length;
+  const totalTemplates = MANIFEST_ACTIVE_TEMPLATES;
   const totalCategories = productivityCategories.length;
   const totalRoles = crewRoles.length;
 
@@ -6,7 +6,7 @@ import { Users, User } from "lucide-react";
 import { cn } from "@/lib/utils";
 import { formatCurrency } from "@/lib/utils";
 import { getCrewRoleByCode, type CrewRole } from "@/data/crew-roles";
-import type { CrewMember } from "@/data/productivity-templates";
+import type { CrewMember } from "@/data/productivity-templates/common";
 
 interface CrewCompositionProps {
   crew: CrewMember[];
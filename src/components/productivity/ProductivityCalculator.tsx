@@ -19,9 +19,10 @@ import { cn } from "@/lib/utils";
 import { formatCurrency, formatNumber } from "@/lib/utils";
 import { CrewComposition } from "./CrewComposition";
 import { ConditionFactorSelector } from "./ConditionFactorSelector";
+import { useProductivityTemplates } from "./useProductivityTemplates";
 import { calculateProductivityCost, estimateCompletionDate, analyzeConditionImpact } from "@/lib/calculations";
 import { getCrewRoleByCode } from "@/data/crew-roles";
-import { productivityTemplates, getTemplateById, type ProductivityTemplate } from "@/data/productivity-templates";
+import { templateCategoryIds } from "@/data/productivity-templates/manifest";
 import { conditionFactors, getFactorById, type ConditionFactor } from "@/data/condition-factors";
 
 interface ProductivityCalculatorProps {
@@ -61,9 +62,12 @@ export function ProductivityCalculator({
   const [quantity, setQuantity] = useState<string>("");
   const [selectedFactorIds, setSelectedFactorIds] = useState<string[]>([]);
 
+  // The calculator offers every template, fetched once it is shown
+  const { templates } = useProductivityTemplates(templateCategoryIds);
+
   const selectedTemplate = useMemo(() => {
-    return selectedTemplateId ? getTemplateById(selectedTemplateId) : null;
-  }, [selectedTemplateId]);
+    return selectedTemplateId ? templates.find(t => t.id === selectedTemplateId) ?? null : null;
+  }, [templates, selectedTemplateId]);
 
   const selectedFactors = useMemo(() => {
     return selectedFactorIds
@@ -131,7 +135,7 @@ export function ProductivityCalculator({
               <SelectValue placeholder={isArabic ? "اختر نوع العمل" : "Select work type"} />
             </SelectTrigger>
             <SelectContent>
-              {productivityTemplates.map(template => (
+              {templates.map(template => (
                 <SelectItem key={template.id} value={template.id}>
                   {isArabic ? template.nameAr : (template.nameEn ?? template.nameAr)}
                   {" "}({template.unitAr})
@@ -24,17 +24,18 @@ import {
 import { cn } from "@/lib/utils";
 import { formatNumber, formatCurrency } from "@/lib/utils";
 import { CrewCompositionInline } from "./CrewComposition";
+import { useProductivityTemplates } from "./useProductivityTemplates";
 import {
-  productivityTemplates,
+  getDailyCrewCost,
   type ProductivityTemplate,
   type ProductivitySource
-} from "@/data/productivity-templates";
+} from "@/data/productivity-templates/common";
+import { templateCategoryIds, templateCategoryManifest } from "@/data/productivity-templates/manifest";
 import {
   productivityCategories,
   getCategoryById,
   type ProductivityCategory
 } from "@/data/productivity-categories";
-import { getCrewRoleByCode } from "@/data/crew-roles";
 
 interface ProductivityTableProps {
   onSelect?: (template: ProductivityTemplate) => void;
@@ -62,21 +63,26 @@ export function ProductivityTable({
   const [sortField, setSortField] = useState<SortField>("name");
   const [sortDirection, setSortDirection] = useState<SortDirection>("asc");
 
-  // Get unique sources from templates
+  // Only the categories being shown are fetched
+  const { templates, loading, error } = useProductivityTemplates(
+    categoryFilter === "all" ? templateCategoryIds : [categoryFilter]
+  );
+
+  // Get unique sources from the manifest
   const sources = useMemo(() => {
-    const sourceSet = new Set(productivityTemplates.map(t => t.source));
+    const sourceSet = new Set<ProductivitySource>(templateCategoryManifest.flatMap(c => c.sources));
     return Array.from(sourceSet);
   }, []);
 
-  // Get unique categories from templates
+  // Get categories that have templates
   const categoriesInUse = useMemo(() => {
-    const categoryIds = new Set(productivityTemplates.map(t => t.categoryId));
+    const categoryIds = new Set(templateCategoryIds);
     return productivityCategories.filter(c => categoryIds.has(c.id));
   }, []);
 
   // Filter and sort templates
   const filteredTemplates = useMemo(() => {
-    let result = productivityTemplates.filter(t => t.isActive);
+    let result = templates.filter(t => t.isActive);
 
     // Search filter
     if (searchQuery) {
@@ -124,7 +130,7 @@ export function ProductivityTable({
     });
 
     return result;
-  }, [searchQuery, categoryFilter, sourceFilter, sortField, sortDirection, isArabic, locale]);
+  }, [templates, searchQuery, categoryFilter, sourceFilter, sortField, sortDirection, isArabic, locale]);
 
   const handleSort = (field: SortField) => {
     if (sortField === field) {
@@ -135,13 +141,6 @@ export function ProductivityTable({
     }
   };
 
-  const getDailyCost = (template: ProductivityTemplate): number => {
-    return template.crew.reduce((sum, member) => {
-      const role = getCrewRoleByCode(member.roleCode);
-      return sum + (role?.dailyRate ?? 0) * member.qty;
-    }, 0);
-  };
-
   return (
     <div className={cn("space-y-4", className)} dir={isArabic ? "rtl" : "ltr"}>
       {/* Filters Row */}
@@ -265,13 +264,17 @@ export function ProductivityTable({
             {filteredTemplates.length === 0 ? (
               <TableRow>
                 <TableCell colSpan={6} className="text-center py-8 text-muted-foreground">
-                  {isArabic ? "لا توجد نتائج" : "No results found"}
+                  {loading
+                    ? (isArabic ? "جارٍ التحميل..." : "Loading...")
+                    : error
+                      ? (isArabic ? "تعذر تحميل القوالب" : "Could not load templates")
+                      : (isArabic ? "لا توجد نتائج" : "No results found")}
                 </TableCell>
               </TableRow>
             ) : (
               filteredTemplates.map(template => {
                 const category = getCategoryById(template.categoryId);
-                const dailyCost = getDailyCost(template);
+                const dailyCost = getDailyCrewCost(template);
                 const isSelected = selectedId === template.id;
 
                 return (
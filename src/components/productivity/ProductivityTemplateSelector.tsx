@@ -14,8 +14,10 @@ import {
 import { Badge } from "@/components/ui/badge";
 import { Button } from "@/components/ui/button";
 import { cn } from "@/lib/utils";
-import { productivityTemplates, type ProductivityTemplate } from "@/data/productivity-templates";
+import type { ProductivityTemplate } from "@/data/productivity-templates/common";
+import { templateCategoryIds } from "@/data/productivity-templates/manifest";
 import { productivityCategories, getCategoryById } from "@/data/productivity-categories";
+import { useProductivityTemplates } from "./useProductivityTemplates";
 import { getCrewRoleByCode } from "@/data/crew-roles";
 import { formatNumber, formatCurrency } from "@/lib/utils";
 
@@ -46,15 +48,20 @@ export function ProductivityTemplateSelector({
   const [categoryFilter, setCategoryFilter] = useState("all");
   const [selectedTemplate, setSelectedTemplate] = useState<ProductivityTemplate | null>(null);
 
-  // Get unique categories from templates
+  // Only the selected category (or all of them) is fetched
+  const { templates, loading, error } = useProductivityTemplates(
+    categoryFilter === "all" ? templateCategoryIds : [categoryFilter]
+  );
+
+  // Get categories that have templates
   const availableCategories = useMemo(() => {
-    const categoryIds = new Set(productivityTemplates.map(t => t.categoryId));
+    const categoryIds = new Set(templateCategoryIds);
     return productivityCategories.filter(c => categoryIds.has(c.id));
   }, []);
 
   // Filter templates
   const filteredTemplates = useMemo(() => {
-    return productivityTemplates.filter(template => {
+    return templates.filter(template => {
       const matchesSearch =
         template.nameAr.includes(searchTerm) ||
         template.code.toLowerCase().includes(searchTerm.toLowerCase());
@@ -62,7 +69,7 @@ export function ProductivityTemplateSelector({
         categoryFilter === "all" || template.categoryId === categoryFilter;
       return matchesSearch && matchesCategory && template.isActive;
     });
-  }, [searchTerm, categoryFilter]);
+  }, [templates, searchTerm, categoryFilter]);
 
   // Calculate labor items for selected template
   const laborItems = useMemo(() => {
@@ -168,7 +175,11 @@ export function ProductivityTemplateSelector({
           })}
           {filteredTemplates.length === 0 && (
             <div className="text-center py-8 text-muted-foreground">
-              {isArabic ? "لا توجد قوالب مطابقة" : "No matching templates"}
+              {loading
+                ? (isArabic ? "جارٍ التحميل..." : "Loading...")
+                : error
+                  ? (isArabic ? "تعذر تحميل القوالب" : "Could not load templates")
+                  : (isArabic ? "لا توجد قوالب مطابقة" : "No matching templates")}
             </div>
           )}
         </div>
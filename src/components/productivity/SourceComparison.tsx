@@ -16,8 +16,11 @@ import {
 import { cn } from "@/lib/utils";
 import { formatNumber, formatCurrency } from "@/lib/utils";
 import { compareProductivitySources, type ProductivityComparison } from "@/lib/calculations";
-import { getCrewRoleByCode } from "@/data/crew-roles";
-import type { ProductivityTemplate, ProductivitySource } from "@/data/productivity-templates";
+import {
+  getDailyCrewCost,
+  type ProductivityTemplate,
+  type ProductivitySource
+} from "@/data/productivity-templates/common";
 
 interface SourceComparisonProps {
   /** Multiple templates for the same work type from different sources */
@@ -48,16 +51,11 @@ export function SourceComparison({
   // Calculate daily crew cost for each template
   const templateData = useMemo(() => {
     return templates.map(template => {
-      const dailyCrewCost = template.crew.reduce((sum, member) => {
-        const role = getCrewRoleByCode(member.roleCode);
-        return sum + (role?.dailyRate ?? 0) * member.qty;
-      }, 0);
-
       return {
         source: template.source,
         productivityRate: template.productivityRate,
         crewSize: template.crewSize,
-        dailyCrewCost
+        dailyCrewCost: getDailyCrewCost(template)
       };
     });
   }, [templates]);
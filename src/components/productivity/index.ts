@@ -5,3 +5,4 @@ export { ConditionFactorSelector, SelectedFactorsDisplay } from './ConditionFact
 export { ProductivityTable } from './ProductivityTable';
 export { SourceComparison, SourceComparisonInline } from './SourceComparison';
 export { ProductivityTemplateSelector, type LaborItem } from './ProductivityTemplateSelector';
+export { useProductivityTemplates } from './useProductivityTemplates';
@@ -0,0 +1,45 @@
+"use client";
+
+import { useEffect, useState } from "react";
+import type { ProductivityTemplate } from "@/data/productivity-templates/common";
+import { loadTemplates } from "@/data/productivity-templates/loaders";
+
+// Shared so memoized filters see the same array while categories load
+const noTemplates: ProductivityTemplate[] = [];
+
+/**
+ * Templates of the given categories, fetched on demand from the per-category
+ * modules so a page only downloads the categories it shows. `error` is set
+ * when a category module fails to load (e.g. a chunk request fails offline).
+ */
+export function useProductivityTemplates(categoryIds: string[]) {
+  const key = categoryIds.join(",");
+  const [loaded, setLoaded] = useState<{
+    key: string;
+    templates: ProductivityTemplate[];
+    error: Error | null;
+  } | null>(null);
+
+  useEffect(() => {
+    let cancelled = false;
+    loadTemplates(key ? key.split(",") : [])
+      .then(templates => {
+        if (!cancelled) setLoaded({ key, templates, error: null });
+      })
+      .catch((error: unknown) => {
+        if (!cancelled) {
+          setLoaded({ key, templates: noTemplates, error: error instanceof Error ? error : new Error(String(error)) });
+        }
+      });
+    return () => {
+      cancelled = true;
+    };
+  }, [key]);
+
+  const current = loaded && loaded.key === key ? loaded : null;
+  return {
+    templates: current?.templates ?? noTemplates,
+    loading: current === null,
+    error: current?.error ?? null
+  };
+}
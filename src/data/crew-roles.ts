@@ -451,6 +451,27 @@ export const crewRoles: CrewRole[] = [
   },
 ];
 
+/**
+ * Version stamp of the daily rate table: an FNV-1a hash of the sorted
+ * "code=dailyRate" pairs. generate-templates.py computes the same stamp for
+ * the rates it precomputes template crew costs from, so a mismatch means the
+ * precomputed figures are stale.
+ */
+export function crewRateTableVersion(roles: CrewRole[]): string {
+  const text = roles
+    .map(role => `${role.code}=${role.dailyRate}`)
+    .sort()
+    .join(';');
+  let hash = 0x811c9dc5;
+  for (let i = 0; i < text.length; i++) {
+    hash ^= text.charCodeAt(i);
+    hash = Math.imul(hash, 0x01000193) >>> 0;
+  }
+  return hash.toString(16).padStart(8, '0');
+}
+
+export const CREW_RATE_TABLE_VERSION = crewRateTableVersion(crewRoles);
+
 /**
  * Get crew role by code
  */
@@ -8,2002 +8,415 @@
  * - productivity_rate: units produced per crew per day
  * - crew: labor roles needed with quantities
  * - source: origin of the productivity data (sheet name)
+ * - dailyCrewCost / laborCostPerUnit: crew cost from crew-roles.ts rates,
+ *   valid while CREW_RATE_TABLE_VERSION matches TEMPLATE_CREW_RATES_VERSION
+ *
+ * The templates live in one module per category under
+ * ./productivity-templates/; this module combines them and indexes the whole
+ * catalog. Pages that only need some categories should use the loaders and
+ * manifest in that directory instead of importing this module.
  */
 
 import type { ComponentItem } from '@/lib/supabase';
+import { lazyTemplates, type ProductivitySource, type ProductivityTemplate } from './productivity-templates/common';
+import * as siteServices from './productivity-templates/site-services';
+import * as pipeInstallation from './productivity-templates/pipe-installation';
+import * as electrical from './productivity-templates/electrical';
+import * as steelWorks from './productivity-templates/steel-works';
+import * as metalWorks from './productivity-templates/metal-works';
+import * as carpentry from './productivity-templates/carpentry';
+import * as aluminum from './productivity-templates/aluminum';
+import * as landscape from './productivity-templates/landscape';
+import * as elevator from './productivity-templates/elevator';
 
-export interface ProductivityTemplate {
-  id: string;
-  code: string;
-  nameAr: string;
-  nameEn?: string;
-  categoryId: string;
-  unit: string;
-  unitAr: string;
-  productivityRate: number;
-  crewSize: number;
-  crew: CrewMember[];
-  source: ProductivitySource;
-  sourceRef?: string;
-  notes?: string;
-  isActive: boolean;
-}
+export type { CrewMember, ProductivitySource, ProductivityTemplate } from './productivity-templates/common';
+export { TEMPLATE_CREW_RATES_VERSION, getDailyCrewCost, getLaborCostPerUnit } from './productivity-templates/common';
+
+// Category modules in productivityTemplates order
+const categoryModules = [siteServices, pipeInstallation, electrical, steelWorks, metalWorks, carpentry, aluminum, landscape, elevator];
 
-export interface CrewMember {
-  roleCode: string;
-  qty: number;
-  description?: string;
+const templateIds = categoryModules.flatMap(category => category.templateIds);
+const templateCodes = categoryModules.flatMap(category => category.templateCodes);
+
+// Position in productivityTemplates of each category module's first template
+const categoryStarts = [0, 18, 52, 65, 73, 85, 100, 111, 121];
+
+function categoryTemplateAt(i: number): ProductivityTemplate {
+  let k = categoryStarts.length - 1;
+  while (categoryStarts[k] > i) k--;
+  return categoryModules[k].templateAt(i - categoryStarts[k]);
 }
 
-export type ProductivitySource =
-  | 'بتروجت'
-  | 'H.A'
-  | 'البقري/النادي'
-  | 'مصادر اخري'
-  | 'متوسط'
-  | 'اعمال تخديميه'
-  | 'تركيب المواسير'
-  | 'اعمال الكهرباء'
-  | 'اعمال الحديد'
-  | 'الاعمال المعدنيه'
-  | 'اعمال الخشب'
-  | 'اعمال الالمونيوم'
-  | 'اعمال الاند اسكيب'
-  | 'اعمال الاسانسير';
+const catalog = lazyTemplates(templateIds.length, categoryTemplateAt);
+const templateAt = catalog.templateAt;
 
 /**
  * Productivity Templates Database
  * Extracted from Excel: الانتاجيات
+ *
+ * An array view over the category modules; rows are built on first access.
  */
-export const productivityTemplates: ProductivityTemplate[] = [
-  // ========================================
-  // أعمال تخديمية - Site Services
-  // ========================================
-  {
-    id: 'SVC-001',
-    code: 'SVC-001',
-    nameAr: 'رفع بلوك طابق واحد باليد العاملة',
-    categoryId: 'site-services',
-    unit: 'م3',
-    unitAr: 'م3',
-    productivityRate: 4.0,
-    crewSize: 2,
-    crew: [{ roleCode: 'LAB-GENERAL', qty: 2, description: 'عامل' }],
-    source: 'اعمال تخديميه',
-    sourceRef: 'اعمال تخديميه',
-    isActive: true
-  },
-  {
-    id: 'SVC-002',
-    code: 'SVC-002',
-    nameAr: 'تنزيل ورفع بلوك بالونش الجمل',
-    categoryId: 'site-services',
-    unit: 'م3',
-    unitAr: 'م3',
-    productivityRate: 12.0,
-    crewSize: 3,
-    crew: [{ roleCode: 'LAB-GENERAL', qty: 3, description: 'عامل' }],
-    source: 'اعمال تخديميه',
-    sourceRef: 'اعمال تخديميه',
-    isActive: true
-  },
-  {
-    id: 'SVC-003',
-    code: 'SVC-003',
-    nameAr: 'تحميل وتنزيل بلوك على العربية',
-    categoryId: 'site-services',
-    unit: 'م3',
-    unitAr: 'م3',
-    productivityRate: 10.0,
-    crewSize: 2,
-    crew: [{ roleCode: 'LAB-GENERAL', qty: 2, description: 'عامل' }],
-    source: 'اعمال تخديميه',
-    sourceRef: 'اعمال تخديميه',
-    isActive: true
-  },
-  {
-    id: 'SVC-004',
-    code: 'SVC-004',
-    nameAr: 'نقل وتوزيع بلوك ضمن الابنية فى المنسوب الواحد',
-    categoryId: 'site-services',
-    unit: 'م3',
-    unitAr: 'م3',
-    productivityRate: 16.0,
-    crewSize: 2,
-    crew: [{ roleCode: 'LAB-GENERAL', qty: 2, description: 'عامل' }],
-    source: 'اعمال تخديميه',
-    sourceRef: 'اعمال تخديميه',
-    isActive: true
-  },
-  {
-    id: 'SVC-005',
-    code: 'SVC-005',
-    nameAr: 'رفع بلاط ورخام للطوابق بالونش',
-    categoryId: 'site-services',
-    unit: 'م2',
-    unitAr: 'م2',
-    productivityRate: 180.0,
-    crewSize: 3,
-    crew: [{ roleCode: 'LAB-GENERAL', qty: 3, description: 'عامل' }],
-    source: 'اعمال تخديميه',
-    sourceRef: 'اعمال تخديميه',
-    isActive: true
-  },
-  {
-    id: 'SVC-006',
-    code: 'SVC-006',
-    nameAr: 'تحميل وتنزيل بلاط ورخام وسيراميك ضمن الادوار',
-    categoryId: 'site-services',
-    unit: 'م2',
-    unitAr: 'م2',
-    productivityRate: 200.0,
-    crewSize: 2,
-    crew: [{ roleCode: 'LAB-GENERAL', qty: 2, description: 'عامل' }],
-    source: 'اعمال تخديميه',
-    sourceRef: 'اعمال تخديميه',
-    isActive: true
-  },
-  {
-    id: 'SVC-007',
-    code: 'SVC-007',
-    nameAr: 'تحميل وتنزيل اسمنت على العربية',
-    categoryId: 'site-services',
-    unit: 'طن',
-    unitAr: 'طن',
-    productivityRate: 10.0,
-    crewSize: 2,
-    crew: [{ roleCode: 'LAB-GENERAL', qty: 2, description: 'عامل' }],
-    source: 'اعمال تخديميه',
-    sourceRef: 'اعمال تخديميه',
-    isActive: true
-  },
-  {
-    id: 'SVC-008',
-    code: 'SVC-008',
-    nameAr: 'تكسير خرسانة يدوى',
-    categoryId: 'site-services',
-    unit: 'م3',
-    unitAr: 'م3',
-    productivityRate: 0.5,
-    crewSize: 1,
-    crew: [{ roleCode: 'LAB-DEMOLITION', qty: 1, description: 'نحات' }],
-    source: 'اعمال تخديميه',
-    sourceRef: 'اعمال تخديميه',
-    isActive: true
-  },
-  {
-    id: 'SVC-009',
-    code: 'SVC-009',
-    nameAr: 'تكسير خرسانة بالكمبروسور',
-    categoryId: 'site-services',
-    unit: 'م3',
-    unitAr: 'م3',
-    productivityRate: 3.0,
-    crewSize: 2,
-    crew: [{ roleCode: 'EQP-COMPRESSOR', qty: 1, description: 'ماكينة' },
-      { roleCode: 'LAB-GENERAL', qty: 1, description: 'عامل' }],
-    source: 'اعمال تخديميه',
-    sourceRef: 'اعمال تخديميه',
-    isActive: true
-  },
-  {
-    id: 'SVC-010',
-    code: 'SVC-010',
-    nameAr: 'تكسير بلوك مع ازالة الناتج',
-    categoryId: 'site-services',
-    unit: 'م3',
-    unitAr: 'م3',
-    productivityRate: 3.0,
-    crewSize: 2,
-    crew: [{ roleCode: 'LAB-DEMOLITION', qty: 2, description: 'نحات' }],
-    source: 'اعمال تخديميه',
-    sourceRef: 'اعمال تخديميه',
-    isActive: true
-  },
-  {
-    id: 'SVC-011',
-    code: 'SVC-011',
-    nameAr: 'ترآيب سقائل معدنية للوجهات',
-    categoryId: 'site-services',
-    unit: 'م2',
-    unitAr: 'م2',
-    productivityRate: 70.0,
-    crewSize: 3,
-    crew: [{ roleCode: 'LAB-CARPENTER-FW', qty: 1, description: 'نجار' },
-      { roleCode: 'LAB-GENERAL', qty: 2, description: 'عامل' }],
-    source: 'اعمال تخديميه',
-    sourceRef: 'اعمال تخديميه',
-    isActive: true
-  },
-  {
-    id: 'SVC-012',
-    code: 'SVC-012',
-    nameAr: 'فك سقايل للوجهات',
-    categoryId: 'site-services',
-    unit: 'م2',
-    unitAr: 'م2',
-    productivityRate: 100.0,
-    crewSize: 3,
-    crew: [{ roleCode: 'LAB-CARPENTER-FW', qty: 1, description: 'نجار' },
-      { roleCode: 'LAB-GENERAL', qty: 2, description: 'عامل' }],
-    source: 'اعمال تخديميه',
-    sourceRef: 'اعمال تخديميه',
-    isActive: true
-  },
-  {
-    id: 'SVC-013',
-    code: 'SVC-013',
-    nameAr: 'ازالة البياض الداخلى مع ازالة الناتج',
-    categoryId: 'site-services',
-    unit: 'م2',
-    unitAr: 'م2',
-    productivityRate: 16.0,
-    crewSize: 2,
-    crew: [{ roleCode: 'LAB-DEMOLITION', qty: 1, description: 'نحات' },
-      { roleCode: 'LAB-GENERAL', qty: 1, description: 'عامل' }],
-    source: 'اعمال تخديميه',
-    sourceRef: 'اعمال تخديميه',
-    isActive: true
-  },
-  {
-    id: 'SVC-014',
-    code: 'SVC-014',
-    nameAr: 'تحميل وتنزيل حديد تسليح مشكل',
-    categoryId: 'site-services',
-    unit: 'طن',
-    unitAr: 'طن',
-    productivityRate: 2.0,
-    crewSize: 2,
-    crew: [{ roleCode: 'LAB-GENERAL', qty: 2, description: 'عامل' }],
-    source: 'اعمال تخديميه',
-    sourceRef: 'اعمال تخديميه',
-    isActive: true
-  },
-  {
-    id: 'SVC-015',
-    code: 'SVC-015',
-    nameAr: 'تكسير بلاط وازالة الناتج خارج من المبنى',
-    categoryId: 'site-services',
-    unit: 'م2',
-    unitAr: 'م2',
-    productivityRate: 30.0,
-    crewSize: 2,
-    crew: [{ roleCode: 'LAB-GENERAL', qty: 2, description: 'عامل' }],
-    source: 'اعمال تخديميه',
-    sourceRef: 'اعمال تخديميه',
-    isActive: true
-  },
-  {
-    id: 'SVC-016',
-    code: 'SVC-016',
-    nameAr: 'رفع ورص بلوك هوردى',
-    categoryId: 'site-services',
-    unit: 'عدد',
-    unitAr: 'عدد',
-    productivityRate: 250.0,
-    crewSize: 2,
-    crew: [{ roleCode: 'LAB-GENERAL', qty: 2, description: 'عامل' }],
-    source: 'اعمال تخديميه',
-    sourceRef: 'اعمال تخديميه',
-    isActive: true
-  },
-  {
-    id: 'SVC-017',
-    code: 'SVC-017',
-    nameAr: 'رفع وتوزيع اسمنت على الادوار بالونش',
-    categoryId: 'site-services',
-    unit: 'طن',
-    unitAr: 'طن',
-    productivityRate: 7.0,
-    crewSize: 2,
-    crew: [{ roleCode: 'LAB-GENERAL', qty: 2, description: 'عامل' }],
-    source: 'اعمال تخديميه',
-    sourceRef: 'اعمال تخديميه',
-    isActive: true
-  },
-  {
-    id: 'SVC-018',
-    code: 'SVC-018',
-    nameAr: 'رفع وتوزيع رمل على الادوار بالونش',
-    categoryId: 'site-services',
-    unit: 'م3',
-    unitAr: 'م3',
-    productivityRate: 6.0,
-    crewSize: 3,
-    crew: [{ roleCode: 'LAB-GENERAL', qty: 3, description: 'عامل' }],
-    source: 'اعمال تخديميه',
-    sourceRef: 'اعمال تخديميه',
-    isActive: true
-  },
-  // ========================================
-  // تركيب المواسير - Pipe Installation
-  // ========================================
-  {
-    id: 'PIP-001',
-    code: 'PIPE-001',
-    nameAr: 'مواسير صرف PVC طول القطعة 3م قطر الماسورة حتى 150 مم',
-    categoryId: 'pipe-installation',
-    unit: 'م.ط',
-    unitAr: 'م.ط',
-    productivityRate: 145.6,
-    crewSize: 4,
-    crew: [{ roleCode: 'LAB-PLUMBER', qty: 1, description: 'صناعي' },
-      { roleCode: 'LAB-PLUMBER-ASST', qty: 3, description: 'مساعد' }],
-    source: 'تركيب المواسير',
-    sourceRef: 'تركيب المواسير',
-    isActive: true
-  },
-  {
-    id: 'PIP-002',
-    code: 'PIPE-002',
-    nameAr: 'مواسير صرف PVC طول القطعة 6م قطر الماسورة حتى 150 مم',
-    categoryId: 'pipe-installation',
-    unit: 'م.ط',
-    unitAr: 'م.ط',
-    productivityRate: 266.4,
-    crewSize: 4,
-    crew: [{ roleCode: 'LAB-PLUMBER', qty: 1, description: 'صناعي' },
-      { roleCode: 'LAB-PLUMBER-ASST', qty: 3, description: 'مساعد' }],
-    source: 'تركيب المواسير',
-    sourceRef: 'تركيب المواسير',
-    isActive: true
-  },
-  {
-    id: 'PIP-003',
-    code: 'PIPE-003',
-    nameAr: 'مواسير صرف PVC طول القطعة 3م قطر الماسورة حتى 200 مم',
-    categoryId: 'pipe-installation',
-    unit: 'م.ط',
-    unitAr: 'م.ط',
-    productivityRate: 102.4,
-    crewSize: 4,
-    crew: [{ roleCode: 'LAB-PLUMBER', qty: 1, description: 'صناعي' },
-      { roleCode: 'LAB-PLUMBER-ASST', qty: 3, description: 'مساعد' }],
-    source: 'تركيب المواسير',
-    sourceRef: 'تركيب المواسير',
-    isActive: true
-  },
-  {
-    id: 'PIP-004',
-    code: 'PIPE-004',
-    nameAr: 'مواسير صرف PVC طول القطعة 6م قطر الماسورة حتى 200 مم',
-    categoryId: 'pipe-installation',
-    unit: 'م.ط',
-    unitAr: 'م.ط',
-    productivityRate: 204.8,
-    crewSize: 5,
-    crew: [{ roleCode: 'LAB-PLUMBER', qty: 1, description: 'صناعي' },
-      { roleCode: 'LAB-PLUMBER-ASST', qty: 4, description: 'مساعد' }],
-    source: 'تركيب المواسير',
-    sourceRef: 'تركيب المواسير',
-    isActive: true
-  },
-  {
-    id: 'PIP-005',
-    code: 'PIPE-005',
-    nameAr: 'مواسير من الفخار والتقفيل بمونة اسمنتية قطر الماسورة 75 مم',
-    categoryId: 'pipe-installation',
-    unit: 'م.ط',
-    unitAr: 'م.ط',
-    productivityRate: 52.8,
-    crewSize: 5,
-    crew: [{ roleCode: 'LAB-PLUMBER', qty: 1, description: 'صناعي' },
-      { roleCode: 'LAB-PLUMBER-ASST', qty: 4, description: 'مساعد' }],
-    source: 'تركيب المواسير',
-    sourceRef: 'تركيب المواسير',
-    isActive: true
-  },
-  {
-    id: 'PIP-006',
-    code: 'PIPE-006',
-    nameAr: 'مواسير من الفخار والتقفيل بمونة اسمنتية قطر الماسورة 100 مم',
-    categoryId: 'pipe-installation',
-    unit: 'م.ط',
-    unitAr: 'م.ط',
-    productivityRate: 49.6,
-    crewSize: 5,
-    crew: [{ roleCode: 'LAB-PLUMBER', qty: 1, description: 'صناعي' },
-      { roleCode: 'LAB-PLUMBER-ASST', qty: 4, description: 'مساعد' }],
-    source: 'تركيب المواسير',
-    sourceRef: 'تركيب المواسير',
-    isActive: true
-  },
-  {
-    id: 'PIP-007',
-    code: 'PIPE-007',
-    nameAr: 'مواسير من الفخار والتقفيل بمونة اسمنتية قطر الماسورة 150 مم',
-    categoryId: 'pipe-installation',
-    unit: 'م.ط',
-    unitAr: 'م.ط',
-    productivityRate: 36.0,
-    crewSize: 5,
-    crew: [{ roleCode: 'LAB-PLUMBER', qty: 1, description: 'صناعي' },
-      { roleCode: 'LAB-PLUMBER-ASST', qty: 4, description: 'مساعد' }],
-    source: 'تركيب المواسير',
-    sourceRef: 'تركيب المواسير',
-    isActive: true
-  },
-  {
-    id: 'PIP-008',
-    code: 'PIPE-008',
-    nameAr: 'مواسير من الفخار والتقفيل بمونة اسمنتية قطر الماسورة 225 مم',
-    categoryId: 'pipe-installation',
-    unit: 'م.ط',
-    unitAr: 'م.ط',
-    productivityRate: 24.8,
-    crewSize: 5,
-    crew: [{ roleCode: 'LAB-PLUMBER', qty: 1, description: 'صناعي' },
-      { roleCode: 'LAB-PLUMBER-ASST', qty: 4, description: 'مساعد' }],
-    source: 'تركيب المواسير',
-    sourceRef: 'تركيب المواسير',
-    isActive: true
-  },
-  {
-    id: 'PIP-009',
-    code: 'PIPE-009',
-    nameAr: 'مواسير من الفخار والتقفيل بمونة اسمنتية قطر الماسورة 300 مم',
-    categoryId: 'pipe-installation',
-    unit: 'م.ط',
-    unitAr: 'م.ط',
-    productivityRate: 19.2,
-    crewSize: 5,
-    crew: [{ roleCode: 'LAB-PLUMBER', qty: 1, description: 'صناعي' },
-      { roleCode: 'LAB-PLUMBER-ASST', qty: 4, description: 'مساعد' }],
-    source: 'تركيب المواسير',
-    sourceRef: 'تركيب المواسير',
-    isActive: true
-  },
-  {
-    id: 'PIP-010',
-    code: 'PIPE-010',
-    nameAr: 'مواسير من الفخار والتقفيل بمونة اسمنتية قطر الماسورة اآبر 300 مم',
-    categoryId: 'pipe-installation',
-    unit: 'م.ط',
-    unitAr: 'م.ط',
-    productivityRate: 12.8,
-    crewSize: 5,
-    crew: [{ roleCode: 'LAB-PLUMBER', qty: 1, description: 'صناعي' },
-      { roleCode: 'LAB-PLUMBER-ASST', qty: 4, description: 'مساعد' }],
-    source: 'تركيب المواسير',
-    sourceRef: 'تركيب المواسير',
-    isActive: true
-  },
-  {
-    id: 'PIP-011',
-    code: 'PIPE-011',
-    nameAr: 'مواسير من الفخار Flexible Joints قطر الماسورة 75 مم',
-    categoryId: 'pipe-installation',
-    unit: 'م.ط',
-    unitAr: 'م.ط',
-    productivityRate: 100.0,
-    crewSize: 5,
-    crew: [{ roleCode: 'LAB-PLUMBER', qty: 1, description: 'صناعي' },
-      { roleCode: 'LAB-PLUMBER-ASST', qty: 4, description: 'مساعد' }],
-    source: 'تركيب المواسير',
-    sourceRef: 'تركيب المواسير',
-    isActive: true
-  },
-  {
-    id: 'PIP-012',
-    code: 'PIPE-012',
-    nameAr: 'مواسير من الفخار Flexible Joints قطر الماسورة 100 مم',
-    categoryId: 'pipe-installation',
-    unit: 'م.ط',
-    unitAr: 'م.ط',
-    productivityRate: 80.0,
-    crewSize: 5,
-    crew: [{ roleCode: 'LAB-PLUMBER', qty: 1, description: 'صناعي' },
-      { roleCode: 'LAB-PLUMBER-ASST', qty: 4, description: 'مساعد' }],
-    source: 'تركيب المواسير',
-    sourceRef: 'تركيب المواسير',
-    isActive: true
-  },
-  {
-    id: 'PIP-013',
-    code: 'PIPE-013',
-    nameAr: 'مواسير من الفخار Flexible Joints قطر الماسورة 150 مم',
-    categoryId: 'pipe-installation',
-    unit: 'م.ط',
-    unitAr: 'م.ط',
-    productivityRate: 61.6,
-    crewSize: 5,
-    crew: [{ roleCode: 'LAB-PLUMBER', qty: 1, description: 'صناعي' },
-      { roleCode: 'LAB-PLUMBER-ASST', qty: 4, description: 'مساعد' }],
-    source: 'تركيب المواسير',
-    sourceRef: 'تركيب المواسير',
-    isActive: true
-  },
-  {
-    id: 'PIP-014',
-    code: 'PIPE-014',
-    nameAr: 'مواسير من الفخار Flexible Joints قطر الماسورة 225 مم',
-    categoryId: 'pipe-installation',
-    unit: 'م.ط',
-    unitAr: 'م.ط',
-    productivityRate: 32.0,
-    crewSize: 5,
-    crew: [{ roleCode: 'LAB-PLUMBER', qty: 1, description: 'صناعي' },
-      { roleCode: 'LAB-PLUMBER-ASST', qty: 4, description: 'مساعد' }],
-    source: 'تركيب المواسير',
-    sourceRef: 'تركيب المواسير',
-    isActive: true
-  },
-  {
-    id: 'PIP-015',
-    code: 'PIPE-015',
-    nameAr: 'مواسير من الفخار Flexible Joints قطر الماسورة 300 مم',
-    categoryId: 'pipe-installation',
-    unit: 'م.ط',
-    unitAr: 'م.ط',
-    productivityRate: 20.0,
-    crewSize: 5,
-    crew: [{ roleCode: 'LAB-PLUMBER', qty: 1, description: 'صناعي' },
-      { roleCode: 'LAB-PLUMBER-ASST', qty: 4, description: 'مساعد' }],
-    source: 'تركيب المواسير',
-    sourceRef: 'تركيب المواسير',
-    isActive: true
-  },
-  {
-    id: 'PIP-016',
-    code: 'PIPE-016',
-    nameAr: 'مواسير من الفخار Flexible Joints قطر الماسورة اآبر 300 مم',
-    categoryId: 'pipe-installation',
-    unit: 'م.ط',
-    unitAr: 'م.ط',
-    productivityRate: 16.8,
-    crewSize: 5,
-    crew: [{ roleCode: 'LAB-PLUMBER', qty: 1, description: 'صناعي' },
-      { roleCode: 'LAB-PLUMBER-ASST', qty: 4, description: 'مساعد' }],
-    source: 'تركيب المواسير',
-    sourceRef: 'تركيب المواسير',
-    isActive: true
-  },
-  {
-    id: 'PIP-017',
-    code: 'PIPE-017',
-    nameAr: 'مواسير خرسانية طول القطعة 1.5 م قطر الماسورة حتى 375 مم',
-    categoryId: 'pipe-installation',
-    unit: 'م.ط',
-    unitAr: 'م.ط',
-    productivityRate: 30.4,
-    crewSize: 5,
-    crew: [{ roleCode: 'LAB-PLUMBER', qty: 1, description: 'صناعي' },
-      { roleCode: 'LAB-PLUMBER-ASST', qty: 4, description: 'مساعد' }],
-    source: 'تركيب المواسير',
-    sourceRef: 'تركيب المواسير',
-    isActive: true
-  },
-  {
-    id: 'PIP-018',
-    code: 'PIPE-018',
-    nameAr: 'مواسير خرسانية طول القطعة 1.5 م قطر الماسورة حتى 450 مم',
-    categoryId: 'pipe-installation',
-    unit: 'م.ط',
-    unitAr: 'م.ط',
-    productivityRate: 28.8,
-    crewSize: 5,
-    crew: [{ roleCode: 'LAB-PLUMBER', qty: 1, description: 'صناعي' },
-      { roleCode: 'LAB-PLUMBER-ASST', qty: 4, description: 'مساعد' }],
-    source: 'تركيب المواسير',
-    sourceRef: 'تركيب المواسير',
-    isActive: true
-  },
-  {
-    id: 'PIP-019',
-    code: 'PIPE-019',
-    nameAr: 'مواسير خرسانية طول القطعة 1.5 م قطر الماسورة حتى 525 مم',
-    categoryId: 'pipe-installation',
-    unit: 'م.ط',
-    unitAr: 'م.ط',
-    productivityRate: 27.2,
-    crewSize: 5,
-    crew: [{ roleCode: 'LAB-PLUMBER', qty: 1, description: 'صناعي' },
-      { roleCode: 'LAB-PLUMBER-ASST', qty: 4, description: 'مساعد' }],
-    source: 'تركيب المواسير',
-    sourceRef: 'تركيب المواسير',
-    isActive: true
-  },
-  {
-    id: 'PIP-020',
-    code: 'PIPE-020',
-    nameAr: 'مواسير خرسانية طول القطعة 1.5 م قطر الماسورة حتى 600 مم',
-    categoryId: 'pipe-installation',
-    unit: 'م.ط',
-    unitAr: 'م.ط',
-    productivityRate: 26.4,
-    crewSize: 5,
-    crew: [{ roleCode: 'LAB-PLUMBER', qty: 1, description: 'صناعي' },
-      { roleCode: 'LAB-PLUMBER-ASST', qty: 4, description: 'مساعد' }],
-    source: 'تركيب المواسير',
-    sourceRef: 'تركيب المواسير',
-    isActive: true
-  },
-  {
-    id: 'PIP-021',
-    code: 'PIPE-021',
-    nameAr: 'مواسير خرسانية طول القطعة 1.5 م قطر الماسورة حتى 675 مم',
-    categoryId: 'pipe-installation',
-    unit: 'م.ط',
-    unitAr: 'م.ط',
-    productivityRate: 23.2,
-    crewSize: 5,
-    crew: [{ roleCode: 'LAB-PLUMBER', qty: 1, description: 'صناعي' },
-      { roleCode: 'LAB-PLUMBER-ASST', qty: 4, description: 'مساعد' }],
-    source: 'تركيب المواسير',
-    sourceRef: 'تركيب المواسير',
-    isActive: true
-  },
-  {
-    id: 'PIP-022',
-    code: 'PIPE-022',
-    nameAr: 'مواسير خرسانية طول القطعة 1.5 م قطر الماسورة حتى 750 مم',
-    categoryId: 'pipe-installation',
-    unit: 'م.ط',
-    unitAr: 'م.ط',
-    productivityRate: 20.0,
-    crewSize: 5,
-    crew: [{ roleCode: 'LAB-PLUMBER', qty: 1, description: 'صناعي' },
-      { roleCode: 'LAB-PLUMBER-ASST', qty: 4, description: 'مساعد' }],
-    source: 'تركيب المواسير',
-    sourceRef: 'تركيب المواسير',
-    isActive: true
-  },
-  {
-    id: 'PIP-023',
-    code: 'PIPE-023',
-    nameAr: 'مواسير خرسانية طول القطعة 1.5 م قطر الماسورة حتى 1500 مم',
-    categoryId: 'pipe-installation',
-    unit: 'م.ط',
-    unitAr: 'م.ط',
-    productivityRate: 2.5,
-    crewSize: 5,
-    crew: [{ roleCode: 'LAB-PLUMBER', qty: 1, description: 'صناعي' },
-      { roleCode: 'LAB-PLUMBER-ASST', qty: 4, description: 'مساعد' }],
-    source: 'تركيب المواسير',
-    sourceRef: 'تركيب المواسير',
-    isActive: true
-  },
-  {
-    id: 'PIP-024',
-    code: 'PIPE-024',
-    nameAr: 'مواسير خرسانية طول القطعة 1.5 م قطر الماسورة حتى 1800 مم',
-    categoryId: 'pipe-installation',
-    unit: 'م.ط',
-    unitAr: 'م.ط',
-    productivityRate: 2.1,
-    crewSize: 5,
-    crew: [{ roleCode: 'LAB-PLUMBER', qty: 1, description: 'صناعي' },
-      { roleCode: 'LAB-PLUMBER-ASST', qty: 4, description: 'مساعد' }],
-    source: 'تركيب المواسير',
-    sourceRef: 'تركيب المواسير',
-    isActive: true
-  },
-  {
-    id: 'PIP-025',
-    code: 'PIPE-025',
-    nameAr: 'مواسير خرسانية طول القطعة 2.5 م قطر الماسورة حتى 375 مم',
-    categoryId: 'pipe-installation',
-    unit: 'م.ط',
-    unitAr: 'م.ط',
-    productivityRate: 40.0,
-    crewSize: 5,
-    crew: [{ roleCode: 'LAB-PLUMBER', qty: 1, description: 'صناعي' },
-      { roleCode: 'LAB-PLUMBER-ASST', qty: 4, description: 'مساعد' }],
-    source: 'تركيب المواسير',
-    sourceRef: 'تركيب المواسير',
-    isActive: true
-  },
-  {
-    id: 'PIP-026',
-    code: 'PIPE-026',
-    nameAr: 'مواسير خرسانية طول القطعة 2.5 م قطر الماسورة حتى 450 مم',
-    categoryId: 'pipe-installation',
-    unit: 'م.ط',
-    unitAr: 'م.ط',
-    productivityRate: 36.0,
-    crewSize: 5,
-    crew: [{ roleCode: 'LAB-PLUMBER', qty: 1, description: 'صناعي' },
-      { roleCode: 'LAB-PLUMBER-ASST', qty: 4, description: 'مساعد' }],
-    source: 'تركيب المواسير',
-    sourceRef: 'تركيب المواسير',
-    isActive: true
-  },
-  {
-    id: 'PIP-027',
-    code: 'PIPE-027',
-    nameAr: 'مواسير خرسانية طول القطعة 2.5 م قطر الماسورة حتى 525 مم',
-    categoryId: 'pipe-installation',
-    unit: 'م.ط',
-    unitAr: 'م.ط',
-    productivityRate: 32.8,
-    crewSize: 5,
-    crew: [{ roleCode: 'LAB-PLUMBER', qty: 1, description: 'صناعي' },
-      { roleCode: 'LAB-PLUMBER-ASST', qty: 4, description: 'مساعد' }],
-    source: 'تركيب المواسير',
-    sourceRef: 'تركيب المواسير',
-    isActive: true
-  },
-  {
-    id: 'PIP-028',
-    code: 'PIPE-028',
-    nameAr: 'مواسير خرسانية طول القطعة 2.5 م قطر الماسورة حتى 600 مم',
-    categoryId: 'pipe-installation',
-    unit: 'م.ط',
-    unitAr: 'م.ط',
-    productivityRate: 32.0,
-    crewSize: 5,
-    crew: [{ roleCode: 'LAB-PLUMBER', qty: 1, description: 'صناعي' },
-      { roleCode: 'LAB-PLUMBER-ASST', qty: 4, description: 'مساعد' }],
-    source: 'تركيب المواسير',
-    sourceRef: 'تركيب المواسير',
-    isActive: true
-  },
-  {
-    id: 'PIP-029',
-    code: 'PIPE-029',
-    nameAr: 'مواسير خرسانية طول القطعة 2.5 م قطر الماسورة حتى 675 مم',
-    categoryId: 'pipe-installation',
-    unit: 'م.ط',
-    unitAr: 'م.ط',
-    productivityRate: 29.6,
-    crewSize: 5,
-    crew: [{ roleCode: 'LAB-PLUMBER', qty: 1, description: 'صناعي' },
-      { roleCode: 'LAB-PLUMBER-ASST', qty: 4, description: 'مساعد' }],
-    source: 'تركيب المواسير',
-    sourceRef: 'تركيب المواسير',
-    isActive: true
-  },
-  {
-    id: 'PIP-030',
-    code: 'PIPE-030',
-    nameAr: 'مواسير خرسانية طول القطعة 2.5 م قطر الماسورة حتى 750 مم',
-    categoryId: 'pipe-installation',
-    unit: 'م.ط',
-    unitAr: 'م.ط',
-    productivityRate: 28.8,
-    crewSize: 5,
-    crew: [{ roleCode: 'LAB-PLUMBER', qty: 1, description: 'صناعي' },
-      { roleCode: 'LAB-PLUMBER-ASST', qty: 4, description: 'مساعد' }],
-    source: 'تركيب المواسير',
-    sourceRef: 'تركيب المواسير',
-    isActive: true
-  },
-  {
-    id: 'PIP-031',
-    code: 'PIPE-031',
-    nameAr: 'مواسير UPVC قطر 75 مم',
-    categoryId: 'pipe-installation',
-    unit: 'م.ط',
-    unitAr: 'م.ط',
-    productivityRate: 26.4,
-    crewSize: 4,
-    crew: [{ roleCode: 'LAB-PLUMBER', qty: 1, description: 'صناعي' },
-      { roleCode: 'LAB-PLUMBER-ASST', qty: 3, description: 'مساعد' }],
-    source: 'تركيب المواسير',
-    sourceRef: 'تركيب المواسير',
-    isActive: true
-  },
-  {
-    id: 'PIP-032',
-    code: 'PIPE-032',
-    nameAr: 'مواسير UPVC Fittings قطر 75 مم',
-    categoryId: 'pipe-installation',
-    unit: 'عدد',
-    unitAr: 'عدد',
-    productivityRate: 24.8,
-    crewSize: 1,
-    crew: [{ roleCode: 'LAB-PLUMBER', qty: 1, description: 'صناعي' }],
-    source: 'تركيب المواسير',
-    sourceRef: 'تركيب المواسير',
-    isActive: true
-  },
-  {
-    id: 'PIP-033',
-    code: 'PIPE-033',
-    nameAr: 'مواسير Cast Iron قطر 75 مم',
-    categoryId: 'pipe-installation',
-    unit: 'م.ط',
-    unitAr: 'م.ط',
-    productivityRate: 16.8,
-    crewSize: 4,
-    crew: [{ roleCode: 'LAB-PLUMBER', qty: 1, description: 'صناعي' },
-      { roleCode: 'LAB-PLUMBER-ASST', qty: 3, description: 'مساعد' }],
-    source: 'تركيب المواسير',
-    sourceRef: 'تركيب المواسير',
-    isActive: true
-  },
-  {
-    id: 'PIP-034',
-    code: 'PIPE-034',
-    nameAr: 'مواسير Cast Iron Fittings قطر 75 مم',
-    categoryId: 'pipe-installation',
-    unit: 'عدد',
-    unitAr: 'عدد',
-    productivityRate: 17.6,
-    crewSize: 1,
-    crew: [{ roleCode: 'LAB-PLUMBER', qty: 1, description: 'صناعي' }],
-    source: 'تركيب المواسير',
-    sourceRef: 'تركيب المواسير',
-    isActive: true
-  },
-  // ========================================
-  // أعمال الكهرباء - Electrical Works
-  // ========================================
-  {
-    id: 'ELE-001',
-    code: 'ELEC-001',
-    nameAr: 'تركيب كابل، كابل واحد في خندق مع حماية',
-    categoryId: 'electrical',
-    unit: 'م',
-    unitAr: 'م',
-    productivityRate: 49.6,
-    crewSize: 3,
-    crew: [{ roleCode: 'LAB-ELECTRICIAN', qty: 1, description: 'كهربائي' },
-      { roleCode: 'LAB-ELECTRICIAN-ASST', qty: 2, description: 'مساعد' }],
-    source: 'اعمال الكهرباء',
-    sourceRef: 'اعمال الكهرباء',
-    isActive: true
-  },
-  {
-    id: 'ELE-002',
-    code: 'ELEC-002',
-    nameAr: 'تركيب كابل، كابلان في خندق مع حماية',
-    categoryId: 'electrical',
-    unit: 'م',
-    unitAr: 'م',
-    productivityRate: 44.8,
-    crewSize: 3,
-    crew: [{ roleCode: 'LAB-ELECTRICIAN', qty: 1, description: 'كهربائي' },
-      { roleCode: 'LAB-ELECTRICIAN-ASST', qty: 2, description: 'مساعد' }],
-    source: 'اعمال الكهرباء',
-    sourceRef: 'اعمال الكهرباء',
-    isActive: true
-  },
-  {
-    id: 'ELE-003',
-    code: 'ELEC-003',
-    nameAr: 'تركيب كابل، 5 كابلات في خندق مع حماية',
-    categoryId: 'electrical',
-    unit: 'م',
-    unitAr: 'م',
-    productivityRate: 34.4,
-    crewSize: 3,
-    crew: [{ roleCode: 'LAB-ELECTRICIAN', qty: 1, description: 'كهربائي' },
-      { roleCode: 'LAB-ELECTRICIAN-ASST', qty: 2, description: 'مساعد' }],
-    source: 'اعمال الكهرباء',
-    sourceRef: 'اعمال الكهرباء',
-    isActive: true
-  },
-  {
-    id: 'ELE-004',
-    code: 'ELEC-004',
-    nameAr: 'تركيب كابل، 7 كابلات في خندق مع حماية',
-    categoryId: 'electrical',
-    unit: 'م',
-    unitAr: 'م',
-    productivityRate: 29.6,
-    crewSize: 3,
-    crew: [{ roleCode: 'LAB-ELECTRICIAN', qty: 1, description: 'كهربائي' },
-      { roleCode: 'LAB-ELECTRICIAN-ASST', qty: 2, description: 'مساعد' }],
-    source: 'اعمال الكهرباء',
-    sourceRef: 'اعمال الكهرباء',
-    isActive: true
-  },
-  {
-    id: 'ELE-005',
-    code: 'ELEC-005',
-    nameAr: 'تركيب كابل، 8 كابلات في خندق مع حماية',
-    categoryId: 'electrical',
-    unit: 'م',
-    unitAr: 'م',
-    productivityRate: 28.0,
-    crewSize: 3,
-    crew: [{ roleCode: 'LAB-ELECTRICIAN', qty: 1, description: 'كهربائي' },
-      { roleCode: 'LAB-ELECTRICIAN-ASST', qty: 2, description: 'مساعد' }],
-    source: 'اعمال الكهرباء',
-    sourceRef: 'اعمال الكهرباء',
-    isActive: true
-  },
-  {
-    id: 'ELE-006',
-    code: 'ELEC-006',
-    nameAr: 'تركيب كابل، كابلان في خندق مع حماية، قطر 100 مم',
-    categoryId: 'electrical',
-    unit: 'م',
-    unitAr: 'م',
-    productivityRate: 14.4,
-    crewSize: 3,
-    crew: [{ roleCode: 'LAB-ELECTRICIAN', qty: 1, description: 'كهربائي' },
-      { roleCode: 'LAB-ELECTRICIAN-ASST', qty: 2, description: 'مساعد' }],
-    source: 'اعمال الكهرباء',
-    sourceRef: 'اعمال الكهرباء',
-    isActive: true
-  },
-  {
-    id: 'ELE-007',
-    code: 'ELEC-007',
-    nameAr: 'تركيب كابل، كابلان في خندق مع حماية، قطر 135 مم',
-    categoryId: 'electrical',
-    unit: 'م',
-    unitAr: 'م',
-    productivityRate: 12.8,
-    crewSize: 3,
-    crew: [{ roleCode: 'LAB-ELECTRICIAN', qty: 1, description: 'كهربائي' },
-      { roleCode: 'LAB-ELECTRICIAN-ASST', qty: 2, description: 'مساعد' }],
-    source: 'اعمال الكهرباء',
-    sourceRef: 'اعمال الكهرباء',
-    isActive: true
-  },
-  {
-    id: 'ELE-008',
-    code: 'ELEC-008',
-    nameAr: 'تركيب كابل، 3 كابلات في خندق مع حماية، قطر 100 مم',
-    categoryId: 'electrical',
-    unit: 'م',
-    unitAr: 'م',
-    productivityRate: 8.0,
-    crewSize: 3,
-    crew: [{ roleCode: 'LAB-ELECTRICIAN', qty: 1, description: 'كهربائي' },
-      { roleCode: 'LAB-ELECTRICIAN-ASST', qty: 2, description: 'مساعد' }],
-    source: 'اعمال الكهرباء',
-    sourceRef: 'اعمال الكهرباء',
-    isActive: true
-  },
-  {
-    id: 'ELE-009',
-    code: 'ELEC-009',
-    nameAr: 'تركيب كابل، 6 كابلات في خندق مع حماية، قطر 100 مم',
-    categoryId: 'electrical',
-    unit: 'م',
-    unitAr: 'م',
-    productivityRate: 5.6,
-    crewSize: 3,
-    crew: [{ roleCode: 'LAB-ELECTRICIAN', qty: 1, description: 'كهربائي' },
-      { roleCode: 'LAB-ELECTRICIAN-ASST', qty: 2, description: 'مساعد' }],
-    source: 'اعمال الكهرباء',
-    sourceRef: 'اعمال الكهرباء',
-    isActive: true
-  },
-  {
-    id: 'ELE-010',
-    code: 'ELEC-010',
-    nameAr: 'تركيب كابل، 4 كابلات في خندق مع حماية، قطر 150 مم',
-    categoryId: 'electrical',
-    unit: 'م',
-    unitAr: 'م',
-    productivityRate: 9.6,
-    crewSize: 3,
-    crew: [{ roleCode: 'LAB-ELECTRICIAN', qty: 1, description: 'كهربائي' },
-      { roleCode: 'LAB-ELECTRICIAN-ASST', qty: 2, description: 'مساعد' }],
-    source: 'اعمال الكهرباء',
-    sourceRef: 'اعمال الكهرباء',
-    isActive: true
-  },
-  {
-    id: 'ELE-011',
-    code: 'ELEC-011',
-    nameAr: 'تركيب كابل، 36 كابل في خندق مع حماية، قطر 100 مم',
-    categoryId: 'electrical',
-    unit: 'م',
-    unitAr: 'م',
-    productivityRate: 1.6,
-    crewSize: 3,
-    crew: [{ roleCode: 'LAB-ELECTRICIAN', qty: 1, description: 'كهربائي' },
-      { roleCode: 'LAB-ELECTRICIAN-ASST', qty: 2, description: 'مساعد' }],
-    source: 'اعمال الكهرباء',
-    sourceRef: 'اعمال الكهرباء',
-    isActive: true
-  },
-  {
-    id: 'ELE-012',
-    code: 'ELEC-012',
-    nameAr: 'تركيب كابل، 10 كابلات في خندق مع حماية، قطر 100 مم',
-    categoryId: 'electrical',
-    unit: 'م',
-    unitAr: 'م',
-    productivityRate: 4.0,
-    crewSize: 3,
-    crew: [{ roleCode: 'LAB-ELECTRICIAN', qty: 1, description: 'كهربائي' },
-      { roleCode: 'LAB-ELECTRICIAN-ASST', qty: 2, description: 'مساعد' }],
-    source: 'اعمال الكهرباء',
-    sourceRef: 'اعمال الكهرباء',
-    isActive: true
-  },
-  {
-    id: 'ELE-013',
-    code: 'ELEC-013',
-    nameAr: 'تركيب كابل، كابل واحد في خندق مع حماية، قطر 300 مم',
-    categoryId: 'electrical',
-    unit: 'م',
-    unitAr: 'م',
-    productivityRate: 10.4,
-    crewSize: 3,
-    crew: [{ roleCode: 'LAB-ELECTRICIAN', qty: 1, description: 'كهربائي' },
-      { roleCode: 'LAB-ELECTRICIAN-ASST', qty: 2, description: 'مساعد' }],
-    source: 'اعمال الكهرباء',
-    sourceRef: 'اعمال الكهرباء',
-    isActive: true
-  },
-  // ========================================
-  // أعمال الحديد - Steel Works
-  // ========================================
-  {
-    id: 'STL-001',
-    code: 'STEEL-001',
-    nameAr: 'Steel Frame and Roof Members',
-    categoryId: 'steel-works',
-    unit: 'طن',
-    unitAr: 'طن',
-    productivityRate: 4.6,
-    crewSize: 1,
-    crew: [],
-    source: 'اعمال الحديد',
-    sourceRef: 'اعمال الحديد',
-    isActive: true
-  },
-  {
-    id: 'STL-002',
-    code: 'STEEL-002',
-    nameAr: 'Wall Frame, Bow String Truss and Frame',
-    categoryId: 'steel-works',
-    unit: 'طن',
-    unitAr: 'طن',
-    productivityRate: 1.6,
-    crewSize: 1,
-    crew: [],
-    source: 'اعمال الحديد',
-    sourceRef: 'اعمال الحديد',
-    isActive: true
-  },
-  {
-    id: 'STL-003',
-    code: 'STEEL-003',
-    nameAr: 'Roof Frame, Curved Truss and Frame',
-    categoryId: 'steel-works',
-    unit: 'طن',
-    unitAr: 'طن',
-    productivityRate: 5.2,
-    crewSize: 1,
-    crew: [],
-    source: 'اعمال الحديد',
-    sourceRef: 'اعمال الحديد',
-    isActive: true
-  },
-  {
-    id: 'STL-004',
-    code: 'STEEL-004',
-    nameAr: 'Wall Frame, Glazed Frame and Atrium',
-    categoryId: 'steel-works',
-    unit: 'طن',
-    unitAr: 'طن',
-    productivityRate: 0.3,
-    crewSize: 1,
-    crew: [],
-    source: 'اعمال الحديد',
-    sourceRef: 'اعمال الحديد',
-    isActive: true
-  },
-  {
-    id: 'STL-005',
-    code: 'STEEL-005',
-    nameAr: 'Horizontal heavy duty strutting',
-    categoryId: 'steel-works',
-    unit: 'عدد',
-    unitAr: 'عدد',
-    productivityRate: 2.0,
-    crewSize: 1,
-    crew: [],
-    source: 'اعمال الحديد',
-    sourceRef: 'اعمال الحديد',
-    isActive: true
-  },
-  {
-    id: 'STL-006',
-    code: 'STEEL-006',
-    nameAr: 'Diagonal heavy duty strutting',
-    categoryId: 'steel-works',
-    unit: 'عدد',
-    unitAr: 'عدد',
-    productivityRate: 6.0,
-    crewSize: 1,
-    crew: [],
-    source: 'اعمال الحديد',
-    sourceRef: 'اعمال الحديد',
-    isActive: true
-  },
-  {
-    id: 'STL-007',
-    code: 'STEEL-007',
-    nameAr: 'Metal Decking, large areas',
-    categoryId: 'steel-works',
-    unit: 'م2',
-    unitAr: 'م2',
-    productivityRate: 70.0,
-    crewSize: 1,
-    crew: [],
-    source: 'اعمال الحديد',
-    sourceRef: 'اعمال الحديد',
-    isActive: true
-  },
-  {
-    id: 'STL-008',
-    code: 'STEEL-008',
-    nameAr: 'Metal Decking, small or complicated',
-    categoryId: 'steel-works',
-    unit: 'م2',
-    unitAr: 'م2',
-    productivityRate: 28.0,
-    crewSize: 1,
-    crew: [],
-    source: 'اعمال الحديد',
-    sourceRef: 'اعمال الحديد',
-    isActive: true
-  },
-  // ========================================
-  // الأعمال المعدنية - Metal Works
-  // ========================================
-  {
-    id: 'MTL-001',
-    code: 'METAL-001',
-    nameAr: 'تركيب ابواب و شابيبك',
-    categoryId: 'metal-works',
-    unit: 'كجم',
-    unitAr: 'كجم',
-    productivityRate: 150.0,
-    crewSize: 1,
-    crew: [{ roleCode: 'LAB-PLUMBER', qty: 1, description: 'صناعي' }],
-    source: 'الاعمال المعدنيه',
-    sourceRef: 'الاعمال المعدنيه',
-    isActive: true
-  },
-  {
-    id: 'MTL-002',
-    code: 'METAL-002',
-    nameAr: 'Windows, Steel, 1.0-3.0m2',
-    categoryId: 'metal-works',
-    unit: 'عدد',
-    unitAr: 'عدد',
-    productivityRate: 9.6,
-    crewSize: 1,
-    crew: [{ roleCode: 'LAB-PLUMBER', qty: 1, description: 'صناعي' }],
-    source: 'الاعمال المعدنيه',
-    sourceRef: 'الاعمال المعدنيه',
-    isActive: true
-  },
-  {
-    id: 'MTL-003',
-    code: 'METAL-003',
-    nameAr: 'Windows, Steel, 3.0-7.0m2',
-    categoryId: 'metal-works',
-    unit: 'عدد',
-    unitAr: 'عدد',
-    productivityRate: 4.8,
-    crewSize: 1,
-    crew: [{ roleCode: 'LAB-PLUMBER', qty: 1, description: 'صناعي' }],
-    source: 'الاعمال المعدنيه',
-    sourceRef: 'الاعمال المعدنيه',
-    isActive: true
-  },
-  {
-    id: 'MTL-004',
-    code: 'METAL-004',
-    nameAr: 'Windows, Steel, 7.0-10.0m2',
-    categoryId: 'metal-works',
-    unit: 'عدد',
-    unitAr: 'عدد',
-    productivityRate: 2.4,
-    crewSize: 1,
-    crew: [{ roleCode: 'LAB-PLUMBER', qty: 1, description: 'صناعي' }],
-    source: 'الاعمال المعدنيه',
-    sourceRef: 'الاعمال المعدنيه',
-    isActive: true
-  },
-  {
-    id: 'MTL-005',
-    code: 'METAL-005',
-    nameAr: 'تركيب اعمال معدنية للاسوار والبلكونات',
-    categoryId: 'metal-works',
-    unit: 'كجم',
-    unitAr: 'كجم',
-    productivityRate: 150.0,
-    crewSize: 1,
-    crew: [{ roleCode: 'LAB-PLUMBER', qty: 1, description: 'صناعي' }],
-    source: 'الاعمال المعدنيه',
-    sourceRef: 'الاعمال المعدنيه',
-    isActive: true
-  },
-  {
-    id: 'MTL-006',
-    code: 'METAL-006',
-    nameAr: 'تركيب اعمال معدنية للاسوار والبلكونات',
-    categoryId: 'metal-works',
-    unit: 'م.ط',
-    unitAr: 'م.ط',
-    productivityRate: 20.0,
-    crewSize: 1,
-    crew: [{ roleCode: 'LAB-PLUMBER', qty: 1, description: 'صناعي' }],
-    source: 'الاعمال المعدنيه',
-    sourceRef: 'الاعمال المعدنيه',
-    isActive: true
-  },
-  {
-    id: 'MTL-007',
-    code: 'METAL-007',
-    nameAr: 'تركيب اعمال معدنية للدرابزين والادراج',
-    categoryId: 'metal-works',
-    unit: 'كجم',
-    unitAr: 'كجم',
-    productivityRate: 100.0,
-    crewSize: 1,
-    crew: [{ roleCode: 'LAB-PLUMBER', qty: 1, description: 'صناعي' }],
-    source: 'الاعمال المعدنيه',
-    sourceRef: 'الاعمال المعدنيه',
-    isActive: true
-  },
-  {
-    id: 'MTL-008',
-    code: 'METAL-008',
-    nameAr: 'تركيب باب جرار',
-    categoryId: 'metal-works',
-    unit: 'كجم',
-    unitAr: 'كجم',
-    productivityRate: 150.0,
-    crewSize: 1,
-    crew: [{ roleCode: 'LAB-PLUMBER', qty: 1, description: 'صناعي' }],
-    source: 'الاعمال المعدنيه',
-    sourceRef: 'الاعمال المعدنيه',
-    isActive: true
-  },
-  {
-    id: 'MTL-009',
-    code: 'METAL-009',
-    nameAr: 'تصنيع خزان سماآة 2-1.5 مم',
-    categoryId: 'metal-works',
-    unit: 'كجم',
-    unitAr: 'كجم',
-    productivityRate: 80.0,
-    crewSize: 1,
-    crew: [{ roleCode: 'LAB-PLUMBER', qty: 1, description: 'صناعي' }],
-    source: 'الاعمال المعدنيه',
-    sourceRef: 'الاعمال المعدنيه',
-    isActive: true
-  },
-  {
-    id: 'MTL-010',
-    code: 'METAL-010',
-    nameAr: 'تصنيع خزانات 3 مم',
-    categoryId: 'metal-works',
-    unit: 'كجم',
-    unitAr: 'كجم',
-    productivityRate: 120.0,
-    crewSize: 1,
-    crew: [{ roleCode: 'LAB-PLUMBER', qty: 1, description: 'صناعي' }],
-    source: 'الاعمال المعدنيه',
-    sourceRef: 'الاعمال المعدنيه',
-    isActive: true
-  },
-  {
-    id: 'MTL-011',
-    code: 'METAL-011',
-    nameAr: 'تصنيع وتركيب زاوية معدنية لفواصل التمدد',
-    categoryId: 'metal-works',
-    unit: 'م.ط',
-    unitAr: 'م.ط',
-    productivityRate: 40.0,
-    crewSize: 1,
-    crew: [{ roleCode: 'LAB-PLUMBER', qty: 1, description: 'صناعي' }],
-    source: 'الاعمال المعدنيه',
-    sourceRef: 'الاعمال المعدنيه',
-    isActive: true
-  },
-  {
-    id: 'MTL-012',
-    code: 'METAL-012',
-    nameAr: 'قص وتركيب زجاج على الحديد',
-    categoryId: 'metal-works',
-    unit: 'م2',
-    unitAr: 'م2',
-    productivityRate: 9.0,
-    crewSize: 1,
-    crew: [{ roleCode: 'LAB-PLUMBER', qty: 1, description: 'صناعي' }],
-    source: 'الاعمال المعدنيه',
-    sourceRef: 'الاعمال المعدنيه',
-    isActive: true
-  },
-  // ========================================
-  // أعمال الخشب - Carpentry
-  // ========================================
-  {
-    id: 'CRP-001',
-    code: 'CARP-001',
-    nameAr: 'شبابيك خشب بعد اكتمال أعمال الحوائط',
-    categoryId: 'carpentry',
-    unit: 'م2',
-    unitAr: 'م2',
-    productivityRate: 16.0,
-    crewSize: 1,
-    crew: [{ roleCode: 'LAB-PLUMBER', qty: 1, description: 'صناعي' }],
-    source: 'اعمال الخشب',
-    sourceRef: 'اعمال الخشب',
-    isActive: true
-  },
-  {
-    id: 'CRP-002',
-    code: 'CARP-002',
-    nameAr: 'تزجيج النوافذ – زجاج مفرد',
-    categoryId: 'carpentry',
-    unit: 'م2',
-    unitAr: 'م2',
-    productivityRate: 16.0,
-    crewSize: 1,
-    crew: [{ roleCode: 'LAB-PLUMBER', qty: 1, description: 'صناعي' }],
-    source: 'اعمال الخشب',
-    sourceRef: 'اعمال الخشب',
-    isActive: true
-  },
-  {
-    id: 'CRP-003',
-    code: 'CARP-003',
-    nameAr: 'تزجيج النوافذ – زجاج مزدوج',
-    categoryId: 'carpentry',
-    unit: 'م2',
-    unitAr: 'م2',
-    productivityRate: 10.4,
-    crewSize: 1,
-    crew: [{ roleCode: 'LAB-PLUMBER', qty: 1, description: 'صناعي' }],
-    source: 'اعمال الخشب',
-    sourceRef: 'اعمال الخشب',
-    isActive: true
-  },
-  {
-    id: 'CRP-004',
-    code: 'CARP-004',
-    nameAr: 'حلق أبواب من 1.0 إلى 3.0 م²',
-    categoryId: 'carpentry',
-    unit: 'عدد',
-    unitAr: 'عدد',
-    productivityRate: 1.6,
-    crewSize: 1,
-    crew: [{ roleCode: 'LAB-PLUMBER', qty: 1, description: 'صناعي' }],
-    source: 'اعمال الخشب',
-    sourceRef: 'اعمال الخشب',
-    isActive: true
-  },
-  {
-    id: 'CRP-005',
-    code: 'CARP-005',
-    nameAr: 'حلق أبواب من 3.0 إلى 7.0 م²',
-    categoryId: 'carpentry',
-    unit: 'عدد',
-    unitAr: 'عدد',
-    productivityRate: 3.2,
-    crewSize: 1,
-    crew: [{ roleCode: 'LAB-PLUMBER', qty: 1, description: 'صناعي' }],
-    source: 'اعمال الخشب',
-    sourceRef: 'اعمال الخشب',
-    isActive: true
-  },
-  {
-    id: 'CRP-006',
-    code: 'CARP-006',
-    nameAr: 'حلق أبواب من 7.0 إلى 10.0 م²',
-    categoryId: 'carpentry',
-    unit: 'عدد',
-    unitAr: 'عدد',
-    productivityRate: 6.4,
-    crewSize: 1,
-    crew: [{ roleCode: 'LAB-PLUMBER', qty: 1, description: 'صناعي' }],
-    source: 'اعمال الخشب',
-    sourceRef: 'اعمال الخشب',
-    isActive: true
-  },
-  {
-    id: 'CRP-007',
-    code: 'CARP-007',
-    nameAr: 'شبابيك خشب لين من 1.0 إلى 3.0 م²',
-    categoryId: 'carpentry',
-    unit: 'عدد',
-    unitAr: 'عدد',
-    productivityRate: 1.7,
-    crewSize: 1,
-    crew: [{ roleCode: 'LAB-PLUMBER', qty: 1, description: 'صناعي' }],
-    source: 'اعمال الخشب',
-    sourceRef: 'اعمال الخشب',
-    isActive: true
-  },
-  {
-    id: 'CRP-008',
-    code: 'CARP-008',
-    nameAr: 'شبابيك من 3.0 إلى 7.0 م²',
-    categoryId: 'carpentry',
-    unit: 'عدد',
-    unitAr: 'عدد',
-    productivityRate: 3.2,
-    crewSize: 1,
-    crew: [{ roleCode: 'LAB-PLUMBER', qty: 1, description: 'صناعي' }],
-    source: 'اعمال الخشب',
-    sourceRef: 'اعمال الخشب',
-    isActive: true
-  },
-  {
-    id: 'CRP-009',
-    code: 'CARP-009',
-    nameAr: 'شبابيك من 7.0 إلى 10.0 م²',
-    categoryId: 'carpentry',
-    unit: 'عدد',
-    unitAr: 'عدد',
-    productivityRate: 7.2,
-    crewSize: 1,
-    crew: [{ roleCode: 'LAB-PLUMBER', qty: 1, description: 'صناعي' }],
-    source: 'اعمال الخشب',
-    sourceRef: 'اعمال الخشب',
-    isActive: true
-  },
-  {
-    id: 'CRP-010',
-    code: 'CARP-010',
-    nameAr: 'عتب خشب',
-    categoryId: 'carpentry',
-    unit: 'م',
-    unitAr: 'م',
-    productivityRate: 97.6,
-    crewSize: 1,
-    crew: [{ roleCode: 'LAB-PLUMBER', qty: 1, description: 'صناعي' }],
-    source: 'اعمال الخشب',
-    sourceRef: 'اعمال الخشب',
-    isActive: true
-  },
-  {
-    id: 'CRP-011',
-    code: 'CARP-011',
-    nameAr: 'تعليق الأبواب (المفصلات والإكسسوارات)',
-    categoryId: 'carpentry',
-    unit: 'عدد',
-    unitAr: 'عدد',
-    productivityRate: 7.2,
-    crewSize: 1,
-    crew: [{ roleCode: 'LAB-PLUMBER', qty: 1, description: 'صناعي' }],
-    source: 'اعمال الخشب',
-    sourceRef: 'اعمال الخشب',
-    isActive: true
-  },
-  {
-    id: 'CRP-012',
-    code: 'CARP-012',
-    nameAr: 'التخريم في الباب وتركيب الكالون',
-    categoryId: 'carpentry',
-    unit: 'عدد',
-    unitAr: 'عدد',
-    productivityRate: 5.0,
-    crewSize: 1,
-    crew: [{ roleCode: 'LAB-PLUMBER', qty: 1, description: 'صناعي' }],
-    source: 'اعمال الخشب',
-    sourceRef: 'اعمال الخشب',
-    isActive: true
-  },
-  {
-    id: 'CRP-013',
-    code: 'CARP-013',
-    nameAr: 'تركيب نظام فواصل دورات المياه – ألواح الفصل',
-    categoryId: 'carpentry',
-    unit: 'عدد',
-    unitAr: 'عدد',
-    productivityRate: 6.4,
-    crewSize: 1,
-    crew: [{ roleCode: 'LAB-PLUMBER', qty: 1, description: 'صناعي' }],
-    source: 'اعمال الخشب',
-    sourceRef: 'اعمال الخشب',
-    isActive: true
-  },
-  {
-    id: 'CRP-014',
-    code: 'CARP-014',
-    nameAr: 'تركيب نظام فواصل دورات المياه – الألواح الأمامية للحائط',
-    categoryId: 'carpentry',
-    unit: 'عدد',
-    unitAr: 'عدد',
-    productivityRate: 5.6,
-    crewSize: 1,
-    crew: [{ roleCode: 'LAB-PLUMBER', qty: 1, description: 'صناعي' }],
-    source: 'اعمال الخشب',
-    sourceRef: 'اعمال الخشب',
-    isActive: true
-  },
-  {
-    id: 'CRP-015',
-    code: 'CARP-015',
-    nameAr: 'تركيب نظام فواصل دورات المياه – باب مفصلي مثبت بالحائط',
-    categoryId: 'carpentry',
-    unit: 'عدد',
-    unitAr: 'عدد',
-    productivityRate: 4.8,
-    crewSize: 1,
-    crew: [{ roleCode: 'LAB-PLUMBER', qty: 1, description: 'صناعي' }],
-    source: 'اعمال الخشب',
-    sourceRef: 'اعمال الخشب',
-    isActive: true
-  },
-  // ========================================
-  // أعمال الألومنيوم - Aluminum Works
-  // ========================================
-  {
-    id: 'ALU-001',
-    code: 'ALUM-001',
-    nameAr: 'ابواب وشبابيك جرارة او مفصلات',
-    categoryId: 'aluminum',
-    unit: 'م2',
-    unitAr: 'م2',
-    productivityRate: 3.0,
-    crewSize: 1,
-    crew: [{ roleCode: 'LAB-PLUMBER', qty: 1, description: 'صناعي' }],
-    source: 'اعمال الالمونيوم',
-    sourceRef: 'اعمال الالمونيوم',
-    isActive: true
-  },
-  {
-    id: 'ALU-002',
-    code: 'ALUM-002',
-    nameAr: 'قواطع المنيوم ثابتة',
-    categoryId: 'aluminum',
-    unit: 'م2',
-    unitAr: 'م2',
-    productivityRate: 4.0,
-    crewSize: 1,
-    crew: [{ roleCode: 'LAB-PLUMBER', qty: 1, description: 'صناعي' }],
-    source: 'اعمال الالمونيوم',
-    sourceRef: 'اعمال الالمونيوم',
-    isActive: true
-  },
-  {
-    id: 'ALU-003',
-    code: 'ALUM-003',
-    nameAr: 'درابزين المنيوم',
-    categoryId: 'aluminum',
-    unit: 'م2',
-    unitAr: 'م2',
-    productivityRate: 6.0,
-    crewSize: 1,
-    crew: [{ roleCode: 'LAB-PLUMBER', qty: 1, description: 'صناعي' }],
-    source: 'اعمال الالمونيوم',
-    sourceRef: 'اعمال الالمونيوم',
-    isActive: true
-  },
-  {
-    id: 'ALU-004',
-    code: 'ALUM-004',
-    nameAr: 'شبابيك ألومنيوم من 1.0 إلى 3.0 م²',
-    categoryId: 'aluminum',
-    unit: 'عدد',
-    unitAr: 'عدد',
-    productivityRate: 6.4,
-    crewSize: 1,
-    crew: [{ roleCode: 'LAB-PLUMBER', qty: 1, description: 'صناعي' }],
-    source: 'اعمال الالمونيوم',
-    sourceRef: 'اعمال الالمونيوم',
-    isActive: true
-  },
-  {
-    id: 'ALU-005',
-    code: 'ALUM-005',
-    nameAr: 'شبابيك ألومنيوم من 3.0 إلى 7.0 م²',
-    categoryId: 'aluminum',
-    unit: 'عدد',
-    unitAr: 'عدد',
-    productivityRate: 3.2,
-    crewSize: 1,
-    crew: [{ roleCode: 'LAB-PLUMBER', qty: 1, description: 'صناعي' }],
-    source: 'اعمال الالمونيوم',
-    sourceRef: 'اعمال الالمونيوم',
-    isActive: true
-  },
-  {
-    id: 'ALU-006',
-    code: 'ALUM-006',
-    nameAr: 'شبابيك ألومنيوم من 7.0 إلى 10.0 م²',
-    categoryId: 'aluminum',
-    unit: 'عدد',
-    unitAr: 'عدد',
-    productivityRate: 2.4,
-    crewSize: 1,
-    crew: [{ roleCode: 'LAB-PLUMBER', qty: 1, description: 'صناعي' }],
-    source: 'اعمال الالمونيوم',
-    sourceRef: 'اعمال الالمونيوم',
-    isActive: true
-  },
-  {
-    id: 'ALU-007',
-    code: 'ALUM-007',
-    nameAr: 'وزرة ألومنيوم مثبتة بالمسامير على مسافات 150–300 مم',
-    categoryId: 'aluminum',
-    unit: 'م',
-    unitAr: 'م',
-    productivityRate: 60.0,
-    crewSize: 1,
-    crew: [{ roleCode: 'LAB-PLUMBER', qty: 1, description: 'صناعي' }],
-    source: 'اعمال الالمونيوم',
-    sourceRef: 'اعمال الالمونيوم',
-    isActive: true
-  },
-  {
-    id: 'ALU-008',
-    code: 'ALUM-008',
-    nameAr: 'حوائط ستائر زجاجية – المرحلة الأولى',
-    categoryId: 'aluminum',
-    unit: 'م2',
-    unitAr: 'م2',
-    productivityRate: 9.6,
-    crewSize: 1,
-    crew: [{ roleCode: 'LAB-PLUMBER', qty: 1, description: 'صناعي' }],
-    source: 'اعمال الالمونيوم',
-    sourceRef: 'اعمال الالمونيوم',
-    isActive: true
-  },
-  {
-    id: 'ALU-009',
-    code: 'ALUM-009',
-    nameAr: 'حوائط ستائر زجاجية – المرحلة الثانية',
-    categoryId: 'aluminum',
-    unit: 'م2',
-    unitAr: 'م2',
-    productivityRate: 8.8,
-    crewSize: 1,
-    crew: [{ roleCode: 'LAB-PLUMBER', qty: 1, description: 'صناعي' }],
-    source: 'اعمال الالمونيوم',
-    sourceRef: 'اعمال الالمونيوم',
-    isActive: true
-  },
-  {
-    id: 'ALU-010',
-    code: 'ALUM-010',
-    nameAr: 'حوائط ستائر زجاجية عالية الجودة – تركيب ثلاثي المراحل',
-    categoryId: 'aluminum',
-    unit: 'م2',
-    unitAr: 'م2',
-    productivityRate: 25.0,
-    crewSize: 1,
-    crew: [{ roleCode: 'LAB-PLUMBER', qty: 1, description: 'صناعي' }],
-    source: 'اعمال الالمونيوم',
-    sourceRef: 'اعمال الالمونيوم',
-    isActive: true
-  },
-  {
-    id: 'ALU-011',
-    code: 'ALUM-011',
-    nameAr: 'تركيب واجهات المنيوم مستمرة',
-    categoryId: 'aluminum',
-    unit: 'م2',
-    unitAr: 'م2',
-    productivityRate: 3.0,
-    crewSize: 1,
-    crew: [{ roleCode: 'LAB-PLUMBER', qty: 1, description: 'صناعي' }],
-    source: 'اعمال الالمونيوم',
-    sourceRef: 'اعمال الالمونيوم',
-    isActive: true
-  },
-  // ========================================
-  // أعمال الاند اسكيب - Landscape
-  // ========================================
-  {
-    id: 'LND-001',
-    code: 'LAND-001',
-    nameAr: 'بلاطات خرسانية على طبقة رمل مدموكة',
-    categoryId: 'landscape',
-    unit: 'م2',
-    unitAr: 'م2',
-    productivityRate: 20.0,
-    crewSize: 3,
-    crew: [{ roleCode: 'LAB-GENERAL', qty: 3, description: 'مجموعة عمل' }],
-    source: 'اعمال الاند اسكيب',
-    sourceRef: 'اعمال الاند اسكيب',
-    isActive: true
-  },
-  {
-    id: 'LND-002',
-    code: 'LAND-002',
-    nameAr: 'بلاطات خرسانية على طبقة مونة اسمنتية',
-    categoryId: 'landscape',
-    unit: 'م2',
-    unitAr: 'م2',
-    productivityRate: 10.0,
-    crewSize: 3,
-    crew: [{ roleCode: 'LAB-GENERAL', qty: 3, description: 'مجموعة عمل' }],
-    source: 'اعمال الاند اسكيب',
-    sourceRef: 'اعمال الاند اسكيب',
-    isActive: true
-  },
-  {
-    id: 'LND-003',
-    code: 'LAND-003',
-    nameAr: 'اعمال حجر بازلت على مونة اسمنتية',
-    categoryId: 'landscape',
-    unit: 'م2',
-    unitAr: 'م2',
-    productivityRate: 2.0,
-    crewSize: 3,
-    crew: [{ roleCode: 'LAB-GENERAL', qty: 3, description: 'مجموعة عمل' }],
-    source: 'اعمال الاند اسكيب',
-    sourceRef: 'اعمال الاند اسكيب',
-    isActive: true
-  },
-  {
-    id: 'LND-004',
-    code: 'LAND-004',
-    nameAr: 'اعمال الحجر الصناعى على فرشة رمل',
-    categoryId: 'landscape',
-    unit: 'م2',
-    unitAr: 'م2',
-    productivityRate: 20.0,
-    crewSize: 3,
-    crew: [{ roleCode: 'LAB-GENERAL', qty: 3, description: 'مجموعة عمل' }],
-    source: 'اعمال الاند اسكيب',
-    sourceRef: 'اعمال الاند اسكيب',
-    isActive: true
-  },
-  {
-    id: 'LND-005',
-    code: 'LAND-005',
-    nameAr: 'أعمال بلاطات طوب',
-    categoryId: 'landscape',
-    unit: 'م2',
-    unitAr: 'م2',
-    productivityRate: 9.0,
-    crewSize: 3,
-    crew: [{ roleCode: 'LAB-GENERAL', qty: 3, description: 'مجموعة عمل' }],
-    source: 'اعمال الاند اسكيب',
-    sourceRef: 'اعمال الاند اسكيب',
-    isActive: true
-  },
-  {
-    id: 'LND-006',
-    code: 'LAND-006',
-    nameAr: 'ممرات حصوية شاملة تجهيز طبقة الأساس',
-    categoryId: 'landscape',
-    unit: 'م2',
-    unitAr: 'م2',
-    productivityRate: 84.0,
-    crewSize: 3,
-    crew: [{ roleCode: 'LAB-GENERAL', qty: 3, description: 'مجموعة عمل' }],
-    source: 'اعمال الاند اسكيب',
-    sourceRef: 'اعمال الاند اسكيب',
-    isActive: true
-  },
-  {
-    id: 'LND-007',
-    code: 'LAND-007',
-    nameAr: 'فرش طبقة الرمل وتسويتها فبل وضع النجيلة',
-    categoryId: 'landscape',
-    unit: 'م2',
-    unitAr: 'م2',
-    productivityRate: 20.0,
-    crewSize: 3,
-    crew: [{ roleCode: 'LAB-GENERAL', qty: 3, description: 'مجموعة عمل' }],
-    source: 'اعمال الاند اسكيب',
-    sourceRef: 'اعمال الاند اسكيب',
-    isActive: true
-  },
-  {
-    id: 'LND-008',
-    code: 'LAND-008',
-    nameAr: 'تركيب طبقات النجيلة',
-    categoryId: 'landscape',
-    unit: 'م2',
-    unitAr: 'م2',
-    productivityRate: 130.0,
-    crewSize: 3,
-    crew: [{ roleCode: 'LAB-GENERAL', qty: 3, description: 'مجموعة عمل' }],
-    source: 'اعمال الاند اسكيب',
-    sourceRef: 'اعمال الاند اسكيب',
-    isActive: true
-  },
-  {
-    id: 'LND-009',
-    code: 'LAND-009',
-    nameAr: 'زرع شجر بطول 75 سم',
-    categoryId: 'landscape',
-    unit: 'عدد',
-    unitAr: 'عدد',
-    productivityRate: 32.0,
-    crewSize: 3,
-    crew: [{ roleCode: 'LAB-GENERAL', qty: 3, description: 'مجموعة عمل' }],
-    source: 'اعمال الاند اسكيب',
-    sourceRef: 'اعمال الاند اسكيب',
-    isActive: true
-  },
-  {
-    id: 'LND-010',
-    code: 'LAND-010',
-    nameAr: 'زرع شجر بطول اآبر 75 سم',
-    categoryId: 'landscape',
-    unit: 'عدد',
-    unitAr: 'عدد',
-    productivityRate: 12.0,
-    crewSize: 3,
-    crew: [{ roleCode: 'LAB-GENERAL', qty: 3, description: 'مجموعة عمل' }],
-    source: 'اعمال الاند اسكيب',
-    sourceRef: 'اعمال الاند اسكيب',
-    isActive: true
-  },
-  // ========================================
-  // أعمال الأسانسير - Elevator Works
-  // ========================================
-  {
-    id: 'ELV-001',
-    code: 'ELEV-001',
-    nameAr: 'مصعد هيدروليكي – تركيب من 2 إلى 3 أدوار',
-    categoryId: 'elevator',
-    unit: 'دور',
-    unitAr: 'دور',
-    productivityRate: 3.0,
-    crewSize: 1,
-    crew: [],
-    source: 'اعمال الاسانسير',
-    sourceRef: 'اعمال الاسانسير',
-    notes: 'بالاسبوع',
-    isActive: true
-  },
-  {
-    id: 'ELV-002',
-    code: 'ELEV-002',
-    nameAr: 'مصعد هيدروليكي – تركيب 4 أدوار فأكثر',
-    categoryId: 'elevator',
-    unit: 'دور',
-    unitAr: 'دور',
-    productivityRate: 2.0,
-    crewSize: 1,
-    crew: [],
-    source: 'اعمال الاسانسير',
-    sourceRef: 'اعمال الاسانسير',
-    notes: 'بالاسبوع',
-    isActive: true
-  },
-  {
-    id: 'ELV-003',
-    code: 'ELEV-003',
-    nameAr: 'مصعد عادي – تصنيع واختبار وتسليم',
-    categoryId: 'elevator',
-    unit: 'عدد',
-    unitAr: 'عدد',
-    productivityRate: 12.0,
-    crewSize: 1,
-    crew: [],
-    source: 'اعمال الاسانسير',
-    sourceRef: 'اعمال الاسانسير',
-    notes: 'بالاسبوع',
-    isActive: true
-  },
-  {
-    id: 'ELV-004',
-    code: 'ELEV-004',
-    nameAr: 'نوع ترس (Truss) – التركيب الكامل (باستثناء الأعمال المعمارية)',
-    categoryId: 'elevator',
-    unit: 'عدد',
-    unitAr: 'عدد',
-    productivityRate: 60.0,
-    crewSize: 1,
-    crew: [],
-    source: 'اعمال الاسانسير',
-    sourceRef: 'اعمال الاسانسير',
-    notes: 'بالاسبوع',
-    isActive: true
-  },
-  {
-    id: 'ELV-005',
-    code: 'ELEV-005',
-    nameAr: 'نوع ترس (Truss) – تصنيع واختبار وتسليم',
-    categoryId: 'elevator',
-    unit: 'عدد',
-    unitAr: 'عدد',
-    productivityRate: 1.0,
-    crewSize: 1,
-    crew: [],
-    source: 'اعمال الاسانسير',
-    sourceRef: 'اعمال الاسانسير',
-    notes: 'بالاسبوع',
-    isActive: true
-  },
-  {
-    id: 'ELV-006',
-    code: 'ELEV-006',
-    nameAr: 'نوع ترس (Truss) – المرحلة A تجميع الهيكل المعدني',
-    categoryId: 'elevator',
-    unit: 'عدد',
-    unitAr: 'عدد',
-    productivityRate: 6.0,
-    crewSize: 1,
-    crew: [],
-    source: 'اعمال الاسانسير',
-    sourceRef: 'اعمال الاسانسير',
-    notes: 'بالاسبوع',
-    isActive: true
-  },
-  {
-    id: 'ELV-007',
-    code: 'ELEV-007',
-    nameAr: 'نوع ترس (Truss) – إيقاف الأعمال لاستكمال التشطيبات المحيطة',
-    categoryId: 'elevator',
-    unit: 'عدد',
-    unitAr: 'عدد',
-    productivityRate: 5.0,
-    crewSize: 1,
-    crew: [],
-    source: 'اعمال الاسانسير',
-    sourceRef: 'اعمال الاسانسير',
-    notes: 'بالاسبوع',
-    isActive: true
-  },
-  {
-    id: 'ELV-008',
-    code: 'ELEV-008',
-    nameAr: 'نوع ترس (Truss) – المرحلة B تركيب الأرضيات والزجاج وغيرها',
-    categoryId: 'elevator',
-    unit: 'عدد',
-    unitAr: 'عدد',
-    productivityRate: 2.0,
-    crewSize: 1,
-    crew: [],
-    source: 'اعمال الاسانسير',
-    sourceRef: 'اعمال الاسانسير',
-    notes: 'بالاسبوع',
-    isActive: true
-  },
-  {
-    id: 'ELV-009',
-    code: 'ELEV-009',
-    nameAr: 'نوع ترس (Truss) – المرحلة C اختبارات الأداء',
-    categoryId: 'elevator',
-    unit: 'عدد',
-    unitAr: 'عدد',
-    productivityRate: 2.0,
-    crewSize: 1,
-    crew: [],
-    source: 'اعمال الاسانسير',
-    sourceRef: 'اعمال الاسانسير',
-    notes: 'بالاسبوع',
-    isActive: true
-  },
-  {
-    id: 'ELV-010',
-    code: 'ELEV-010',
-    nameAr: 'نوع ترس (Truss) – المرحلة D اختبار التحميل الكامل',
-    categoryId: 'elevator',
-    unit: 'عدد',
-    unitAr: 'عدد',
-    productivityRate: 2.0,
-    crewSize: 1,
-    crew: [],
-    source: 'اعمال الاسانسير',
-    sourceRef: 'اعمال الاسانسير',
-    notes: 'بالاسبوع',
-    isActive: true
-  },
+export const productivityTemplates: ProductivityTemplate[] = catalog.templates;
+
+// ========================================
+// Lookup Indexes (built by generate-templates.py)
+// ========================================
+
+// Active templates per category/source as [start, count] runs of array positions
+const activeRunsByCategory = new Map<string, [number, number][]>([
+  ['site-services', [[0, 18]]],
+  ['pipe-installation', [[18, 34]]],
+  ['electrical', [[52, 13]]],
+  ['steel-works', [[65, 8]]],
+  ['metal-works', [[73, 12]]],
+  ['carpentry', [[85, 15]]],
+  ['aluminum', [[100, 11]]],
+  ['landscape', [[111, 10]]],
+  ['elevator', [[121, 10]]]
+]);
+
+const activeRunsBySource = new Map<string, [number, number][]>([
+  ['اعمال تخديميه', [[0, 18]]],
+  ['تركيب المواسير', [[18, 34]]],
+  ['اعمال الكهرباء', [[52, 13]]],
+  ['اعمال الحديد', [[65, 8]]],
+  ['الاعمال المعدنيه', [[73, 12]]],
+  ['اعمال الخشب', [[85, 15]]],
+  ['اعمال الالمونيوم', [[100, 11]]],
+  ['اعمال الاند اسكيب', [[111, 10]]],
+  ['اعمال الاسانسير', [[121, 10]]]
+]);
+
+// First occurrence wins, as with the .find() lookups these replace
+function buildKeyIndex(keys: string[]): Map<string, number> {
+  const index = new Map<string, number>();
+  keys.forEach((key, i) => {
+    if (!index.has(key)) index.set(key, i);
+  });
+  return index;
+}
+
+const templateIndexById = buildKeyIndex(templateIds);
+const templateIndexByCode = buildKeyIndex(templateCodes);
+
+function templatesInRuns(runs: [number, number][] | undefined): ProductivityTemplate[] {
+  const templates: ProductivityTemplate[] = [];
+  for (const [start, count] of runs ?? []) {
+    for (let i = start; i < start + count; i++) templates.push(templateAt(i));
+  }
+  return templates;
+}
+
+// ========================================
+// Search Index (built by generate-templates.py)
+// ========================================
+
+const SEARCH_CHAR_MAP: Record<string, string> = { 'أ': 'ا', 'إ': 'ا', 'آ': 'ا', 'ٱ': 'ا', 'ى': 'ي', 'ی': 'ي', 'ئ': 'ي', 'ة': 'ه', 'ؤ': 'و', 'ک': 'ك', '٠': '0', '١': '1', '٢': '2', '٣': '3', '٤': '4', '٥': '5', '٦': '6', '٧': '7', '٨': '8', '٩': '9', '۰': '0', '۱': '1', '۲': '2', '۳': '3', '۴': '4', '۵': '5', '۶': '6', '۷': '7', '۸': '8', '۹': '9' };
+
+// Keep in sync with normalize_search_text() in scripts/generate-templates.py
+export function normalizeSearchText(text: string): string {
+  return text
+    .normalize('NFKC')
+    .toLowerCase()
+    .replace(/[\u064b-\u065f\u0670\u0640\u200c-\u200f\u202a-\u202e]/g, '')
+    .replace(/[أإآٱىیئةؤک٠١٢٣٤٥٦٧٨٩۰۱۲۳۴۵۶۷۸۹]/g, c => SEARCH_CHAR_MAP[c])
+    .replace(/[^0-9a-z\u0621-\u064a]+/g, ' ')
+    .trim();
+}
+
+// Normalized nameAr per template, in array order (generated templates have no nameEn)
+const searchKeys: string[] = [
+  'رفع بلوك طابق واحد باليد العامله', 'تنزيل ورفع بلوك بالونش الجمل', 'تحميل وتنزيل بلوك علي العربيه', 'نقل وتوزيع بلوك ضمن الابنيه في المنسوب الواحد',
+  'رفع بلاط ورخام للطوابق بالونش', 'تحميل وتنزيل بلاط ورخام وسيراميك ضمن الادوار', 'تحميل وتنزيل اسمنت علي العربيه', 'تكسير خرسانه يدوي',
+  'تكسير خرسانه بالكمبروسور', 'تكسير بلوك مع ازاله الناتج', 'ترايب سقايل معدنيه للوجهات', 'فك سقايل للوجهات',
+  'ازاله البياض الداخلي مع ازاله الناتج', 'تحميل وتنزيل حديد تسليح مشكل', 'تكسير بلاط وازاله الناتج خارج من المبني', 'رفع ورص بلوك هوردي',
+  'رفع وتوزيع اسمنت علي الادوار بالونش', 'رفع وتوزيع رمل علي الادوار بالونش', 'مواسير صرف pvc طول القطعه 3م قطر الماسوره حتي 150 مم', 'مواسير صرف pvc طول القطعه 6م قطر الماسوره حتي 150 مم',
+  'مواسير صرف pvc طول القطعه 3م قطر الماسوره حتي 200 مم', 'مواسير صرف pvc طول القطعه 6م قطر الماسوره حتي 200 مم', 'مواسير من الفخار والتقفيل بمونه اسمنتيه قطر الماسوره 75 مم', 'مواسير من الفخار والتقفيل بمونه اسمنتيه قطر الماسوره 100 مم',
+  'مواسير من الفخار والتقفيل بمونه اسمنتيه قطر الماسوره 150 مم', 'مواسير من الفخار والتقفيل بمونه اسمنتيه قطر الماسوره 225 مم', 'مواسير من الفخار والتقفيل بمونه اسمنتيه قطر الماسوره 300 مم', 'مواسير من الفخار والتقفيل بمونه اسمنتيه قطر الماسوره اابر 300 مم',
+  'مواسير من الفخار flexible joints قطر الماسوره 75 مم', 'مواسير من الفخار flexible joints قطر الماسوره 100 مم', 'مواسير من الفخار flexible joints قطر الماسوره 150 مم', 'مواسير من الفخار flexible joints قطر الماسوره 225 مم',
+  'مواسير من الفخار flexible joints قطر الماسوره 300 مم', 'مواسير من الفخار flexible joints قطر الماسوره اابر 300 مم', 'مواسير خرسانيه طول القطعه 1 5 م قطر الماسوره حتي 375 مم', 'مواسير خرسانيه طول القطعه 1 5 م قطر الماسوره حتي 450 مم',
+  'مواسير خرسانيه طول القطعه 1 5 م قطر الماسوره حتي 525 مم', 'مواسير خرسانيه طول القطعه 1 5 م قطر الماسوره حتي 600 مم', 'مواسير خرسانيه طول القطعه 1 5 م قطر الماسوره حتي 675 مم', 'مواسير خرسانيه طول القطعه 1 5 م قطر الماسوره حتي 750 مم',
+  'مواسير خرسانيه طول القطعه 1 5 م قطر الماسوره حتي 1500 مم', 'مواسير خرسانيه طول القطعه 1 5 م قطر الماسوره حتي 1800 مم', 'مواسير خرسانيه طول القطعه 2 5 م قطر الماسوره حتي 375 مم', 'مواسير خرسانيه طول القطعه 2 5 م قطر الماسوره حتي 450 مم',
+  'مواسير خرسانيه طول القطعه 2 5 م قطر الماسوره حتي 525 مم', 'مواسير خرسانيه طول القطعه 2 5 م قطر الماسوره حتي 600 مم', 'مواسير خرسانيه طول القطعه 2 5 م قطر الماسوره حتي 675 مم', 'مواسير خرسانيه طول القطعه 2 5 م قطر الماسوره حتي 750 مم',
+  'مواسير upvc قطر 75 مم', 'مواسير upvc fittings قطر 75 مم', 'مواسير cast iron قطر 75 مم', 'مواسير cast iron fittings قطر 75 مم',
+  'تركيب كابل كابل واحد في خندق مع حمايه', 'تركيب كابل كابلان في خندق مع حمايه', 'تركيب كابل 5 كابلات في خندق مع حمايه', 'تركيب كابل 7 كابلات في خندق مع حمايه',
+  'تركيب كابل 8 كابلات في خندق مع حمايه', 'تركيب كابل كابلان في خندق مع حمايه قطر 100 مم', 'تركيب كابل كابلان في خندق مع حمايه قطر 135 مم', 'تركيب كابل 3 كابلات في خندق مع حمايه قطر 100 مم',
+  'تركيب كابل 6 كابلات في خندق مع حمايه قطر 100 مم', 'تركيب كابل 4 كابلات في خندق مع حمايه قطر 150 مم', 'تركيب كابل 36 كابل في خندق مع حمايه قطر 100 مم', 'تركيب كابل 10 كابلات في خندق مع حمايه قطر 100 مم',
+  'تركيب كابل كابل واحد في خندق مع حمايه قطر 300 مم', 'steel frame and roof members', 'wall frame bow string truss and frame', 'roof frame curved truss and frame',
+  'wall frame glazed frame and atrium', 'horizontal heavy duty strutting', 'diagonal heavy duty strutting', 'metal decking large areas',
+  'metal decking small or complicated', 'تركيب ابواب و شابيبك', 'windows steel 1 0 3 0m2', 'windows steel 3 0 7 0m2',
+  'windows steel 7 0 10 0m2', 'تركيب اعمال معدنيه للاسوار والبلكونات', 'تركيب اعمال معدنيه للاسوار والبلكونات', 'تركيب اعمال معدنيه للدرابزين والادراج',
+  'تركيب باب جرار', 'تصنيع خزان سمااه 2 1 5 مم', 'تصنيع خزانات 3 مم', 'تصنيع وتركيب زاويه معدنيه لفواصل التمدد',
+  'قص وتركيب زجاج علي الحديد', 'شبابيك خشب بعد اكتمال اعمال الحوايط', 'تزجيج النوافذ زجاج مفرد', 'تزجيج النوافذ زجاج مزدوج',
+  'حلق ابواب من 1 0 الي 3 0 م2', 'حلق ابواب من 3 0 الي 7 0 م2', 'حلق ابواب من 7 0 الي 10 0 م2', 'شبابيك خشب لين من 1 0 الي 3 0 م2',
+  'شبابيك من 3 0 الي 7 0 م2', 'شبابيك من 7 0 الي 10 0 م2', 'عتب خشب', 'تعليق الابواب المفصلات والاكسسوارات',
+  'التخريم في الباب وتركيب الكالون', 'تركيب نظام فواصل دورات المياه الواح الفصل', 'تركيب نظام فواصل دورات المياه الالواح الاماميه للحايط', 'تركيب نظام فواصل دورات المياه باب مفصلي مثبت بالحايط',
+  'ابواب وشبابيك جراره او مفصلات', 'قواطع المنيوم ثابته', 'درابزين المنيوم', 'شبابيك الومنيوم من 1 0 الي 3 0 م2',
+  'شبابيك الومنيوم من 3 0 الي 7 0 م2', 'شبابيك الومنيوم من 7 0 الي 10 0 م2', 'وزره الومنيوم مثبته بالمسامير علي مسافات 150 300 مم', 'حوايط ستاير زجاجيه المرحله الاولي',
+  'حوايط ستاير زجاجيه المرحله الثانيه', 'حوايط ستاير زجاجيه عاليه الجوده تركيب ثلاثي المراحل', 'تركيب واجهات المنيوم مستمره', 'بلاطات خرسانيه علي طبقه رمل مدموكه',
+  'بلاطات خرسانيه علي طبقه مونه اسمنتيه', 'اعمال حجر بازلت علي مونه اسمنتيه', 'اعمال الحجر الصناعي علي فرشه رمل', 'اعمال بلاطات طوب',
+  'ممرات حصويه شامله تجهيز طبقه الاساس', 'فرش طبقه الرمل وتسويتها فبل وضع النجيله', 'تركيب طبقات النجيله', 'زرع شجر بطول 75 سم',
+  'زرع شجر بطول اابر 75 سم', 'مصعد هيدروليكي تركيب من 2 الي 3 ادوار', 'مصعد هيدروليكي تركيب 4 ادوار فاكثر', 'مصعد عادي تصنيع واختبار وتسليم',
+  'نوع ترس truss التركيب الكامل باستثناء الاعمال المعماريه', 'نوع ترس truss تصنيع واختبار وتسليم', 'نوع ترس truss المرحله a تجميع الهيكل المعدني', 'نوع ترس truss ايقاف الاعمال لاستكمال التشطيبات المحيطه',
+  'نوع ترس truss المرحله b تركيب الارضيات والزجاج وغيرها', 'نوع ترس truss المرحله c اختبارات الاداء', 'نوع ترس truss المرحله d اختبار التحميل الكامل'
 ];
 
+// 3-gram postings: "gram:p,p|..." with positions delta-encoded in base 36
+const searchIndexData = ' 0 :22,1,1,c,1,1,1,1,1,a,1,1| 0m:22,1,1| 1 :y,1,1,1,1,1,1,1,x,7,7,3,c| 10:n,6,s,2,1,2,1,d,e,3,c| 13:1m| 15:i,1,5,6,a,l,19| 18:15| 2 :16,1,1,1,1,1,y,14| 20:k,1| 22:p,6| 3 :1n,f,1,7,6,1,2,1,b,1,h| 30:q,1,5,1,v,16| 36:1q| 37:y,8| 3م:i,2| 4 :1p,1p| 45:z,8| 5 :y,1,1,1,1,1,1,1,1,1,1,1,1,1,7,r| 52:10,8| 6 :1o| 60:11,8| 67:12,8| 6م:j,2| 7 :1j,k,1,d,1,2,1,b,1| 75:m,6,b,8,1,1,1,1,1w,1| 8 :1k| a :3i| an:1t,1,1,1| ar:1z| at:1w| b :3k| bo:1u| c :3l| ca:1e,1| co:20| cu:1v| d :3m| de:1z,1| du:1x,1| fi:1d,2| fl:s,1,1,1,1,1| fr:1t,1,1,1| gl:1w| he:1x,1| ir:1e,1| jo:s,1,1,1,1,1| la:1z| me:1t| or:20| pv:i,1,1,1| ro:1t| sm:20| st:1u,3,1,4,1,1| tr:1u,1,1l,1,1,1,1,1,1| up:1c,1| اا:r,6,2f| اب:21,f,1,1| اخ:3l,1| اد:3d,1| از:9,3| اس:6,a,6,1,1,1,1,1,2d,1| اع:25,1,1,6| اك:2d| ال:0,1,1,1,2,1,3,3,2,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,10,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,2,1,1,1,1,1,1,1,1,1,4,2,1,1,3,3,2,1,1,1,1| او:2s| اي:3j| با:0,1,3,4,8,1,1r,j,7,7,b| بط:3b,1| بع:2d| بل:0,1,1,1,1,1,4,5,1,2s| بم:m,1,1,1,1,1| تج:38,a| تر:31,c,1,2,1,1,1,1,1,1| تس:d| تص:3f,2| ثا:2t| ثل:31| جر:28,k| حت:i,1,1,1,d,1,1,1,1,1,1,1,1,1,1,1,1,1| حج:35| حد:d| حص:38| حم:1g,1,1,1,1,1,1,1,1,1,1,1,1| خا:e| خر:7,1,q,1,1,1,1,1,1,1,1,1,1,1,1,1,1s,1| خز:29,1| خش:2d,6,3| خن:1g,1,1,1,1,1,1,1,1,1,1,1,1| دو:2p,1,1| رم:h,2m,3| زا:2b| زج:2c,2,1,k,1,1| ست:2z,1,1| سق:a,1| سم:29,12,1| شا:21,17| شج:3b,1| صر:i,1,1,1| ضم:3,2| طا:0| طب:33,1,4,1,1| طو:i,1,1,1,d,1,1,1,1,1,1,1,1,1,1,1,1,1,1w| عا:31,e| عل:2,4,a,1,1v,m,5,1,1,1| فا:3e| فب:39| فر:36| فو:2p,1,1| في:3,1d,1,1,1,1,1,1,1,1,1,1,1,1,w| قط:i,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,6,1,1,1,1,1,1,1| كا:1g,1,1,1,1,1,1,1,1,1,1,1,1| لا:3j| لف:2b| لل:4,6,1,1u,1,1,j| لي:2j| م :y,1,1,1,1,1,1,1,1,1,1,1,1,1| م2:2g,1,1,1,1,1,a,1,1| مث:2r,7| مد:33| مز:2f| مس:2y,4| مش:d| مع:9,1,2,14,1,1,1,1,1,1,1,1,1,1,1,1,d,1,1,4| مف:2e,d,1| مم:i,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,6,1,1,1,1,1,1,1,h,1,o| من:e,8,1,1,1,1,1,1,1,1,1,1,1,1j,1,1,1,1,1,a,1,1,g| مو:34,1| نظ:2p,1,1| هو:f| هي:3d,1| و :21| وا:0,e,8,1,1,1,1,1,p,c,d,1,1,g,f,d,2,3| وت:2,1,2,1,7,3,1,1u,1,c,l,6,2| ور:1,3,1,a| وس:5| وش:2s| وض:39| وغ:3k| يد:7|0 0:24,e,3,c|0 1:24|0 3:22,w|0 7:23|0 ا:2g,1,1,1,1,1,a,1,1|0 ك:1r|0 م:i,1,1,1,2,1,2,1,2,1,2,1,2,2,2,1,1,2,2,2,a,2,1,1,1,1,1,o,1,1,1,1,1,a,1,1,1|00 :k,1,2,3,1,2,3,1,4,3,1,4,c,2,1,2,1,1,16|0m2:22,1,1|1 0:22,e,3,c|1 5:y,1,1,1,1,1,1,1,14|10 :1r,d,e,3,c|100:n,6,s,2,1,2,1|135:1m|150:i,1,5,6,a,l,19|180:15|2 1:29|2 5:16,1,1,1,1,1|2 ا:3d|200:k,1|225:p,6|25 :p,6,5,8|3 0:22,1,d,1,2,1,b,1|3 ا:3d|3 ك:1n|3 م:2a|300:q,1,5,1,v,16|35 :1m|36 :1q|375:y,8|3م :i,2|4 ا:3e|4 ك:1p|450:z,8|5 س:3b,1|5 ك:1i|5 م:m,3,3,3,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,7,n|50 :i,1,5,6,5,4,4,4,e,19|500:14|525:10,8|6 ك:1o,2|600:11,8|675:12,8|6م :j,2|7 0:23,1,d,1,2,1,b,1|7 ك:1j|75 :m,6,6,4,4,4,2,1,1,1,1w,1|750:13,8|8 ك:1k|800:15|a ت:3i|ago:1y|al :1x,1,1,1|all:1u,2,4|ame:1t,1,1,1|and:1t,1,1,1|are:1z|arg:1z|ast:1e,1|ate:20|atr:1w|avy:1x,1|aze:1w|b ت:3k|ber:1t|ble:s,1,1,1,1,1|bow:1u|c f:1d|c ا:3l|c ط:i,1,1,1|c ق:1c|cas:1e,1|cat:20|cki:1z,1|com:20|cur:1v|d a:1w|d f:1u,1,1|d r:1t|d t:1v|d ا:3m|dec:1z,1|dia:1y|dow:22,1,1|dut:1x,1|e a:1t,3,3|e b:1u|e c:1v|e g:1w|e j:s,1,1,1,1,1|eas:1z|eav:1x,1|eck:1z,1|ed :1v,1|eel:1t,9,1,1|el :1t,9,1,1|emb:1t|ers:1t|eta:1z,1|exi:s,1,1,1,1,1|f f:1v|f m:1t|fit:1d,2|fle:s,1,1,1,1,1|fra:1t,1,1,1|g l:1z|g s:20|g t:1u|ge :1z|gla:1w|gon:1y|gs :1d,2|hea:1x,1|hor:1x|iag:1y|ibl:s,1,1,1,1,1|ica:20|ind:22,1,1|ing:1d,2,f,3,1,1,1|int:s,1,1,1,1,1|iro:1e,1|itt:1d,2|ium:1w|izo:1x|joi:s,1,1,1,1,1|kin:1z,1|l 1:22|l 3:23|l 7:24|l d:1z,1|l f:1t,1,2|l h:1x,1|l o:20|lar:1z|laz:1w|le :s,1,1,1,1,1|lex:s,1,1,1,1,1|lic:20|ll :1u,2,4|mal:20|mbe:1t|me :1t,1,1,1|mem:1t|met:1z,1|mpl:20|n f:1f|n ق:1e|nal:1y|nd :1t,1,1,1|ndo:22,1,1|ng :1u,5,1|ngs:1d,2|nta:1x|nts:s,1,1,1,1,1|of :1t,2|oin:s,1,1,1,1,1|omp:20|on :1e,1|ona:1y|ont:1x|oof:1t,2|or :20|ori:1x|ow :1u|ows:22,1,1|pli:20|pvc:i,1,1,1,r,1|r c:20|ram:1t,1,1,1|rea:1z|rge:1z|rin:1u|riu:1w|riz:1x|ron:1e,1|roo:1t,2|rus:1u,1,1l,1,1,1,1,1,1|rut:1x,1|rve:1v|s a:1u,1|s s:22,1,1|s ا:3g,2,1,1,1,1|s ت:3h|s ق:s,1,1,1,1,1,g,2|sma:20|ss :1u,1,1l,1,1,1,1,1,1|st :1e,1|ste:1t,9,1,1|str:1u,3,1|t i:1e,1|tal:1x,2,1|ted:20|tee:1t,9,1,1|tin:1d,2,i,1|tri:1u,2|tru:1u,1,2,1,1i,1,1,1,1,1,1|ts :s,1,1,1,1,1|tti:1d,2,i,1|ty :1x,1|upv:1c,1|urv:1v|uss:1u,1,1l,1,1,1,1,1,1|utt:1x,1|uty:1x,1|vc :i,1,1,1,r,1|ved:1v|vy :1x,1|w s:1u|wal:1u,2|win:22,1,1|ws :22,1,1|xib:s,1,1,1,1,1|y d:1x,1|y s:1x,1|zed:1w|zon:1x|ء ا:3g|ا ف:39|اء :3g|ااب:r,6,2f|ااه:29|اب :21,7,8,1,1,5,1,3,1|ابت:2t|ابر:r,6,2f|ابز:27,n|ابق:0,4|ابل:1g,1,1,1,1,1,1,1,1,1,1,1,1|ابن:3|ابو:21,f,1,1,5,5|ابي:21,c,6,1,1,7,3,1,1|ات :1i,1,1,3,1,1,2,j,d,2,1,1,7,4,1,1,3,1,2,9,1,1|اتج:9,3,2|اثي:31|اج :2c,2,1,15|اجه:32|اجي:2z,1,1|اح :2p,1|احد:0,3,1d,c|احل:31|اخت:3f,2,4,1|اخل:c|ادا:3l|ادر:27|ادو:5,b,1,2w,1|ادي:3f|ار :g,1,5,1,1,1,1,1,1,1,1,1,1,1,18,1,18,1,2,5|ارا:2n,y|ارج:e|ارض:3k|اره:2s|اري:3g|ازا:9,3,2|ازل:35|اسا:38|است:3g,3|اسم:6,a,6,1,1,1,1,1,2d,1|اسو:i,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,u,1|اسي:i,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1|اصل:2b,e,1,1|اض :c|اط :4,1,9|اطا:33,1,3|اطع:2t|اعم:25,1,1,6,s,1,1,9,3|اعي:36|اف :3j|افا:2y|افذ:2e,1|اكت:2d|اكث:3e|اكس:2n|ال :25,1,1,6,s,1,1,9,3|الا:3,2,b,1,1q,g,3,9,9,8,3,1,1|الب:c,1t,1,i|الت:m,1,1,1,1,1,1k,d,s,3,3|الث:30|الج:1,30|الح:2c,1,e,f|الد:c|الر:39|الز:3k|الص:36|الع:0,2,4|الف:m,1,1,1,1,1,1,1,1,1,1,1,1s|الق:i,1,1,1,d,1,1,1,1,1,1,1,1,1,1,1,1,1|الك:8,2g,s,6|الم:3,b,4,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1c,2,1,1,2,1,4,1,1,1,1,e,2,1,1,1,1|الن:9,3,2,20,1,u,1|اله:9,3,2,34|الو:1,2,1,c,1,27,1,1,5,1,1,1|الي:0,2g,1,1,1,1,1,a,1,1,4,c|ام :4,1,2k,1,1|اما:2q|امل:0,38,8,6|امي:5,2l,8|ان :1h,4,1,n|انا:2a|انه:7,1|اني:y,1,1,1,1,1,1,1,1,1,1,1,1,1,1p,3,1|اه :29,g,1,1|او :2s|اول:2z|اوي:2b|ايب:a|اير:2z,1,1|ايط:2d,d,1,8,1,1|ايق:3j|ايل:a,1|ايه:1g,1,1,1,1,1,1,1,1,1,1,1,1|ب 4:3e|ب ا:3,1y,4,1,1,g,1,s,4|ب ب:28,5|ب ث:31|ب ج:28|ب خ:2m|ب ز:2b,1|ب س:a|ب ط:3a|ب ك:1g,1,1,1,1,1,1,1,1,1,1,1,1|ب ل:2j|ب م:2g,1,1,9,m|ب ن:2p,1,1|ب و:21,n,4,a|باب:28,5,6,1,1,3,3,1,3,1,1|بات:3j|بار:3f,2,4,1|باز:35|باس:3g|بال:0,1,3,4,8,1,2a,7|بت :2r|بته:2t,5|بر :r,6,2f|برو:8|بزي:27,n|بطو:3b,1|بعد:2d|بق :0,4|بقا:3a|بقه:33,1,4,1|بل :1g,1,1,1,1,1,1,1,1,1,1,1,1,1h|بلا:4,1,9,13,1,1,1,1,1,1,1,1,2,1c,1,3|بلك:25,1|بلو:0,1,1,1,6,6|بمو:m,1,1,1,1,1|بني:3,b|بوا:21,f,1,1,5,5|بيا:c|بيب:21|بيك:2d,6,1,1,7,3,1,1|بيه:2,4|ت 1:2y|ت 3:2a|ت ا:2p,1,1,b,8,9,2|ت ب:2r|ت ح:38|ت خ:33,1|ت ط:37|ت ع:6,a,2p|ت ف:1i,1,1,3,1,1,2|ت و:2n,x|تاي:2z,1,1|تب :2m|تبا:3f,2,4,1|تثن:3g|تج :e|تجم:3i|تجه:38|تحم:2,3,1,7,39|تخر:2o|ترا:a|ترس:3g,1,1,1,1,1,1|ترك:1g,1,1,1,1,1,1,1,1,1,1,1,1,9,4,1,1,1,3,1,c,1,1,1,a,1,8,3,1,2,4|تزج:2e,1|تسل:d,32,2|تسو:39|تشط:3j|تصن:29,1,1,14,2|تعل:2n|تقف:m,1,1,1,1,1|تكس:7,1,1,5|تكم:3j|تما:2d|تمد:2b|تمر:32|تنز:1,1,3,1,7|ته :2y|تها:39|توز:3,d,1|تي :i,1,1,1,d,1,1,1,1,1,1,1,1,1,1,1,1,1|تيه:m,1,1,1,1,1,2d,1|ثاب:2t|ثان:30|ثبت:2r,7|ثلا:31|ثنا:3g|ثي :31|ج ا:2e,1|ج خ:e|ج ع:2c|ج م:e,20,1|ج و:3k|جاج:2c,2,1,k,1,1,j|جر :35,1,5,1|جرا:28,k|جمل:1|جمي:3i|جها:a,1,2r|جهي:38|جود:31|جيج:2e,1|جيل:39,1|جيه:2z,1,1|ح ا:2p,1|ح م:d|حاي:2q,1|حتي:i,1,1,1,d,1,1,1,1,1,1,1,1,1,1,1,1,1|حجر:35,1|حد :0,1g,c|حدي:d,1z|حصو:38|حلق:2g,1,1|حله:2z,1,i,2,1,1|حما:1g,1,1,1,1,1,1,1,1,1,1,1,1|حمي:2,3,1,7,39|حوا:2d,m,1,1|حيط:3j|خار:e,8,1,1,1,1,1,1,1,1,1,1,1|خام:4,1|ختب:3f,2,4,1|خرس:7,1,q,1,1,1,1,1,1,1,1,1,1,1,1,1,1s,1|خري:2o|خزا:29,1|خشب:2d,6,3|خلي:c|خند:1g,1,1,1,1,1,1,1,1,1,1,1,1|د ا:0,2d|د ب:0|د ت:d|د ع:3f|د ف:1g,c|د ه:3d,1|داء:3l|داخ:c|درا:27,n|درو:3d,1|دق :1g,1,1,1,1,1,1,1,1,1,1,1,1|دمو:33|دني:a,1v,1,1,4,17|ده :31|دوا:5,b,1,2w,1|دوج:2f|دور:2p,1,1|دوي:7|دي :3f|ديد:d,1z|ذ ز:2e,1|ر 1:1l,1,1,1,1,1,1|ر 3:r,6,v|ر 7:1c,1,1,1,1x|ر c:1e,1|ر f:s,1,1,1,1,1|ر u:1c,1|ر ا:i,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1v,g|ر ب:9,5,2,1,2o,6,1|ر خ:7,1,q,1,1,1,1,1,1,1,1,1,1,1,1,1|ر ز:2z,1,1|ر ص:i,1,1,1|ر ع:2y|ر ف:3e|ر م:m,1,1,1,1,1,1,1,1,1,1,1|ر و:m,1,1,1,1,1,1e,1,19,2|راب:27,n|رات:2n,2,1,1,h,d|راج:27|راح:31|رار:28,k|رام:5|راي:a|ربي:2,4|رج :e|رحل:2z,1,i,2,1,1|رخا:4,1|ردي:f|رس :3g,1,1,1,1,1,1|رسا:7,1,q,1,1,1,1,1,1,1,1,1,1,1,1,1,1s,1|رش :39|رشه:36|رص :f|رضي:3k|رع :3b,1|رف :i,1,1,1|رفع:0,1,3,b,1,1|ركي:1g,1,1,1,1,1,1,1,1,1,1,1,1,9,4,1,1,1,3,1,c,1,1,1,a,1,8,3,1,2,4|رمل:h,2m,3,3|ره :i,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1h,6|رها:3k|روس:8|رول:3d,1|ريم:2o|ريه:3g|ز ط:38|زال:9,3,2|زان:29,1|زاو:2b|زجا:2c,2,1,k,1,1,j|زجي:2e,1|زدو:2f|زرع:3b,1|زره:2y|زلت:35|زيع:3,d,1|زيل:1,1,3,1,7|زين:27,n|س t:3g,1,1,1,1,1,1|ساس:38|ساف:2y|سام:2y|سان:7,1,q,1,1,1,1,1,1,1,1,1,1,1,1,1,1s,1|ستا:2z,1,1|ستث:3g|ستك:3j|ستم:32|سسو:2n|سقا:a,1|سلي:d,32,2|سما:29|سمن:6,a,6,1,1,1,1,1,2d,1|سوا:25,1,h|سوب:3|سور:8,a,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1|سوي:39|سير:5,2,1,1,5,4,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1|ش ا:1|ش ط:39|شاب:21|شام:38|شب :2d,6|شبا:2d,6,1,1,7,3,1,1|شجر:3b,1|شطي:3j|شكل:d|شه :36|ص ب:f|ص و:2c|صرف:i,1,1,1|صعد:3d,1,1|صل :2b,e,1,1|صلا:2n,5|صلي:2r|صنا:36|صني:29,1,1,14,2|صوي:38|ض ا:c|ضع :39|ضمن:3,2|ضيا:3k|ط س:2z,1,1|ط و:4,1,9|طاب:0|طات:33,1,3|طبق:33,1,4,1,1|طر :i,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,6,1,1,1,1,1,1,1|طع :2t|طعه:i,1,1,1,d,1,1,1,1,1,1,1,1,1,1,1,1,1|طوا:4|طوب:37|طول:i,1,1,1,d,1,1,1,1,1,1,1,1,1,1,1,1,1,20,1|طيب:3j|ظام:2p,1,1|ع ا:9,3,4,2d,g,9|ع ب:0,1,2,1|ع ت:3g,1,1,1,1,1,1|ع ح:1g,1,1,1,1,1,1,1,1,1,1,1,1|ع خ:29,1|ع ر:h|ع ش:3b,1|ع و:f,1,1,1u,14,2|عاد:3f|عال:31|عام:0|عتب:2m|عد :2d,10,1,1|عدن:a,1v,1,1,4,17|عرب:2,4|علي:2,4,a,1,1v,b,b,5,1,1,1|عما:25,1,1,6,s,1,1,9,3|عه :i,1,1,1,d,1,1,1,1,1,1,1,1,1,1,1,1,1|عي :36|غير:3k|ف p:i,1,1,1|ف ا:3j|فات:2y|فاك:3e|فبل:39|فخا:m,1,1,1,1,1,1,1,1,1,1,1|فذ :2e,1|فرد:2e|فرش:36,3|فصل:2n,2,2,1|فع :0,1,3,b,1,1|فك :b|فوا:2b,e,1,1|في :3,1d,1,1,1,1,1,1,1,1,1,1,1,1,w|فيل:m,1,1,1,1,1|ق ا:2g,1,1,5|ق ب:4|ق م:1g,1,1,1,1,1,1,1,1,1,1,1,1|ق و:0|قات:3a|قاف:3j|قاي:a,1|قص :2c|قطر:i,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,6,1,1,1,1,1,1,1|قطع:i,1,1,1,d,1,1,1,1,1,1,1,1,1,1,1,1,1|قفي:m,1,1,1,1,1|قل :3|قه :33,1,4,1|قوا:2t|ك ا:2v,1,1|ك ب:1|ك ج:2s|ك خ:2d,6|ك س:b|ك ض:3,2|ك ط:0|ك ع:2|ك م:9,2b,1|ك ه:f|كاب:1g,1,1,1,1,1,1,1,1,1,1,1,1|كال:2o|كام:3g,6|كتم:2d|كثر:3e|كسس:2n|كسي:7,1,1,5|كل :3i|كما:3j|كمب:8|كون:25,1|كي :3d,1|كيب:1g,1,1,1,1,1,1,1,1,1,1,1,1,9,4,1,1,1,3,1,c,1,1,1,a,1,8,3,1,2,4|ل 1:1r|ل 3:1n,3|ل 4:1p|ل 5:1i|ل 6:1o|ل 7:1j,1s|ل 8:1k|ل ا:6,c,1,1,1,d,1,1,1,1,1,1,1,1,1,1,1,1,1,10,2,t,6,4,2,1,3|ل ب:2,3,h,1,1,1,1,1,2g,9|ل ح:d,2s|ل د:2p,1,1|ل ع:h|ل ف:1q|ل ك:1g,1,4,1,6|ل ل:b,38|ل م:a,1v,1,1,w|ل و:1,1,1,2,1,7,13,c,1h|لاب:3,2k|لات:1i,1,1,3,1,1,2,w,5|لاث:31|لاد:5,b,1,1q,1e|لار:3k|لاس:25,1,12,b|لاط:4,1,9,2p,1,3|لاع:3g,3|لاك:2n|لال:2q|لام:2q|لان:1h,4,1|لاو:2z|لبا:2o|لبل:25,1|لبي:c|لت :35|لتح:3m|لتخ:2o|لتر:3g|لتش:3j|لتق:m,1,1,1,1,1|لتم:2b|لثا:30|لجم:1|لجو:31|لحا:2q,1|لحج:36|لحد:2c|لحو:2d|لدا:c|لدر:27|لرم:39|لزج:3k|لصن:36|لطو:4|لعا:0|لعر:2,4|لفخ:m,1,1,1,1,1,1,1,1,1,1,1|لفص:2p|لفو:2b|لق :2g,1,1|لقط:i,1,1,1,d,1,1,1,1,1,1,1,1,1,1,1,1,1|لكا:2o,s,6|لكم:8|لكو:25,1|للا:25,1|للح:2q|للد:27|للط:4|للو:a,1|لما:i,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1|لمب:e|لمح:3j|لمر:2z,1,1,h,2,1,1|لمس:2y|لمع:3g,2|لمف:2n|لمن:3,2q,1,8|لمي:2p,1,1|لنا:9,3,2|لنج:39,1|لنو:2e,1|له :9,3,2,2l,1,8,a,2,1,1|لهي:3i|لوا:3,2m,1|لوج:a,1|لوك:0,1,1,1,6,6|لوم:2v,1,1,1|لون:1,3,c,1,27|لي :2,4,6,4,1,1v,4,1,1,1,1,1,6,4,1,1,1,5,1,1,1,7|ليح:d|ليد:0|ليق:2n|ليك:3d,1|ليم:3f,2|لين:2j|ليه:31|م ث:2t|م ف:2o,1,1,1|م ق:i,1,1,1,d,1,1,1,1,1,1,1,1,1,1,1,1,1|م ل:4|م م:2v,1,1,1,4|م و:5|ماا:29|مار:3g|ماس:i,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1|مال:25,1,1,6,s,1,1,9,3|مام:2q|ماي:1g,1,1,1,1,1,1,1,1,1,1,1,1|مبر:8|مبن:e|مثب:2r,7|محي:3j|مدد:2b|مدم:33|مرا:31,7|مرح:2z,1,i,2,1,1|مره:32|مزد:2f|مسا:2y|مست:32|مشك:d|مصع:3d,1,1|مع :9,3,14,1,1,1,1,1,1,1,1,1,1,1,1|معد:a,1v,1,1,4,17|معم:3g|مفر:2e|مفص:2n,4,1|مل :h,2m,6,7|مله:0,38|ممر:38|من :3,2,9,8,1,1,1,1,1,1,1,1,1,1,1,1j,1,1,1,1,1,a,1,1,g|منت:6,a,6,1,1,1,1,1,2d,1|منس:3|مني:2t,1,1,1,1,1,4|موا:i,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1|موك:33|مون:m,1,1,1,1,1,2d,1|ميا:2p,1,1|مير:2y|ميع:3i|ميك:5|ميل:2,3,1,7,39|ميه:2q|ن 1:2g,3,c|ن 2:3d|ن 3:2h,3,c|ن 7:2i,3,c|ن ا:3,2,9,8,1,1,1,1,1,1,1,1,1,1,1,1x|ن س:29|ن ف:1h,4,1|ن م:2j|ن و:27|ناء:3g|نات:9,3,2,1r,1,4|ناع:36|نت :6,a|نتي:m,1,1,1,1,1,2d,1|نجي:39,1|ندق:1g,1,1,1,1,1,1,1,1,1,1,1,1|نزي:1,1,3,1,7|نسو:3|نش :1|نظا:2p,1,1|نقل:3|نه :7,1,e,1,1,1,1,1,2d,1|نوا:2e,1|نوع:3g,1,1,1,1,1,1|نيع:29,1,1,14,2|نيه:3,7,o,1,1,1,1,1,1,1,1,1,1,1,1,1,u,1,1,4,p,3,1|نيو:2t,1,1,1,1,1,4|ه 1:n,1,5,1,4,1,1,1,1,1,1,1|ه 2:p,6,b,1,1,1,1,1,y|ه 3:i,2,6,6|ه 6:j,2|ه 7:m,6|ه a:3i|ه b:3k|ه c:3l|ه d:3m|ه ا:9,3,2,8,1,1,1,1,1,6,1s,1,2,6,1,1,1,3,1,3,1|ه ب:8,2j,7|ه ت:31,7|ه ح:i,1,1,1,d,1,1,1,1,1,1,1,1,1,1,1,1,1|ه ر:33,3|ه ش:38|ه ط:y,1,1,1,1,1,1,1,1,1,1,1,1,1|ه ع:31,2,1|ه ف:3|ه ق:m,1,1,1,1,1,u,1,1,1,1,1,1,1|ه ل:a,1v,1,1,4,f|ه م:2b,t|ه ي:7|ها :39|هات:a,1,2r|هور:f|هيد:3d,1|هيز:38|هيك:3i|و ش:21|و م:2s|واب:4,1x,f,1,1,5,5|واج:32|واح:0,3,1d,c,x,1|واخ:3f,2|وار:5,b,1,1o,1,h,q,1|واز:e|واس:i,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1|واص:2b,e,1,1|واط:2t|واف:2e,1|وال:m,1,1,1,1,1,1e,1,1,g,x|واي:2d,m,1,1|وب :3|وتر:2b,1,c|وتس:39,6,2|وتن:2,3,1,7|وتو:3,d,1|وجه:a,1|وده:31|ورا:2p,1,1|ورخ:4,1|ورد:f|ورص:f|ورف:1|وره:i,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1|وزر:2y|وزي:3,d,1|وسو:8|وسي:5|وشب:2s|وضع:39|وع :3g,1,1,1,1,1,1|وغي:3k|وك :0,1,1,1,6,6|وكه:33|ول :i,1,1,1,d,1,1,1,1,1,1,1,1,1,1,1,1,1,20,1|ولي:2z,e,1|وم :2t,2,1,1,1,4|ومن:2v,1,1,1|ونا:25,1|ونش:1,3,c,1|ونه:m,1,1,1,1,1,2d,1|ويت:39|ويه:2b,x|ي 1:i,1,l,1,1d,3,c|ي 2:k,1|ي 3:y,8,1a,3,c,i|ي 4:z,8|ي 5:10,8|ي 6:11,1,7,1|ي 7:13,8,16,3,c|ي ا:2,1,3,a,1,1v,c,d|ي ت:3d,1,1|ي خ:1g,1,1,1,1,1,1,1,1,1,1,1,1|ي ط:33,1|ي ع:36|ي ف:36|ي م:c,2f,7,7|يات:3k|ياض:c|ياه:2p,1,1|يب :a,16,1,1,1,1,1,1,1,1,1,1,1,1,9,4,1,1,1,3,1,c,1,1,1,a,1,8,3,1,2,4|يبا:3j|يبك:21|يته:39|يج :2e,1|يح :d|يد :0,d|يدر:3d,1|يدو:7|ير :7,1,1,5,4,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1j,1,1,1|يرا:5|يره:3k|يز :38|يط :2z,1,1|يطه:3j|يع :3,d,1,1s,1,1,14,2,1|يق :2n|يقا:3j|يك :5,28,6,1,1,7,3,1,1|يكل:3i|يكي:3d,1|يل :1,1,3,1,4,1,2,9,1,1,1,1,1,2v|يله:39,1|يم :2o|ين :27,c,b|يه :3,7,c,1,1,1,1,1,7,1,1,1,1,1,1,1,1,1,1,1,1,1,a,1,1,1,1,1,1,1,d,1,1,4,f,9,1,1,2,1,4|يوم:2t,1,1,1,1,1,4';
+const SEARCH_GRAM = 3;
+
+let searchPostings: Map<string, number[]> | null = null;
+
+function getSearchPostings(): Map<string, number[]> {
+  if (searchPostings) return searchPostings;
+  searchPostings = new Map();
+  for (const entry of searchIndexData.split('|')) {
+    const separator = entry.indexOf(':');
+    let position = 0;
+    searchPostings.set(
+      entry.slice(0, separator),
+      entry.slice(separator + 1).split(',').map(delta => (position += parseInt(delta, 36)))
+    );
+  }
+  return searchPostings;
+}
+
+function intersectSorted(a: number[], b: number[]): number[] {
+  const result: number[] = [];
+  let i = 0;
+  let j = 0;
+  while (i < a.length && j < b.length) {
+    if (a[i] === b[j]) {
+      result.push(a[i]);
+      i++;
+      j++;
+    } else if (a[i] < b[j]) {
+      i++;
+    } else {
+      j++;
+    }
+  }
+  return result;
+}
+
+// ========================================
+// Activity Statistics (built by generate-templates.py)
+// ========================================
+
+// Templates with the same normalized name and unit are one activity, whatever
+// their source. stdDev is the population standard deviation of the rates.
+export interface ActivityProductivityStats {
+  activityKey: string;
+  nameAr: string;
+  unit: string;
+  templateIndexes: number[];
+  count: number;
+  mean: number;
+  median: number;
+  min: number;
+  max: number;
+  stdDev: number;
+}
+
+export const activityProductivityStats: ActivityProductivityStats[] = [
+  { activityKey: 'رفع بلوك طابق واحد باليد العامله|م3', nameAr: 'رفع بلوك طابق واحد باليد العاملة', unit: 'م3', templateIndexes: [0], count: 1, mean: 4.0, median: 4.0, min: 4.0, max: 4.0, stdDev: 0.0 },
+  { activityKey: 'تنزيل ورفع بلوك بالونش الجمل|م3', nameAr: 'تنزيل ورفع بلوك بالونش الجمل', unit: 'م3', templateIndexes: [1], count: 1, mean: 12.0, median: 12.0, min: 12.0, max: 12.0, stdDev: 0.0 },
+  { activityKey: 'تحميل وتنزيل بلوك علي العربيه|م3', nameAr: 'تحميل وتنزيل بلوك على العربية', unit: 'م3', templateIndexes: [2], count: 1, mean: 10.0, median: 10.0, min: 10.0, max: 10.0, stdDev: 0.0 },
+  { activityKey: 'نقل وتوزيع بلوك ضمن الابنيه في المنسوب الواحد|م3', nameAr: 'نقل وتوزيع بلوك ضمن الابنية فى المنسوب الواحد', unit: 'م3', templateIndexes: [3], count: 1, mean: 16.0, median: 16.0, min: 16.0, max: 16.0, stdDev: 0.0 },
+  { activityKey: 'رفع بلاط ورخام للطوابق بالونش|م2', nameAr: 'رفع بلاط ورخام للطوابق بالونش', unit: 'م2', templateIndexes: [4], count: 1, mean: 180.0, median: 180.0, min: 180.0, max: 180.0, stdDev: 0.0 },
+  { activityKey: 'تحميل وتنزيل بلاط ورخام وسيراميك ضمن الادوار|م2', nameAr: 'تحميل وتنزيل بلاط ورخام وسيراميك ضمن الادوار', unit: 'م2', templateIndexes: [5], count: 1, mean: 200.0, median: 200.0, min: 200.0, max: 200.0, stdDev: 0.0 },
+  { activityKey: 'تحميل وتنزيل اسمنت علي العربيه|طن', nameAr: 'تحميل وتنزيل اسمنت على العربية', unit: 'طن', templateIndexes: [6], count: 1, mean: 10.0, median: 10.0, min: 10.0, max: 10.0, stdDev: 0.0 },
+  { activityKey: 'تكسير خرسانه يدوي|م3', nameAr: 'تكسير خرسانة يدوى', unit: 'م3', templateIndexes: [7], count: 1, mean: 0.5, median: 0.5, min: 0.5, max: 0.5, stdDev: 0.0 },
+  { activityKey: 'تكسير خرسانه بالكمبروسور|م3', nameAr: 'تكسير خرسانة بالكمبروسور', unit: 'م3', templateIndexes: [8], count: 1, mean: 3.0, median: 3.0, min: 3.0, max: 3.0, stdDev: 0.0 },
+  { activityKey: 'تكسير بلوك مع ازاله الناتج|م3', nameAr: 'تكسير بلوك مع ازالة الناتج', unit: 'م3', templateIndexes: [9], count: 1, mean: 3.0, median: 3.0, min: 3.0, max: 3.0, stdDev: 0.0 },
+  { activityKey: 'ترايب سقايل معدنيه للوجهات|م2', nameAr: 'ترآيب سقائل معدنية للوجهات', unit: 'م2', templateIndexes: [10], count: 1, mean: 70.0, median: 70.0, min: 70.0, max: 70.0, stdDev: 0.0 },
+  { activityKey: 'فك سقايل للوجهات|م2', nameAr: 'فك سقايل للوجهات', unit: 'م2', templateIndexes: [11], count: 1, mean: 100.0, median: 100.0, min: 100.0, max: 100.0, stdDev: 0.0 },
+  { activityKey: 'ازاله البياض الداخلي مع ازاله الناتج|م2', nameAr: 'ازالة البياض الداخلى مع ازالة الناتج', unit: 'م2', templateIndexes: [12], count: 1, mean: 16.0, median: 16.0, min: 16.0, max: 16.0, stdDev: 0.0 },
+  { activityKey: 'تحميل وتنزيل حديد تسليح مشكل|طن', nameAr: 'تحميل وتنزيل حديد تسليح مشكل', unit: 'طن', templateIndexes: [13], count: 1, mean: 2.0, median: 2.0, min: 2.0, max: 2.0, stdDev: 0.0 },
+  { activityKey: 'تكسير بلاط وازاله الناتج خارج من المبني|م2', nameAr: 'تكسير بلاط وازالة الناتج خارج من المبنى', unit: 'م2', templateIndexes: [14], count: 1, mean: 30.0, median: 30.0, min: 30.0, max: 30.0, stdDev: 0.0 },
+  { activityKey: 'رفع ورص بلوك هوردي|عدد', nameAr: 'رفع ورص بلوك هوردى', unit: 'عدد', templateIndexes: [15], count: 1, mean: 250.0, median: 250.0, min: 250.0, max: 250.0, stdDev: 0.0 },
+  { activityKey: 'رفع وتوزيع اسمنت علي الادوار بالونش|طن', nameAr: 'رفع وتوزيع اسمنت على الادوار بالونش', unit: 'طن', templateIndexes: [16], count: 1, mean: 7.0, median: 7.0, min: 7.0, max: 7.0, stdDev: 0.0 },
+  { activityKey: 'رفع وتوزيع رمل علي الادوار بالونش|م3', nameAr: 'رفع وتوزيع رمل على الادوار بالونش', unit: 'م3', templateIndexes: [17], count: 1, mean: 6.0, median: 6.0, min: 6.0, max: 6.0, stdDev: 0.0 },
+  { activityKey: 'مواسير صرف pvc طول القطعه 3م قطر الماسوره حتي 150 مم|م ط', nameAr: 'مواسير صرف PVC طول القطعة 3م قطر الماسورة حتى 150 مم', unit: 'م.ط', templateIndexes: [18], count: 1, mean: 145.6, median: 145.6, min: 145.6, max: 145.6, stdDev: 0.0 },
+  { activityKey: 'مواسير صرف pvc طول القطعه 6م قطر الماسوره حتي 150 مم|م ط', nameAr: 'مواسير صرف PVC طول القطعة 6م قطر الماسورة حتى 150 مم', unit: 'م.ط', templateIndexes: [19], count: 1, mean: 266.4, median: 266.4, min: 266.4, max: 266.4, stdDev: 0.0 },
+  { activityKey: 'مواسير صرف pvc طول القطعه 3م قطر الماسوره حتي 200 مم|م ط', nameAr: 'مواسير صرف PVC طول القطعة 3م قطر الماسورة حتى 200 مم', unit: 'م.ط', templateIndexes: [20], count: 1, mean: 102.4, median: 102.4, min: 102.4, max: 102.4, stdDev: 0.0 },
+  { activityKey: 'مواسير صرف pvc طول القطعه 6م قطر الماسوره حتي 200 مم|م ط', nameAr: 'مواسير صرف PVC طول القطعة 6م قطر الماسورة حتى 200 مم', unit: 'م.ط', templateIndexes: [21], count: 1, mean: 204.8, median: 204.8, min: 204.8, max: 204.8, stdDev: 0.0 },
+  { activityKey: 'مواسير من الفخار والتقفيل بمونه اسمنتيه قطر الماسوره 75 مم|م ط', nameAr: 'مواسير من الفخار والتقفيل بمونة اسمنتية قطر الماسورة 75 مم', unit: 'م.ط', templateIndexes: [22], count: 1, mean: 52.8, median: 52.8, min: 52.8, max: 52.8, stdDev: 0.0 },
+  { activityKey: 'مواسير من الفخار والتقفيل بمونه اسمنتيه قطر الماسوره 100 مم|م ط', nameAr: 'مواسير من الفخار والتقفيل بمونة اسمنتية قطر الماسورة 100 مم', unit: 'م.ط', templateIndexes: [23], count: 1, mean: 49.6, median: 49.6, min: 49.6, max: 49.6, stdDev: 0.0 },
+  { activityKey: 'مواسير من الفخار والتقفيل بمونه اسمنتيه قطر الماسوره 150 مم|م ط', nameAr: 'مواسير من الفخار والتقفيل بمونة اسمنتية قطر الماسورة 150 مم', unit: 'م.ط', templateIndexes: [24], count: 1, mean: 36.0, median: 36.0, min: 36.0, max: 36.0, stdDev: 0.0 },
+  { activityKey: 'مواسير من الفخار والتقفيل بمونه اسمنتيه قطر الماسوره 225 مم|م ط', nameAr: 'مواسير من الفخار والتقفيل بمونة اسمنتية قطر الماسورة 225 مم', unit: 'م.ط', templateIndexes: [25], count: 1, mean: 24.8, median: 24.8, min: 24.8, max: 24.8, stdDev: 0.0 },
+  { activityKey: 'مواسير من الفخار والتقفيل بمونه اسمنتيه قطر الماسوره 300 مم|م ط', nameAr: 'مواسير من الفخار والتقفيل بمونة اسمنتية قطر الماسورة 300 مم', unit: 'م.ط', templateIndexes: [26], count: 1, mean: 19.2, median: 19.2, min: 19.2, max: 19.2, stdDev: 0.0 },
+  { activityKey: 'مواسير من الفخار والتقفيل بمونه اسمنتيه قطر الماسوره اابر 300 مم|م ط', nameAr: 'مواسير من الفخار والتقفيل بمونة اسمنتية قطر الماسورة اآبر 300 مم', unit: 'م.ط', templateIndexes: [27], count: 1, mean: 12.8, median: 12.8, min: 12.8, max: 12.8, stdDev: 0.0 },
+  { activityKey: 'مواسير من الفخار flexible joints قطر الماسوره 75 مم|م ط', nameAr: 'مواسير من الفخار Flexible Joints قطر الماسورة 75 مم', unit: 'م.ط', templateIndexes: [28], count: 1, mean: 100.0, median: 100.0, min: 100.0, max: 100.0, stdDev: 0.0 },
+  { activityKey: 'مواسير من الفخار flexible joints قطر الماسوره 100 مم|م ط', nameAr: 'مواسير من الفخار Flexible Joints قطر الماسورة 100 مم', unit: 'م.ط', templateIndexes: [29], count: 1, mean: 80.0, median: 80.0, min: 80.0, max: 80.0, stdDev: 0.0 },
+  { activityKey: 'مواسير من الفخار flexible joints قطر الماسوره 150 مم|م ط', nameAr: 'مواسير من الفخار Flexible Joints قطر الماسورة 150 مم', unit: 'م.ط', templateIndexes: [30], count: 1, mean: 61.6, median: 61.6, min: 61.6, max: 61.6, stdDev: 0.0 },
+  { activityKey: 'مواسير من الفخار flexible joints قطر الماسوره 225 مم|م ط', nameAr: 'مواسير من الفخار Flexible Joints قطر الماسورة 225 مم', unit: 'م.ط', templateIndexes: [31], count: 1, mean: 32.0, median: 32.0, min: 32.0, max: 32.0, stdDev: 0.0 },
+  { activityKey: 'مواسير من الفخار flexible joints قطر الماسوره 300 مم|م ط', nameAr: 'مواسير من الفخار Flexible Joints قطر الماسورة 300 مم', unit: 'م.ط', templateIndexes: [32], count: 1, mean: 20.0, median: 20.0, min: 20.0, max: 20.0, stdDev: 0.0 },
+  { activityKey: 'مواسير من الفخار flexible joints قطر الماسوره اابر 300 مم|م ط', nameAr: 'مواسير من الفخار Flexible Joints قطر الماسورة اآبر 300 مم', unit: 'م.ط', templateIndexes: [33], count: 1, mean: 16.8, median: 16.8, min: 16.8, max: 16.8, stdDev: 0.0 },
+  { activityKey: 'مواسير خرسانيه طول القطعه 1 5 م قطر الماسوره حتي 375 مم|م ط', nameAr: 'مواسير خرسانية طول القطعة 1.5 م قطر الماسورة حتى 375 مم', unit: 'م.ط', templateIndexes: [34], count: 1, mean: 30.4, median: 30.4, min: 30.4, max: 30.4, stdDev: 0.0 },
+  { activityKey: 'مواسير خرسانيه طول القطعه 1 5 م قطر الماسوره حتي 450 مم|م ط', nameAr: 'مواسير خرسانية طول القطعة 1.5 م قطر الماسورة حتى 450 مم', unit: 'م.ط', templateIndexes: [35], count: 1, mean: 28.8, median: 28.8, min: 28.8, max: 28.8, stdDev: 0.0 },
+  { activityKey: 'مواسير خرسانيه طول القطعه 1 5 م قطر الماسوره حتي 525 مم|م ط', nameAr: 'مواسير خرسانية طول القطعة 1.5 م قطر الماسورة حتى 525 مم', unit: 'م.ط', templateIndexes: [36], count: 1, mean: 27.2, median: 27.2, min: 27.2, max: 27.2, stdDev: 0.0 },
+  { activityKey: 'مواسير خرسانيه طول القطعه 1 5 م قطر الماسوره حتي 600 مم|م ط', nameAr: 'مواسير خرسانية طول القطعة 1.5 م قطر الماسورة حتى 600 مم', unit: 'م.ط', templateIndexes: [37], count: 1, mean: 26.4, median: 26.4, min: 26.4, max: 26.4, stdDev: 0.0 },
+  { activityKey: 'مواسير خرسانيه طول القطعه 1 5 م قطر الماسوره حتي 675 مم|م ط', nameAr: 'مواسير خرسانية طول القطعة 1.5 م قطر الماسورة حتى 675 مم', unit: 'م.ط', templateIndexes: [38], count: 1, mean: 23.2, median: 23.2, min: 23.2, max: 23.2, stdDev: 0.0 },
+  { activityKey: 'مواسير خرسانيه طول القطعه 1 5 م قطر الماسوره حتي 750 مم|م ط', nameAr: 'مواسير خرسانية طول القطعة 1.5 م قطر الماسورة حتى 750 مم', unit: 'م.ط', templateIndexes: [39], count: 1, mean: 20.0, median: 20.0, min: 20.0, max: 20.0, stdDev: 0.0 },
+  { activityKey: 'مواسير خرسانيه طول القطعه 1 5 م قطر الماسوره حتي 1500 مم|م ط', nameAr: 'مواسير خرسانية طول القطعة 1.5 م قطر الماسورة حتى 1500 مم', unit: 'م.ط', templateIndexes: [40], count: 1, mean: 2.5, median: 2.5, min: 2.5, max: 2.5, stdDev: 0.0 },
+  { activityKey: 'مواسير خرسانيه طول القطعه 1 5 م قطر الماسوره حتي 1800 مم|م ط', nameAr: 'مواسير خرسانية طول القطعة 1.5 م قطر الماسورة حتى 1800 مم', unit: 'م.ط', templateIndexes: [41], count: 1, mean: 2.1, median: 2.1, min: 2.1, max: 2.1, stdDev: 0.0 },
+  { activityKey: 'مواسير خرسانيه طول القطعه 2 5 م قطر الماسوره حتي 375 مم|م ط', nameAr: 'مواسير خرسانية طول القطعة 2.5 م قطر الماسورة حتى 375 مم', unit: 'م.ط', templateIndexes: [42], count: 1, mean: 40.0, median: 40.0, min: 40.0, max: 40.0, stdDev: 0.0 },
+  { activityKey: 'مواسير خرسانيه طول القطعه 2 5 م قطر الماسوره حتي 450 مم|م ط', nameAr: 'مواسير خرسانية طول القطعة 2.5 م قطر الماسورة حتى 450 مم', unit: 'م.ط', templateIndexes: [43], count: 1, mean: 36.0, median: 36.0, min: 36.0, max: 36.0, stdDev: 0.0 },
+  { activityKey: 'مواسير خرسانيه طول القطعه 2 5 م قطر الماسوره حتي 525 مم|م ط', nameAr: 'مواسير خرسانية طول القطعة 2.5 م قطر الماسورة حتى 525 مم', unit: 'م.ط', templateIndexes: [44], count: 1, mean: 32.8, median: 32.8, min: 32.8, max: 32.8, stdDev: 0.0 },
+  { activityKey: 'مواسير خرسانيه طول القطعه 2 5 م قطر الماسوره حتي 600 مم|م ط', nameAr: 'مواسير خرسانية طول القطعة 2.5 م قطر الماسورة حتى 600 مم', unit: 'م.ط', templateIndexes: [45], count: 1, mean: 32.0, median: 32.0, min: 32.0, max: 32.0, stdDev: 0.0 },
+  { activityKey: 'مواسير خرسانيه طول القطعه 2 5 م قطر الماسوره حتي 675 مم|م ط', nameAr: 'مواسير خرسانية طول القطعة 2.5 م قطر الماسورة حتى 675 مم', unit: 'م.ط', templateIndexes: [46], count: 1, mean: 29.6, median: 29.6, min: 29.6, max: 29.6, stdDev: 0.0 },
+  { activityKey: 'مواسير خرسانيه طول القطعه 2 5 م قطر الماسوره حتي 750 مم|م ط', nameAr: 'مواسير خرسانية طول القطعة 2.5 م قطر الماسورة حتى 750 مم', unit: 'م.ط', templateIndexes: [47], count: 1, mean: 28.8, median: 28.8, min: 28.8, max: 28.8, stdDev: 0.0 },
+  { activityKey: 'مواسير upvc قطر 75 مم|م ط', nameAr: 'مواسير UPVC قطر 75 مم', unit: 'م.ط', templateIndexes: [48], count: 1, mean: 26.4, median: 26.4, min: 26.4, max: 26.4, stdDev: 0.0 },
+  { activityKey: 'مواسير upvc fittings قطر 75 مم|عدد', nameAr: 'مواسير UPVC Fittings قطر 75 مم', unit: 'عدد', templateIndexes: [49], count: 1, mean: 24.8, median: 24.8, min: 24.8, max: 24.8, stdDev: 0.0 },
+  { activityKey: 'مواسير cast iron قطر 75 مم|م ط', nameAr: 'مواسير Cast Iron قطر 75 مم', unit: 'م.ط', templateIndexes: [50], count: 1, mean: 16.8, median: 16.8, min: 16.8, max: 16.8, stdDev: 0.0 },
+  { activityKey: 'مواسير cast iron fittings قطر 75 مم|عدد', nameAr: 'مواسير Cast Iron Fittings قطر 75 مم', unit: 'عدد', templateIndexes: [51], count: 1, mean: 17.6, median: 17.6, min: 17.6, max: 17.6, stdDev: 0.0 },
+  { activityKey: 'تركيب كابل كابل واحد في خندق مع حمايه|م', nameAr: 'تركيب كابل، كابل واحد في خندق مع حماية', unit: 'م', templateIndexes: [52], count: 1, mean: 49.6, median: 49.6, min: 49.6, max: 49.6, stdDev: 0.0 },
+  { activityKey: 'تركيب كابل كابلان في خندق مع حمايه|م', nameAr: 'تركيب كابل، كابلان في خندق مع حماية', unit: 'م', templateIndexes: [53], count: 1, mean: 44.8, median: 44.8, min: 44.8, max: 44.8, stdDev: 0.0 },
+  { activityKey: 'تركيب كابل 5 كابلات في خندق مع حمايه|م', nameAr: 'تركيب كابل، 5 كابلات في خندق مع حماية', unit: 'م', templateIndexes: [54], count: 1, mean: 34.4, median: 34.4, min: 34.4, max: 34.4, stdDev: 0.0 },
+  { activityKey: 'تركيب كابل 7 كابلات في خندق مع حمايه|م', nameAr: 'تركيب كابل، 7 كابلات في خندق مع حماية', unit: 'م', templateIndexes: [55], count: 1, mean: 29.6, median: 29.6, min: 29.6, max: 29.6, stdDev: 0.0 },
+  { activityKey: 'تركيب كابل 8 كابلات في خندق مع حمايه|م', nameAr: 'تركيب كابل، 8 كابلات في خندق مع حماية', unit: 'م', templateIndexes: [56], count: 1, mean: 28.0, median: 28.0, min: 28.0, max: 28.0, stdDev: 0.0 },
+  { activityKey: 'تركيب كابل كابلان في خندق مع حمايه قطر 100 مم|م', nameAr: 'تركيب كابل، كابلان في خندق مع حماية، قطر 100 مم', unit: 'م', templateIndexes: [57], count: 1, mean: 14.4, median: 14.4, min: 14.4, max: 14.4, stdDev: 0.0 },
+  { activityKey: 'تركيب كابل كابلان في خندق مع حمايه قطر 135 مم|م', nameAr: 'تركيب كابل، كابلان في خندق مع حماية، قطر 135 مم', unit: 'م', templateIndexes: [58], count: 1, mean: 12.8, median: 12.8, min: 12.8, max: 12.8, stdDev: 0.0 },
+  { activityKey: 'تركيب كابل 3 كابلات في خندق مع حمايه قطر 100 مم|م', nameAr: 'تركيب كابل، 3 كابلات في خندق مع حماية، قطر 100 مم', unit: 'م', templateIndexes: [59], count: 1, mean: 8.0, median: 8.0, min: 8.0, max: 8.0, stdDev: 0.0 },
+  { activityKey: 'تركيب كابل 6 كابلات في خندق مع حمايه قطر 100 مم|م', nameAr: 'تركيب كابل، 6 كابلات في خندق مع حماية، قطر 100 مم', unit: 'م', templateIndexes: [60], count: 1, mean: 5.6, median: 5.6, min: 5.6, max: 5.6, stdDev: 0.0 },
+  { activityKey: 'تركيب كابل 4 كابلات في خندق مع حمايه قطر 150 مم|م', nameAr: 'تركيب كابل، 4 كابلات في خندق مع حماية، قطر 150 مم', unit: 'م', templateIndexes: [61], count: 1, mean: 9.6, median: 9.6, min: 9.6, max: 9.6, stdDev: 0.0 },
+  { activityKey: 'تركيب كابل 36 كابل في خندق مع حمايه قطر 100 مم|م', nameAr: 'تركيب كابل، 36 كابل في خندق مع حماية، قطر 100 مم', unit: 'م', templateIndexes: [62], count: 1, mean: 1.6, median: 1.6, min: 1.6, max: 1.6, stdDev: 0.0 },
+  { activityKey: 'تركيب كابل 10 كابلات في خندق مع حمايه قطر 100 مم|م', nameAr: 'تركيب كابل، 10 كابلات في خندق مع حماية، قطر 100 مم', unit: 'م', templateIndexes: [63], count: 1, mean: 4.0, median: 4.0, min: 4.0, max: 4.0, stdDev: 0.0 },
+  { activityKey: 'تركيب كابل كابل واحد في خندق مع حمايه قطر 300 مم|م', nameAr: 'تركيب كابل، كابل واحد في خندق مع حماية، قطر 300 مم', unit: 'م', templateIndexes: [64], count: 1, mean: 10.4, median: 10.4, min: 10.4, max: 10.4, stdDev: 0.0 },
+  { activityKey: 'steel frame and roof members|طن', nameAr: 'Steel Frame and Roof Members', unit: 'طن', templateIndexes: [65], count: 1, mean: 4.6, median: 4.6, min: 4.6, max: 4.6, stdDev: 0.0 },
+  { activityKey: 'wall frame bow string truss and frame|طن', nameAr: 'Wall Frame, Bow String Truss and Frame', unit: 'طن', templateIndexes: [66], count: 1, mean: 1.6, median: 1.6, min: 1.6, max: 1.6, stdDev: 0.0 },
+  { activityKey: 'roof frame curved truss and frame|طن', nameAr: 'Roof Frame, Curved Truss and Frame', unit: 'طن', templateIndexes: [67], count: 1, mean: 5.2, median: 5.2, min: 5.2, max: 5.2, stdDev: 0.0 },
+  { activityKey: 'wall frame glazed frame and atrium|طن', nameAr: 'Wall Frame, Glazed Frame and Atrium', unit: 'طن', templateIndexes: [68], count: 1, mean: 0.3, median: 0.3, min: 0.3, max: 0.3, stdDev: 0.0 },
+  { activityKey: 'horizontal heavy duty strutting|عدد', nameAr: 'Horizontal heavy duty strutting', unit: 'عدد', templateIndexes: [69], count: 1, mean: 2.0, median: 2.0, min: 2.0, max: 2.0, stdDev: 0.0 },
+  { activityKey: 'diagonal heavy duty strutting|عدد', nameAr: 'Diagonal heavy duty strutting', unit: 'عدد', templateIndexes: [70], count: 1, mean: 6.0, median: 6.0, min: 6.0, max: 6.0, stdDev: 0.0 },
+  { activityKey: 'metal decking large areas|م2', nameAr: 'Metal Decking, large areas', unit: 'م2', templateIndexes: [71], count: 1, mean: 70.0, median: 70.0, min: 70.0, max: 70.0, stdDev: 0.0 },
+  { activityKey: 'metal decking small or complicated|م2', nameAr: 'Metal Decking, small or complicated', unit: 'م2', templateIndexes: [72], count: 1, mean: 28.0, median: 28.0, min: 28.0, max: 28.0, stdDev: 0.0 },
+  { activityKey: 'تركيب ابواب و شابيبك|كجم', nameAr: 'تركيب ابواب و شابيبك', unit: 'كجم', templateIndexes: [73], count: 1, mean: 150.0, median: 150.0, min: 150.0, max: 150.0, stdDev: 0.0 },
+  { activityKey: 'windows steel 1 0 3 0m2|عدد', nameAr: 'Windows, Steel, 1.0-3.0m2', unit: 'عدد', templateIndexes: [74], count: 1, mean: 9.6, median: 9.6, min: 9.6, max: 9.6, stdDev: 0.0 },
+  { activityKey: 'windows steel 3 0 7 0m2|عدد', nameAr: 'Windows, Steel, 3.0-7.0m2', unit: 'عدد', templateIndexes: [75], count: 1, mean: 4.8, median: 4.8, min: 4.8, max: 4.8, stdDev: 0.0 },
+  { activityKey: 'windows steel 7 0 10 0m2|عدد', nameAr: 'Windows, Steel, 7.0-10.0m2', unit: 'عدد', templateIndexes: [76], count: 1, mean: 2.4, median: 2.4, min: 2.4, max: 2.4, stdDev: 0.0 },
+  { activityKey: 'تركيب اعمال معدنيه للاسوار والبلكونات|كجم', nameAr: 'تركيب اعمال معدنية للاسوار والبلكونات', unit: 'كجم', templateIndexes: [77], count: 1, mean: 150.0, median: 150.0, min: 150.0, max: 150.0, stdDev: 0.0 },
+  { activityKey: 'تركيب اعمال معدنيه للاسوار والبلكونات|م ط', nameAr: 'تركيب اعمال معدنية للاسوار والبلكونات', unit: 'م.ط', templateIndexes: [78], count: 1, mean: 20.0, median: 20.0, min: 20.0, max: 20.0, stdDev: 0.0 },
+  { activityKey: 'تركيب اعمال معدنيه للدرابزين والادراج|كجم', nameAr: 'تركيب اعمال معدنية للدرابزين والادراج', unit: 'كجم', templateIndexes: [79], count: 1, mean: 100.0, median: 100.0, min: 100.0, max: 100.0, stdDev: 0.0 },
+  { activityKey: 'تركيب باب جرار|كجم', nameAr: 'تركيب باب جرار', unit: 'كجم', templateIndexes: [80], count: 1, mean: 150.0, median: 150.0, min: 150.0, max: 150.0, stdDev: 0.0 },
+  { activityKey: 'تصنيع خزان سمااه 2 1 5 مم|كجم', nameAr: 'تصنيع خزان سماآة 2-1.5 مم', unit: 'كجم', templateIndexes: [81], count: 1, mean: 80.0, median: 80.0, min: 80.0, max: 80.0, stdDev: 0.0 },
+  { activityKey: 'تصنيع خزانات 3 مم|كجم', nameAr: 'تصنيع خزانات 3 مم', unit: 'كجم', templateIndexes: [82], count: 1, mean: 120.0, median: 120.0, min: 120.0, max: 120.0, stdDev: 0.0 },
+  { activityKey: 'تصنيع وتركيب زاويه معدنيه لفواصل التمدد|م ط', nameAr: 'تصنيع وتركيب زاوية معدنية لفواصل التمدد', unit: 'م.ط', templateIndexes: [83], count: 1, mean: 40.0, median: 40.0, min: 40.0, max: 40.0, stdDev: 0.0 },
+  { activityKey: 'قص وتركيب زجاج علي الحديد|م2', nameAr: 'قص وتركيب زجاج على الحديد', unit: 'م2', templateIndexes: [84], count: 1, mean: 9.0, median: 9.0, min: 9.0, max: 9.0, stdDev: 0.0 },
+  { activityKey: 'شبابيك خشب بعد اكتمال اعمال الحوايط|م2', nameAr: 'شبابيك خشب بعد اكتمال أعمال الحوائط', unit: 'م2', templateIndexes: [85], count: 1, mean: 16.0, median: 16.0, min: 16.0, max: 16.0, stdDev: 0.0 },
+  { activityKey: 'تزجيج النوافذ زجاج مفرد|م2', nameAr: 'تزجيج النوافذ – زجاج مفرد', unit: 'م2', templateIndexes: [86], count: 1, mean: 16.0, median: 16.0, min: 16.0, max: 16.0, stdDev: 0.0 },
+  { activityKey: 'تزجيج النوافذ زجاج مزدوج|م2', nameAr: 'تزجيج النوافذ – زجاج مزدوج', unit: 'م2', templateIndexes: [87], count: 1, mean: 10.4, median: 10.4, min: 10.4, max: 10.4, stdDev: 0.0 },
+  { activityKey: 'حلق ابواب من 1 0 الي 3 0 م2|عدد', nameAr: 'حلق أبواب من 1.0 إلى 3.0 م²', unit: 'عدد', templateIndexes: [88], count: 1, mean: 1.6, median: 1.6, min: 1.6, max: 1.6, stdDev: 0.0 },
+  { activityKey: 'حلق ابواب من 3 0 الي 7 0 م2|عدد', nameAr: 'حلق أبواب من 3.0 إلى 7.0 م²', unit: 'عدد', templateIndexes: [89], count: 1, mean: 3.2, median: 3.2, min: 3.2, max: 3.2, stdDev: 0.0 },
+  { activityKey: 'حلق ابواب من 7 0 الي 10 0 م2|عدد', nameAr: 'حلق أبواب من 7.0 إلى 10.0 م²', unit: 'عدد', templateIndexes: [90], count: 1, mean: 6.4, median: 6.4, min: 6.4, max: 6.4, stdDev: 0.0 },
+  { activityKey: 'شبابيك خشب لين من 1 0 الي 3 0 م2|عدد', nameAr: 'شبابيك خشب لين من 1.0 إلى 3.0 م²', unit: 'عدد', templateIndexes: [91], count: 1, mean: 1.7, median: 1.7, min: 1.7, max: 1.7, stdDev: 0.0 },
+  { activityKey: 'شبابيك من 3 0 الي 7 0 م2|عدد', nameAr: 'شبابيك من 3.0 إلى 7.0 م²', unit: 'عدد', templateIndexes: [92], count: 1, mean: 3.2, median: 3.2, min: 3.2, max: 3.2, stdDev: 0.0 },
+  { activityKey: 'شبابيك من 7 0 الي 10 0 م2|عدد', nameAr: 'شبابيك من 7.0 إلى 10.0 م²', unit: 'عدد', templateIndexes: [93], count: 1, mean: 7.2, median: 7.2, min: 7.2, max: 7.2, stdDev: 0.0 },
+  { activityKey: 'عتب خشب|م', nameAr: 'عتب خشب', unit: 'م', templateIndexes: [94], count: 1, mean: 97.6, median: 97.6, min: 97.6, max: 97.6, stdDev: 0.0 },
+  { activityKey: 'تعليق الابواب المفصلات والاكسسوارات|عدد', nameAr: 'تعليق الأبواب (المفصلات والإكسسوارات)', unit: 'عدد', templateIndexes: [95], count: 1, mean: 7.2, median: 7.2, min: 7.2, max: 7.2, stdDev: 0.0 },
+  { activityKey: 'التخريم في الباب وتركيب الكالون|عدد', nameAr: 'التخريم في الباب وتركيب الكالون', unit: 'عدد', templateIndexes: [96], count: 1, mean: 5.0, median: 5.0, min: 5.0, max: 5.0, stdDev: 0.0 },
+  { activityKey: 'تركيب نظام فواصل دورات المياه الواح الفصل|عدد', nameAr: 'تركيب نظام فواصل دورات المياه – ألواح الفصل', unit: 'عدد', templateIndexes: [97], count: 1, mean: 6.4, median: 6.4, min: 6.4, max: 6.4, stdDev: 0.0 },
+  { activityKey: 'تركيب نظام فواصل دورات المياه الالواح الاماميه للحايط|عدد', nameAr: 'تركيب نظام فواصل دورات المياه – الألواح الأمامية للحائط', unit: 'عدد', templateIndexes: [98], count: 1, mean: 5.6, median: 5.6, min: 5.6, max: 5.6, stdDev: 0.0 },
+  { activityKey: 'تركيب نظام فواصل دورات المياه باب مفصلي مثبت بالحايط|عدد', nameAr: 'تركيب نظام فواصل دورات المياه – باب مفصلي مثبت بالحائط', unit: 'عدد', templateIndexes: [99], count: 1, mean: 4.8, median: 4.8, min: 4.8, max: 4.8, stdDev: 0.0 },
+  { activityKey: 'ابواب وشبابيك جراره او مفصلات|م2', nameAr: 'ابواب وشبابيك جرارة او مفصلات', unit: 'م2', templateIndexes: [100], count: 1, mean: 3.0, median: 3.0, min: 3.0, max: 3.0, stdDev: 0.0 },
+  { activityKey: 'قواطع المنيوم ثابته|م2', nameAr: 'قواطع المنيوم ثابتة', unit: 'م2', templateIndexes: [101], count: 1, mean: 4.0, median: 4.0, min: 4.0, max: 4.0, stdDev: 0.0 },
+  { activityKey: 'درابزين المنيوم|م2', nameAr: 'درابزين المنيوم', unit: 'م2', templateIndexes: [102], count: 1, mean: 6.0, median: 6.0, min: 6.0, max: 6.0, stdDev: 0.0 },
+  { activityKey: 'شبابيك الومنيوم من 1 0 الي 3 0 م2|عدد', nameAr: 'شبابيك ألومنيوم من 1.0 إلى 3.0 م²', unit: 'عدد', templateIndexes: [103], count: 1, mean: 6.4, median: 6.4, min: 6.4, max: 6.4, stdDev: 0.0 },
+  { activityKey: 'شبابيك الومنيوم من 3 0 الي 7 0 م2|عدد', nameAr: 'شبابيك ألومنيوم من 3.0 إلى 7.0 م²', unit: 'عدد', templateIndexes: [104], count: 1, mean: 3.2, median: 3.2, min: 3.2, max: 3.2, stdDev: 0.0 },
+  { activityKey: 'شبابيك الومنيوم من 7 0 الي 10 0 م2|عدد', nameAr: 'شبابيك ألومنيوم من 7.0 إلى 10.0 م²', unit: 'عدد', templateIndexes: [105], count: 1, mean: 2.4, median: 2.4, min: 2.4, max: 2.4, stdDev: 0.0 },
+  { activityKey: 'وزره الومنيوم مثبته بالمسامير علي مسافات 150 300 مم|م', nameAr: 'وزرة ألومنيوم مثبتة بالمسامير على مسافات 150–300 مم', unit: 'م', templateIndexes: [106], count: 1, mean: 60.0, median: 60.0, min: 60.0, max: 60.0, stdDev: 0.0 },
+  { activityKey: 'حوايط ستاير زجاجيه المرحله الاولي|م2', nameAr: 'حوائط ستائر زجاجية – المرحلة الأولى', unit: 'م2', templateIndexes: [107], count: 1, mean: 9.6, median: 9.6, min: 9.6, max: 9.6, stdDev: 0.0 },
+  { activityKey: 'حوايط ستاير زجاجيه المرحله الثانيه|م2', nameAr: 'حوائط ستائر زجاجية – المرحلة الثانية', unit: 'م2', templateIndexes: [108], count: 1, mean: 8.8, median: 8.8, min: 8.8, max: 8.8, stdDev: 0.0 },
+  { activityKey: 'حوايط ستاير زجاجيه عاليه الجوده تركيب ثلاثي المراحل|م2', nameAr: 'حوائط ستائر زجاجية عالية الجودة – تركيب ثلاثي المراحل', unit: 'م2', templateIndexes: [109], count: 1, mean: 25.0, median: 25.0, min: 25.0, max: 25.0, stdDev: 0.0 },
+  { activityKey: 'تركيب واجهات المنيوم مستمره|م2', nameAr: 'تركيب واجهات المنيوم مستمرة', unit: 'م2', templateIndexes: [110], count: 1, mean: 3.0, median: 3.0, min: 3.0, max: 3.0, stdDev: 0.0 },
+  { activityKey: 'بلاطات خرسانيه علي طبقه رمل مدموكه|م2', nameAr: 'بلاطات خرسانية على طبقة رمل مدموكة', unit: 'م2', templateIndexes: [111], count: 1, mean: 20.0, median: 20.0, min: 20.0, max: 20.0, stdDev: 0.0 },
+  { activityKey: 'بلاطات خرسانيه علي طبقه مونه اسمنتيه|م2', nameAr: 'بلاطات خرسانية على طبقة مونة اسمنتية', unit: 'م2', templateIndexes: [112], count: 1, mean: 10.0, median: 10.0, min: 10.0, max: 10.0, stdDev: 0.0 },
+  { activityKey: 'اعمال حجر بازلت علي مونه اسمنتيه|م2', nameAr: 'اعمال حجر بازلت على مونة اسمنتية', unit: 'م2', templateIndexes: [113], count: 1, mean: 2.0, median: 2.0, min: 2.0, max: 2.0, stdDev: 0.0 },
+  { activityKey: 'اعمال الحجر الصناعي علي فرشه رمل|م2', nameAr: 'اعمال الحجر الصناعى على فرشة رمل', unit: 'م2', templateIndexes: [114], count: 1, mean: 20.0, median: 20.0, min: 20.0, max: 20.0, stdDev: 0.0 },
+  { activityKey: 'اعمال بلاطات طوب|م2', nameAr: 'أعمال بلاطات طوب', unit: 'م2', templateIndexes: [115], count: 1, mean: 9.0, median: 9.0, min: 9.0, max: 9.0, stdDev: 0.0 },
+  { activityKey: 'ممرات حصويه شامله تجهيز طبقه الاساس|م2', nameAr: 'ممرات حصوية شاملة تجهيز طبقة الأساس', unit: 'م2', templateIndexes: [116], count: 1, mean: 84.0, median: 84.0, min: 84.0, max: 84.0, stdDev: 0.0 },
+  { activityKey: 'فرش طبقه الرمل وتسويتها فبل وضع النجيله|م2', nameAr: 'فرش طبقة الرمل وتسويتها فبل وضع النجيلة', unit: 'م2', templateIndexes: [117], count: 1, mean: 20.0, median: 20.0, min: 20.0, max: 20.0, stdDev: 0.0 },
+  { activityKey: 'تركيب طبقات النجيله|م2', nameAr: 'تركيب طبقات النجيلة', unit: 'م2', templateIndexes: [118], count: 1, mean: 130.0, median: 130.0, min: 130.0, max: 130.0, stdDev: 0.0 },
+  { activityKey: 'زرع شجر بطول 75 سم|عدد', nameAr: 'زرع شجر بطول 75 سم', unit: 'عدد', templateIndexes: [119], count: 1, mean: 32.0, median: 32.0, min: 32.0, max: 32.0, stdDev: 0.0 },
+  { activityKey: 'زرع شجر بطول اابر 75 سم|عدد', nameAr: 'زرع شجر بطول اآبر 75 سم', unit: 'عدد', templateIndexes: [120], count: 1, mean: 12.0, median: 12.0, min: 12.0, max: 12.0, stdDev: 0.0 },
+  { activityKey: 'مصعد هيدروليكي تركيب من 2 الي 3 ادوار|دور', nameAr: 'مصعد هيدروليكي – تركيب من 2 إلى 3 أدوار', unit: 'دور', templateIndexes: [121], count: 1, mean: 3.0, median: 3.0, min: 3.0, max: 3.0, stdDev: 0.0 },
+  { activityKey: 'مصعد هيدروليكي تركيب 4 ادوار فاكثر|دور', nameAr: 'مصعد هيدروليكي – تركيب 4 أدوار فأكثر', unit: 'دور', templateIndexes: [122], count: 1, mean: 2.0, median: 2.0, min: 2.0, max: 2.0, stdDev: 0.0 },
+  { activityKey: 'مصعد عادي تصنيع واختبار وتسليم|عدد', nameAr: 'مصعد عادي – تصنيع واختبار وتسليم', unit: 'عدد', templateIndexes: [123], count: 1, mean: 12.0, median: 12.0, min: 12.0, max: 12.0, stdDev: 0.0 },
+  { activityKey: 'نوع ترس truss التركيب الكامل باستثناء الاعمال المعماريه|عدد', nameAr: 'نوع ترس (Truss) – التركيب الكامل (باستثناء الأعمال المعمارية)', unit: 'عدد', templateIndexes: [124], count: 1, mean: 60.0, median: 60.0, min: 60.0, max: 60.0, stdDev: 0.0 },
+  { activityKey: 'نوع ترس truss تصنيع واختبار وتسليم|عدد', nameAr: 'نوع ترس (Truss) – تصنيع واختبار وتسليم', unit: 'عدد', templateIndexes: [125], count: 1, mean: 1.0, median: 1.0, min: 1.0, max: 1.0, stdDev: 0.0 },
+  { activityKey: 'نوع ترس truss المرحله a تجميع الهيكل المعدني|عدد', nameAr: 'نوع ترس (Truss) – المرحلة A تجميع الهيكل المعدني', unit: 'عدد', templateIndexes: [126], count: 1, mean: 6.0, median: 6.0, min: 6.0, max: 6.0, stdDev: 0.0 },
+  { activityKey: 'نوع ترس truss ايقاف الاعمال لاستكمال التشطيبات المحيطه|عدد', nameAr: 'نوع ترس (Truss) – إيقاف الأعمال لاستكمال التشطيبات المحيطة', unit: 'عدد', templateIndexes: [127], count: 1, mean: 5.0, median: 5.0, min: 5.0, max: 5.0, stdDev: 0.0 },
+  { activityKey: 'نوع ترس truss المرحله b تركيب الارضيات والزجاج وغيرها|عدد', nameAr: 'نوع ترس (Truss) – المرحلة B تركيب الأرضيات والزجاج وغيرها', unit: 'عدد', templateIndexes: [128], count: 1, mean: 2.0, median: 2.0, min: 2.0, max: 2.0, stdDev: 0.0 },
+  { activityKey: 'نوع ترس truss المرحله c اختبارات الاداء|عدد', nameAr: 'نوع ترس (Truss) – المرحلة C اختبارات الأداء', unit: 'عدد', templateIndexes: [129], count: 1, mean: 2.0, median: 2.0, min: 2.0, max: 2.0, stdDev: 0.0 },
+  { activityKey: 'نوع ترس truss المرحله d اختبار التحميل الكامل|عدد', nameAr: 'نوع ترس (Truss) – المرحلة D اختبار التحميل الكامل', unit: 'عدد', templateIndexes: [130], count: 1, mean: 2.0, median: 2.0, min: 2.0, max: 2.0, stdDev: 0.0 }
+];
+
+const activityByTemplate: number[] = [];
+activityProductivityStats.forEach((stats, activity) => {
+  for (const i of stats.templateIndexes) activityByTemplate[i] = activity;
+});
+
 // ========================================
 // Helper Functions
 // ========================================
 
 export function getTemplateById(id: string): ProductivityTemplate | undefined {
-  return productivityTemplates.find(t => t.id === id);
+  const index = templateIndexById.get(id);
+  return index === undefined ? undefined : templateAt(index);
 }
 
 export function getTemplateByCode(code: string): ProductivityTemplate | undefined {
-  return productivityTemplates.find(t => t.code === code);
+  const index = templateIndexByCode.get(code);
+  return index === undefined ? undefined : templateAt(index);
 }
 
 export function getTemplatesByCategory(categoryId: string): ProductivityTemplate[] {
-  return productivityTemplates.filter(t => t.categoryId === categoryId && t.isActive);
+  return templatesInRuns(activeRunsByCategory.get(categoryId));
 }
 
 export function getTemplatesBySource(source: ProductivitySource): ProductivityTemplate[] {
-  return productivityTemplates.filter(t => t.source === source && t.isActive);
+  return templatesInRuns(activeRunsBySource.get(source));
 }
 
 export function searchTemplates(query: string): ProductivityTemplate[] {
-  const lowerQuery = query.toLowerCase();
-  return productivityTemplates.filter(t =>
-    t.nameAr.includes(query) ||
-    (t.nameEn?.toLowerCase().includes(lowerQuery))
-  );
+  const normalized = normalizeSearchText(query);
+  if (!normalized) {
+    if (!query.trim()) return productivityTemplates.slice();
+    // Punctuation-only queries ("–", "(") normalize to nothing; match them as typed
+    const lowerQuery = query.toLowerCase();
+    return productivityTemplates.filter(t =>
+      t.nameAr.includes(query) ||
+      (t.nameEn?.toLowerCase().includes(lowerQuery))
+    );
+  }
+
+  // Intersect the postings of every query gram, rarest first, then confirm
+  // the candidates contain the whole query. Queries shorter than a gram
+  // fall back to scanning the normalized keys.
+  let candidates: number[] | null = null;
+  if (normalized.length >= SEARCH_GRAM) {
+    const postings = getSearchPostings();
+    const grams = new Set<string>();
+    for (let i = 0; i + SEARCH_GRAM <= normalized.length; i++) grams.add(normalized.slice(i, i + SEARCH_GRAM));
+    const lists = Array.from(grams, gram => postings.get(gram) ?? []).sort((a, b) => a.length - b.length);
+    for (const list of lists) {
+      candidates = candidates ? intersectSorted(candidates, list) : list;
+      if (candidates.length === 0) return [];
+    }
+  }
+
+  const matches: ProductivityTemplate[] = [];
+  if (candidates) {
+    for (const i of candidates) {
+      if (searchKeys[i].includes(normalized)) matches.push(templateAt(i));
+    }
+  } else {
+    searchKeys.forEach((key, i) => {
+      if (key.includes(normalized)) matches.push(templateAt(i));
+    });
+  }
+  return matches;
 }
 
 export function templateToBOQTemplate(template: ProductivityTemplate): {
@@ -2048,12 +461,19 @@ export interface MultiSourceProductivity {
     crewSize: number;
   }[];
   averageRate: number;
+  stats: ActivityProductivityStats;
+}
+
+export function getActivityStats(code: string): ActivityProductivityStats | undefined {
+  const index = templateIndexByCode.get(code);
+  return index === undefined ? undefined : activityProductivityStats[activityByTemplate[index]];
 }
 
 export function getMultiSourceComparison(code: string): MultiSourceProductivity | null {
-  const templates = productivityTemplates.filter(t => t.code.startsWith(code.split('-').slice(0, 2).join('-')));
-  if (templates.length === 0) return null;
+  const stats = getActivityStats(code);
+  if (!stats) return null;
 
+  const templates = stats.templateIndexes.map(templateAt);
   const primary = templates[0];
   return {
     code: primary.code,
@@ -2064,10 +484,15 @@ export function getMultiSourceComparison(code: string): MultiSourceProductivity
       productivityRate: t.productivityRate,
       crewSize: t.crewSize
     })),
-    averageRate: templates.reduce((sum, t) => sum + t.productivityRate, 0) / templates.length
+    averageRate: stats.mean,
+    stats
   };
 }
 
 // Export count for reference
 export const TOTAL_TEMPLATES = productivityTemplates.length;
-export const ACTIVE_TEMPLATES = productivityTemplates.filter(t => t.isActive).length;
+// Counted from the active runs so the columnar layout does not hydrate every row
+export const ACTIVE_TEMPLATES = Array.from(activeRunsByCategory.values()).reduce(
+  (total, runs) => total + runs.reduce((sum, [, count]) => sum + count, 0),
+  0
+);
@@ -0,0 +1,63 @@
+/**
+ * Productivity templates: أعمال الألومنيوم - Aluminum Works
+ * Generated by scripts/generate-templates.py (11 templates).
+ */
+
+import { hydrateTemplate, lazyTemplates, type TemplateColumns } from './common';
+
+const columns: TemplateColumns = {
+  categoryId: 'aluminum',
+  units: [
+    'م2', 'عدد', 'م'
+  ],
+  sources: [
+    'اعمال الالمونيوم'
+  ],
+  roleCodes: [
+    'LAB-PLUMBER'
+  ],
+  crewDescriptions: [
+    'صناعي'
+  ],
+  crews: [
+    [0, 1, 0]
+  ],
+  crewDailyCosts: [
+    380
+  ],
+  ids: [
+    'ALU-001', 'ALU-002', 'ALU-003', 'ALU-004', 'ALU-005', 'ALU-006', 'ALU-007', 'ALU-008', 'ALU-009', 'ALU-010',
+    'ALU-011'
+  ],
+  codes: [
+    'ALUM-001', 'ALUM-002', 'ALUM-003', 'ALUM-004', 'ALUM-005', 'ALUM-006', 'ALUM-007', 'ALUM-008', 'ALUM-009', 'ALUM-010',
+    'ALUM-011'
+  ],
+  names: [
+    'ابواب وشبابيك جرارة او مفصلات', 'قواطع المنيوم ثابتة', 'درابزين المنيوم', 'شبابيك ألومنيوم من 1.0 إلى 3.0 م²',
+    'شبابيك ألومنيوم من 3.0 إلى 7.0 م²', 'شبابيك ألومنيوم من 7.0 إلى 10.0 م²', 'وزرة ألومنيوم مثبتة بالمسامير على مسافات 150–300 مم', 'حوائط ستائر زجاجية – المرحلة الأولى',
+    'حوائط ستائر زجاجية – المرحلة الثانية', 'حوائط ستائر زجاجية عالية الجودة – تركيب ثلاثي المراحل', 'تركيب واجهات المنيوم مستمرة'
+  ],
+  unit: [
+    0, 0, 0, 1, 1, 1, 2, 0, 0, 0, 0
+  ],
+  source: [
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0
+  ],
+  crew: [
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0
+  ],
+  productivityRate: [
+    3.0, 4.0, 6.0, 6.4, 3.2, 2.4, 60.0, 9.6, 8.8, 25.0,
+    3.0
+  ],
+  laborCostPerUnit: [
+    126.6667, 95, 63.3333, 59.375, 118.75, 158.3333, 6.3333, 39.5833, 43.1818, 15.2,
+    126.6667
+  ],
+  notes: {}
+};
+
+export const { templates, templateAt } = lazyTemplates(columns.ids.length, i => hydrateTemplate(columns, i));
+export const templateIds = columns.ids;
+export const templateCodes = columns.codes;
@@ -0,0 +1,64 @@
+/**
+ * Productivity templates: أعمال الخشب - Carpentry
+ * Generated by scripts/generate-templates.py (15 templates).
+ */
+
+import { hydrateTemplate, lazyTemplates, type TemplateColumns } from './common';
+
+const columns: TemplateColumns = {
+  categoryId: 'carpentry',
+  units: [
+    'م2', 'عدد', 'م'
+  ],
+  sources: [
+    'اعمال الخشب'
+  ],
+  roleCodes: [
+    'LAB-PLUMBER'
+  ],
+  crewDescriptions: [
+    'صناعي'
+  ],
+  crews: [
+    [0, 1, 0]
+  ],
+  crewDailyCosts: [
+    380
+  ],
+  ids: [
+    'CRP-001', 'CRP-002', 'CRP-003', 'CRP-004', 'CRP-005', 'CRP-006', 'CRP-007', 'CRP-008', 'CRP-009', 'CRP-010',
+    'CRP-011', 'CRP-012', 'CRP-013', 'CRP-014', 'CRP-015'
+  ],
+  codes: [
+    'CARP-001', 'CARP-002', 'CARP-003', 'CARP-004', 'CARP-005', 'CARP-006', 'CARP-007', 'CARP-008', 'CARP-009', 'CARP-010',
+    'CARP-011', 'CARP-012', 'CARP-013', 'CARP-014', 'CARP-015'
+  ],
+  names: [
+    'شبابيك خشب بعد اكتمال أعمال الحوائط', 'تزجيج النوافذ – زجاج مفرد', 'تزجيج النوافذ – زجاج مزدوج', 'حلق أبواب من 1.0 إلى 3.0 م²',
+    'حلق أبواب من 3.0 إلى 7.0 م²', 'حلق أبواب من 7.0 إلى 10.0 م²', 'شبابيك خشب لين من 1.0 إلى 3.0 م²', 'شبابيك من 3.0 إلى 7.0 م²',
+    'شبابيك من 7.0 إلى 10.0 م²', 'عتب خشب', 'تعليق الأبواب (المفصلات والإكسسوارات)', 'التخريم في الباب وتركيب الكالون',
+    'تركيب نظام فواصل دورات المياه – ألواح الفصل', 'تركيب نظام فواصل دورات المياه – الألواح الأمامية للحائط', 'تركيب نظام فواصل دورات المياه – باب مفصلي مثبت بالحائط'
+  ],
+  unit: [
+    0, 0, 0, 1, 1, 1, 1, 1, 1, 2, 1, 1, 1, 1, 1
+  ],
+  source: [
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0
+  ],
+  crew: [
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0
+  ],
+  productivityRate: [
+    16.0, 16.0, 10.4, 1.6, 3.2, 6.4, 1.7, 3.2, 7.2, 97.6,
+    7.2, 5.0, 6.4, 5.6, 4.8
+  ],
+  laborCostPerUnit: [
+    23.75, 23.75, 36.5385, 237.5, 118.75, 59.375, 223.5294, 118.75, 52.7778, 3.8934,
+    52.7778, 76, 59.375, 67.8571, 79.1667
+  ],
+  notes: {}
+};
+
+export const { templates, templateAt } = lazyTemplates(columns.ids.length, i => hydrateTemplate(columns, i));
+export const templateIds = columns.ids;
+export const templateCodes = columns.codes;
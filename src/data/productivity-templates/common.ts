@@ -0,0 +1,157 @@
+/**
+ * Productivity template types and row helpers shared by the per-category
+ * modules. Generated by scripts/generate-templates.py.
+ */
+
+import { CREW_RATE_TABLE_VERSION, getCrewRoleByCode } from '@/data/crew-roles';
+
+export interface ProductivityTemplate {
+  id: string;
+  code: string;
+  nameAr: string;
+  nameEn?: string;
+  categoryId: string;
+  unit: string;
+  unitAr: string;
+  productivityRate: number;
+  crewSize: number;
+  crew: CrewMember[];
+  dailyCrewCost?: number;     // sum of crew qty x daily rate
+  laborCostPerUnit?: number;  // dailyCrewCost / productivityRate
+  source: ProductivitySource;
+  sourceRef?: string;
+  notes?: string;
+  isActive: boolean;
+}
+
+export interface CrewMember {
+  roleCode: string;
+  qty: number;
+  description?: string;
+}
+
+export type ProductivitySource =
+  | 'بتروجت'
+  | 'H.A'
+  | 'البقري/النادي'
+  | 'مصادر اخري'
+  | 'متوسط'
+  | 'اعمال تخديميه'
+  | 'تركيب المواسير'
+  | 'اعمال الكهرباء'
+  | 'اعمال الحديد'
+  | 'الاعمال المعدنيه'
+  | 'اعمال الخشب'
+  | 'اعمال الالمونيوم'
+  | 'اعمال الاند اسكيب'
+  | 'اعمال الاسانسير';
+
+// Crew rate table the dailyCrewCost/laborCostPerUnit columns were computed from
+export const TEMPLATE_CREW_RATES_VERSION = 'c43ef805';
+
+function hasCurrentCrewCosts(template: ProductivityTemplate): boolean {
+  return template.dailyCrewCost !== undefined && TEMPLATE_CREW_RATES_VERSION === CREW_RATE_TABLE_VERSION;
+}
+
+/**
+ * Daily crew cost of a template: the generated column while crew-roles.ts
+ * still has the rates it was computed from, otherwise summed per member.
+ */
+export function getDailyCrewCost(template: ProductivityTemplate): number {
+  if (hasCurrentCrewCosts(template)) return template.dailyCrewCost!;
+  return template.crew.reduce(
+    (sum, member) => sum + (getCrewRoleByCode(member.roleCode)?.dailyRate ?? 0) * member.qty,
+    0
+  );
+}
+
+export function getLaborCostPerUnit(template: ProductivityTemplate): number {
+  if (hasCurrentCrewCosts(template) && template.laborCostPerUnit !== undefined) return template.laborCostPerUnit;
+  return template.productivityRate > 0 ? getDailyCrewCost(template) / template.productivityRate : 0;
+}
+
+/**
+ * One category's templates stored column-wise: units, sources, role codes,
+ * crew descriptions and whole crews are interned into tables, and the
+ * per-template columns hold positions in them.
+ */
+export interface TemplateColumns {
+  categoryId: string;
+  units: string[];
+  sources: ProductivitySource[];
+  roleCodes: string[];
+  crewDescriptions: string[];
+  crews: number[][];          // flat [role, qty, description] triples
+  crewDailyCosts: number[];
+  ids: string[];
+  codes: string[];
+  names: string[];
+  unit: number[];
+  source: number[];
+  crew: number[];
+  productivityRate: number[];
+  laborCostPerUnit: number[];
+  notes: Record<number, string>;
+}
+
+export function hydrateTemplate(columns: TemplateColumns, i: number): ProductivityTemplate {
+  const crew: CrewMember[] = [];
+  const members = columns.crews[columns.crew[i]];
+  for (let m = 0; m < members.length; m += 3) {
+    crew.push({
+      roleCode: columns.roleCodes[members[m]],
+      qty: members[m + 1],
+      description: columns.crewDescriptions[members[m + 2]]
+    });
+  }
+  const unit = columns.units[columns.unit[i]];
+  const source = columns.sources[columns.source[i]];
+  return {
+    id: columns.ids[i],
+    code: columns.codes[i],
+    nameAr: columns.names[i],
+    categoryId: columns.categoryId,
+    unit,
+    unitAr: unit,
+    productivityRate: columns.productivityRate[i],
+    crewSize: crew.length ? crew.reduce((sum, member) => sum + member.qty, 0) : 1,
+    crew,
+    dailyCrewCost: columns.crewDailyCosts[columns.crew[i]],
+    laborCostPerUnit: columns.laborCostPerUnit[i],
+    source,
+    sourceRef: source,
+    ...(i in columns.notes ? { notes: columns.notes[i] } : {}),
+    isActive: true
+  };
+}
+
+export interface LazyTemplates {
+  templates: ProductivityTemplate[];
+  templateAt: (i: number) => ProductivityTemplate;
+}
+
+/**
+ * An array view over `count` rows built by `build` on first access and
+ * cached, so every access returns the same object. Indexing, iteration and
+ * array methods all go through the cache.
+ */
+export function lazyTemplates(count: number, build: (i: number) => ProductivityTemplate): LazyTemplates {
+  const rows: (ProductivityTemplate | undefined)[] = new Array(count).fill(undefined);
+
+  function templateAt(i: number): ProductivityTemplate {
+    let template = rows[i];
+    if (template === undefined) template = rows[i] = build(i);
+    return template;
+  }
+
+  const templates = new Proxy(rows as ProductivityTemplate[], {
+    get(target, key, receiver) {
+      // Built rows and array members resolve directly; only unbuilt rows are parsed as indexes
+      const value = Reflect.get(target, key, receiver);
+      if (value !== undefined || typeof key !== 'string') return value;
+      const i = Number(key);
+      return Number.isInteger(i) && i >= 0 && i < count && String(i) === key ? templateAt(i) : value;
+    }
+  });
+  return { templates, templateAt };
+}
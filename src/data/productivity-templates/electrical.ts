@@ -0,0 +1,64 @@
+/**
+ * Productivity templates: أعمال الكهرباء - Electrical Works
+ * Generated by scripts/generate-templates.py (13 templates).
+ */
+
+import { hydrateTemplate, lazyTemplates, type TemplateColumns } from './common';
+
+const columns: TemplateColumns = {
+  categoryId: 'electrical',
+  units: [
+    'م'
+  ],
+  sources: [
+    'اعمال الكهرباء'
+  ],
+  roleCodes: [
+    'LAB-ELECTRICIAN', 'LAB-ELECTRICIAN-ASST'
+  ],
+  crewDescriptions: [
+    'كهربائي', 'مساعد'
+  ],
+  crews: [
+    [0, 1, 0, 1, 2, 1]
+  ],
+  crewDailyCosts: [
+    780
+  ],
+  ids: [
+    'ELE-001', 'ELE-002', 'ELE-003', 'ELE-004', 'ELE-005', 'ELE-006', 'ELE-007', 'ELE-008', 'ELE-009', 'ELE-010',
+    'ELE-011', 'ELE-012', 'ELE-013'
+  ],
+  codes: [
+    'ELEC-001', 'ELEC-002', 'ELEC-003', 'ELEC-004', 'ELEC-005', 'ELEC-006', 'ELEC-007', 'ELEC-008', 'ELEC-009', 'ELEC-010',
+    'ELEC-011', 'ELEC-012', 'ELEC-013'
+  ],
+  names: [
+    'تركيب كابل، كابل واحد في خندق مع حماية', 'تركيب كابل، كابلان في خندق مع حماية', 'تركيب كابل، 5 كابلات في خندق مع حماية', 'تركيب كابل، 7 كابلات في خندق مع حماية',
+    'تركيب كابل، 8 كابلات في خندق مع حماية', 'تركيب كابل، كابلان في خندق مع حماية، قطر 100 مم', 'تركيب كابل، كابلان في خندق مع حماية، قطر 135 مم', 'تركيب كابل، 3 كابلات في خندق مع حماية، قطر 100 مم',
+    'تركيب كابل، 6 كابلات في خندق مع حماية، قطر 100 مم', 'تركيب كابل، 4 كابلات في خندق مع حماية، قطر 150 مم', 'تركيب كابل، 36 كابل في خندق مع حماية، قطر 100 مم', 'تركيب كابل، 10 كابلات في خندق مع حماية، قطر 100 مم',
+    'تركيب كابل، كابل واحد في خندق مع حماية، قطر 300 مم'
+  ],
+  unit: [
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0
+  ],
+  source: [
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0
+  ],
+  crew: [
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0
+  ],
+  productivityRate: [
+    49.6, 44.8, 34.4, 29.6, 28.0, 14.4, 12.8, 8.0, 5.6, 9.6,
+    1.6, 4.0, 10.4
+  ],
+  laborCostPerUnit: [
+    15.7258, 17.4107, 22.6744, 26.3514, 27.8571, 54.1667, 60.9375, 97.5, 139.2857, 81.25,
+    487.5, 195, 75
+  ],
+  notes: {}
+};
+
+export const { templates, templateAt } = lazyTemplates(columns.ids.length, i => hydrateTemplate(columns, i));
+export const templateIds = columns.ids;
+export const templateCodes = columns.codes;
@@ -0,0 +1,65 @@
+/**
+ * Productivity templates: أعمال الأسانسير - Elevator Works
+ * Generated by scripts/generate-templates.py (10 templates).
+ */
+
+import { hydrateTemplate, lazyTemplates, type TemplateColumns } from './common';
+
+const columns: TemplateColumns = {
+  categoryId: 'elevator',
+  units: [
+    'دور', 'عدد'
+  ],
+  sources: [
+    'اعمال الاسانسير'
+  ],
+  roleCodes: [
+
+  ],
+  crewDescriptions: [
+
+  ],
+  crews: [
+    []
+  ],
+  crewDailyCosts: [
+    0
+  ],
+  ids: [
+    'ELV-001', 'ELV-002', 'ELV-003', 'ELV-004', 'ELV-005', 'ELV-006', 'ELV-007', 'ELV-008', 'ELV-009', 'ELV-010'
+  ],
+  codes: [
+    'ELEV-001', 'ELEV-002', 'ELEV-003', 'ELEV-004', 'ELEV-005', 'ELEV-006', 'ELEV-007', 'ELEV-008', 'ELEV-009', 'ELEV-010'
+  ],
+  names: [
+    'مصعد هيدروليكي – تركيب من 2 إلى 3 أدوار', 'مصعد هيدروليكي – تركيب 4 أدوار فأكثر', 'مصعد عادي – تصنيع واختبار وتسليم', 'نوع ترس (Truss) – التركيب الكامل (باستثناء الأعمال المعمارية)',
+    'نوع ترس (Truss) – تصنيع واختبار وتسليم', 'نوع ترس (Truss) – المرحلة A تجميع الهيكل المعدني', 'نوع ترس (Truss) – إيقاف الأعمال لاستكمال التشطيبات المحيطة', 'نوع ترس (Truss) – المرحلة B تركيب الأرضيات والزجاج وغيرها',
+    'نوع ترس (Truss) – المرحلة C اختبارات الأداء', 'نوع ترس (Truss) – المرحلة D اختبار التحميل الكامل'
+  ],
+  unit: [
+    0, 0, 1, 1, 1, 1, 1, 1, 1, 1
+  ],
+  source: [
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0
+  ],
+  crew: [
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0
+  ],
+  productivityRate: [
+    3.0, 2.0, 12.0, 60.0, 1.0, 6.0, 5.0, 2.0, 2.0, 2.0
+  ],
+  laborCostPerUnit: [
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0
+  ],
+  notes: {
+    0: 'بالاسبوع', 1: 'بالاسبوع',
+    2: 'بالاسبوع', 3: 'بالاسبوع',
+    4: 'بالاسبوع', 5: 'بالاسبوع',
+    6: 'بالاسبوع', 7: 'بالاسبوع',
+    8: 'بالاسبوع', 9: 'بالاسبوع'
+  }
+};
+
+export const { templates, templateAt } = lazyTemplates(columns.ids.length, i => hydrateTemplate(columns, i));
+export const templateIds = columns.ids;
+export const templateCodes = columns.codes;
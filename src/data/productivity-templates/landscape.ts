@@ -0,0 +1,59 @@
+/**
+ * Productivity templates: أعمال الاند اسكيب - Landscape
+ * Generated by scripts/generate-templates.py (10 templates).
+ */
+
+import { hydrateTemplate, lazyTemplates, type TemplateColumns } from './common';
+
+const columns: TemplateColumns = {
+  categoryId: 'landscape',
+  units: [
+    'م2', 'عدد'
+  ],
+  sources: [
+    'اعمال الاند اسكيب'
+  ],
+  roleCodes: [
+    'LAB-GENERAL'
+  ],
+  crewDescriptions: [
+    'مجموعة عمل'
+  ],
+  crews: [
+    [0, 3, 0]
+  ],
+  crewDailyCosts: [
+    450
+  ],
+  ids: [
+    'LND-001', 'LND-002', 'LND-003', 'LND-004', 'LND-005', 'LND-006', 'LND-007', 'LND-008', 'LND-009', 'LND-010'
+  ],
+  codes: [
+    'LAND-001', 'LAND-002', 'LAND-003', 'LAND-004', 'LAND-005', 'LAND-006', 'LAND-007', 'LAND-008', 'LAND-009', 'LAND-010'
+  ],
+  names: [
+    'بلاطات خرسانية على طبقة رمل مدموكة', 'بلاطات خرسانية على طبقة مونة اسمنتية', 'اعمال حجر بازلت على مونة اسمنتية', 'اعمال الحجر الصناعى على فرشة رمل',
+    'أعمال بلاطات طوب', 'ممرات حصوية شاملة تجهيز طبقة الأساس', 'فرش طبقة الرمل وتسويتها فبل وضع النجيلة', 'تركيب طبقات النجيلة',
+    'زرع شجر بطول 75 سم', 'زرع شجر بطول اآبر 75 سم'
+  ],
+  unit: [
+    0, 0, 0, 0, 0, 0, 0, 0, 1, 1
+  ],
+  source: [
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0
+  ],
+  crew: [
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0
+  ],
+  productivityRate: [
+    20.0, 10.0, 2.0, 20.0, 9.0, 84.0, 20.0, 130.0, 32.0, 12.0
+  ],
+  laborCostPerUnit: [
+    22.5, 45, 225, 22.5, 50, 5.3571, 22.5, 3.4615, 14.0625, 37.5
+  ],
+  notes: {}
+};
+
+export const { templates, templateAt } = lazyTemplates(columns.ids.length, i => hydrateTemplate(columns, i));
+export const templateIds = columns.ids;
+export const templateCodes = columns.codes;
@@ -0,0 +1,35 @@
+/**
+ * Async loaders for the per-category template modules; each category is its
+ * own chunk, fetched the first time it is needed. Generated by
+ * scripts/generate-templates.py.
+ */
+
+import type { ProductivityTemplate } from './common';
+import { templateCategoryIds } from './manifest';
+
+const categoryLoaders: Record<string, () => Promise<{ templates: ProductivityTemplate[] }>> = {
+  'site-services': () => import('./site-services'),
+  'pipe-installation': () => import('./pipe-installation'),
+  'electrical': () => import('./electrical'),
+  'steel-works': () => import('./steel-works'),
+  'metal-works': () => import('./metal-works'),
+  'carpentry': () => import('./carpentry'),
+  'aluminum': () => import('./aluminum'),
+  'landscape': () => import('./landscape'),
+  'elevator': () => import('./elevator')
+};
+
+export function loadCategoryTemplates(categoryId: string): Promise<ProductivityTemplate[]> {
+  const load = categoryLoaders[categoryId];
+  return load ? load().then(loaded => loaded.templates) : Promise.resolve([]);
+}
+
+/** Templates of the given categories, in the order the categories are listed */
+export async function loadTemplates(categoryIds: string[]): Promise<ProductivityTemplate[]> {
+  const parts = await Promise.all(categoryIds.map(loadCategoryTemplates));
+  return parts.flat();
+}
+
+export function loadAllTemplates(): Promise<ProductivityTemplate[]> {
+  return loadTemplates(templateCategoryIds);
+}
@@ -0,0 +1,32 @@
+/**
+ * Productivity template manifest: what each category module holds, without
+ * loading any templates. Generated by scripts/generate-templates.py.
+ */
+
+import type { ProductivitySource } from './common';
+
+export interface TemplateCategoryManifest {
+  categoryId: string;
+  label: string;
+  count: number;
+  activeCount: number;
+  sources: ProductivitySource[];
+}
+
+export const templateCategoryManifest: TemplateCategoryManifest[] = [
+  { categoryId: 'site-services', label: 'أعمال تخديمية - Site Services', count: 18, activeCount: 18, sources: ['اعمال تخديميه'] },
+  { categoryId: 'pipe-installation', label: 'تركيب المواسير - Pipe Installation', count: 34, activeCount: 34, sources: ['تركيب المواسير'] },
+  { categoryId: 'electrical', label: 'أعمال الكهرباء - Electrical Works', count: 13, activeCount: 13, sources: ['اعمال الكهرباء'] },
+  { categoryId: 'steel-works', label: 'أعمال الحديد - Steel Works', count: 8, activeCount: 8, sources: ['اعمال الحديد'] },
+  { categoryId: 'metal-works', label: 'الأعمال المعدنية - Metal Works', count: 12, activeCount: 12, sources: ['الاعمال المعدنيه'] },
+  { categoryId: 'carpentry', label: 'أعمال الخشب - Carpentry', count: 15, activeCount: 15, sources: ['اعمال الخشب'] },
+  { categoryId: 'aluminum', label: 'أعمال الألومنيوم - Aluminum Works', count: 11, activeCount: 11, sources: ['اعمال الالمونيوم'] },
+  { categoryId: 'landscape', label: 'أعمال الاند اسكيب - Landscape', count: 10, activeCount: 10, sources: ['اعمال الاند اسكيب'] },
+  { categoryId: 'elevator', label: 'أعمال الأسانسير - Elevator Works', count: 10, activeCount: 10, sources: ['اعمال الاسانسير'] }
+];
+
+/** Every category id, in manifest order */
+export const templateCategoryIds: string[] = templateCategoryManifest.map(category => category.categoryId);
+
+export const MANIFEST_TOTAL_TEMPLATES = 131;
+export const MANIFEST_ACTIVE_TEMPLATES = 131;
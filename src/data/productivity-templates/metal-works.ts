@@ -0,0 +1,63 @@
+/**
+ * Productivity templates: الأعمال المعدنية - Metal Works
+ * Generated by scripts/generate-templates.py (12 templates).
+ */
+
+import { hydrateTemplate, lazyTemplates, type TemplateColumns } from './common';
+
+const columns: TemplateColumns = {
+  categoryId: 'metal-works',
+  units: [
+    'كجم', 'عدد', 'م.ط', 'م2'
+  ],
+  sources: [
+    'الاعمال المعدنيه'
+  ],
+  roleCodes: [
+    'LAB-PLUMBER'
+  ],
+  crewDescriptions: [
+    'صناعي'
+  ],
+  crews: [
+    [0, 1, 0]
+  ],
+  crewDailyCosts: [
+    380
+  ],
+  ids: [
+    'MTL-001', 'MTL-002', 'MTL-003', 'MTL-004', 'MTL-005', 'MTL-006', 'MTL-007', 'MTL-008', 'MTL-009', 'MTL-010',
+    'MTL-011', 'MTL-012'
+  ],
+  codes: [
+    'METAL-001', 'METAL-002', 'METAL-003', 'METAL-004', 'METAL-005', 'METAL-006', 'METAL-007', 'METAL-008', 'METAL-009', 'METAL-010',
+    'METAL-011', 'METAL-012'
+  ],
+  names: [
+    'تركيب ابواب و شابيبك', 'Windows, Steel, 1.0-3.0m2', 'Windows, Steel, 3.0-7.0m2', 'Windows, Steel, 7.0-10.0m2',
+    'تركيب اعمال معدنية للاسوار والبلكونات', 'تركيب اعمال معدنية للاسوار والبلكونات', 'تركيب اعمال معدنية للدرابزين والادراج', 'تركيب باب جرار',
+    'تصنيع خزان سماآة 2-1.5 مم', 'تصنيع خزانات 3 مم', 'تصنيع وتركيب زاوية معدنية لفواصل التمدد', 'قص وتركيب زجاج على الحديد'
+  ],
+  unit: [
+    0, 1, 1, 1, 0, 2, 0, 0, 0, 0, 2, 3
+  ],
+  source: [
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0
+  ],
+  crew: [
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0
+  ],
+  productivityRate: [
+    150.0, 9.6, 4.8, 2.4, 150.0, 20.0, 100.0, 150.0, 80.0, 120.0,
+    40.0, 9.0
+  ],
+  laborCostPerUnit: [
+    2.5333, 39.5833, 79.1667, 158.3333, 2.5333, 19, 3.8, 2.5333, 4.75, 3.1667,
+    9.5, 42.2222
+  ],
+  notes: {}
+};
+
+export const { templates, templateAt } = lazyTemplates(columns.ids.length, i => hydrateTemplate(columns, i));
+export const templateIds = columns.ids;
+export const templateCodes = columns.codes;
@@ -0,0 +1,77 @@
+/**
+ * Productivity templates: تركيب المواسير - Pipe Installation
+ * Generated by scripts/generate-templates.py (34 templates).
+ */
+
+import { hydrateTemplate, lazyTemplates, type TemplateColumns } from './common';
+
+const columns: TemplateColumns = {
+  categoryId: 'pipe-installation',
+  units: [
+    'م.ط', 'عدد'
+  ],
+  sources: [
+    'تركيب المواسير'
+  ],
+  roleCodes: [
+    'LAB-PLUMBER', 'LAB-PLUMBER-ASST'
+  ],
+  crewDescriptions: [
+    'صناعي', 'مساعد'
+  ],
+  crews: [
+    [0, 1, 0, 1, 3, 1], [0, 1, 0, 1, 4, 1], [0, 1, 0]
+  ],
+  crewDailyCosts: [
+    980, 1180, 380
+  ],
+  ids: [
+    'PIP-001', 'PIP-002', 'PIP-003', 'PIP-004', 'PIP-005', 'PIP-006', 'PIP-007', 'PIP-008', 'PIP-009', 'PIP-010',
+    'PIP-011', 'PIP-012', 'PIP-013', 'PIP-014', 'PIP-015', 'PIP-016', 'PIP-017', 'PIP-018', 'PIP-019', 'PIP-020',
+    'PIP-021', 'PIP-022', 'PIP-023', 'PIP-024', 'PIP-025', 'PIP-026', 'PIP-027', 'PIP-028', 'PIP-029', 'PIP-030',
+    'PIP-031', 'PIP-032', 'PIP-033', 'PIP-034'
+  ],
+  codes: [
+    'PIPE-001', 'PIPE-002', 'PIPE-003', 'PIPE-004', 'PIPE-005', 'PIPE-006', 'PIPE-007', 'PIPE-008', 'PIPE-009', 'PIPE-010',
+    'PIPE-011', 'PIPE-012', 'PIPE-013', 'PIPE-014', 'PIPE-015', 'PIPE-016', 'PIPE-017', 'PIPE-018', 'PIPE-019', 'PIPE-020',
+    'PIPE-021', 'PIPE-022', 'PIPE-023', 'PIPE-024', 'PIPE-025', 'PIPE-026', 'PIPE-027', 'PIPE-028', 'PIPE-029', 'PIPE-030',
+    'PIPE-031', 'PIPE-032', 'PIPE-033', 'PIPE-034'
+  ],
+  names: [
+    'مواسير صرف PVC طول القطعة 3م قطر الماسورة حتى 150 مم', 'مواسير صرف PVC طول القطعة 6م قطر الماسورة حتى 150 مم', 'مواسير صرف PVC طول القطعة 3م قطر الماسورة حتى 200 مم', 'مواسير صرف PVC طول القطعة 6م قطر الماسورة حتى 200 مم',
+    'مواسير من الفخار والتقفيل بمونة اسمنتية قطر الماسورة 75 مم', 'مواسير من الفخار والتقفيل بمونة اسمنتية قطر الماسورة 100 مم', 'مواسير من الفخار والتقفيل بمونة اسمنتية قطر الماسورة 150 مم', 'مواسير من الفخار والتقفيل بمونة اسمنتية قطر الماسورة 225 مم',
+    'مواسير من الفخار والتقفيل بمونة اسمنتية قطر الماسورة 300 مم', 'مواسير من الفخار والتقفيل بمونة اسمنتية قطر الماسورة اآبر 300 مم', 'مواسير من الفخار Flexible Joints قطر الماسورة 75 مم', 'مواسير من الفخار Flexible Joints قطر الماسورة 100 مم',
+    'مواسير من الفخار Flexible Joints قطر الماسورة 150 مم', 'مواسير من الفخار Flexible Joints قطر الماسورة 225 مم', 'مواسير من الفخار Flexible Joints قطر الماسورة 300 مم', 'مواسير من الفخار Flexible Joints قطر الماسورة اآبر 300 مم',
+    'مواسير خرسانية طول القطعة 1.5 م قطر الماسورة حتى 375 مم', 'مواسير خرسانية طول القطعة 1.5 م قطر الماسورة حتى 450 مم', 'مواسير خرسانية طول القطعة 1.5 م قطر الماسورة حتى 525 مم', 'مواسير خرسانية طول القطعة 1.5 م قطر الماسورة حتى 600 مم',
+    'مواسير خرسانية طول القطعة 1.5 م قطر الماسورة حتى 675 مم', 'مواسير خرسانية طول القطعة 1.5 م قطر الماسورة حتى 750 مم', 'مواسير خرسانية طول القطعة 1.5 م قطر الماسورة حتى 1500 مم', 'مواسير خرسانية طول القطعة 1.5 م قطر الماسورة حتى 1800 مم',
+    'مواسير خرسانية طول القطعة 2.5 م قطر الماسورة حتى 375 مم', 'مواسير خرسانية طول القطعة 2.5 م قطر الماسورة حتى 450 مم', 'مواسير خرسانية طول القطعة 2.5 م قطر الماسورة حتى 525 مم', 'مواسير خرسانية طول القطعة 2.5 م قطر الماسورة حتى 600 مم',
+    'مواسير خرسانية طول القطعة 2.5 م قطر الماسورة حتى 675 مم', 'مواسير خرسانية طول القطعة 2.5 م قطر الماسورة حتى 750 مم', 'مواسير UPVC قطر 75 مم', 'مواسير UPVC Fittings قطر 75 مم',
+    'مواسير Cast Iron قطر 75 مم', 'مواسير Cast Iron Fittings قطر 75 مم'
+  ],
+  unit: [
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 1
+  ],
+  source: [
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0
+  ],
+  crew: [
+    0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 0, 2, 0, 2
+  ],
+  productivityRate: [
+    145.6, 266.4, 102.4, 204.8, 52.8, 49.6, 36.0, 24.8, 19.2, 12.8,
+    100.0, 80.0, 61.6, 32.0, 20.0, 16.8, 30.4, 28.8, 27.2, 26.4,
+    23.2, 20.0, 2.5, 2.1, 40.0, 36.0, 32.8, 32.0, 29.6, 28.8,
+    26.4, 24.8, 16.8, 17.6
+  ],
+  laborCostPerUnit: [
+    6.7308, 3.6787, 9.5703, 5.7617, 22.3485, 23.7903, 32.7778, 47.5806, 61.4583, 92.1875,
+    11.8, 14.75, 19.1558, 36.875, 59, 70.2381, 38.8158, 40.9722, 43.3824, 44.697,
+    50.8621, 59, 472, 561.9048, 29.5, 32.7778, 35.9756, 36.875, 39.8649, 40.9722,
+    37.1212, 15.3226, 58.3333, 21.5909
+  ],
+  notes: {}
+};
+
+export const { templates, templateAt } = lazyTemplates(columns.ids.length, i => hydrateTemplate(columns, i));
+export const templateIds = columns.ids;
+export const templateCodes = columns.codes;
@@ -0,0 +1,66 @@
+/**
+ * Productivity templates: أعمال تخديمية - Site Services
+ * Generated by scripts/generate-templates.py (18 templates).
+ */
+
+import { hydrateTemplate, lazyTemplates, type TemplateColumns } from './common';
+
+const columns: TemplateColumns = {
+  categoryId: 'site-services',
+  units: [
+    'م3', 'م2', 'طن', 'عدد'
+  ],
+  sources: [
+    'اعمال تخديميه'
+  ],
+  roleCodes: [
+    'LAB-GENERAL', 'LAB-DEMOLITION', 'EQP-COMPRESSOR', 'LAB-CARPENTER-FW'
+  ],
+  crewDescriptions: [
+    'عامل', 'نحات', 'ماكينة', 'نجار'
+  ],
+  crews: [
+    [0, 2, 0], [0, 3, 0], [1, 1, 1], [2, 1, 2, 0, 1, 0], [1, 2, 1], [3, 1, 3, 0, 2, 0],
+    [1, 1, 1, 0, 1, 0]
+  ],
+  crewDailyCosts: [
+    300, 450, 250, 650, 500, 700, 400
+  ],
+  ids: [
+    'SVC-001', 'SVC-002', 'SVC-003', 'SVC-004', 'SVC-005', 'SVC-006', 'SVC-007', 'SVC-008', 'SVC-009', 'SVC-010',
+    'SVC-011', 'SVC-012', 'SVC-013', 'SVC-014', 'SVC-015', 'SVC-016', 'SVC-017', 'SVC-018'
+  ],
+  codes: [
+    'SVC-001', 'SVC-002', 'SVC-003', 'SVC-004', 'SVC-005', 'SVC-006', 'SVC-007', 'SVC-008', 'SVC-009', 'SVC-010',
+    'SVC-011', 'SVC-012', 'SVC-013', 'SVC-014', 'SVC-015', 'SVC-016', 'SVC-017', 'SVC-018'
+  ],
+  names: [
+    'رفع بلوك طابق واحد باليد العاملة', 'تنزيل ورفع بلوك بالونش الجمل', 'تحميل وتنزيل بلوك على العربية', 'نقل وتوزيع بلوك ضمن الابنية فى المنسوب الواحد',
+    'رفع بلاط ورخام للطوابق بالونش', 'تحميل وتنزيل بلاط ورخام وسيراميك ضمن الادوار', 'تحميل وتنزيل اسمنت على العربية', 'تكسير خرسانة يدوى',
+    'تكسير خرسانة بالكمبروسور', 'تكسير بلوك مع ازالة الناتج', 'ترآيب سقائل معدنية للوجهات', 'فك سقايل للوجهات',
+    'ازالة البياض الداخلى مع ازالة الناتج', 'تحميل وتنزيل حديد تسليح مشكل', 'تكسير بلاط وازالة الناتج خارج من المبنى', 'رفع ورص بلوك هوردى',
+    'رفع وتوزيع اسمنت على الادوار بالونش', 'رفع وتوزيع رمل على الادوار بالونش'
+  ],
+  unit: [
+    0, 0, 0, 0, 1, 1, 2, 0, 0, 0, 1, 1, 1, 2, 1, 3, 2, 0
+  ],
+  source: [
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0
+  ],
+  crew: [
+    0, 1, 0, 0, 1, 0, 0, 2, 3, 4, 5, 5, 6, 0, 0, 0, 0, 1
+  ],
+  productivityRate: [
+    4.0, 12.0, 10.0, 16.0, 180.0, 200.0, 10.0, 0.5, 3.0, 3.0,
+    70.0, 100.0, 16.0, 2.0, 30.0, 250.0, 7.0, 6.0
+  ],
+  laborCostPerUnit: [
+    75, 37.5, 30, 18.75, 2.5, 1.5, 30, 500, 216.6667, 166.6667,
+    10, 7, 25, 150, 10, 1.2, 42.8571, 75
+  ],
+  notes: {}
+};
+
+export const { templates, templateAt } = lazyTemplates(columns.ids.length, i => hydrateTemplate(columns, i));
+export const templateIds = columns.ids;
+export const templateCodes = columns.codes;
@@ -0,0 +1,58 @@
+/**
+ * Productivity templates: أعمال الحديد - Steel Works
+ * Generated by scripts/generate-templates.py (8 templates).
+ */
+
+import { hydrateTemplate, lazyTemplates, type TemplateColumns } from './common';
+
+const columns: TemplateColumns = {
+  categoryId: 'steel-works',
+  units: [
+    'طن', 'عدد', 'م2'
+  ],
+  sources: [
+    'اعمال الحديد'
+  ],
+  roleCodes: [
+
+  ],
+  crewDescriptions: [
+
+  ],
+  crews: [
+    []
+  ],
+  crewDailyCosts: [
+    0
+  ],
+  ids: [
+    'STL-001', 'STL-002', 'STL-003', 'STL-004', 'STL-005', 'STL-006', 'STL-007', 'STL-008'
+  ],
+  codes: [
+    'STEEL-001', 'STEEL-002', 'STEEL-003', 'STEEL-004', 'STEEL-005', 'STEEL-006', 'STEEL-007', 'STEEL-008'
+  ],
+  names: [
+    'Steel Frame and Roof Members', 'Wall Frame, Bow String Truss and Frame', 'Roof Frame, Curved Truss and Frame', 'Wall Frame, Glazed Frame and Atrium',
+    'Horizontal heavy duty strutting', 'Diagonal heavy duty strutting', 'Metal Decking, large areas', 'Metal Decking, small or complicated'
+  ],
+  unit: [
+    0, 0, 0, 0, 1, 1, 2, 2
+  ],
+  source: [
+    0, 0, 0, 0, 0, 0, 0, 0
+  ],
+  crew: [
+    0, 0, 0, 0, 0, 0, 0, 0
+  ],
+  productivityRate: [
+    4.6, 1.6, 5.2, 0.3, 2.0, 6.0, 70.0, 28.0
+  ],
+  laborCostPerUnit: [
+    0, 0, 0, 0, 0, 0, 0, 0
+  ],
+  notes: {}
+};
+
+export const { templates, templateAt } = lazyTemplates(columns.ids.length, i => hydrateTemplate(columns, i));
+export const templateIds = columns.ids;
+export const templateCodes = columns.codes;
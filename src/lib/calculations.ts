@@ -492,7 +492,7 @@ export function validateEstimate(
 
 import type { ConditionFactor } from '@/data/condition-factors';
 import type { CrewRole } from '@/data/crew-roles';
-import type { ProductivityTemplate, CrewMember } from '@/data/productivity-templates';
+import type { ProductivityTemplate, CrewMember } from '@/data/productivity-templates/common';
 
 /**
  * Result of a productivity-based labor cost calculation
@@ -0,0 +1,87 @@
+-- Generated by scripts/extract-excel-data.py.
+INSERT INTO master_rates (code, name_ar, name_en, description, unit, current_rate, waste_factor, category_id, source, is_active)
+SELECT v.code, v.name_ar, v.name_en, v.description, v.unit, v.current_rate::numeric, COALESCE(v.waste_factor::numeric, 1.000), c.id, 'excel', true
+FROM (VALUES
+  ('LAB-CARP-FND', 'نجار - قواعد عادية', 'Carpenter - Plain Foundations', NULL, 'م³/يوم', '10', NULL, 'LAB'),
+  ('LAB-CARP-SLAB', 'نجار - لبشة عادية', 'Carpenter - Plain Slab', NULL, 'م³/يوم', '50', NULL, 'LAB'),
+  ('LAB-CARP-RFND', 'نجار - قواعد مسلحة', 'Carpenter - Reinforced Foundations', NULL, 'م³/يوم', '3', NULL, 'LAB'),
+  ('LAB-CARP-COL', 'نجار - أعمدة', 'Carpenter - Columns', NULL, 'م³/يوم', '1.5', NULL, 'LAB'),
+  ('LAB-CARP-SOLID', 'نجار - أسقف سوليد', 'Carpenter - Solid Slab', NULL, 'م³/يوم', '3', NULL, 'LAB'),
+  ('LAB-CARP-FLAT', 'نجار - أسقف فلات', 'Carpenter - Flat Slab', NULL, 'م³/يوم', '5', NULL, 'LAB'),
+  ('LAB-STEEL-FND', 'حداد - قواعد مسلحة', 'Steel Fixer - Foundations', NULL, 'م³/يوم', '3', NULL, 'LAB'),
+  ('LAB-STEEL-SLAB', 'حداد - لبشة', 'Steel Fixer - Slab', NULL, 'م³/يوم', '5', NULL, 'LAB'),
+  ('LAB-STEEL-COL', 'حداد - أعمدة', 'Steel Fixer - Columns', NULL, 'م³/يوم', '2.5', NULL, 'LAB'),
+  ('LAB-MASON-BRICK', 'بناء - طوب', 'Mason - Brickwork', NULL, 'م³/يوم', '4', NULL, 'LAB'),
+  ('LAB-PLASTER-SPRAY', 'مبيض - طرطشة', 'Plasterer - Spray', NULL, 'م²/يوم', '200', NULL, 'LAB'),
+  ('LAB-PLASTER-DOTS', 'مبيض - بؤج', 'Plasterer - Dots', NULL, 'م²/يوم', '150', NULL, 'LAB'),
+  ('LAB-PLASTER-INT', 'مبيض - ملو داخلي', 'Plasterer - Interior', NULL, 'م²/يوم', '40', NULL, 'LAB'),
+  ('LAB-PLASTER-CEIL', 'مبيض - ملو أسقف', 'Plasterer - Ceiling', NULL, 'م²/يوم', '30', NULL, 'LAB'),
+  ('LAB-PLASTER-EXT', 'مبيض - ملو خارجي', 'Plasterer - Exterior', NULL, 'م²/يوم', '25', NULL, 'LAB'),
+  ('LAB-PAINT-PUTTY', 'نقاش - معجون وصنفرة', 'Painter - Putty & Sanding', NULL, 'م²/يوم', '60', NULL, 'LAB'),
+  ('LAB-PAINT-PLASTIC', 'نقاش - دهان بلاستيك', 'Painter - Plastic Paint', NULL, 'م²/يوم', '200', NULL, 'LAB'),
+  ('LAB-TILE-FLOOR', 'مبلط - أرضيات سيراميك', 'Tiler - Floor Ceramic', NULL, 'م²/يوم', '25', NULL, 'LAB'),
+  ('LAB-TILE-WALL', 'مبلط - حوائط سيراميك', 'Tiler - Wall Ceramic', NULL, 'م²/يوم', '15', NULL, 'LAB'),
+  ('LAB-MARBLE-FLOOR', 'مرخماتي - أرضيات', 'Marble Worker - Floor', NULL, 'م²/يوم', '15', NULL, 'LAB'),
+  ('LAB-MARBLE-STAIR', 'مرخماتي - درج سلم', 'Marble Worker - Stairs', NULL, 'م.ط/يوم', '12', NULL, 'LAB'),
+  ('LAB-WP-BITUMEN', 'صنايعي - عزل بيتومين', 'Waterproofing - Bitumen', NULL, 'م²/يوم', '100', NULL, 'LAB'),
+  ('MAT-CONC-PLAIN', 'خرسانة عادية', 'Plain Concrete', '0.8م³ زلط + 0.4م³ رمل + 250كجم أسمنت', 'م³', '750', NULL, 'MAT'),
+  ('MAT-CONC-REINF', 'خرسانة مسلحة', 'Reinforced Concrete', '0.8م³ زلط + 0.4م³ رمل + 350كجم أسمنت', 'م³', '950', NULL, 'MAT'),
+  ('MAT-STEEL-FND', 'حديد تسليح قواعد', 'Steel Rebar - Foundations', NULL, 'كجم', '28', '1.05', 'MAT'),
+  ('MAT-STEEL-COL', 'حديد تسليح أعمدة', 'Steel Rebar - Columns', NULL, 'كجم', '28', '1.03', 'MAT'),
+  ('MAT-STEEL-SLAB', 'حديد تسليح أسقف', 'Steel Rebar - Slabs', NULL, 'كجم', '28', '1.03', 'MAT'),
+  ('MAT-CEMENT', 'أسمنت رمادي', 'Grey Cement', NULL, 'طن', '2500', NULL, 'MAT'),
+  ('MAT-SAND', 'رمل', 'Sand', NULL, 'م³', '180', NULL, 'MAT'),
+  ('MAT-GRAVEL', 'زلط', 'Gravel', NULL, 'م³', '220', NULL, 'MAT'),
+  ('MAT-BRICK-SINGLE', 'طوب فرداني', 'Single Brick', NULL, '1000 طوبة', '1800', NULL, 'MAT'),
+  ('MAT-BRICK-DOUBLE', 'طوب دبل', 'Double Brick', NULL, '1000 طوبة', '3200', NULL, 'MAT'),
+  ('MAT-PLASTER-MORTAR', 'مونة بياض', 'Plaster Mortar', '1م³ رمل + 350كجم أسمنت', 'م³', '850', NULL, 'MAT'),
+  ('MAT-PUTTY', 'معجون', 'Putty', NULL, 'كجم', '25', NULL, 'MAT'),
+  ('MAT-SEALER', 'سيلار', 'Sealer', NULL, 'لتر', '45', NULL, 'MAT'),
+  ('MAT-PAINT-PLASTIC', 'دهان بلاستيك', 'Plastic Paint', NULL, 'لتر', '85', NULL, 'MAT'),
+  ('MAT-CERAMIC-FLOOR', 'سيراميك أرضيات', 'Floor Ceramic', NULL, 'م²', '120', NULL, 'MAT'),
+  ('MAT-CERAMIC-WALL', 'سيراميك حوائط', 'Wall Ceramic', NULL, 'م²', '100', NULL, 'MAT'),
+  ('MAT-MARBLE', 'رخام', 'Marble', NULL, 'م²', '450', NULL, 'MAT'),
+  ('MAT-GRANITE', 'جرانيت', 'Granite', NULL, 'م²', '550', NULL, 'MAT'),
+  ('MAT-BITUMEN', 'بيتومين', 'Bitumen', NULL, 'لتر', '35', NULL, 'MAT'),
+  ('MAT-MEMBRANE', 'ممبرين', 'Membrane', NULL, 'م²', '75', '1.1', 'MAT'),
+  ('EQP-MIXER', 'خلاطة خرسانة', 'Concrete Mixer', NULL, 'يوم', '500', NULL, 'EQP'),
+  ('EQP-VIBRATOR', 'هزاز خرسانة', 'Concrete Vibrator', NULL, 'يوم', '200', NULL, 'EQP'),
+  ('EQP-PUMP', 'مضخة خرسانة', 'Concrete Pump', NULL, 'يوم', '3500', NULL, 'EQP'),
+  ('EQP-CRANE', 'رافعة', 'Crane', NULL, 'يوم', '5000', NULL, 'EQP'),
+  ('EQP-SCAFFOLDING', 'سقالات', 'Scaffolding', NULL, 'م²/شهر', '25', NULL, 'EQP'),
+  ('EQP-EXCAVATOR', 'حفار', 'Excavator', NULL, 'يوم', '4500', NULL, 'EQP'),
+  ('EQP-LOADER', 'لودر', 'Loader', NULL, 'يوم', '3000', NULL, 'EQP'),
+  ('EQP-TRUCK', 'سيارة نقل', 'Truck', NULL, 'رحلة', '350', NULL, 'EQP'),
+  ('EQP-COMPACTOR', 'هراس', 'Compactor', NULL, 'يوم', '2500', NULL, 'EQP')
+) AS v(code, name_ar, name_en, description, unit, current_rate, waste_factor, category_code) JOIN rate_categories c ON c.code = v.category_code
+ON CONFLICT (code) DO UPDATE SET name_ar = EXCLUDED.name_ar, name_en = EXCLUDED.name_en, description = EXCLUDED.description, unit = EXCLUDED.unit, current_rate = EXCLUDED.current_rate, waste_factor = EXCLUDED.waste_factor, category_id = EXCLUDED.category_id, source = EXCLUDED.source, is_active = EXCLUDED.is_active, updated_at = NOW();
+INSERT INTO boq_templates (code, name_ar, name_en, unit, category_id, materials, labor, equipment, source, is_active)
+SELECT v.code, v.name_ar, v.name_en, v.unit, c.id, v.materials::jsonb, v.labor::jsonb, v.equipment::jsonb, 'excel', true
+FROM (VALUES
+  ('EXC-01', 'حفر في جميع أنواع التربة', 'Excavation in All Soil Types', 'م³', 'EXC', '[]', '[{"rateCode":"LAB-HELPER","qty":0.5,"description":"عامل حفر"}]', '[{"rateCode":"EQP-EXCAVATOR","qty":0.02,"description":"حفار"}]'),
+  ('EXC-02', 'ردم بالرمل', 'Sand Backfill', 'م³', 'EXC', '[{"rateCode":"MAT-SAND","qty":1.25,"description":"رمل ردم"}]', '[{"rateCode":"LAB-HELPER","qty":0.3,"description":"عامل"}]', '[{"rateCode":"EQP-COMPACTOR","qty":0.01,"description":"هراس"}]'),
+  ('CON-PC-01', 'خرسانة عادية للقواعد', 'Plain Concrete for Foundations', 'م³', 'STR', '[{"rateCode":"MAT-CONC-PLAIN","qty":1.05,"description":"خرسانة عادية"}]', '[{"rateCode":"LAB-CARP-FND","qty":0.1,"description":"نجار"},{"rateCode":"LAB-HELPER","qty":0.2,"description":"مساعد"}]', '[{"rateCode":"EQP-MIXER","qty":0.05,"description":"خلاطة"}]'),
+  ('CON-RC-FND', 'خرسانة مسلحة للقواعد والسملات', 'Reinforced Concrete for Foundations', 'م³', 'STR', '[{"rateCode":"MAT-CONC-REINF","qty":1.05,"description":"خرسانة مسلحة"},{"rateCode":"MAT-STEEL-FND","qty":90,"description":"حديد تسليح (90 كجم/م³)"}]', '[{"rateCode":"LAB-CARP-RFND","qty":0.33,"description":"نجار مسلح"},{"rateCode":"LAB-STEEL-FND","qty":0.33,"description":"حداد"},{"rateCode":"LAB-HELPER","qty":0.5,"description":"مساعد"}]', '[{"rateCode":"EQP-MIXER","qty":0.05,"description":"خلاطة"},{"rateCode":"EQP-VIBRATOR","qty":0.05,"description":"هزاز"}]'),
+  ('CON-RC-COL', 'خرسانة مسلحة للأعمدة', 'Reinforced Concrete for Columns', 'م³', 'STR', '[{"rateCode":"MAT-CONC-REINF","qty":1.05,"description":"خرسانة مسلحة"},{"rateCode":"MAT-STEEL-COL","qty":130,"description":"حديد تسليح (130 كجم/م³)"}]', '[{"rateCode":"LAB-CARP-COL","qty":0.67,"description":"نجار مسلح"},{"rateCode":"LAB-STEEL-COL","qty":0.4,"description":"حداد"},{"rateCode":"LAB-HELPER","qty":0.5,"description":"مساعد"}]', '[{"rateCode":"EQP-MIXER","qty":0.05,"description":"خلاطة"},{"rateCode":"EQP-VIBRATOR","qty":0.1,"description":"هزاز"}]'),
+  ('CON-RC-SLAB', 'خرسانة مسلحة للأسقف', 'Reinforced Concrete for Slabs', 'م³', 'STR', '[{"rateCode":"MAT-CONC-REINF","qty":1.05,"description":"خرسانة مسلحة"},{"rateCode":"MAT-STEEL-SLAB","qty":85,"description":"حديد تسليح (85 كجم/م³)"}]', '[{"rateCode":"LAB-CARP-SOLID","qty":0.33,"description":"نجار مسلح"},{"rateCode":"LAB-STEEL-SLAB","qty":0.33,"description":"حداد"},{"rateCode":"LAB-HELPER","qty":0.5,"description":"مساعد"}]', '[{"rateCode":"EQP-PUMP","qty":0.02,"description":"مضخة"},{"rateCode":"EQP-VIBRATOR","qty":0.1,"description":"هزاز"}]'),
+  ('MAS-BRICK-25', 'مباني طوب سمك 25 سم', 'Brick Wall 25cm Thick', 'م³', 'MAS', '[{"rateCode":"MAT-BRICK-SINGLE","qty":0.44,"description":"طوب (440 طوبة)"},{"rateCode":"MAT-CEMENT","qty":0.06,"description":"أسمنت"},{"rateCode":"MAT-SAND","qty":0.2,"description":"رمل"}]', '[{"rateCode":"LAB-MASON-BRICK","qty":0.25,"description":"بناء"},{"rateCode":"LAB-HELPER","qty":0.25,"description":"مساعد"}]', '[]'),
+  ('MAS-BRICK-12', 'مباني طوب سمك 12 سم', 'Brick Wall 12cm Thick', 'م²', 'MAS', '[{"rateCode":"MAT-BRICK-SINGLE","qty":0.055,"description":"طوب (55 طوبة)"},{"rateCode":"MAT-CEMENT","qty":0.006,"description":"أسمنت"},{"rateCode":"MAT-SAND","qty":0.02,"description":"رمل"}]', '[{"rateCode":"LAB-MASON-BRICK","qty":0.037,"description":"بناء"},{"rateCode":"LAB-HELPER","qty":0.037,"description":"مساعد"}]', '[]'),
+  ('PLT-INT', 'بياض محارة داخلي', 'Interior Plastering', 'م²', 'FIN', '[{"rateCode":"MAT-CEMENT","qty":0.012,"description":"أسمنت"},{"rateCode":"MAT-SAND","qty":0.03,"description":"رمل"}]', '[{"rateCode":"LAB-PLASTER-SPRAY","qty":0.005,"description":"طرطشة"},{"rateCode":"LAB-PLASTER-DOTS","qty":0.007,"description":"بؤج"},{"rateCode":"LAB-PLASTER-INT","qty":0.025,"description":"ملو"}]', '[]'),
+  ('PAINT-PLASTIC', 'دهان بلاستيك (3 أوجه)', 'Plastic Paint (3 coats)', 'م²', 'FIN', '[{"rateCode":"MAT-PUTTY","qty":0.3,"description":"معجون"},{"rateCode":"MAT-SEALER","qty":0.1,"description":"سيلار"},{"rateCode":"MAT-PAINT-PLASTIC","qty":0.35,"description":"دهان بلاستيك"}]', '[{"rateCode":"LAB-PAINT-PUTTY","qty":0.017,"description":"معجون وصنفرة"},{"rateCode":"LAB-PAINT-PLASTIC","qty":0.015,"description":"دهان"}]', '[]'),
+  ('TILE-FLOOR', 'سيراميك أرضيات', 'Floor Ceramic Tiles', 'م²', 'FIN', '[{"rateCode":"MAT-CERAMIC-FLOOR","qty":1.05,"description":"سيراميك"},{"rateCode":"MAT-CEMENT","qty":0.012,"description":"أسمنت"},{"rateCode":"MAT-SAND","qty":0.1,"description":"رمل"}]', '[{"rateCode":"LAB-TILE-FLOOR","qty":0.04,"description":"مبلط"},{"rateCode":"LAB-HELPER","qty":0.04,"description":"مساعد"}]', '[]'),
+  ('TILE-WALL', 'سيراميك حوائط', 'Wall Ceramic Tiles', 'م²', 'FIN', '[{"rateCode":"MAT-CERAMIC-WALL","qty":1.05,"description":"سيراميك"},{"rateCode":"MAT-CEMENT","qty":0.015,"description":"أسمنت"},{"rateCode":"MAT-SAND","qty":0.03,"description":"رمل"}]', '[{"rateCode":"LAB-TILE-WALL","qty":0.067,"description":"مبلط"},{"rateCode":"LAB-HELPER","qty":0.067,"description":"مساعد"}]', '[]'),
+  ('MARBLE-FLOOR', 'رخام أرضيات', 'Floor Marble', 'م²', 'FIN', '[{"rateCode":"MAT-MARBLE","qty":1.05,"description":"رخام"},{"rateCode":"MAT-CEMENT","qty":0.015,"description":"أسمنت"},{"rateCode":"MAT-SAND","qty":0.1,"description":"رمل"}]', '[{"rateCode":"LAB-MARBLE-FLOOR","qty":0.067,"description":"مرخماتي"},{"rateCode":"LAB-HELPER","qty":0.067,"description":"مساعد"}]', '[]'),
+  ('WP-BITUMEN', 'عزل بيتومين (وجهين)', 'Bitumen Waterproofing (2 coats)', 'م²', 'FIN', '[{"rateCode":"MAT-BITUMEN","qty":2.0,"description":"بيتومين"}]', '[{"rateCode":"LAB-WP-BITUMEN","qty":0.01,"description":"صنايعي عزل"}]', '[]'),
+  ('WP-MEMBRANE', 'عزل ممبرين', 'Membrane Waterproofing', 'م²', 'FIN', '[{"rateCode":"MAT-MEMBRANE","qty":1.1,"description":"ممبرين"},{"rateCode":"MAT-BITUMEN","qty":0.5,"description":"بيتومين تحضير"}]', '[{"rateCode":"LAB-WP-BITUMEN","qty":0.02,"description":"صنايعي عزل"}]', '[]')
+) AS v(code, name_ar, name_en, unit, category_code, materials, labor, equipment) LEFT JOIN boq_categories c ON c.code = v.category_code
+ON CONFLICT (code) DO UPDATE SET name_ar = EXCLUDED.name_ar, name_en = EXCLUDED.name_en, unit = EXCLUDED.unit, category_id = EXCLUDED.category_id, materials = EXCLUDED.materials, labor = EXCLUDED.labor, equipment = EXCLUDED.equipment, source = EXCLUDED.source, is_active = EXCLUDED.is_active, updated_at = NOW();
+INSERT INTO indirect_cost_config (code, name_ar, name_en, percentage, applies_to, is_active)
+SELECT v.code, v.name_ar, v.name_en, v.percentage::numeric, v.applies_to::text[], true
+FROM (VALUES
+  ('IND-SITE', 'مصاريف الموقع', 'Site Overhead', '0.08', '{"ALL"}'),
+  ('IND-HEAD', 'مصاريف إدارية', 'Head Office Overhead', '0.05', '{"ALL"}'),
+  ('IND-INS', 'التأمينات', 'Insurance', '0.02', '{"ALL"}'),
+  ('IND-TAX', 'ضرائب', 'Taxes', '0.05', '{"ALL"}'),
+  ('IND-CONT', 'احتياطي', 'Contingency', '0.05', '{"ALL"}')
+) AS v(code, name_ar, name_en, percentage, applies_to)
+ON CONFLICT (code) DO UPDATE SET name_ar = EXCLUDED.name_ar, name_en = EXCLUDED.name_en, percentage = EXCLUDED.percentage, applies_to = EXCLUDED.applies_to, is_active = EXCLUDED.is_active, updated_at = NOW();
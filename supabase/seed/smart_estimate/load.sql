@@ -0,0 +1,26 @@
+-- Generated by scripts/extract-excel-data.py. \copy paths are relative to the
+-- working directory: run from this directory (scripts/load-seed-sql.py does).
+
+DROP TABLE IF EXISTS stage_master_rates;
+CREATE TEMP TABLE stage_master_rates (code text, name_ar text, name_en text, description text, unit text, current_rate text, waste_factor text, category_code text);
+\copy stage_master_rates FROM 'master_rates.copy'
+INSERT INTO master_rates (code, name_ar, name_en, description, unit, current_rate, waste_factor, category_id, source, is_active)
+SELECT v.code, v.name_ar, v.name_en, v.description, v.unit, v.current_rate::numeric, COALESCE(v.waste_factor::numeric, 1.000), c.id, 'excel', true
+FROM stage_master_rates v JOIN rate_categories c ON c.code = v.category_code
+ON CONFLICT (code) DO UPDATE SET name_ar = EXCLUDED.name_ar, name_en = EXCLUDED.name_en, description = EXCLUDED.description, unit = EXCLUDED.unit, current_rate = EXCLUDED.current_rate, waste_factor = EXCLUDED.waste_factor, category_id = EXCLUDED.category_id, source = EXCLUDED.source, is_active = EXCLUDED.is_active, updated_at = NOW();
+
+DROP TABLE IF EXISTS stage_boq_templates;
+CREATE TEMP TABLE stage_boq_templates (code text, name_ar text, name_en text, unit text, category_code text, materials text, labor text, equipment text);
+\copy stage_boq_templates FROM 'boq_templates.copy'
+INSERT INTO boq_templates (code, name_ar, name_en, unit, category_id, materials, labor, equipment, source, is_active)
+SELECT v.code, v.name_ar, v.name_en, v.unit, c.id, v.materials::jsonb, v.labor::jsonb, v.equipment::jsonb, 'excel', true
+FROM stage_boq_templates v LEFT JOIN boq_categories c ON c.code = v.category_code
+ON CONFLICT (code) DO UPDATE SET name_ar = EXCLUDED.name_ar, name_en = EXCLUDED.name_en, unit = EXCLUDED.unit, category_id = EXCLUDED.category_id, materials = EXCLUDED.materials, labor = EXCLUDED.labor, equipment = EXCLUDED.equipment, source = EXCLUDED.source, is_active = EXCLUDED.is_active, updated_at = NOW();
+
+DROP TABLE IF EXISTS stage_indirect_cost_config;
+CREATE TEMP TABLE stage_indirect_cost_config (code text, name_ar text, name_en text, percentage text, applies_to text);
+\copy stage_indirect_cost_config FROM 'indirect_cost_config.copy'
+INSERT INTO indirect_cost_config (code, name_ar, name_en, percentage, applies_to, is_active)
+SELECT v.code, v.name_ar, v.name_en, v.percentage::numeric, v.applies_to::text[], true
+FROM stage_indirect_cost_config v
+ON CONFLICT (code) DO UPDATE SET name_ar = EXCLUDED.name_ar, name_en = EXCLUDED.name_en, percentage = EXCLUDED.percentage, applies_to = EXCLUDED.applies_to, is_active = EXCLUDED.is_active, updated_at = NOW();